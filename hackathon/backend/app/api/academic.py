@@ -5,6 +5,7 @@ from typing import Optional, List
 from datetime import datetime, timedelta
 import random
 
+from ..core.responses import fast_response, to_response, to_response_list
 from ..db.session import get_session
 from ..models.academic import (
     AcademicRecord, Course, Scholarship,
@@ -14,6 +15,8 @@ from ..models.user import User
 from ..services.user_service import JWTService
 
 router = APIRouter()
+# 동기 세션으로 조회하는 핸들러는 async가 아닌 def로 두어 스레드풀에서 실행 (이벤트 루프를 막지 않음)
+# 조회 핸들러는 ORM 객체를 응답 모델 형태의 dict로 바로 옮겨 fast_response로 반환 (response_model 재검증 생략)
 security = HTTPBearer()
 
 
@@ -36,7 +39,7 @@ def get_current_user(
 
 
 @router.get("/academic/record", response_model=AcademicRecordResponse)
-async def get_academic_record(
+def get_academic_record(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -51,24 +54,7 @@ async def get_academic_record(
             # 목업 데이터 생성
             academic_record = create_mock_academic_record(current_user.id, db)
         
-        return AcademicRecordResponse(
-            id=academic_record.id,
-            student_id=academic_record.student_id,
-            university=academic_record.university,
-            department=academic_record.department,
-            major=academic_record.major,
-            grade_level=academic_record.grade_level,
-            semester=academic_record.semester,
-            enrollment_status=academic_record.enrollment_status,
-            total_credits=academic_record.total_credits,
-            required_credits=academic_record.required_credits,
-            gpa=academic_record.gpa,
-            major_gpa=academic_record.major_gpa,
-            expected_graduation=academic_record.expected_graduation,
-            graduation_date=academic_record.graduation_date,
-            created_at=academic_record.created_at,
-            updated_at=academic_record.updated_at
-        )
+        return fast_response(to_response(AcademicRecordResponse, academic_record))
         
     except Exception as e:
         raise HTTPException(
@@ -78,7 +64,7 @@ async def get_academic_record(
 
 
 @router.get("/academic/courses", response_model=List[CourseResponse])
-async def get_courses(
+def get_courses(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -102,21 +88,7 @@ async def get_courses(
             # 목업 데이터 생성
             courses = create_mock_courses(academic_record.id, db)
         
-        return [
-            CourseResponse(
-                id=course.id,
-                course_code=course.course_code,
-                course_name=course.course_name,
-                course_type=course.course_type,
-                credits=course.credits,
-                grade=course.grade,
-                grade_point=course.grade_point,
-                year=course.year,
-                semester=course.semester,
-                created_at=course.created_at
-            )
-            for course in courses
-        ]
+        return fast_response(to_response_list(CourseResponse, courses))
         
     except Exception as e:
         raise HTTPException(
@@ -126,7 +98,7 @@ async def get_courses(
 
 
 @router.get("/academic/scholarships", response_model=List[ScholarshipResponse])
-async def get_scholarships(
+def get_scholarships(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -141,19 +113,7 @@ async def get_scholarships(
             # 목업 데이터 생성
             scholarships = create_mock_scholarships(current_user.id, db)
         
-        return [
-            ScholarshipResponse(
-                id=scholarship.id,
-                scholarship_name=scholarship.scholarship_name,
-                scholarship_type=scholarship.scholarship_type,
-                amount=scholarship.amount,
-                semester=scholarship.semester,
-                year=scholarship.year,
-                status=scholarship.status,
-                created_at=scholarship.created_at
-            )
-            for scholarship in scholarships
-        ]
+        return fast_response(to_response_list(ScholarshipResponse, scholarships))
         
     except Exception as e:
         raise HTTPException(
@@ -163,7 +123,7 @@ async def get_scholarships(
 
 
 @router.get("/academic/summary", response_model=AcademicSummaryResponse)
-async def get_academic_summary(
+def get_academic_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -200,56 +160,13 @@ async def get_academic_summary(
         credit_progress = (academic_record.total_credits / academic_record.required_credits) * 100
         graduation_progress = min(credit_progress, 100)
         
-        return AcademicSummaryResponse(
-            academic_record=AcademicRecordResponse(
-                id=academic_record.id,
-                student_id=academic_record.student_id,
-                university=academic_record.university,
-                department=academic_record.department,
-                major=academic_record.major,
-                grade_level=academic_record.grade_level,
-                semester=academic_record.semester,
-                enrollment_status=academic_record.enrollment_status,
-                total_credits=academic_record.total_credits,
-                required_credits=academic_record.required_credits,
-                gpa=academic_record.gpa,
-                major_gpa=academic_record.major_gpa,
-                expected_graduation=academic_record.expected_graduation,
-                graduation_date=academic_record.graduation_date,
-                created_at=academic_record.created_at,
-                updated_at=academic_record.updated_at
-            ),
-            courses=[
-                CourseResponse(
-                    id=course.id,
-                    course_code=course.course_code,
-                    course_name=course.course_name,
-                    course_type=course.course_type,
-                    credits=course.credits,
-                    grade=course.grade,
-                    grade_point=course.grade_point,
-                    year=course.year,
-                    semester=course.semester,
-                    created_at=course.created_at
-                )
-                for course in courses
-            ],
-            scholarships=[
-                ScholarshipResponse(
-                    id=scholarship.id,
-                    scholarship_name=scholarship.scholarship_name,
-                    scholarship_type=scholarship.scholarship_type,
-                    amount=scholarship.amount,
-                    semester=scholarship.semester,
-                    year=scholarship.year,
-                    status=scholarship.status,
-                    created_at=scholarship.created_at
-                )
-                for scholarship in scholarships
-            ],
-            credit_progress=credit_progress,
-            graduation_progress=graduation_progress
-        )
+        return fast_response({
+            "academic_record": to_response(AcademicRecordResponse, academic_record),
+            "courses": to_response_list(CourseResponse, courses),
+            "scholarships": to_response_list(ScholarshipResponse, scholarships),
+            "credit_progress": credit_progress,
+            "graduation_progress": graduation_progress
+        })
         
     except Exception as e:
         raise HTTPException(
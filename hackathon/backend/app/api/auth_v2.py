@@ -1,12 +1,16 @@
 from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Optional, List
 from datetime import datetime
 from pydantic import BaseModel
 
-from ..db.session import get_session
+from ..core.responses import fast_response, to_response_list
+from ..db.session import get_session, get_async_session
 from ..models.user import (
+    User,
     UserSignupRequest,
     UserLoginRequest,
     EmailCheckRequest,
@@ -36,6 +40,8 @@ class UserListResponse(BaseModel):
     page_size: int
 
 
+# 동기 세션을 쓰는 핸들러는 async가 아닌 def로 두어 스레드풀에서 실행 (이벤트 루프를 막지 않음)
+# SSAFY API를 await하는 핸들러는 UserService가 DB 작업만 스레드풀로 넘김
 def get_user_service(db: Session = Depends(get_session)) -> UserService:
     """UserService 의존성 주입"""
     return UserService(db)
@@ -48,7 +54,21 @@ def get_current_user(
     """현재 인증된 사용자 정보 반환"""
     token = credentials.credentials
     user = JWTService.get_user_from_token(token, db)
-    
+    return _current_user_response(user)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_session)
+) -> UserResponse:
+    """현재 인증된 사용자 정보 반환 (비동기 세션, async 라우트용)"""
+    payload = JWTService.verify_token(credentials.credentials)
+    user_id = payload.get("user_id") if payload else None
+    user = await db.get(User, user_id) if user_id else None
+    return _current_user_response(user)
+
+
+def _current_user_response(user: Optional[User]) -> UserResponse:
     if not user:
         raise HTTPException(
             status_code=401,
@@ -125,7 +145,7 @@ async def signup(
 
 
 @router.post("/auth/login", response_model=LoginResponse)
-async def login(
+def login(
     request: UserLoginRequest,
     user_service: UserService = Depends(get_user_service)
 ):
@@ -179,7 +199,7 @@ async def firebase_auth(
     """Firebase UID로 인증하여 JWT 토큰 발급"""
     try:
         # Firebase UID로 사용자 조회
-        user = user_service.get_user_by_firebase_uid(request.firebase_uid)
+        user = await run_in_threadpool(user_service.get_user_by_firebase_uid, request.firebase_uid)
         
         if not user:
             # 사용자가 없으면 새로 생성 (자동 회원가입)
@@ -192,7 +212,7 @@ async def firebase_auth(
             if not result.success:
                 raise HTTPException(status_code=400, detail=result.message)
             
-            user = user_service.get_user_by_firebase_uid(request.firebase_uid)
+            user = await run_in_threadpool(user_service.get_user_by_firebase_uid, request.firebase_uid)
             if not user:
                 raise HTTPException(status_code=500, detail="사용자 생성 후 조회 실패")
         
@@ -229,7 +249,7 @@ async def firebase_auth(
 
 
 @router.get("/auth/me", response_model=UserResponse)
-async def get_current_user_info(
+def get_current_user_info(
     current_user: UserResponse = Depends(get_current_user)
 ):
     """현재 로그인된 사용자 정보 조회"""
@@ -237,7 +257,7 @@ async def get_current_user_info(
 
 
 @router.put("/auth/profile", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     display_name: Optional[str] = None,
     university: Optional[str] = None,
     department: Optional[str] = None,
@@ -290,7 +310,7 @@ async def update_profile(
 
 
 @router.post("/auth/change-password")
-async def change_password(
+def change_password(
     current_password: str,
     new_password: str,
     current_user: UserResponse = Depends(get_current_user),
@@ -335,7 +355,7 @@ async def change_password(
 
 
 @router.delete("/auth/account")
-async def delete_account(
+def delete_account(
     password: str,
     current_user: UserResponse = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service)
@@ -372,7 +392,7 @@ async def delete_account(
 
 
 @router.get("/auth/users", response_model=UserListResponse)
-async def get_users(
+def get_users(
     page: int = 1,
     page_size: int = 20,
     user_service: UserService = Depends(get_user_service)
@@ -386,28 +406,12 @@ async def get_users(
         users = user_service.get_users_paginated(offset=offset, limit=page_size)
         total_count = user_service.get_total_users_count()
         
-        # UserResponse로 변환
-        user_responses = []
-        for user in users:
-            user_responses.append(UserResponse(
-                id=user.id,
-                email=user.email,
-                display_name=user.display_name,
-                current_university=user.current_university,
-                current_department=user.current_department,
-                grade_level=user.grade_level,
-                profile_image=user.profile_image,
-                is_verified=user.is_verified,
-                created_at=user.created_at,
-                last_login_at=user.last_login_at
-            ))
-        
-        return UserListResponse(
-            users=user_responses,
-            total_count=total_count,
-            page=page,
-            page_size=page_size
-        )
+        return fast_response({
+            "users": to_response_list(UserResponse, users),
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -1,55 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import date
 from typing import List, Optional
-import json
 import logging
-from ..db.session import get_session
+from ..db.session import get_async_session
 from ..models.chronicle import ChroniclePost
 from ..models.user import User
-from ..api.auth_v2 import get_current_user
+from ..api.auth_v2 import get_current_user_async
+from ..services.chronicle_service import (
+    ChronicleService, DEFAULT_PAGE_SIZE, InvalidCursorError, MAX_PAGE_SIZE
+)
+from ..services.chronicle_feed import ChronicleFeedService, public_feed_cache
+from ..services.chronicle_search import ChronicleSearchService, SearchUnavailableError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+def _page_response(body: bytes, next_cursor: Optional[str], has_more: bool) -> Response:
+    """본문은 기존처럼 포스트 배열로 두고, 다음 페이지 정보는 헤더로 전달
+
+    이미 인코딩된 본문을 Response로 바로 반환하므로 response_model 검증/재직렬화를 거치지 않는다
+    (response_model은 API 문서용).
+    """
+    headers = {"X-Has-More": "true" if has_more else "false"}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @router.get("/chronicle/posts", response_model=List[dict])
 async def get_user_chronicles(
     user_id: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_session)
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_session)
 ):
-    """사용자의 크로니클 포스트 목록 조회"""
+    """사용자의 크로니클 포스트 목록 조회 (최신순, cursor로 다음 페이지)"""
     try:
         # user_id가 제공되지 않으면 현재 로그인한 사용자의 포스트 조회
         target_user_id = user_id or current_user.id
-        
-        statement = select(ChroniclePost).where(ChroniclePost.user_id == target_user_id).order_by(ChroniclePost.timestamp.desc())
-        posts = db.exec(statement).all()
-        
-        # JSON 직렬화 가능한 형태로 변환
-        result = []
-        for post in posts:
-            # JSON 문자열을 파싱하여 객체로 변환
-            try:
-                rewards = post.rewards if isinstance(post.rewards, dict) else (json.loads(post.rewards) if post.rewards else {})
-                user_content = post.user_content if isinstance(post.user_content, dict) else (json.loads(post.user_content) if post.user_content else {})
-            except (json.JSONDecodeError, TypeError):
-                rewards = {}
-                user_content = {}
-            
-            post_dict = {
-                "id": post.id,
-                "user_id": post.user_id,
-                "type": post.type,
-                "title": post.title,
-                "description": post.description,
-                "timestamp": post.timestamp.isoformat() if post.timestamp else None,
-                "rewards": rewards,
-                "user_content": user_content
-            }
-            result.append(post_dict)
-        
-        return result
+        body, next_cursor, has_more = await ChronicleService.get_page(db, target_user_id, limit, cursor)
+        return _page_response(body, next_cursor, has_more)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -58,78 +53,147 @@ async def get_user_chronicles(
 
 @router.get("/chronicle/posts/public", response_model=List[dict])
 async def get_public_chronicles(
-    db: Session = Depends(get_session)
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_session)
 ):
-    """공개 크로니클 포스트 목록 조회 (인증 없이)"""
+    """공개 크로니클 포스트 목록 조회 (인증 없이, 최신순, cursor로 다음 페이지)"""
     try:
-        statement = select(ChroniclePost).order_by(ChroniclePost.timestamp.desc()).limit(50)
-        posts = db.exec(statement).all()
-        
-        # JSON 직렬화 가능한 형태로 변환
-        result = []
-        for post in posts:
-            # JSON 문자열을 파싱하여 객체로 변환
-            try:
-                rewards = post.rewards if isinstance(post.rewards, dict) else (json.loads(post.rewards) if post.rewards else {})
-                user_content = post.user_content if isinstance(post.user_content, dict) else (json.loads(post.user_content) if post.user_content else {})
-            except (json.JSONDecodeError, TypeError):
-                rewards = {}
-                user_content = {}
-            
-            post_dict = {
-                "id": post.id,
-                "user_id": post.user_id,
-                "type": post.type,
-                "title": post.title,
-                "description": post.description,
-                "timestamp": post.timestamp.isoformat() if post.timestamp else None,
-                "rewards": rewards,
-                "user_content": user_content
-            }
-            result.append(post_dict)
-        
-        return result
+        # 인코딩된 페이지를 캐시에서 반환 (포스트 생성/삭제 시 무효화)
+        body, next_cursor, has_more = await ChronicleFeedService.public_page(db, limit, cursor)
+        return _page_response(body, next_cursor, has_more)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"크로니클 포스트 조회 실패: {str(e)}"
         )
 
+@router.get("/chronicle/search", response_model=List[dict])
+async def search_chronicles(
+    q: str = Query(..., min_length=1, max_length=100),
+    sort: str = Query("relevance", pattern="^(relevance|recent)$"),
+    user_id: Optional[int] = None,
+    post_type: Optional[str] = Query(None, alias="type"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_session)
+):
+    """크로니클 포스트 검색 (제목/내용, 관련도순 또는 최신순, cursor로 다음 페이지)"""
+    try:
+        body, next_cursor, has_more = await ChronicleSearchService.search(
+            db, q, limit, cursor, sort, user_id, post_type, start_date, end_date
+        )
+        return _page_response(body, next_cursor, has_more)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except SearchUnavailableError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"크로니클 포스트 검색 실패: {str(e)}"
+        )
+
+@router.get("/chronicle/feed", response_model=List[dict])
+async def get_home_feed(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """홈 타임라인: 본인과 팔로우 중인 사용자의 포스트 (최신순, cursor로 다음 페이지)"""
+    try:
+        body, next_cursor, has_more = await ChronicleFeedService.home_page(db, current_user.id, limit, cursor)
+        return _page_response(body, next_cursor, has_more)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"홈 타임라인 조회 실패: {str(e)}"
+        )
+
+@router.post("/chronicle/follows/{user_id}", response_model=dict)
+async def follow_user(
+    user_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """사용자 팔로우 (이후 해당 사용자의 포스트가 홈 타임라인에 표시됨)"""
+    if await db.get(User, user_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
+    try:
+        followed = await ChronicleFeedService.follow(db, current_user.id, user_id)
+        await db.commit()
+        return {"following": True, "created": followed}
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"팔로우 실패: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"팔로우 실패: {str(e)}"
+        )
+
+@router.delete("/chronicle/follows/{user_id}", response_model=dict)
+async def unfollow_user(
+    user_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """사용자 언팔로우 (홈 타임라인에서 해당 사용자의 포스트 제거)"""
+    try:
+        removed = await ChronicleFeedService.unfollow(db, current_user.id, user_id)
+        await db.commit()
+        return {"following": False, "removed": removed}
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"언팔로우 실패: {str(e)}"
+        )
+
 @router.post("/chronicle/posts", response_model=dict)
 async def create_chronicle_post(
     post_data: dict,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_session)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_session)
 ):
     """새로운 크로니클 포스트 생성"""
     try:
-        # JSON 데이터를 문자열로 변환 (기본 크레도 점수 포함)
-        default_rewards = {"credo": 5}  # 기본 크레도 점수
+        # 기본 크레도 점수 포함
+        rewards = {"credo": 5}  # 기본 크레도 점수
         if post_data.get("rewards"):
-            default_rewards.update(post_data.get("rewards"))
-        
-        rewards = json.dumps(default_rewards)
-        user_content = json.dumps(post_data.get("user_content", {})) if post_data.get("user_content") else "{}"
+            rewards.update(post_data.get("rewards"))
+        user_content = post_data.get("user_content") or {}
         
         new_post = ChroniclePost(
             user_id=current_user.id,
             type=post_data.get("type", "user_post"),
             title=post_data.get("title", ""),
             description=post_data.get("description"),
-            rewards=rewards,  # JSON 문자열로 저장 (크레도 점수 포함)
-            user_content=user_content  # JSON 문자열로 저장
+            rewards=rewards,  # JSON 컬럼 (크레도 점수 포함)
+            user_content=user_content
         )
         
         db.add(new_post)
-        db.commit()
-        db.refresh(new_post)
+        await db.flush()
+        # 본인/팔로워 홈 타임라인에 전파 (포스트와 같은 트랜잭션)
+        await ChronicleFeedService.fan_out(db, new_post)
+        await db.commit()
+        public_feed_cache.invalidate()
         
         return {
             "id": new_post.id,
             "message": "크로니클 포스트가 성공적으로 생성되었습니다."
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"크로니클 포스트 생성 실패: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -139,8 +203,8 @@ async def create_chronicle_post(
 @router.delete("/chronicle/posts/{post_id}")
 async def delete_chronicle_post(
     post_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_session)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_session)
 ):
     """크로니클 포스트 삭제"""
     try:
@@ -148,7 +212,7 @@ async def delete_chronicle_post(
             ChroniclePost.id == post_id,
             ChroniclePost.user_id == current_user.id
         )
-        post = db.exec(statement).first()
+        post = (await db.exec(statement)).first()
         
         if not post:
             raise HTTPException(
@@ -156,14 +220,16 @@ async def delete_chronicle_post(
                 detail="포스트를 찾을 수 없습니다."
             )
         
-        db.delete(post)
-        db.commit()
+        await ChronicleFeedService.remove_post(db, post.id)
+        await db.delete(post)
+        await db.commit()
+        public_feed_cache.invalidate()
         
         return {"message": "크로니클 포스트가 성공적으로 삭제되었습니다."}
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"크로니클 포스트 삭제 실패: {str(e)}"
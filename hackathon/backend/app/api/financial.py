@@ -1,5 +1,6 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 from typing import Optional, List
 from datetime import datetime, timedelta
@@ -7,14 +8,18 @@ import random
 import logging
 
 
+from ..core.responses import fast_response, to_response, to_response_list
 from ..db.session import get_session
 from ..models.financial import (
     BankAccount, Transaction, FinancialProduct, UserProduct, CreditScore,
     BankAccountResponse, TransactionResponse, FinancialProductResponse, 
-    UserProductResponse, CreditScoreResponse, FinancialSummaryResponse
+    UserProductResponse, CreditScoreResponse, FinancialSummaryResponse, MonthlyAnalyticsResponse
 )
 from ..models.user import User
 from ..services.user_service import JWTService
+from ..services.financial_aggregate_service import FinancialAggregateService
+from ..services.ledger_sync_service import LedgerSyncService
+from ..services.spending_rollup_service import MAX_ANALYTICS_MONTHS, SpendingRollupService
 
 # 신한그룹 브랜드 정보
 SHINHAN_GROUP = {
@@ -27,6 +32,8 @@ SHINHAN_GROUP = {
 }
 
 router = APIRouter()
+# 동기 세션으로 조회하는 핸들러는 async가 아닌 def로 두어 스레드풀에서 실행 (이벤트 루프를 막지 않음)
+# 조회 핸들러는 ORM 객체를 응답 모델 형태의 dict로 바로 옮겨 fast_response로 반환 (response_model 재검증 생략)
 security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
@@ -50,7 +57,7 @@ def get_current_user(
 
 
 @router.get("/financial/accounts", response_model=List[BankAccountResponse])
-async def get_bank_accounts(
+def get_bank_accounts(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -66,23 +73,7 @@ async def get_bank_accounts(
             logger.info(f"사용자 {current_user.id}의 계좌가 없습니다")
             return []
         
-        return [
-            BankAccountResponse(
-                id=account.id,
-                account_number=account.account_number,
-                bank_name=account.bank_name,
-                account_type=account.account_type,
-                account_name=account.account_name,
-                balance=account.balance,
-                currency=account.currency,
-                is_active=account.is_active,
-                created_date=account.created_date,
-                last_transaction_date=account.last_transaction_date,
-                created_at=account.created_at,
-                updated_at=account.updated_at
-            )
-            for account in accounts
-        ]
+        return fast_response(to_response_list(BankAccountResponse, accounts))
         
     except Exception as e:
         raise HTTPException(
@@ -92,7 +83,7 @@ async def get_bank_accounts(
 
 
 @router.get("/financial/transactions", response_model=List[TransactionResponse])
-async def get_transactions(
+def get_transactions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session),
     account_id: Optional[int] = None,
@@ -133,19 +124,7 @@ async def get_transactions(
             logger.info(f"사용자 {current_user.id}의 거래 내역이 없습니다")
             return []
         
-        return [
-            TransactionResponse(
-                id=transaction.id,
-                transaction_type=transaction.transaction_type,
-                amount=transaction.amount,
-                balance_after=transaction.balance_after,
-                description=transaction.description,
-                category=transaction.category,
-                transaction_date=transaction.transaction_date,
-                created_at=transaction.created_at
-            )
-            for transaction in transactions
-        ]
+        return fast_response(to_response_list(TransactionResponse, transactions))
         
     except Exception as e:
         raise HTTPException(
@@ -155,7 +134,7 @@ async def get_transactions(
 
 
 @router.get("/financial/products", response_model=List[FinancialProductResponse])
-async def get_financial_products(
+def get_financial_products(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session),
     product_type: Optional[str] = None
@@ -179,25 +158,7 @@ async def get_financial_products(
             # 목업 데이터 생성
             products = create_mock_financial_products(db)
         
-        return [
-            FinancialProductResponse(
-                id=product.id,
-                product_code=product.product_code,
-                product_name=product.product_name,
-                product_type=product.product_type,
-                bank_name=product.bank_name,
-                interest_rate=product.interest_rate,
-                min_amount=product.min_amount,
-                max_amount=product.max_amount,
-                term_months=product.term_months,
-                description=product.description,
-                features=product.features,
-                is_active=product.is_active,
-                created_at=product.created_at,
-                updated_at=product.updated_at
-            )
-            for product in products
-        ]
+        return fast_response(to_response_list(FinancialProductResponse, products))
         
     except Exception as e:
         raise HTTPException(
@@ -207,65 +168,24 @@ async def get_financial_products(
 
 
 @router.get("/financial/user-products", response_model=List[UserProductResponse])
-async def get_user_products(
+def get_user_products(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
     """현재 사용자의 가입 상품 목록 조회"""
     try:
-        # 사용자의 가입 상품 조회
+        # 사용자의 가입 상품 조회 (상품/계좌 관계 함께 조회)
         user_products = db.exec(
-            select(UserProduct).where(UserProduct.user_id == current_user.id)
+            select(UserProduct)
+            .where(UserProduct.user_id == current_user.id)
+            .options(selectinload(UserProduct.product), selectinload(UserProduct.account))
         ).all()
         
         if not user_products:
             # 목업 데이터 생성
             user_products = create_mock_user_products(current_user.id, db)
         
-        return [
-            UserProductResponse(
-                id=up.id,
-                product=FinancialProductResponse(
-                    id=up.product.id,
-                    product_code=up.product.product_code,
-                    product_name=up.product.product_name,
-                    product_type=up.product.product_type,
-                    bank_name=up.product.bank_name,
-                    interest_rate=up.product.interest_rate,
-                    min_amount=up.product.min_amount,
-                    max_amount=up.product.max_amount,
-                    term_months=up.product.term_months,
-                    description=up.product.description,
-                    features=up.product.features,
-                    is_active=up.product.is_active,
-                    created_at=up.product.created_at,
-                    updated_at=up.product.updated_at
-                ),
-                account=BankAccountResponse(
-                    id=up.account.id,
-                    account_number=up.account.account_number,
-                    bank_name=up.account.bank_name,
-                    account_type=up.account.account_type,
-                    account_name=up.account.account_name,
-                    balance=up.account.balance,
-                    currency=up.account.currency,
-                    is_active=up.account.is_active,
-                    created_date=up.account.created_date,
-                    last_transaction_date=up.account.last_transaction_date,
-                    created_at=up.account.created_at,
-                    updated_at=up.account.updated_at
-                ),
-                amount=up.amount,
-                start_date=up.start_date,
-                end_date=up.end_date,
-                status=up.status,
-                total_interest=up.total_interest,
-                last_interest_date=up.last_interest_date,
-                created_at=up.created_at,
-                updated_at=up.updated_at
-            )
-            for up in user_products
-        ]
+        return fast_response(to_response_list(UserProductResponse, user_products))
         
     except Exception as e:
         raise HTTPException(
@@ -275,7 +195,7 @@ async def get_user_products(
 
 
 @router.get("/financial/credit-score", response_model=CreditScoreResponse)
-async def get_credit_score(
+def get_credit_score(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -290,16 +210,7 @@ async def get_credit_score(
             # 목업 데이터 생성
             credit_score = create_mock_credit_score(current_user.id, db)
         
-        return CreditScoreResponse(
-            id=credit_score.id,
-            score=credit_score.score,
-            grade=credit_score.grade,
-            last_updated=credit_score.last_updated,
-            credit_limit=credit_score.credit_limit,
-            used_credit=credit_score.used_credit,
-            created_at=credit_score.created_at,
-            updated_at=credit_score.updated_at
-        )
+        return fast_response(to_response(CreditScoreResponse, credit_score))
         
     except Exception as e:
         raise HTTPException(
@@ -309,7 +220,7 @@ async def get_credit_score(
 
 
 @router.get("/financial/summary", response_model=FinancialSummaryResponse)
-async def get_financial_summary(
+def get_financial_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -366,8 +277,11 @@ async def get_financial_summary(
         
         # 가입 상품 조회 (안전한 처리)
         try:
+            # 상품/계좌 관계는 한 번에 함께 조회 (행마다 지연 로딩하지 않음)
             user_products = db.exec(
-                select(UserProduct).where(UserProduct.user_id == current_user.id)
+                select(UserProduct)
+                .where(UserProduct.user_id == current_user.id)
+                .options(selectinload(UserProduct.product), selectinload(UserProduct.account))
             ).all()
             
             if not user_products:
@@ -378,109 +292,36 @@ async def get_financial_summary(
             print(f"⚠️ 가입상품 조회 실패: {e}")
             user_products = []
         
-        # 요약 정보 계산 (안전한 처리)
+        # 요약 정보: 계좌/거래 변경 시 갱신되는 사용자별 집계 행에서 읽음 (계좌가 없으면 행 없음)
         try:
-            total_balance = sum(account.balance for account in accounts if account.account_type == "수시입출금")
-            total_assets = sum(account.balance for account in accounts if account.account_type in ["수시입출금", "예금", "적금"])
-            total_liabilities = sum(account.balance for account in accounts if account.account_type == "대출")
-            net_worth = total_assets - total_liabilities
+            aggregate = FinancialAggregateService.get(db, current_user.id)
         except Exception as e:
-            print(f"⚠️ 요약 정보 계산 실패, 기본값 사용: {e}")
-            total_balance = 0
-            total_assets = 0
-            total_liabilities = 0
-            net_worth = 0
-        
-        return FinancialSummaryResponse(
-            total_balance=total_balance,
-            total_assets=total_assets,
-            total_liabilities=total_liabilities,
-            net_worth=net_worth,
-            credit_score=CreditScoreResponse(
-                id=credit_score.id if credit_score else 0,
-                score=credit_score.score if credit_score else 0,
-                grade=credit_score.grade if credit_score else 'N/A',
-                last_updated=credit_score.last_updated if credit_score else datetime.now(),
-                credit_limit=credit_score.credit_limit if credit_score else 0,
-                used_credit=credit_score.used_credit if credit_score else 0,
-                created_at=credit_score.created_at if credit_score else datetime.now(),
-                updated_at=credit_score.updated_at if credit_score else datetime.now()
-            ),
-            accounts=[
-                BankAccountResponse(
-                    id=account.id,
-                    account_number=account.account_number,
-                    bank_name=account.bank_name,
-                    account_type=account.account_type,
-                    account_name=account.account_name,
-                    balance=account.balance,
-                    currency=account.currency,
-                    is_active=account.is_active,
-                    created_date=account.created_date,
-                    last_transaction_date=account.last_transaction_date,
-                    created_at=account.created_at,
-                    updated_at=account.updated_at
-                )
-                for account in accounts
-            ],
-            recent_transactions=[
-                TransactionResponse(
-                    id=transaction.id,
-                    transaction_type=transaction.transaction_type,
-                    amount=transaction.amount,
-                    balance_after=transaction.balance_after,
-                    description=transaction.description,
-                    category=transaction.category,
-                    transaction_date=transaction.transaction_date,
-                    created_at=transaction.created_at
-                )
-                for transaction in transactions
-            ],
-            products=[
-                UserProductResponse(
-                    id=up.id,
-                    product=FinancialProductResponse(
-                        id=up.product.id,
-                        product_code=up.product.product_code,
-                        product_name=up.product.product_name,
-                        product_type=up.product.product_type,
-                        bank_name=up.product.bank_name,
-                        interest_rate=up.product.interest_rate,
-                        min_amount=up.product.min_amount,
-                        max_amount=up.product.max_amount,
-                        term_months=up.product.term_months,
-                        description=up.product.description,
-                        features=up.product.features,
-                        is_active=up.product.is_active,
-                        created_at=up.product.created_at,
-                        updated_at=up.product.updated_at
-                    ),
-                    account=BankAccountResponse(
-                        id=up.account.id,
-                        account_number=up.account.account_number,
-                        bank_name=up.account.bank_name,
-                        account_type=up.account.account_type,
-                        account_name=up.account.account_name,
-                        balance=up.account.balance,
-                        currency=up.account.currency,
-                        is_active=up.account.is_active,
-                        created_date=up.account.created_date,
-                        last_transaction_date=up.account.last_transaction_date,
-                        created_at=up.account.created_at,
-                        updated_at=up.account.updated_at
-                    ),
-                    amount=up.amount,
-                    start_date=up.start_date,
-                    end_date=up.end_date,
-                    status=up.status,
-                    total_interest=up.total_interest,
-                    last_interest_date=up.last_interest_date,
-                    created_at=up.created_at,
-                    updated_at=up.updated_at
-                )
-                for up in user_products
-            ]
-        )
+            logger.warning(f"금융 집계 조회 실패, 기본값 사용: {e}")
+            aggregate = None
+        total_balance = aggregate.total_balance if aggregate else 0
+        total_assets = aggregate.total_assets if aggregate else 0
+        total_liabilities = aggregate.total_liabilities if aggregate else 0
+        net_worth = aggregate.net_worth if aggregate else 0
+        
+        if credit_score is None:
+            now = datetime.now()
+            credit_score_response = {
+                "id": 0, "score": 0, "grade": "N/A", "last_updated": now,
+                "credit_limit": 0, "used_credit": 0, "created_at": now, "updated_at": now
+            }
+        else:
+            credit_score_response = to_response(CreditScoreResponse, credit_score)
+
+        return fast_response({
+            "total_balance": total_balance,
+            "total_assets": total_assets,
+            "total_liabilities": total_liabilities,
+            "net_worth": net_worth,
+            "credit_score": credit_score_response,
+            "accounts": to_response_list(BankAccountResponse, accounts),
+            "recent_transactions": to_response_list(TransactionResponse, transactions),
+            "products": to_response_list(UserProductResponse, user_products)
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -489,6 +330,41 @@ async def get_financial_summary(
         )
 
 
+@router.get("/financial/analytics/monthly", response_model=List[MonthlyAnalyticsResponse])
+def get_monthly_analytics(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session),
+    months: int = Query(3, ge=1, le=MAX_ANALYTICS_MONTHS, description="조회할 달력 월 수 (이번 달 포함)"),
+    account_id: Optional[int] = Query(None, description="특정 계좌만 집계")
+):
+    """최근 N개월 수입/지출/순수입과 카테고리별 금액 (최신 월 먼저, 월간 카테고리 집계 테이블에서 한 번에 조회)"""
+    try:
+        return fast_response(SpendingRollupService.monthly(db, current_user.id, months, account_id))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"월별 분석 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/financial/sync")
+async def sync_ledger(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """SSAFY 거래내역을 로컬 원장으로 동기화 (마지막 동기화 이후 거래만 반영)"""
+    if not current_user.ssafy_user_key:
+        raise HTTPException(status_code=400, detail="SSAFY 계정이 연동되지 않았습니다")
+
+    try:
+        return await LedgerSyncService.sync_user(db, current_user)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"거래내역 동기화 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
 # 목업 데이터 생성 함수들
 def create_mock_bank_accounts(user_id: int, db: Session) -> List[BankAccount]:
     """목업 은행 계좌 생성 (신한그룹 통일)"""
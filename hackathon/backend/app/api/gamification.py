@@ -11,6 +11,8 @@ import random
 import uuid
 import math
 
+from ..services.leaderboard_service import leaderboards
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/gamification", tags=["Gamification"])
@@ -20,7 +22,6 @@ user_profiles_db = {}
 achievements_db = {}
 quests_db = {}
 financial_goals_db = {}
-leaderboard_db = {}
 
 # 기본 업적 데이터
 DEFAULT_ACHIEVEMENTS = [
@@ -189,6 +190,7 @@ async def get_user_profile(user_id: str):
         level_info = calculate_level(profile["currentXP"])
         profile["level"] = level_info["level"]
         profile["xpToNextLevel"] = level_info["xpToNext"]
+        publish_profile(profile)
         
         print(f"✅ 사용자 프로필 조회 완료: 레벨 {profile['level']}")
         
@@ -382,6 +384,7 @@ async def complete_quest(quest_id: str, user_id: str):
         # 활성 퀘스트에서 제거하고 완료된 퀘스트에 추가
         profile["activeQuests"] = [q for q in profile["activeQuests"] if q["id"] != quest_id]
         profile["completedQuests"].append(quest)
+        publish_profile(profile)
         
         print(f"✅ 퀘스트 완료: XP +{rewards['xp']}, 크레도 +{rewards['credits']}")
         if level_up:
@@ -501,49 +504,40 @@ async def update_goal_progress(goal_id: str, current_amount: int):
         raise HTTPException(status_code=500, detail=f"진행도 업데이트 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/leaderboard")
-async def get_leaderboard(category: str = "level"):
-    """리더보드 조회"""
+async def get_leaderboard(
+    category: str = "level",
+    limit: int = Query(100, ge=1, le=100),
+    user_id: Optional[str] = None,
+    around: int = Query(5, ge=0, le=50)
+):
+    """리더보드 조회 (user_id를 넘기면 내 순위와 위/아래 around명도 함께 반환)"""
     try:
         print(f"🏆 리더보드 조회: {category}")
+        if category == "credo":
+            raise ValueError("크레도 리더보드는 /api/xp/leaderboard를 사용하세요")
+        board = leaderboards[category]
         
-        # 모든 사용자 프로필 수집
-        all_profiles = list(user_profiles_db.values())
-        
-        if not all_profiles:
-            return {"success": True, "leaderboard": [], "total_count": 0}
-        
-        # 카테고리별 정렬
-        if category == "level":
-            all_profiles.sort(key=lambda x: (x["level"], x["currentXP"]), reverse=True)
-        elif category == "credits":
-            all_profiles.sort(key=lambda x: x["totalCredits"], reverse=True)
-        elif category == "achievements":
-            all_profiles.sort(key=lambda x: x["stats"]["achievementsUnlocked"], reverse=True)
-        elif category == "streak":
-            all_profiles.sort(key=lambda x: x["stats"]["daysStreak"], reverse=True)
-        
-        # 리더보드 엔트리 생성
-        leaderboard = []
-        for i, profile in enumerate(all_profiles[:100], 1):  # 상위 100명
-            leaderboard.append({
-                "rank": i,
-                "userId": profile["userId"],
-                "name": f"사용자{profile['userId'][-4:]}",  # 임시 이름
-                "level": profile["level"],
-                "totalCredits": profile["totalCredits"],
-                "achievements": profile["stats"]["achievementsUnlocked"],
-                "streak": profile["stats"]["daysStreak"]
-            })
-        
-        print(f"✅ 리더보드 조회 완료: {len(leaderboard)}명")
+        # 리더보드 엔트리 생성 (순위표는 점수 변경 시 갱신되어 있음)
+        leaderboard = [leaderboard_entry(entry) for entry in board.top(limit)]
         
-        return {
+        response = {
             "success": True,
             "leaderboard": leaderboard,
             "total_count": len(leaderboard),
+            "total_users": len(board),
             "category": category
         }
+        if user_id is not None:
+            me = board.around(user_id, around, around)
+            if me is not None:
+                me["entries"] = [leaderboard_entry(entry) for entry in me["entries"]]
+            response["me"] = me
         
+        logger.debug(f"리더보드 조회 완료: {len(leaderboard)}명")
+        return response
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"리더보드 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"리더보드 조회 중 오류가 발생했습니다: {str(e)}")
@@ -589,6 +583,7 @@ async def daily_checkin(user_id: str):
         # 보상 지급
         profile["currentXP"] += xp_reward
         profile["totalCredits"] += credit_reward
+        publish_profile(profile)
         
         print(f"✅ 일일 체크인 완료: 스트릭 {streak}일, XP +{xp_reward}, 크레도 +{credit_reward}")
         
@@ -633,6 +628,7 @@ async def gain_xp(user_id: str, amount: int, reason: str):
         if level_up:
             rewards = calculate_level_rewards(new_level_info["level"])
             profile["totalCredits"] += rewards["credits"]
+        publish_profile(profile)
         
         print(f"✅ XP 획득 완료: {amount}XP, 총 {profile['currentXP']}XP")
         if level_up:
@@ -662,6 +658,7 @@ async def gain_credits(user_id: str, amount: int, reason: str):
         profile = user_profiles_db[user_id]
         
         profile["totalCredits"] += amount
+        publish_profile(profile)
         
         print(f"✅ 크레도 획득 완료: +{amount}, 총 {profile['totalCredits']}")
         
@@ -707,9 +704,36 @@ def create_default_profile(user_id: str) -> Dict[str, Any]:
     
     # 기본 퀘스트 할당
     profile["activeQuests"] = DEFAULT_QUESTS[:2].copy()  # 처음 2개 퀘스트
+    publish_profile(profile)
     
     return profile
 
+def leaderboard_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """순위표 항목을 리더보드 응답 형식으로 변환"""
+    return {
+        "rank": entry["rank"],
+        "userId": entry["user_id"],
+        "name": f"사용자{entry['user_id'][-4:]}",  # 임시 이름
+        "level": entry["level"],
+        "totalCredits": entry["totalCredits"],
+        "achievements": entry["achievements"],
+        "streak": entry["streak"]
+    }
+
+def publish_profile(profile: Dict[str, Any]) -> None:
+    """프로필 점수를 카테고리별 순위표에 반영"""
+    user_id = profile["userId"]
+    info = {
+        "level": profile["level"],
+        "totalCredits": profile["totalCredits"],
+        "achievements": profile["stats"]["achievementsUnlocked"],
+        "streak": profile["stats"]["daysStreak"]
+    }
+    leaderboards["level"].update(user_id, (profile["level"], profile["currentXP"]), **info)
+    leaderboards["credits"].update(user_id, profile["totalCredits"], **info)
+    leaderboards["achievements"].update(user_id, profile["stats"]["achievementsUnlocked"], **info)
+    leaderboards["streak"].update(user_id, profile["stats"]["daysStreak"], **info)
+
 def calculate_level(xp: int) -> Dict[str, Any]:
     """레벨 계산"""
     level = int(math.sqrt(xp / 100)) + 1
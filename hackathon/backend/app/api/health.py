@@ -1,7 +1,26 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from ..db.session import engine, query_timer
+from ..models.user import UserResponse
+from .auth_v2 import get_current_user_async
 
 router = APIRouter()
 
 @router.get("/health")
 async def health():
     return {"status": "ok"}
+
+@router.get("/health/db")
+async def database_health(limit: int = 20, current_user: UserResponse = Depends(get_current_user_async)):
+    """DB 커넥션 풀 상태와 누적 시간이 큰 SQL 문장 통계 (SQL 문장이 노출되므로 로그인 필요)"""
+    return {
+        "dialect": engine.dialect.name,
+        "pool": engine.pool.status(),
+        "statements": query_timer.top(limit),
+    }
+
+@router.delete("/health/db/statements")
+async def reset_database_statements(current_user: UserResponse = Depends(get_current_user_async)):
+    """SQL 문장 통계 초기화"""
+    query_timer.reset()
+    return {"message": "SQL 문장 통계를 초기화했습니다"}
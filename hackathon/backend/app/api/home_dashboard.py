@@ -4,41 +4,175 @@
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Awaitable, Tuple
+from datetime import datetime
+import asyncio
 import logging
 import random
 
-from ..services.ssafy_api_service import SSAFYAPIService
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
+
+from ..core.config import settings
+from ..db.session import get_session
+from ..models.user import User
+from ..services.ssafy_api_service import AsyncSSAFYAPIService
+from ..services.ssafy_fetch_plan import SSAFYFetchPlan
+from ..services.ledger_sync_service import LedgerSyncService, extract_records, record_fields
+from ..services.spending_rollup_service import month_key, recent_months
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/home", tags=["Home Dashboard"])
+router = APIRouter(prefix="/home", tags=["Home Dashboard"])
 
 # SSAFY API 서비스 인스턴스
-ssafy_service = SSAFYAPIService()
+ssafy_service = AsyncSSAFYAPIService()
+
+# 계좌구분별 (계좌구분, 계좌 목록 조회 메서드, 목록 응답의 잔액 필드)
+ACCOUNT_LISTS = (
+    ("수시입출금", "get_demand_deposit_accounts", "accountBalance"),
+    ("예금", "get_deposit_accounts", "depositBalance"),
+    ("적금", "get_savings_accounts", "totalBalance"),
+    ("대출", "get_loan_accounts", "loanBalance")
+)
+
+# 계좌 상세 API의 계좌 타입 → (계좌구분, 잔액 필드)
+ACCOUNT_DETAIL_TYPES = {
+    "demand_deposit": ("수시입출금", "accountBalance"),
+    "deposit": ("예금", "depositBalance"),
+    "savings": ("적금", "totalBalance"),
+    "loan": ("대출", "loanBalance")
+}
+
+# 월별 수입/지출 분석 개월 수
+ANALYSIS_MONTHS = 3
+
+# 대출 상품을 추천하는 자산 기반 신용등급
+LOAN_RECOMMEND_GRADES = ("A", "B")
+
+# 대시보드 섹션별 시간 예산 (초) - 초과 시 해당 섹션만 기본값으로 응답
+SECTION_TIME_BUDGETS = {
+    "account_summary": 5.0,
+    "recent_transactions": 5.0,
+    "financial_status": 8.0,
+    "recommended_products": 5.0
+}
+
+def _empty_account_summary() -> Dict[str, Any]:
+    return {
+        "total_accounts": 0,
+        "total_balance": 0,
+        "total_loan": 0,
+        "net_worth": 0,
+        "account_details": [],
+        "account_counts": {"demand_deposit": 0, "deposit": 0, "savings": 0, "loan": 0}
+    }
+
+def _empty_financial_status() -> Dict[str, Any]:
+    return {
+        "credit_score": 0,
+        "credit_grade": "N/A",
+        "monthly_analysis": {},
+        "financial_goals": {}
+    }
+
+# 섹션별 시간 초과 시 기본값
+SECTION_FALLBACKS = {
+    "account_summary": _empty_account_summary,
+    "recent_transactions": list,
+    "financial_status": _empty_financial_status,
+    "recommended_products": list
+}
+
+async def _run_section(name: str, section: Awaitable[Any]) -> Tuple[Any, bool]:
+    """섹션을 시간 예산 안에서 실행 (초과 시 기본값, 완료 여부 반환)"""
+    try:
+        return await asyncio.wait_for(section, SECTION_TIME_BUDGETS[name]), True
+    except asyncio.TimeoutError:
+        logger.warning(f"대시보드 섹션 시간 초과: {name} ({SECTION_TIME_BUDGETS[name]}초)")
+        return SECTION_FALLBACKS[name](), False
+
+async def _completed(value: Any) -> Any:
+    """이미 계산된 값을 섹션으로 사용"""
+    return value
+
+async def _try_fetch(plan: SSAFYFetchPlan, method_name: str, *args, **kwargs) -> Optional[Dict[str, Any]]:
+    """개별 계좌 조회 (실패 시 None)"""
+    try:
+        return await getattr(plan, method_name)(*args, **kwargs)
+    except Exception as e:
+        logger.warning(f"{method_name}({args[0] if args else ''}) 조회 실패: {str(e)}")
+        return None
+
+def _find_user(db: Session, user_key: str) -> Optional[User]:
+    return db.exec(select(User).where(User.ssafy_user_key == user_key)).first()
+
+def _read_local_ledger(engine: Engine, user_id: int) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+    """동기화된 로컬 원장의 (최근 거래, 월별 분석), 원장이 없으면 None
+
+    동기화가 별도 세션으로 커밋하므로 그 이후 스냅샷을 읽도록 새 세션에서 조회
+    """
+    with Session(engine) as session:
+        if not LedgerSyncService.has_synced_ledger(session, user_id):
+            return None
+        return (
+            LedgerSyncService.get_recent_transactions(session, user_id, 10),
+            LedgerSyncService.get_monthly_summary(session, user_id, ANALYSIS_MONTHS)
+        )
+
+async def _sync_local_ledger(db: Session, user_key: str) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+    """로컬 원장을 동기화하고, 원장을 사용할 수 있으면 (최근 거래, 월별 분석) 반환
+
+    동기 세션 작업은 모두 스레드풀에서 실행해 이벤트 루프를 막지 않음
+    """
+    user = await run_in_threadpool(_find_user, db, user_key)
+    if not user:
+        return None
+
+    try:
+        # 최근에 동기화한 계좌는 건너뛰므로 대부분의 요청에서 업스트림 호출 없음
+        await asyncio.wait_for(
+            LedgerSyncService.sync_user(db, user, max_age=settings.LEDGER_SYNC_INTERVAL),
+            SECTION_TIME_BUDGETS["recent_transactions"]
+        )
+    except Exception as e:
+        logger.warning(f"대시보드 원장 동기화 실패 (기존 원장 사용): {str(e)}")
+
+    return await run_in_threadpool(_read_local_ledger, db.get_bind(), user.id)
 
 @router.get("/dashboard")
-async def get_home_dashboard(user_key: str):
+async def get_home_dashboard(user_key: str, db: Session = Depends(get_session)):
     """홈화면 대시보드 정보 조회"""
+    # 요청 단위 조회 계획: 같은 SSAFY 조회는 한 번만 실행
+    plan = SSAFYFetchPlan(ssafy_service)
     try:
         print(f"🏠 홈화면 대시보드 조회: {user_key}")
         
-        # 1. 계좌 요약 정보
-        print("1️⃣ 계좌 요약 정보 조회...")
-        account_summary = await get_account_summary(user_key)
-        
-        # 2. 최근 거래 내역
-        print("2️⃣ 최근 거래 내역 조회...")
-        recent_transactions = await get_recent_transactions(user_key, limit=10)
-        
-        # 3. 재무 현황
-        print("3️⃣ 재무 현황 조회...")
-        financial_status = await get_financial_status(user_key)
+        # 거래 내역 기반 섹션은 동기화된 로컬 원장이 있으면 SQL로 조회
+        local_ledger = await _sync_local_ledger(db, user_key)
+        if local_ledger is not None:
+            recent_transactions, monthly_analysis = local_ledger
+            recent_transactions_section = _completed(recent_transactions)
+        else:
+            recent_transactions_section = get_recent_transactions(user_key, limit=10, plan=plan)
+            monthly_analysis = None
+        
+        # 1~4. 계좌 요약 / 최근 거래 / 재무 현황 / 추천 상품을 동시에 조회
+        sections = {
+            "account_summary": get_account_summary(user_key, plan),
+            "recent_transactions": recent_transactions_section,
+            "financial_status": get_financial_status(user_key, plan, monthly_analysis),
+            "recommended_products": get_recommended_products(user_key, plan)
+        }
+        results = await asyncio.gather(
+            *[_run_section(name, section) for name, section in sections.items()]
+        )
+        section_data = {name: data for name, (data, _) in zip(sections, results)}
+        partial_sections = [name for name, (_, completed) in zip(sections, results) if not completed]
         
-        # 4. 추천 상품
-        print("4️⃣ 추천 상품 조회...")
-        recommended_products = await get_recommended_products(user_key)
+        account_summary = section_data["account_summary"]
+        recent_transactions = section_data["recent_transactions"]
         
         # 5. 대시보드 응답 생성
         dashboard_data = {
@@ -47,11 +181,13 @@ async def get_home_dashboard(user_key: str):
             "timestamp": datetime.now().isoformat(),
             "account_summary": account_summary,
             "recent_transactions": recent_transactions,
-            "financial_status": financial_status,
-            "recommended_products": recommended_products
+            "financial_status": section_data["financial_status"],
+            "recommended_products": section_data["recommended_products"],
+            "partial": bool(partial_sections),
+            "partial_sections": partial_sections
         }
         
-        print(f"✅ 홈화면 대시보드 조회 완료")
+        logger.debug(f"홈화면 대시보드 조회 완료 (SSAFY 조회 {plan.fetch_count}건)")
         print(f"   총 계좌 수: {account_summary['total_accounts']}개")
         print(f"   총 자산: {account_summary['total_balance']:,}원")
         print(f"   최근 거래: {len(recent_transactions)}건")
@@ -61,110 +197,55 @@ async def get_home_dashboard(user_key: str):
     except Exception as e:
         logger.error(f"홈화면 대시보드 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"대시보드 조회 중 오류가 발생했습니다: {str(e)}")
+    finally:
+        plan.close()
+
+async def get_account_summary(user_key: str, plan: Optional[SSAFYFetchPlan] = None) -> Dict[str, Any]:
+    """계좌 요약 정보 조회 (요청 내 한 번만 계산)"""
+    plan = plan or SSAFYFetchPlan(ssafy_service)
+    return await plan.run_once(("account_summary", user_key), lambda: _build_account_summary(user_key, plan))
 
-async def get_account_summary(user_key: str) -> Dict[str, Any]:
-    """계좌 요약 정보 조회"""
+def _amount(value: Any) -> int:
     try:
-        # 수시입출금 계좌
-        demand_accounts = ssafy_service.get_demand_deposit_accounts(user_key)
-        demand_account_list = demand_accounts.get('dataSearch', {}).get('content', [])
-        
-        # 예금 계좌
-        deposit_accounts = ssafy_service.get_deposit_accounts(user_key)
-        deposit_account_list = deposit_accounts.get('dataSearch', {}).get('content', [])
-        
-        # 적금 계좌
-        savings_accounts = ssafy_service.get_savings_accounts(user_key)
-        savings_account_list = savings_accounts.get('dataSearch', {}).get('content', [])
-        
-        # 대출 계좌
-        loan_accounts = ssafy_service.get_loan_accounts(user_key)
-        loan_account_list = loan_accounts.get('dataSearch', {}).get('content', [])
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+async def _account_lists(user_key: str, plan: SSAFYFetchPlan) -> Dict[str, List[Dict[str, Any]]]:
+    """계좌구분별 계좌 목록 동시 조회 (구분별로 실패하면 빈 목록)"""
+    responses = await asyncio.gather(*[
+        _try_fetch(plan, method_name, user_key) for _, method_name, _ in ACCOUNT_LISTS
+    ])
+    return {
+        account_type: extract_records(response) if response else []
+        for (account_type, _, _), response in zip(ACCOUNT_LISTS, responses)
+    }
+
+async def _build_account_summary(user_key: str, plan: SSAFYFetchPlan) -> Dict[str, Any]:
+    """계좌 요약 정보 계산 (계좌 목록 응답의 잔액을 사용하므로 계좌별 잔액 조회 없음)"""
+    try:
+        account_lists = await _account_lists(user_key, plan)
         
-        # 계좌별 잔액 계산
         total_balance = 0
-        account_details = []
-        
-        # 수시입출금 계좌 잔액
-        for account in demand_account_list:
-            try:
-                balance_info = ssafy_service.get_account_balance(
-                    account.get('accountNo'), 
-                    user_key
-                )
-                if balance_info.get('success'):
-                    balance = balance_info.get('data', {}).get('balance', 0)
-                    total_balance += balance
-                    account_details.append({
-                        'account_no': account.get('accountNo'),
-                        'account_name': account.get('accountName'),
-                        'account_type': '수시입출금',
-                        'balance': balance,
-                        'bank_name': account.get('bankName', 'N/A')
-                    })
-            except Exception as e:
-                print(f"⚠️ 계좌 {account.get('accountNo')} 잔액 조회 실패: {str(e)}")
-        
-        # 예금 계좌 잔액
-        for account in deposit_account_list:
-            try:
-                balance_info = ssafy_service.get_deposit_account_balance(
-                    account.get('accountNo'), 
-                    user_key
-                )
-                if balance_info.get('success'):
-                    balance = balance_info.get('data', {}).get('balance', 0)
-                    total_balance += balance
-                    account_details.append({
-                        'account_no': account.get('accountNo'),
-                        'account_name': account.get('accountName'),
-                        'account_type': '예금',
-                        'balance': balance,
-                        'bank_name': account.get('bankName', 'N/A')
-                    })
-            except Exception as e:
-                print(f"⚠️ 예금 계좌 {account.get('accountNo')} 잔액 조회 실패: {str(e)}")
-        
-        # 적금 계좌 잔액
-        for account in savings_account_list:
-            try:
-                balance_info = ssafy_service.get_savings_account_balance(
-                    account.get('accountNo'), 
-                    user_key
-                )
-                if balance_info.get('success'):
-                    balance = balance_info.get('data', {}).get('balance', 0)
-                    total_balance += balance
-                    account_details.append({
-                        'account_no': account.get('accountNo'),
-                        'account_name': account.get('accountName'),
-                        'account_type': '적금',
-                        'balance': balance,
-                        'bank_name': account.get('bankName', 'N/A')
-                    })
-            except Exception as e:
-                print(f"⚠️ 적금 계좌 {account.get('accountNo')} 잔액 조회 실패: {str(e)}")
-        
-        # 대출 계좌 (부채로 계산)
         total_loan = 0
-        for account in loan_account_list:
-            try:
-                balance_info = ssafy_service.get_loan_account_balance(
-                    account.get('accountNo'), 
-                    user_key
-                )
-                if balance_info.get('success'):
-                    balance = balance_info.get('data', {}).get('balance', 0)
+        account_details = []
+        for account_type, _, balance_field in ACCOUNT_LISTS:
+            for account in account_lists[account_type]:
+                balance = _amount(account.get(balance_field))
+                if account_type == '대출':
+                    # 대출 계좌 (부채로 계산, 음수로 표시)
                     total_loan += balance
-                    account_details.append({
-                        'account_no': account.get('accountNo'),
-                        'account_name': account.get('accountName'),
-                        'account_type': '대출',
-                        'balance': -balance,  # 대출은 음수로 표시
-                        'bank_name': account.get('bankName', 'N/A')
-                    })
-            except Exception as e:
-                print(f"⚠️ 대출 계좌 {account.get('accountNo')} 잔액 조회 실패: {str(e)}")
+                    balance = -balance
+                else:
+                    total_balance += balance
+                
+                account_details.append({
+                    'account_no': account.get('accountNo'),
+                    'account_name': account.get('accountName'),
+                    'account_type': account_type,
+                    'balance': balance,
+                    'bank_name': account.get('bankName', 'N/A')
+                })
         
         # 순자산 계산
         net_worth = total_balance - total_loan
@@ -176,94 +257,65 @@ async def get_account_summary(user_key: str) -> Dict[str, Any]:
             "net_worth": net_worth,
             "account_details": account_details,
             "account_counts": {
-                "demand_deposit": len(demand_account_list),
-                "deposit": len(deposit_account_list),
-                "savings": len(savings_account_list),
-                "loan": len(loan_account_list)
+                "demand_deposit": len(account_lists['수시입출금']),
+                "deposit": len(account_lists['예금']),
+                "savings": len(account_lists['적금']),
+                "loan": len(account_lists['대출'])
             }
         }
         
     except Exception as e:
         logger.error(f"계좌 요약 정보 조회 실패: {str(e)}")
-        return {
-            "total_accounts": 0,
-            "total_balance": 0,
-            "total_loan": 0,
-            "net_worth": 0,
-            "account_details": [],
-            "account_counts": {"demand_deposit": 0, "deposit": 0, "savings": 0, "loan": 0}
-        }
+        return _empty_account_summary()
+
+def _history_window() -> Tuple[str, str]:
+    """거래 내역 조회 기간 (월별 분석 첫 달 1일 ~ 오늘)
+
+    최근 거래 섹션과 월별 분석 섹션이 같은 인자로 조회하므로 요청 내 계좌별 거래 내역 조회는 한 번
+    """
+    return recent_months(ANALYSIS_MONTHS)[-1].replace("-", "") + "01", datetime.now().strftime("%Y%m%d")
 
-async def get_recent_transactions(user_key: str, limit: int = 10) -> List[Dict[str, Any]]:
+async def _demand_histories(user_key: str, plan: SSAFYFetchPlan) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """수시입출금 계좌별 (계좌, 거래 레코드 최신순) 목록 (거래 내역은 수시입출금 계좌만 제공)"""
+    demand_accounts = await plan.get_demand_deposit_accounts(user_key)
+    accounts = [account for account in extract_records(demand_accounts) if account.get('accountNo')]
+    start_date, end_date = _history_window()
+    histories = await asyncio.gather(*[
+        _try_fetch(plan, 'get_transaction_history', account['accountNo'], start_date, end_date, "A", "DESC", user_key)
+        for account in accounts
+    ])
+    return [
+        (account, extract_records(history) if history else [])
+        for account, history in zip(accounts, histories)
+    ]
+
+def _transaction_view(record: Dict[str, Any], account: Dict[str, Any]) -> Dict[str, Any]:
+    """SSAFY 거래 레코드 → 대시보드 거래 형식 (로컬 원장 조회와 같은 형식)"""
+    fields = record_fields(record)
+    return {
+        "transactionUniqueNo": fields["external_id"],
+        "transactionDate": fields["transaction_date"].isoformat(),
+        "amount": fields["amount"],
+        "memo": fields["description"],
+        "category": fields["category"],
+        "balance_after": fields["balance_after"],
+        "account_type": "수시입출금",
+        "account_name": account.get('accountName')
+    }
+
+async def get_recent_transactions(user_key: str, limit: int = 10,
+                                  plan: Optional[SSAFYFetchPlan] = None) -> List[Dict[str, Any]]:
     """최근 거래 내역 조회"""
+    plan = plan or SSAFYFetchPlan(ssafy_service)
     try:
-        all_transactions = []
-        
-        # 수시입출금 계좌 거래 내역
-        demand_accounts = ssafy_service.get_demand_deposit_accounts(user_key)
-        demand_account_list = demand_accounts.get('dataSearch', {}).get('content', [])
-        
-        for account in demand_account_list:
-            try:
-                transactions = ssafy_service.get_demand_deposit_transactions(
-                    account.get('accountNo'),
-                    user_key,
-                    limit=limit
-                )
-                
-                if transactions.get('success'):
-                    transaction_list = transactions.get('dataSearch', {}).get('content', [])
-                    for tx in transaction_list:
-                        tx['account_type'] = '수시입출금'
-                        tx['account_name'] = account.get('accountName')
-                        all_transactions.append(tx)
-            except Exception as e:
-                print(f"⚠️ 계좌 {account.get('accountNo')} 거래 내역 조회 실패: {str(e)}")
-        
-        # 예금 계좌 거래 내역
-        deposit_accounts = ssafy_service.get_deposit_accounts(user_key)
-        deposit_account_list = deposit_accounts.get('dataSearch', {}).get('content', [])
-        
-        for account in deposit_account_list:
-            try:
-                transactions = ssafy_service.get_deposit_transactions(
-                    account.get('accountNo'),
-                    user_key,
-                    limit=limit
-                )
-                
-                if transactions.get('success'):
-                    transaction_list = transactions.get('dataSearch', {}).get('content', [])
-                    for tx in transaction_list:
-                        tx['account_type'] = '예금'
-                        tx['account_name'] = account.get('accountName')
-                        all_transactions.append(tx)
-            except Exception as e:
-                print(f"⚠️ 예금 계좌 {account.get('accountNo')} 거래 내역 조회 실패: {str(e)}")
-        
-        # 적금 계좌 거래 내역
-        savings_accounts = ssafy_service.get_savings_accounts(user_key)
-        savings_account_list = savings_accounts.get('dataSearch', {}).get('content', [])
-        
-        for account in savings_account_list:
-            try:
-                transactions = ssafy_service.get_savings_transactions(
-                    account.get('accountNo'),
-                    user_key,
-                    limit=limit
-                )
-                
-                if transactions.get('success'):
-                    transaction_list = transactions.get('dataSearch', {}).get('content', [])
-                    for tx in transaction_list:
-                        tx['account_type'] = '적금'
-                        tx['account_name'] = account.get('accountName')
-                        all_transactions.append(tx)
-            except Exception as e:
-                print(f"⚠️ 적금 계좌 {account.get('accountNo')} 거래 내역 조회 실패: {str(e)}")
+        all_transactions = [
+            _transaction_view(record, account)
+            for account, records in await _demand_histories(user_key, plan)
+            for record in records[:limit]
+        ]
         
         # 날짜순으로 정렬하고 최근 거래만 반환
-        all_transactions.sort(key=lambda x: x.get('transactionDate', ''), reverse=True)
+        all_transactions.sort(key=lambda x: x['transactionDate'], reverse=True)
         
         return all_transactions[:limit]
         
@@ -271,24 +323,23 @@ async def get_recent_transactions(user_key: str, limit: int = 10) -> List[Dict[s
         logger.error(f"최근 거래 내역 조회 실패: {str(e)}")
         return []
 
-async def get_financial_status(user_key: str) -> Dict[str, Any]:
-    """재무 현황 조회"""
+async def get_financial_status(user_key: str, plan: Optional[SSAFYFetchPlan] = None,
+                               monthly_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """재무 현황 조회 (monthly_analysis가 주어지면 월별 분석 조회 생략)"""
+    plan = plan or SSAFYFetchPlan(ssafy_service)
     try:
-        # 신용등급
-        try:
-            credit_rating = ssafy_service.get_my_credit_rating(user_key)
-            credit_score = credit_rating.get('data', {}).get('creditScore', 0)
-            credit_grade = credit_rating.get('data', {}).get('creditGrade', 'N/A')
-        except Exception as e:
-            print(f"⚠️ 신용등급 조회 실패: {str(e)}")
-            credit_score = 0
-            credit_grade = 'N/A'
-        
-        # 월별 수입/지출 분석 (최근 3개월)
-        monthly_analysis = await analyze_monthly_finances(user_key)
-        
-        # 재무 목표 달성률
-        financial_goals = await calculate_financial_goals(user_key)
+        async def fetch_credit_rating() -> Tuple[int, str]:
+            # 신용등급 (추천 상품 섹션과 조회 결과 공유), SSAFY는 등급만 제공하므로 점수는 0
+            grade = await _credit_grade(user_key, plan)
+            return 0, grade or 'N/A'
+        
+        # 신용등급 / 월별 수입·지출 분석 (최근 3개월) / 재무 목표 달성률 동시 조회
+        (credit_score, credit_grade), monthly_analysis, financial_goals = await asyncio.gather(
+            fetch_credit_rating(),
+            _completed(monthly_analysis) if monthly_analysis is not None
+            else analyze_monthly_finances(user_key, plan),
+            calculate_financial_goals(user_key, plan)
+        )
         
         return {
             "credit_score": credit_score,
@@ -299,57 +350,39 @@ async def get_financial_status(user_key: str) -> Dict[str, Any]:
         
     except Exception as e:
         logger.error(f"재무 현황 조회 실패: {str(e)}")
-        return {
-            "credit_score": 0,
-            "credit_grade": "N/A",
-            "monthly_analysis": {},
-            "financial_goals": {}
-        }
+        return _empty_financial_status()
+
+async def _credit_grade(user_key: str, plan: SSAFYFetchPlan) -> Optional[str]:
+    """자산 기반 신용등급 (A~E, 조회 실패 시 None)"""
+    credit_rating = await _try_fetch(plan, 'get_my_credit_rating', user_key)
+    rec = credit_rating.get('REC') if credit_rating else None
+    return rec.get('ratingName') if isinstance(rec, dict) else None
 
-async def analyze_monthly_finances(user_key: str) -> Dict[str, Any]:
+async def analyze_monthly_finances(user_key: str, plan: Optional[SSAFYFetchPlan] = None) -> Dict[str, Any]:
     """월별 재무 분석"""
+    plan = plan or SSAFYFetchPlan(ssafy_service)
     try:
-        current_month = datetime.now()
-        monthly_data = {}
+        # 최근 3개 달력 월 (30일 단위로 빼면 31일/2월 전후에 같은 월이 겹치거나 빠짐)
+        month_keys = recent_months(ANALYSIS_MONTHS)
+        monthly_data = {
+            key: {"income": 0, "expense": 0, "net": 0}
+            for key in month_keys
+        }
         
-        for i in range(3):  # 최근 3개월
-            target_month = current_month - timedelta(days=30*i)
-            month_key = target_month.strftime("%Y-%m")
-            
-            # 해당 월의 거래 내역 분석
-            monthly_income = 0
-            monthly_expense = 0
-            
-            # 수시입출금 계좌 거래 내역에서 월별 분석
-            demand_accounts = ssafy_service.get_demand_deposit_accounts(user_key)
-            demand_account_list = demand_accounts.get('dataSearch', {}).get('content', [])
-            
-            for account in demand_accounts.get('dataSearch', {}).get('content', []):
-                try:
-                    transactions = ssafy_service.get_demand_deposit_transactions(
-                        account.get('accountNo'),
-                        user_key,
-                        limit=100  # 충분한 거래 내역 조회
-                    )
-                    
-                    if transactions.get('success'):
-                        transaction_list = transactions.get('dataSearch', {}).get('content', [])
-                        for tx in transaction_list:
-                            tx_date = tx.get('transactionDate', '')
-                            if tx_date.startswith(month_key):
-                                amount = tx.get('amount', 0)
-                                if amount > 0:
-                                    monthly_income += amount
-                                else:
-                                    monthly_expense += abs(amount)
-                except Exception as e:
-                    print(f"⚠️ 월별 재무 분석 실패: {str(e)}")
-            
-            monthly_data[month_key] = {
-                "income": monthly_income,
-                "expense": monthly_expense,
-                "net": monthly_income - monthly_expense
-            }
+        # 계좌별 거래 내역은 세 달치를 한 번만 조회하고 (최근 거래 섹션과 공유) 월별로 나눠 집계
+        for _, records in await _demand_histories(user_key, plan):
+            for record in records:
+                fields = record_fields(record)
+                month_data = monthly_data.get(month_key(fields["transaction_date"]))
+                if month_data is None:
+                    continue
+                if fields["amount"] > 0:
+                    month_data["income"] += fields["amount"]
+                else:
+                    month_data["expense"] += abs(fields["amount"])
+        
+        for month in monthly_data.values():
+            month["net"] = month["income"] - month["expense"]
         
         return monthly_data
         
@@ -357,11 +390,11 @@ async def analyze_monthly_finances(user_key: str) -> Dict[str, Any]:
         logger.error(f"월별 재무 분석 실패: {str(e)}")
         return {}
 
-async def calculate_financial_goals(user_key: str) -> Dict[str, Any]:
+async def calculate_financial_goals(user_key: str, plan: Optional[SSAFYFetchPlan] = None) -> Dict[str, Any]:
     """재무 목표 달성률 계산"""
     try:
-        # 계좌 요약 정보 조회
-        account_summary = await get_account_summary(user_key)
+        # 계좌 요약 정보 조회 (대시보드 요청 내 결과 공유)
+        account_summary = await get_account_summary(user_key, plan)
         total_balance = account_summary['total_balance']
         net_worth = account_summary['net_worth']
         
@@ -397,28 +430,27 @@ async def calculate_financial_goals(user_key: str) -> Dict[str, Any]:
         logger.error(f"재무 목표 달성률 계산 실패: {str(e)}")
         return {}
 
-async def get_recommended_products(user_key: str) -> List[Dict[str, Any]]:
+async def get_recommended_products(user_key: str, plan: Optional[SSAFYFetchPlan] = None) -> List[Dict[str, Any]]:
     """추천 상품 조회"""
+    plan = plan or SSAFYFetchPlan(ssafy_service)
     try:
         recommended = []
         
-        # 계좌 요약 정보 조회
-        account_summary = await get_account_summary(user_key)
+        # 계좌 요약 정보 조회 (대시보드 요청 내 결과 공유)
+        account_summary = await get_account_summary(user_key, plan)
         total_balance = account_summary['total_balance']
         
         # 사용 가능한 상품 조회
         try:
-            # 예금 상품
-            deposit_products = ssafy_service.get_deposit_products()
-            deposit_list = deposit_products.get('dataSearch', {}).get('content', [])
-            
-            # 적금 상품
-            savings_products = ssafy_service.get_savings_products()
-            savings_list = savings_products.get('dataSearch', {}).get('content', [])
-            
-            # 대출 상품
-            loan_products = ssafy_service.get_loan_products()
-            loan_list = loan_products.get('dataSearch', {}).get('content', [])
+            # 예금 / 적금 / 대출 상품 동시 조회
+            deposit_products, savings_products, loan_products = await asyncio.gather(
+                plan.get_deposit_products(),
+                plan.get_savings_products(),
+                plan.get_loan_products()
+            )
+            deposit_list = extract_records(deposit_products)
+            savings_list = extract_records(savings_products)
+            loan_list = extract_records(loan_products)
             
             # 추천 로직
             if total_balance < 500000:  # 50만원 미만
@@ -445,7 +477,7 @@ async def get_recommended_products(user_key: str) -> List[Dict[str, Any]]:
                 # 고금리 상품 추천
                 high_rate_products = []
                 for product in deposit_list + savings_list:
-                    rate = product.get('rate', 0)
+                    rate = float(product.get('interestRate') or 0)
                     if rate >= 4.0:  # 4% 이상
                         high_rate_products.append(product)
                 
@@ -457,20 +489,15 @@ async def get_recommended_products(user_key: str) -> List[Dict[str, Any]]:
                         'priority': 'high'
                     })
             
-            # 신용등급이 좋은 경우 대출 상품 추천
-            try:
-                credit_rating = ssafy_service.get_my_credit_rating(user_key)
-                credit_score = credit_rating.get('data', {}).get('creditScore', 0)
-                
-                if credit_score >= 700 and loan_list:  # 신용점수 700 이상
-                    recommended.append({
-                        'type': '대출',
-                        'product': loan_list[0],
-                        'reason': '우수한 신용등급으로 저금리 대출 가능',
-                        'priority': 'low'
-                    })
-            except Exception as e:
-                print(f"⚠️ 신용등급 조회 실패: {str(e)}")
+            # 신용등급이 좋은 경우 대출 상품 추천 (재무 현황 섹션과 조회 결과 공유)
+            credit_grade = await _credit_grade(user_key, plan)
+            if credit_grade in LOAN_RECOMMEND_GRADES and loan_list:
+                recommended.append({
+                    'type': '대출',
+                    'product': loan_list[0],
+                    'reason': '우수한 신용등급으로 저금리 대출 가능',
+                    'priority': 'low'
+                })
                 
         except Exception as e:
             print(f"⚠️ 상품 조회 실패: {str(e)}")
@@ -484,87 +511,76 @@ async def get_recommended_products(user_key: str) -> List[Dict[str, Any]]:
 @router.get("/account-details/{account_no}")
 async def get_account_details(account_no: str, user_key: str):
     """특정 계좌 상세 정보 조회"""
+    plan = SSAFYFetchPlan(ssafy_service)
     try:
         print(f"🔍 계좌 상세 정보 조회: {account_no}")
         
-        # 계좌 타입 확인
-        account_type = await determine_account_type(account_no, user_key)
+        # 계좌 타입 확인 (계좌 목록 응답에서 찾은 계좌 정보와 잔액 사용)
+        account_type, account_info = await find_account(account_no, user_key, plan)
         
         if account_type == "demand_deposit":
-            # 수시입출금 계좌 상세
-            account_info = ssafy_service.get_demand_deposit_account(account_no, user_key)
-            balance_info = ssafy_service.get_account_balance(account_no, user_key)
-            transactions = ssafy_service.get_demand_deposit_transactions(account_no, user_key, limit=50)
-            
+            # 수시입출금 계좌 상세 (거래 내역은 월별 분석과 같은 기간)
+            start_date, end_date = _history_window()
+            transactions = await ssafy_service.get_transaction_history(account_no, start_date, end_date, "A", "DESC", user_key)
         elif account_type == "deposit":
-            # 예금 계좌 상세
-            account_info = ssafy_service.get_deposit_account(account_no, user_key)
-            balance_info = ssafy_service.get_deposit_account_balance(account_no, user_key)
-            transactions = ssafy_service.get_deposit_transactions(account_no, user_key, limit=50)
-            
+            # 예금 계좌 납입 내역
+            transactions = await ssafy_service.get_deposit_payment(account_no, user_key)
         elif account_type == "savings":
-            # 적금 계좌 상세
-            account_info = ssafy_service.get_savings_account(account_no, user_key)
-            balance_info = ssafy_service.get_savings_account_balance(account_no, user_key)
-            transactions = ssafy_service.get_savings_transactions(account_no, user_key, limit=50)
-            
+            # 적금 계좌 납입 내역
+            transactions = await ssafy_service.get_savings_payment(account_no, user_key)
         elif account_type == "loan":
-            # 대출 계좌 상세
-            account_info = ssafy_service.get_loan_account(account_no, user_key)
-            balance_info = ssafy_service.get_loan_account_balance(account_no, user_key)
-            transactions = ssafy_service.get_loan_transactions(account_no, user_key, limit=50)
-            
+            # 대출 계좌 상환 내역
+            transactions = await ssafy_service.get_repayment_records(account_no, user_key)
         else:
             raise HTTPException(status_code=400, detail="계좌 타입을 확인할 수 없습니다.")
         
-        # 응답 데이터 구성
+        _, balance_field = ACCOUNT_DETAIL_TYPES[account_type]
         response_data = {
             "success": True,
             "account_no": account_no,
             "account_type": account_type,
-            "account_info": account_info.get('dataSearch', {}).get('content', [{}])[0] if account_info.get('success') else {},
-            "balance_info": balance_info.get('data', {}) if balance_info.get('success') else {},
-            "transactions": transactions.get('dataSearch', {}).get('content', []) if transactions.get('success') else []
+            "account_info": account_info,
+            "balance_info": {"balance": _amount(account_info.get(balance_field))},
+            "transactions": _detail_records(transactions)
         }
         
         print(f"✅ 계좌 상세 정보 조회 완료: {account_no}")
         
         return response_data
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"계좌 상세 정보 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"계좌 상세 정보 조회 중 오류가 발생했습니다: {str(e)}")
+    finally:
+        plan.close()
+
+def _detail_records(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """거래/납입/상환 내역 레코드 (예금·적금은 paymentInfo, 대출은 repaymentRecords)"""
+    rec = response.get('REC')
+    if isinstance(rec, dict):
+        for key in ('paymentInfo', 'repaymentRecords'):
+            if isinstance(rec.get(key), list):
+                return rec[key]
+    return extract_records(response)
+
+async def find_account(account_no: str, user_key: str,
+                       plan: Optional[SSAFYFetchPlan] = None) -> Tuple[str, Dict[str, Any]]:
+    """계좌구분별 목록에서 계좌 찾기 (계좌 타입, 목록의 계좌 정보), 없으면 ("unknown", {})"""
+    plan = plan or SSAFYFetchPlan(ssafy_service)
+    account_lists = await _account_lists(user_key, plan)
+    for account_type, (list_type, _) in ACCOUNT_DETAIL_TYPES.items():
+        for account in account_lists[list_type]:
+            if account.get('accountNo') == account_no:
+                return account_type, account
+    return "unknown", {}
 
 async def determine_account_type(account_no: str, user_key: str) -> str:
     """계좌 타입 확인"""
     try:
-        # 각 계좌 타입별로 조회 시도
-        try:
-            ssafy_service.get_demand_deposit_account(account_no, user_key)
-            return "demand_deposit"
-        except:
-            pass
-        
-        try:
-            ssafy_service.get_deposit_account(account_no, user_key)
-            return "deposit"
-        except:
-            pass
-        
-        try:
-            ssafy_service.get_savings_account(account_no, user_key)
-            return "savings"
-        except:
-            pass
-        
-        try:
-            ssafy_service.get_loan_account(account_no, user_key)
-            return "loan"
-        except:
-            pass
-        
-        return "unknown"
-        
+        account_type, _ = await find_account(account_no, user_key)
+        return account_type
     except Exception as e:
         logger.error(f"계좌 타입 확인 실패: {str(e)}")
         return "unknown"
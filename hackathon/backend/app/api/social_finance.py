@@ -10,14 +10,14 @@ import logging
 import random
 import uuid
 
-from ..services.ssafy_api_service import SSAFYAPIService
+from ..services.ssafy_api_service import AsyncSSAFYAPIService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/social", tags=["Social Finance"])
+router = APIRouter(prefix="/social", tags=["Social Finance"])
 
 # SSAFY API 서비스 인스턴스
-ssafy_service = SSAFYAPIService()
+ssafy_service = AsyncSSAFYAPIService()
 
 # 임시 데이터 저장 (실제로는 데이터베이스 사용)
 friends_db = {}
@@ -184,7 +184,7 @@ async def request_transfer(
             # SSAFY API를 통한 실제 송금 처리 (시뮬레이션)
             try:
                 # 출금 처리
-                withdrawal_result = ssafy_service.withdraw_from_account(
+                withdrawal_result = await ssafy_service.withdraw_from_account(
                     account_no, amount, memo, from_user_id
                 )
                 
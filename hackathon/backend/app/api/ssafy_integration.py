@@ -8,14 +8,19 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import logging
 
-from ..services.ssafy_api_service import SSAFYAPIService
+from .auth_v2 import get_current_user_async
+from ..models.user import UserResponse
+from ..services.ssafy_api_service import AsyncSSAFYAPIService
+from ..services.ssafy_catalog_cache import catalog_cache
+from ..services.ssafy_resilience import circuit_breaker_stats
+from ..services.ssafy_single_flight import ssafy_single_flight
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ssafy", tags=["SSAFY API Integration"])
 
 # SSAFY API 서비스 인스턴스
-ssafy_service = SSAFYAPIService()
+ssafy_service = AsyncSSAFYAPIService()
 
 # ==================== 학생 인증 API ====================
 
@@ -25,7 +30,7 @@ async def verify_ssafy_student(email: str = Body(..., embed=True)):
     try:
         print(f"🔍 SSAFY API로 학생 이메일 검증 시작: {email}")
         
-        result = ssafy_service.verify_ssafy_student(email)
+        result = await ssafy_service.verify_ssafy_student(email)
         
         if result.get("is_valid"):
             print(f"✅ SSAFY 학생 검증 성공: {email}")
@@ -71,7 +76,7 @@ async def verify_ssafy_email(email: str = Body(..., embed=True)):
     try:
         print(f"🔍 SSAFY API로 학생 이메일 검증 시작: {email}")
         
-        result = ssafy_service.verify_ssafy_student(email)
+        result = await ssafy_service.verify_ssafy_student(email)
         
         if result.get("is_valid"):
             print(f"✅ SSAFY 학생 검증 성공: {email}")
@@ -117,7 +122,7 @@ async def create_ssafy_account(email: str = Body(..., embed=True)):
     try:
         print(f"🏭 SSAFY API로 계정 생성 시작: {email}")
         
-        result = ssafy_service.create_user_account(email)
+        result = await ssafy_service.create_user_account(email)
         
         print(f"✅ SSAFY 계정 생성 성공: {email}")
         print(f"✅ 생성된 계정 정보: {result}")
@@ -157,7 +162,7 @@ async def get_ssafy_integration_status():
         print("🔍 SSAFY API 통합 상태 확인 시작")
         
         # 간단한 API 호출로 상태 확인
-        bank_codes = ssafy_service.get_bank_codes()
+        bank_codes = await ssafy_service.get_bank_codes()
         
         print("✅ SSAFY API 통합 상태 확인 성공")
         return {
@@ -198,7 +203,7 @@ async def get_ssafy_integration_status():
 async def get_bank_codes():
     """은행코드 조회"""
     try:
-        result = ssafy_service.get_bank_codes()
+        result = await ssafy_service.get_bank_codes()
         return {
             "success": True,
             "data": result
@@ -211,7 +216,7 @@ async def get_bank_codes():
 async def get_currency_codes():
     """통화코드 조회"""
     try:
-        result = ssafy_service.get_currency_codes()
+        result = await ssafy_service.get_currency_codes()
         return {
             "success": True,
             "data": result
@@ -226,7 +231,7 @@ async def get_currency_codes():
 async def get_demand_deposit_products():
     """수시입출금 상품 조회"""
     try:
-        result = ssafy_service.get_demand_deposit_products()
+        result = await ssafy_service.get_demand_deposit_products()
         return {
             "success": True,
             "data": result
@@ -243,7 +248,7 @@ async def create_demand_deposit_product(
 ):
     """수시입출금 상품 등록"""
     try:
-        result = ssafy_service.create_demand_deposit_product(
+        result = await ssafy_service.create_demand_deposit_product(
             bank_code, account_name, account_description
         )
         return {
@@ -258,7 +263,7 @@ async def create_demand_deposit_product(
 async def get_demand_deposit_accounts(user_key: str):
     """수시입출금 계좌 목록 조회"""
     try:
-        result = ssafy_service.get_demand_deposit_accounts(user_key)
+        result = await ssafy_service.get_demand_deposit_accounts(user_key)
         return {
             "success": True,
             "data": result
@@ -271,7 +276,7 @@ async def get_demand_deposit_accounts(user_key: str):
 async def get_demand_deposit_account(account_no: str, user_key: str):
     """수시입출금 계좌 조회(단건)"""
     try:
-        result = ssafy_service.get_demand_deposit_account(account_no, user_key)
+        result = await ssafy_service.get_demand_deposit_account(account_no, user_key)
         return {
             "success": True,
             "data": result
@@ -284,7 +289,7 @@ async def get_demand_deposit_account(account_no: str, user_key: str):
 async def get_account_balance(account_no: str, user_key: str):
     """계좌 잔액 조회"""
     try:
-        result = ssafy_service.get_account_balance(account_no, user_key)
+        result = await ssafy_service.get_account_balance(account_no, user_key)
         return {
             "success": True,
             "data": result
@@ -309,7 +314,7 @@ async def get_transaction_history(
         if not end_date:
             end_date = datetime.now().strftime("%Y%m%d")
             
-        result = ssafy_service.get_transaction_history(
+        result = await ssafy_service.get_transaction_history(
             account_no, start_date, end_date, transaction_type, order_by, user_key
         )
         return {
@@ -329,7 +334,7 @@ async def withdraw_from_account(
 ):
     """계좌 출금"""
     try:
-        result = ssafy_service.withdraw_from_account(account_no, amount, summary, user_key)
+        result = await ssafy_service.withdraw_from_account(account_no, amount, summary, user_key)
         return {
             "success": True,
             "data": result
@@ -347,7 +352,7 @@ async def deposit_to_account(
 ):
     """계좌 입금"""
     try:
-        result = ssafy_service.deposit_to_account(account_no, amount, summary, user_key)
+        result = await ssafy_service.deposit_to_account(account_no, amount, summary, user_key)
         return {
             "success": True,
             "data": result
@@ -365,7 +370,7 @@ async def transfer_between_accounts(
 ):
     """계좌 이체"""
     try:
-        result = ssafy_service.transfer_between_accounts(from_account, to_account, amount, user_key)
+        result = await ssafy_service.transfer_between_accounts(from_account, to_account, amount, user_key)
         return {
             "success": True,
             "data": result
@@ -380,7 +385,7 @@ async def transfer_between_accounts(
 async def get_deposit_products():
     """예금 상품 조회"""
     try:
-        result = ssafy_service.get_deposit_products()
+        result = await ssafy_service.get_deposit_products()
         return {
             "success": True,
             "data": result
@@ -402,7 +407,7 @@ async def create_deposit_product(
 ):
     """예금 상품 등록"""
     try:
-        result = ssafy_service.create_deposit_product(
+        result = await ssafy_service.create_deposit_product(
             bank_code, account_name, subscription_period, min_balance, 
             max_balance, interest_rate, account_description, rate_description
         )
@@ -418,7 +423,7 @@ async def create_deposit_product(
 async def get_deposit_accounts(user_key: str):
     """예금 계좌 목록 조회"""
     try:
-        result = ssafy_service.get_deposit_accounts(user_key)
+        result = await ssafy_service.get_deposit_accounts(user_key)
         return {
             "success": True,
             "data": result
@@ -433,7 +438,7 @@ async def get_deposit_accounts(user_key: str):
 async def get_savings_products():
     """적금 상품 조회"""
     try:
-        result = ssafy_service.get_savings_products()
+        result = await ssafy_service.get_savings_products()
         return {
             "success": True,
             "data": result
@@ -455,7 +460,7 @@ async def create_savings_product(
 ):
     """적금 상품 등록"""
     try:
-        result = ssafy_service.create_savings_product(
+        result = await ssafy_service.create_savings_product(
             bank_code, account_name, subscription_period, min_balance, 
             max_balance, interest_rate, account_description, rate_description
         )
@@ -471,7 +476,7 @@ async def create_savings_product(
 async def get_savings_accounts(user_key: str):
     """적금 계좌 목록 조회"""
     try:
-        result = ssafy_service.get_savings_accounts(user_key)
+        result = await ssafy_service.get_savings_accounts(user_key)
         return {
             "success": True,
             "data": result
@@ -486,7 +491,7 @@ async def get_savings_accounts(user_key: str):
 async def get_credit_rating_criteria():
     """신용등급 기준 조회"""
     try:
-        result = ssafy_service.get_credit_rating_criteria()
+        result = await ssafy_service.get_credit_rating_criteria()
         return {
             "success": True,
             "data": result
@@ -499,7 +504,7 @@ async def get_credit_rating_criteria():
 async def get_loan_products():
     """대출 상품 조회"""
     try:
-        result = ssafy_service.get_loan_products()
+        result = await ssafy_service.get_loan_products()
         return {
             "success": True,
             "data": result
@@ -521,7 +526,7 @@ async def create_loan_product(
 ):
     """대출 상품 등록"""
     try:
-        result = ssafy_service.create_loan_product(
+        result = await ssafy_service.create_loan_product(
             bank_code, account_name, rating_unique_no, loan_period,
             min_balance, max_balance, interest_rate, account_description
         )
@@ -537,7 +542,7 @@ async def create_loan_product(
 async def get_my_credit_rating(user_key: str):
     """내 신용등급 조회"""
     try:
-        result = ssafy_service.get_my_credit_rating(user_key)
+        result = await ssafy_service.get_my_credit_rating(user_key)
         return {
             "success": True,
             "data": result
@@ -550,7 +555,7 @@ async def get_my_credit_rating(user_key: str):
 async def get_loan_applications(user_key: str):
     """대출심사 목록 조회"""
     try:
-        result = ssafy_service.get_loan_applications(user_key)
+        result = await ssafy_service.get_loan_applications(user_key)
         return {
             "success": True,
             "data": result
@@ -563,7 +568,7 @@ async def get_loan_applications(user_key: str):
 async def get_loan_accounts(user_key: str):
     """대출 계좌 목록 조회"""
     try:
-        result = ssafy_service.get_loan_accounts(user_key)
+        result = await ssafy_service.get_loan_accounts(user_key)
         return {
             "success": True,
             "data": result
@@ -582,7 +587,7 @@ async def open_account_auth(
 ):
     """1원 송금 (계좌 인증)"""
     try:
-        result = ssafy_service.open_account_auth(account_no, auth_text, user_key)
+        result = await ssafy_service.open_account_auth(account_no, auth_text, user_key)
         return {
             "success": True,
             "data": result
@@ -600,7 +605,7 @@ async def check_auth_code(
 ):
     """1원 송금 검증"""
     try:
-        result = ssafy_service.check_auth_code(account_no, auth_text, auth_code, user_key)
+        result = await ssafy_service.check_auth_code(account_no, auth_text, auth_code, user_key)
         return {
             "success": True,
             "data": result
@@ -620,7 +625,7 @@ async def add_transaction_memo(
 ):
     """거래내역 메모"""
     try:
-        result = ssafy_service.add_transaction_memo(
+        result = await ssafy_service.add_transaction_memo(
             account_no, transaction_unique_no, transaction_memo, user_key
         )
         return {
@@ -637,7 +642,7 @@ async def add_transaction_memo(
 async def get_user_financial_summary(user_key: str):
     """사용자 금융 현황 요약"""
     try:
-        result = ssafy_service.get_user_financial_summary(user_key)
+        result = await ssafy_service.get_user_financial_summary(user_key)
         return {
             "success": True,
             "data": result
@@ -653,7 +658,7 @@ async def get_recent_transactions(
 ):
     """최근 거래내역 조회"""
     try:
-        result = ssafy_service.get_recent_transactions(user_key, days)
+        result = await ssafy_service.get_recent_transactions(user_key, days)
         return {
             "success": True,
             "data": result
@@ -668,7 +673,7 @@ async def get_recent_transactions(
 async def issue_api_key(manager_id: str = Body(..., embed=True)):
     """앱 API KEY 발급"""
     try:
-        result = ssafy_service.issue_api_key(manager_id)
+        result = await ssafy_service.issue_api_key(manager_id)
         return {
             "success": True,
             "data": result
@@ -681,7 +686,7 @@ async def issue_api_key(manager_id: str = Body(..., embed=True)):
 async def reissue_api_key(manager_id: str = Body(..., embed=True)):
     """앱 API KEY 재발급"""
     try:
-        result = ssafy_service.reissue_api_key(manager_id)
+        result = await ssafy_service.reissue_api_key(manager_id)
         return {
             "success": True,
             "data": result
@@ -690,6 +695,41 @@ async def reissue_api_key(manager_id: str = Body(..., embed=True)):
         logger.error(f"API KEY 재발급 실패: {str(e)}")
         raise HTTPException(status_code=400, detail=f"API KEY 재발급 실패: {str(e)}")
 
+# ==================== 카탈로그 캐시 API ====================
+
+@router.get("/catalog-cache")
+async def get_catalog_cache_stats():
+    """상품/코드 카탈로그 캐시 통계 (hit/miss/갱신 횟수)"""
+    return {
+        "success": True,
+        "data": catalog_cache.stats()
+    }
+
+@router.delete("/catalog-cache")
+async def invalidate_catalog_cache(current_user: UserResponse = Depends(get_current_user_async)):
+    """상품/코드 카탈로그 캐시 전체 무효화 (시딩 스크립트 실행 후 사용, 로그인 필요)"""
+    catalog_cache.invalidate()
+    return {
+        "success": True,
+        "message": "카탈로그 캐시가 무효화되었습니다."
+    }
+
+@router.get("/single-flight")
+async def get_single_flight_stats():
+    """동일 조회 공유 통계 (업스트림 호출 수 / 공유된 호출 수)"""
+    return {
+        "success": True,
+        "data": ssafy_single_flight.stats()
+    }
+
+@router.get("/circuit-breakers")
+async def get_circuit_breaker_stats():
+    """엔드포인트별 서킷 브레이커 상태"""
+    return {
+        "success": True,
+        "data": circuit_breaker_stats()
+    }
+
 # ==================== 상태 확인 API ====================
 
 @router.get("/health")
@@ -697,7 +737,7 @@ async def health_check():
     """SSAFY API 연동 상태 확인"""
     try:
         # 간단한 API 호출로 상태 확인
-        bank_codes = ssafy_service.get_bank_codes()
+        bank_codes = await ssafy_service.get_bank_codes()
         return {
             "success": True,
             "status": "healthy",
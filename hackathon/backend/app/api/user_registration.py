@@ -9,7 +9,7 @@ from datetime import datetime
 import logging
 import random
 
-from ..services.ssafy_api_service import SSAFYAPIService
+from ..services.ssafy_api_service import AsyncSSAFYAPIService
 from ..models.user import User
 from ..db.session import get_session
 from sqlalchemy.orm import Session
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/registration", tags=["User Registration"])
 
 # SSAFY API 서비스 인스턴스
-ssafy_service = SSAFYAPIService()
+ssafy_service = AsyncSSAFYAPIService()
 
 class UserRegistrationRequest:
     """사용자 회원가입 요청"""
@@ -54,7 +54,7 @@ async def register_user_with_account(
         
         # 1. SSAFY 학생 인증
         print("1️⃣ SSAFY 학생 인증...")
-        student_verification = ssafy_service.verify_ssafy_student(email)
+        student_verification = await ssafy_service.verify_ssafy_student(email)
         
         if not student_verification.get('is_valid'):
             raise HTTPException(status_code=400, detail="SSAFY 학생 인증에 실패했습니다.")
@@ -64,13 +64,13 @@ async def register_user_with_account(
         # 2. SSAFY API 사용자 계정 생성
         print("2️⃣ SSAFY API 사용자 계정 생성...")
         try:
-            user_account_result = ssafy_service.create_user_account(email)
+            user_account_result = await ssafy_service.create_user_account(email)
             if user_account_result.get('success'):
                 user_key = user_account_result.get('data', {}).get('userKey')
                 print(f"✅ SSAFY API 계정 생성 성공: {user_key}")
             else:
                 # 이미 존재하는 계정인 경우 조회
-                user_search_result = ssafy_service.search_user_account(email)
+                user_search_result = await ssafy_service.search_user_account(email)
                 if user_search_result.get('success'):
                     user_key = user_search_result.get('data', {}).get('userKey')
                     print(f"✅ 기존 SSAFY API 계정 사용: {user_key}")
@@ -80,7 +80,7 @@ async def register_user_with_account(
             print(f"⚠️ SSAFY API 계정 생성 실패, 기존 계정 조회 시도: {str(e)}")
             # 기존 계정 조회 시도
             try:
-                user_search_result = ssafy_service.search_user_account(email)
+                user_search_result = await ssafy_service.search_user_account(email)
                 if user_search_result.get('success'):
                     user_key = user_search_result.get('data', {}).get('userKey')
                     print(f"✅ 기존 SSAFY API 계정 사용: {user_key}")
@@ -91,7 +91,7 @@ async def register_user_with_account(
         
         # 3. 수시입출금 상품 조회 및 선택
         print("3️⃣ 수시입출금 상품 조회...")
-        demand_products = ssafy_service.get_demand_deposit_products()
+        demand_products = await ssafy_service.get_demand_deposit_products()
         available_products = demand_products.get('dataSearch', {}).get('content', [])
         
         if not available_products:
@@ -114,7 +114,7 @@ async def register_user_with_account(
         if not account_type_unique_no:
             raise HTTPException(status_code=400, detail="상품 ID를 찾을 수 없습니다.")
         
-        account_result = ssafy_service.create_demand_deposit_account(
+        account_result = await ssafy_service.create_demand_deposit_account(
             account_type_unique_no, 
             user_key
         )
@@ -130,7 +130,7 @@ async def register_user_with_account(
         welcome_amount = 100000  # 10만원 환영 금액
         
         try:
-            deposit_result = ssafy_service.deposit_to_account(
+            deposit_result = await ssafy_service.deposit_to_account(
                 account_no,
                 welcome_amount,
                 "Campus Credo 환영 금액",
@@ -181,19 +181,19 @@ async def check_account_status(user_key: str):
         print(f"🔍 계좌 상태 확인: {user_key}")
         
         # 1. 수시입출금 계좌 목록 조회
-        demand_accounts = ssafy_service.get_demand_deposit_accounts(user_key)
+        demand_accounts = await ssafy_service.get_demand_deposit_accounts(user_key)
         demand_account_list = demand_accounts.get('dataSearch', {}).get('content', [])
         
         # 2. 예금 계좌 목록 조회
-        deposit_accounts = ssafy_service.get_deposit_accounts(user_key)
+        deposit_accounts = await ssafy_service.get_deposit_accounts(user_key)
         deposit_account_list = deposit_accounts.get('dataSearch', {}).get('content', [])
         
         # 3. 적금 계좌 목록 조회
-        savings_accounts = ssafy_service.get_savings_accounts(user_key)
+        savings_accounts = await ssafy_service.get_savings_accounts(user_key)
         savings_account_list = savings_accounts.get('dataSearch', {}).get('content', [])
         
         # 4. 대출 계좌 목록 조회
-        loan_accounts = ssafy_service.get_loan_accounts(user_key)
+        loan_accounts = await ssafy_service.get_loan_accounts(user_key)
         loan_account_list = loan_accounts.get('dataSearch', {}).get('content', [])
         
         # 5. 계좌별 잔액 조회
@@ -201,7 +201,7 @@ async def check_account_status(user_key: str):
         
         for account in demand_account_list:
             try:
-                balance_info = ssafy_service.get_account_balance(
+                balance_info = await ssafy_service.get_account_balance(
                     account.get('accountNo'), 
                     user_key
                 )
@@ -220,7 +220,7 @@ async def check_account_status(user_key: str):
         
         # 6. 신용등급 조회
         try:
-            credit_rating = ssafy_service.get_my_credit_rating(user_key)
+            credit_rating = await ssafy_service.get_my_credit_rating(user_key)
             credit_score = credit_rating.get('data', {}).get('creditScore', 0)
             credit_grade = credit_rating.get('data', {}).get('creditGrade', 'N/A')
         except Exception as e:
@@ -267,21 +267,21 @@ async def create_additional_account(
         
         if account_type == "deposit":
             # 예금 계좌 생성
-            result = ssafy_service.create_deposit_account(
+            result = await ssafy_service.create_deposit_account(
                 user_key,  # 출금 계좌 (수시입출금)
                 product_id,
                 amount
             )
         elif account_type == "savings":
             # 적금 계좌 생성
-            result = ssafy_service.create_savings_account(
+            result = await ssafy_service.create_savings_account(
                 product_id,
                 amount,
                 user_key  # 출금 계좌 (수시입출금)
             )
         elif account_type == "loan":
             # 대출 계좌 생성
-            result = ssafy_service.create_loan_account(
+            result = await ssafy_service.create_loan_account(
                 product_id,
                 amount,
                 user_key  # 출금 계좌 (수시입출금)
@@ -316,10 +316,10 @@ async def get_available_products():
         print("🏦 사용 가능한 금융 상품 목록 조회...")
         
         # 모든 상품 타입 조회
-        demand_products = ssafy_service.get_demand_deposit_products()
-        deposit_products = ssafy_service.get_deposit_products()
-        savings_products = ssafy_service.get_savings_products()
-        loan_products = ssafy_service.get_loan_products()
+        demand_products = await ssafy_service.get_demand_deposit_products()
+        deposit_products = await ssafy_service.get_deposit_products()
+        savings_products = await ssafy_service.get_savings_products()
+        loan_products = await ssafy_service.get_loan_products()
         
         response_data = {
             "success": True,
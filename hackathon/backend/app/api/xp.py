@@ -1,19 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
-from ..models.xp import XPAddRequest, XPResponse, UserProgress
+from ..models.xp import XPAddRequest, XPResponse, UserProgress, XPBatchRequest, XPBatchResponse
 from ..services.xp_service import XPService
-from ..db.session import get_session
-from ..api.auth_v2 import get_current_user
+from ..db.session import get_async_session
+from ..api.auth_v2 import get_current_user_async
 from ..models.user import User
 
 router = APIRouter()
 
 @router.get("/xp/progress/{user_id}", response_model=UserProgress)
-async def get_user_progress(user_id: int, session: Session = Depends(get_session)):
+async def get_user_progress(user_id: int, session: AsyncSession = Depends(get_async_session)):
     """사용자 크레도 진행률 조회"""
     try:
-        progress = XPService.get_user_progress(user_id)
+        progress = await XPService.get_user_progress_async(session, user_id)
         return progress
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"진행률 조회 실패: {str(e)}")
@@ -21,15 +22,16 @@ async def get_user_progress(user_id: int, session: Session = Depends(get_session
 @router.post("/xp/add", response_model=XPResponse)
 async def add_credo_for_activity(
     payload: XPAddRequest, 
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_async)
 ):
     """활동에 따른 크레도 점수 추가"""
     try:
         # 인증된 사용자의 ID 사용
         user_id = current_user.id
         
-        response = XPService.add_credo_for_activity(
+        # 행 잠금/RETURNING 트랜잭션은 동기 작업 단위로 스레드풀에서 실행 (이벤트 루프를 막지 않음)
+        response = await run_in_threadpool(
+            XPService.add_credo_for_activity,
             user_id=user_id,
             activity_type=payload.activity_type,
             description=payload.description,
@@ -39,14 +41,29 @@ async def add_credo_for_activity(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"크레도 점수 추가 실패: {str(e)}")
 
+@router.post("/xp/add-batch", response_model=XPBatchResponse)
+async def add_credo_batch(
+    payload: XPBatchRequest,
+    current_user: User = Depends(get_current_user_async)
+):
+    """여러 활동의 크레도 점수를 한 번에 추가 (같은 idempotency_key는 한 번만 적립)"""
+    try:
+        return await run_in_threadpool(
+            XPService.add_credo_batch,
+            user_id=current_user.id,
+            items=payload.items
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"크레도 점수 일괄 추가 실패: {str(e)}")
+
 @router.get("/xp/me", response_model=UserProgress)
 async def get_my_progress(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
 ):
     """현재 로그인한 사용자의 크레도 진행률 조회"""
     try:
-        progress = XPService.get_user_progress(current_user.id)
+        progress = await XPService.get_user_progress_async(session, current_user.id)
         return progress
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"진행률 조회 실패: {str(e)}")
@@ -55,11 +72,12 @@ async def get_my_progress(
 async def deduct_credo_for_deletion(
     post_id: str,
     description: str = "크로니클 포스트 삭제",
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_async)
 ):
     """포스트 삭제 시 크레도 점수 차감"""
     try:
-        response = XPService.deduct_credo_for_post_deletion(
+        response = await run_in_threadpool(
+            XPService.deduct_credo_for_post_deletion,
             user_id=current_user.id,
             post_id=post_id,
             description=description
@@ -69,10 +87,25 @@ async def deduct_credo_for_deletion(
         raise HTTPException(status_code=500, detail=f"크레도 점수 차감 실패: {str(e)}")
 
 @router.get("/xp/leaderboard", response_model=List[dict])
-async def get_leaderboard(limit: int = 10, session: Session = Depends(get_session)):
-    """크레도 점수 기반 리더보드"""
+async def get_leaderboard(
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+):
+    """누적 크레도 기반 리더보드"""
     try:
-        leaderboard = XPService.get_leaderboard(limit)
+        leaderboard = XPService.get_leaderboard(limit, offset)
         return leaderboard
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"리더보드 조회 실패: {str(e)}")
+
+@router.get("/xp/leaderboard/me", response_model=dict)
+async def get_my_rank(
+    above: int = Query(5, ge=0, le=50),
+    below: int = Query(5, ge=0, le=50),
+    current_user: User = Depends(get_current_user_async)
+):
+    """내 순위와 위/아래 사용자"""
+    result = XPService.get_my_rank(current_user.id, above, below)
+    if result is None:
+        raise HTTPException(status_code=404, detail="크레도 기록이 없어 순위가 없습니다")
+    return result
@@ -9,12 +9,62 @@ class Settings:
     JWT_SECRET: str = os.getenv("JWT_SECRET", "dev-secret")
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./hackathon.db")
 
+    # 데이터베이스 엔진 (PostgreSQL URL도 사용 가능, SQLite는 아래 PRAGMA 적용)
+    DATABASE_ECHO: bool = os.getenv("DATABASE_ECHO", "false").lower() == "true"  # 모든 SQL 로그 출력 (디버깅용)
+    DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", "10"))  # 유지할 커넥션 수
+    DATABASE_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))  # 풀 초과 시 추가로 열 수 있는 커넥션 수
+    DATABASE_POOL_TIMEOUT: float = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))  # 커넥션 대기 시간 (초)
+    DATABASE_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))  # 서버 DB 커넥션 재연결 주기 (초)
+    DATABASE_SLOW_QUERY_MS: float = float(os.getenv("DATABASE_SLOW_QUERY_MS", "200"))  # 이 시간 이상 걸린 쿼리 경고 로그 (0은 끔)
+    SYNC_DB_ON_EVENT_LOOP: str = os.getenv("SYNC_DB_ON_EVENT_LOOP", "warn")  # 이벤트 루프 스레드에서 동기 엔진 쿼리 실행 시: warn(경고 로그) / raise(예외) / off
+    DATABASE_ASYNC_URL: str = os.getenv("DATABASE_ASYNC_URL", "")  # 비동기 엔진 URL (비우면 DATABASE_URL에서 aiosqlite/asyncpg 드라이버로 변환)
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")  # WAL에서는 NORMAL로도 커밋 일관성 유지
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))  # 잠금 대기 시간 ("database is locked" 방지)
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))  # 커넥션당 페이지 캐시 (KiB)
+    SQLITE_MMAP_SIZE_MB: int = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))  # 메모리 맵 크기 (MiB)
+    DATABASE_AUTO_MIGRATE: bool = os.getenv("DATABASE_AUTO_MIGRATE", "true").lower() == "true"  # 시작 시 남은 마이그레이션 자동 적용
+    MIGRATION_BATCH_SIZE: int = int(os.getenv("MIGRATION_BATCH_SIZE", "1000"))  # backfill 배치당 행 수
+
     # SSAFY(신한) 로그인 API
     SSAFY_LOGIN_URL: str = os.getenv("SSAFY_LOGIN_URL", "https://finopenapi.ssafy.io/ssafy/api/v1/member/")
     SSAFY_API_BASE_URL: str = os.getenv("SSAFY_API_BASE_URL", "https://finopenapi.ssafy.io/ssafy/api/v1")
     SSAFY_EMAIL_CHECK_URL: str = os.getenv("SSAFY_EMAIL_CHECK_URL", "https://finopenapi.ssafy.io/ssafy/api/v1/member/search")
     SSAFY_API_KEY: str = os.getenv("SSAFY_API_KEY", "1924d3d047eb472ab5a81df01977485c")
 
+    # SSAFY API 비동기 전송 설정 (프로세스당 하나의 keep-alive 커넥션 풀 공유)
+    SSAFY_HTTP_POOL_SIZE: int = int(os.getenv("SSAFY_HTTP_POOL_SIZE", "100"))  # 풀 최대 커넥션 수
+    SSAFY_HTTP_KEEPALIVE: float = float(os.getenv("SSAFY_HTTP_KEEPALIVE", "30.0"))  # 유휴 커넥션 유지 시간 (초)
+    SSAFY_HTTP_TIMEOUT: float = float(os.getenv("SSAFY_HTTP_TIMEOUT", "30.0"))  # 요청 타임아웃 (초)
+    SSAFY_MAX_CONCURRENCY: int = int(os.getenv("SSAFY_MAX_CONCURRENCY", "32"))  # 동시 진행 가능한 은행 호출 수
+
+    # SSAFY API 장애 대응 (서킷 브레이커 / 조회 API 재시도 / 요청 기한)
+    SSAFY_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("SSAFY_BREAKER_FAILURE_THRESHOLD", "5"))  # 연속 실패 시 차단
+    SSAFY_BREAKER_RESET_TIMEOUT: float = float(os.getenv("SSAFY_BREAKER_RESET_TIMEOUT", "30.0"))  # 차단 후 시험 호출까지 대기 (초)
+    SSAFY_RETRY_ATTEMPTS: int = int(os.getenv("SSAFY_RETRY_ATTEMPTS", "2"))  # inquire* API 재시도 횟수
+    SSAFY_RETRY_BASE_DELAY: float = float(os.getenv("SSAFY_RETRY_BASE_DELAY", "0.2"))  # 재시도 백오프 기준 (초)
+    SSAFY_RETRY_MAX_DELAY: float = float(os.getenv("SSAFY_RETRY_MAX_DELAY", "2.0"))  # 재시도 백오프 상한 (초)
+    REQUEST_DEADLINE: float = float(os.getenv("REQUEST_DEADLINE", "15.0"))  # 인바운드 요청 기한 (초, X-Request-Timeout 헤더로 단축 가능)
+
+    # SSAFY API 호출 트레이싱 (app.ssafy.trace 로거로 구조화 로그 출력)
+    SSAFY_TRACE_ENABLED: bool = os.getenv("SSAFY_TRACE_ENABLED", "false").lower() == "true"
+    SSAFY_TRACE_SAMPLE_RATE: float = float(os.getenv("SSAFY_TRACE_SAMPLE_RATE", "0.1"))  # 기록할 호출 비율 (0~1)
+    SSAFY_TRACE_BODIES: bool = os.getenv("SSAFY_TRACE_BODIES", "false").lower() == "true"  # 요청/응답 본문 포함 여부
+
+    # SSAFY 상품/코드 카탈로그 캐시 (초 단위)
+    SSAFY_CATALOG_TTL: float = float(os.getenv("SSAFY_CATALOG_TTL", "300"))  # 캐시를 그대로 반환하는 시간
+    SSAFY_CATALOG_STALE_TTL: float = float(os.getenv("SSAFY_CATALOG_STALE_TTL", "3600"))  # TTL 이후 캐시 반환 + 백그라운드 갱신 시간
+
+    # SSAFY 거래내역 → 로컬 원장 동기화
+    LEDGER_SYNC_INTERVAL: float = float(os.getenv("LEDGER_SYNC_INTERVAL", "60"))  # 계좌별 최소 동기화 간격 (초)
+    LEDGER_SYNC_INITIAL_DAYS: int = int(os.getenv("LEDGER_SYNC_INITIAL_DAYS", "365"))  # 최초 동기화 시 조회 기간 (일)
+
+    # 크로니클 피드
+    CHRONICLE_FANOUT_FOLLOWER_LIMIT: int = int(os.getenv("CHRONICLE_FANOUT_FOLLOWER_LIMIT", "1000"))  # 팔로워가 이보다 많은 작성자는 쓰기 시 전파 대신 읽기 시 병합
+    CHRONICLE_PUBLIC_FEED_TTL: float = float(os.getenv("CHRONICLE_PUBLIC_FEED_TTL", "5"))  # 공개 피드 캐시 최대 사용 시간 (초, 다른 워커의 쓰기 반영 지연 상한)
+    CHRONICLE_PUBLIC_FEED_CACHE_PAGES: int = int(os.getenv("CHRONICLE_PUBLIC_FEED_CACHE_PAGES", "32"))  # 캐시할 공개 피드 페이지 수
+    CHRONICLE_SEARCH_RANK_WINDOW: int = int(os.getenv("CHRONICLE_SEARCH_RANK_WINDOW", "10000"))  # 관련도순 검색에서 순위를 매길 최근 일치 포스트 수
+
     # 공공데이터포털 API
     OPENDATA_API_KEY: str = os.getenv("OPENDATA_API_KEY", "YOUR_API_KEY_HERE")
     
@@ -0,0 +1,106 @@
+"""
+응답 직렬화
+- AppJSONResponse: 앱 기본 응답 클래스 (orjson, 없으면 표준 json)
+- to_response / to_response_list: ORM 객체를 응답 모델 필드 구성 그대로 dict로 변환
+  응답 모델별 필드 접근자를 한 번 만들어 캐시해 두고, Pydantic 모델 생성/검증 없이 값만 옮긴다.
+- fast_response: 변환한 dict를 바로 응답으로 반환해 response_model 재검증/jsonable_encoder를 건너뜀
+  (response_model은 API 문서용으로 유지)
+"""
+
+import json
+import operator
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:  # 빠른 JSON 인코더, 없으면 표준 json으로 처리
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """orjson/json이 직접 처리하지 못하는 값"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 변환할 수 없는 타입: {type(value).__name__}")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps_json(content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+else:
+    _encoder = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default)
+
+    def dumps_json(content: Any) -> bytes:
+        return _encoder.encode(content).encode("utf-8")
+
+
+class AppJSONResponse(JSONResponse):
+    """앱 기본 JSON 응답 (FastAPI(default_response_class=...))"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+# ORM → 응답 dict 변환
+
+FieldAccessor = Tuple[str, Callable[[Any], Any]]
+
+
+def _model_class(annotation: Any) -> Optional[Type[BaseModel]]:
+    return annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else None
+
+
+def _field_accessor(name: str, annotation: Any) -> Callable[[Any], Any]:
+    """필드 하나의 값을 꺼내는 함수 (중첩 응답 모델/목록은 재귀 변환, float 필드는 int → float)"""
+    get = operator.attrgetter(name)
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is typing.Union and type(None) in args:
+        inner = [arg for arg in args if arg is not type(None)]
+        if len(inner) == 1:
+            convert = _field_accessor(name, inner[0])
+            return lambda obj: None if get(obj) is None else convert(obj)
+
+    nested = _model_class(annotation)
+    if nested is not None:
+        return lambda obj: to_response(nested, get(obj))
+    if origin in (list, List) and args and _model_class(args[0]) is not None:
+        item_model = args[0]
+        return lambda obj: to_response_list(item_model, get(obj))
+    if annotation is float:
+        return lambda obj: float(get(obj))
+    return get
+
+
+@lru_cache(maxsize=None)
+def _accessors(model: Type[BaseModel]) -> Tuple[FieldAccessor, ...]:
+    return tuple((name, _field_accessor(name, field.annotation)) for name, field in model.model_fields.items())
+
+
+def to_response(model: Type[BaseModel], obj: Any) -> Dict[str, Any]:
+    """obj(ORM 객체 등)에서 응답 모델 필드만 꺼내 dict로 변환 (검증 없음)"""
+    return {name: accessor(obj) for name, accessor in _accessors(model)}
+
+
+def to_response_list(model: Type[BaseModel], objs: Iterable[Any]) -> List[Dict[str, Any]]:
+    accessors = _accessors(model)
+    return [{name: accessor(obj) for name, accessor in accessors} for obj in objs]
+
+
+def fast_response(content: Any, status_code: int = 200) -> AppJSONResponse:
+    """이미 응답 모델 형태로 만든 content를 그대로 응답 (response_model 재검증 생략)"""
+    return AppJSONResponse(content, status_code=status_code)
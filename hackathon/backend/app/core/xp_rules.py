@@ -1,40 +1,168 @@
 import math
-from typing import Tuple, Dict
+import threading
+from bisect import bisect_right
+from typing import Tuple, Dict, List, Optional, Sequence
+
+import numpy as np  # 전체 UserXP 재계산(레벨 곡선 조정)용 벡터 연산
 
 BASE_CREDO = 100  # 기본 크레도 요구량
 MULTIPLIER = 1.2  # 레벨별 증가 배수
 
+_INT64_LIMIT = 2 ** 62  # 이보다 큰 누적 크레도는 int64 벡터 대신 bisect로 처리
 
-def compute_credo_to_next(level: int) -> int:
-    """다음 레벨까지 필요한 크레도 점수 계산"""
+
+def _credo_to_next_formula(level: int, base_credo: int, multiplier: float) -> int:
     if level <= 1:
-        return BASE_CREDO
-    return math.ceil(BASE_CREDO * (MULTIPLIER ** (level - 1)))
+        return base_credo
+    return math.ceil(base_credo * (multiplier ** (level - 1)))
+
+
+class LevelCurve:
+    """레벨 곡선 하나의 누적 임계값 테이블
+
+    thresholds[i] = 레벨 i+1에 도달하는 데 필요한 누적 크레도 (thresholds[0] = 0은 레벨 1),
+    필요한 만큼만 잠금 아래에서 뒤에 덧붙여 늘리므로 다른 스레드가 읽는 도중에도 기존 값은 바뀌지 않는다.
+    """
+
+    def __init__(self, base_credo: int = BASE_CREDO, multiplier: float = MULTIPLIER, levels: int = 100):
+        self.base_credo = base_credo
+        self.multiplier = multiplier
+        self.thresholds: List[int] = [0]
+        self.credo_to_next: List[int] = []
+        self._lock = threading.Lock()
+        self.extend(level=levels)
+
+    def _needs(self, level: Optional[int], total: Optional[int]) -> bool:
+        return (level is not None and len(self.credo_to_next) < level) or (
+            total is not None and self.thresholds[-1] <= total
+        )
+
+    def extend(self, level: Optional[int] = None, total: Optional[int] = None) -> None:
+        """level까지 또는 누적 total을 넘는 레벨까지 테이블 확장"""
+        if not self._needs(level, total):
+            return
+        with self._lock:
+            while self._needs(level, total):
+                credo_to_next = _credo_to_next_formula(len(self.credo_to_next) + 1, self.base_credo, self.multiplier)
+                self.thresholds.append(self.thresholds[-1] + credo_to_next)
+                self.credo_to_next.append(credo_to_next)
+
+    def int64_levels(self, max_total: int) -> int:
+        """누적 max_total까지 int64 벡터 연산에 쓸 레벨 수 (범위를 넘으면 0, bisect로 처리)
+
+        곡선 전체가 아니라 필요한 구간만 보므로 다른 호출이 테이블을 크게 늘려도 벡터 연산을 계속 쓴다.
+        """
+        if max_total >= _INT64_LIMIT:
+            return 0
+        return bisect_right(self.thresholds, max_total)
+
+
+# 현재 레벨 곡선 (configure가 새 곡선을 만든 뒤 참조만 바꾸므로, 각 함수는 처음 읽은 곡선 하나로 계산)
+_curve = LevelCurve()
+
+
+def current_curve() -> LevelCurve:
+    return _curve
+
+
+def configure(base_credo: int = BASE_CREDO, multiplier: float = MULTIPLIER,
+              curve: Optional[LevelCurve] = None) -> LevelCurve:
+    """레벨 곡선 변경 (새 테이블을 다 계산한 뒤 한 번에 교체, curve를 주면 그 곡선으로 교체)"""
+    global _curve
+    _curve = curve or LevelCurve(base_credo, multiplier)
+    return _curve
+
+
+def compute_credo_to_next(level: int, curve: Optional[LevelCurve] = None) -> int:
+    """다음 레벨까지 필요한 크레도 점수 계산"""
+    curve = curve or _curve
+    level = max(level, 1)
+    curve.extend(level=level)
+    return curve.credo_to_next[level - 1]
+
+
+def total_credo(level: int, credo: int, curve: Optional[LevelCurve] = None) -> int:
+    """레벨업에 사용한 누적 크레도 + 현재 레벨의 잔여 크레도"""
+    curve = curve or _curve
+    level = max(level, 1)
+    curve.extend(level=level)
+    return curve.thresholds[level - 1] + credo
+
+
+def level_for_total(total: int, curve: Optional[LevelCurve] = None) -> Tuple[int, int]:
+    """누적 크레도로 (레벨, 잔여 크레도) 계산 (0 미만은 0으로)"""
+    curve = curve or _curve
+    total = max(total, 0)
+    curve.extend(total=total)
+    level = bisect_right(curve.thresholds, total)
+    return level, total - curve.thresholds[level - 1]
 
 
 def add_credo(current_level: int, current_credo: int, delta: int) -> Tuple[int, int, int, bool]:
-    """크레도 점수 추가 및 레벨업 처리"""
-    credo = current_credo + delta
-    level = current_level
-    leveled = False
-    
-    # 레벨업 체크
-    while credo >= compute_credo_to_next(level):
-        credo -= compute_credo_to_next(level)
-        level += 1
-        leveled = True
-    
-    return level, credo, compute_credo_to_next(level), leveled
+    """크레도 점수 추가 및 레벨업 처리
+
+    누적 임계값 테이블에서 이분 탐색하므로 delta가 커도 O(log n),
+    음수 delta는 레벨 다운까지 반영하고 누적 크레도는 0 미만으로 내려가지 않는다.
+    """
+    curve = _curve
+    level, credo = level_for_total(total_credo(current_level, current_credo, curve) + delta, curve)
+    return level, credo, compute_credo_to_next(level, curve), level > current_level
 
 
 def to_response(level: int, credo: int) -> Dict[str, int | float]:
     """응답 데이터 생성"""
     credo_to_next = compute_credo_to_next(level)
     progress = (credo / credo_to_next * 100) if credo_to_next > 0 else 100
-    
+
     return {
         "level": level,
         "credo": credo,
         "credo_to_next": credo_to_next,
         "progress": progress
     }
+
+
+def resolve_totals(totals: Sequence[int], curve: Optional[LevelCurve] = None) -> Dict[str, list]:
+    """누적 크레도 목록을 레벨/잔여 크레도/다음 레벨 요구량/진행률로 한 번에 변환
+
+    NumPy searchsorted로 전체를 벡터 연산하고, 누적 크레도가 int64 범위를 넘는 곡선만 항목별 bisect로 처리한다.
+    """
+    curve = curve or _curve
+    if not len(totals):
+        return {"level": [], "credo": [], "credo_to_next": [], "progress": []}
+    max_total = max(max(totals), 0)
+    curve.extend(total=max_total)
+    count = curve.int64_levels(max_total)
+
+    if not count:
+        levels, credos = zip(*(level_for_total(total, curve) for total in totals))
+        credo_to_next = [curve.credo_to_next[level - 1] for level in levels]
+        progress = [credo / need * 100 for credo, need in zip(credos, credo_to_next)]
+        return {"level": list(levels), "credo": list(credos), "credo_to_next": credo_to_next, "progress": progress}
+
+    thresholds = np.asarray(curve.thresholds[:count], dtype=np.int64)
+    values = np.maximum(np.asarray(totals, dtype=np.int64), 0)
+    levels = np.searchsorted(thresholds, values, side="right")
+    credos = values - thresholds[levels - 1]
+    credo_to_next = np.asarray(curve.credo_to_next[:count], dtype=np.int64)[levels - 1]
+    return {
+        "level": levels.tolist(),
+        "credo": credos.tolist(),
+        "credo_to_next": credo_to_next.tolist(),
+        "progress": (credos / credo_to_next * 100).tolist(),
+    }
+
+
+def totals_for(levels: Sequence[int], credos: Sequence[int], curve: Optional[LevelCurve] = None) -> List[int]:
+    """(레벨, 잔여 크레도) 목록을 누적 크레도 목록으로 변환"""
+    curve = curve or _curve
+    if not len(levels):
+        return []
+    max_level = max(max(levels), 1)
+    curve.extend(level=max_level)
+    if curve.thresholds[max_level - 1] + max(max(credos), 0) >= _INT64_LIMIT:
+        return [total_credo(level, credo, curve) for level, credo in zip(levels, credos)]
+    thresholds = np.asarray(curve.thresholds[:max_level], dtype=np.int64)
+    index = np.maximum(np.asarray(levels, dtype=np.int64), 1) - 1
+    return (thresholds[index] + np.asarray(credos, dtype=np.int64)).tolist()
+
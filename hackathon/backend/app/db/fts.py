@@ -0,0 +1,91 @@
+"""
+SQLite FTS5 전문 검색용 한글 바이그램 토큰화
+
+FTS5 기본 토크나이저(unicode61)는 공백 기준으로 자르므로 "장학금을"로 저장된 글을 "장학금"으로 찾을 수 없다.
+인덱스에 넣기 전에 한글 연속 구간을 겹치는 두 글자(바이그램)로 바꿔 공백으로 이어 두고,
+검색어도 같은 방식으로 바꿔 인접한 바이그램 구(phrase)로 찾는다.
+  "장학금을 받았다" → "장학 학금 금을 을 받았 았다 다"
+각 구간의 마지막 글자도 따로 넣어 한 글자 검색어(접두어 검색)가 어느 위치의 글자든 찾도록 한다.
+영문/숫자는 소문자 단어 그대로 넣고 검색 시 접두어로 찾는다.
+
+트리거가 인덱스 텍스트를 만들 수 있도록 install_search_functions로 SQLite 커넥션마다 함수를 등록한다
+(create_app_engine / create_async_app_engine의 커넥션에는 자동 등록).
+토큰화 규칙을 바꾸면 기존 인덱스와 맞지 않으므로 새 마이그레이션으로 인덱스를 다시 만들어야 한다.
+"""
+
+import json
+import re
+from typing import Any, Iterator, List, Optional
+
+_HANGUL = "가-힣ㄱ-ㆎ"
+_TERM_PIECES = re.compile(rf"[{_HANGUL}]+|[^\W{_HANGUL}_]+")
+_IS_HANGUL = re.compile(rf"[{_HANGUL}]")
+
+# 검색어 단어 수 상한 (MATCH 식이 과도하게 길어지지 않도록)
+MAX_QUERY_TERMS = 8
+
+
+def _tokens(text: str) -> Iterator[str]:
+    for piece in _TERM_PIECES.findall(text):
+        if _IS_HANGUL.match(piece):
+            for i in range(len(piece) - 1):
+                yield piece[i:i + 2]
+            yield piece[-1]
+        else:
+            yield piece.lower()
+
+
+def index_text(*values: Optional[str]) -> str:
+    """인덱스에 저장할 토큰 문자열 (값들을 이어서 토큰화)"""
+    return " ".join(token for value in values if value for token in _tokens(value))
+
+
+def _json_strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _json_strings(item)
+
+
+def json_index_text(raw: Optional[str]) -> str:
+    """JSON 컬럼 텍스트의 문자열 값만 토큰화 (키/숫자는 제외, 깨진 JSON은 빈 문자열)"""
+    if not raw:
+        return ""
+    try:
+        return index_text(*_json_strings(json.loads(raw)))
+    except ValueError:
+        return ""
+
+
+def match_expression(query: str) -> Optional[str]:
+    """검색어 → FTS5 MATCH 식 (단어별 구를 AND로 결합, 검색할 토큰이 없으면 None)
+
+    한글 두 글자 이상은 바이그램을 그대로 이은 구("장학 학금")로 찾고,
+    영문/숫자나 한 글자로 끝나는 단어는 마지막 토큰을 접두어로 찾는다("ssa"*, "금"*).
+    토큰은 글자/숫자로만 이루어지므로 따옴표 안에 넣어도 FTS5 문법과 충돌하지 않는다.
+    """
+    phrases: List[str] = []
+    for term in query.split()[:MAX_QUERY_TERMS]:
+        pieces = _TERM_PIECES.findall(term)
+        if not pieces:
+            continue
+        tokens: List[str] = []
+        for piece in pieces:
+            if _IS_HANGUL.match(piece) and len(piece) > 1:
+                tokens.extend(piece[i:i + 2] for i in range(len(piece) - 1))
+            else:
+                tokens.append(piece.lower())
+        last = pieces[-1]
+        prefix = not _IS_HANGUL.match(last) or len(last) == 1
+        phrases.append(f'"{" ".join(tokens)}"' + ("*" if prefix else ""))
+    return " AND ".join(phrases) or None
+
+
+def install_search_functions(dbapi_connection) -> None:
+    """검색 인덱스 트리거가 호출하는 SQL 함수 등록 (SQLite 커넥션)"""
+    dbapi_connection.create_function("search_index_text", 1, index_text, deterministic=True)
+    dbapi_connection.create_function("search_json_index_text", 1, json_index_text, deterministic=True)
@@ -0,0 +1,11 @@
+"""
+버전 관리되는 스키마 마이그레이션
+
+    python -m app.db.migrations upgrade      # 최신 버전까지 적용
+    python -m app.db.migrations current      # 현재/최신 버전
+    python -m app.db.migrations history      # 적용 기록
+"""
+
+from .runner import current_version, ensure_schema, history, latest_version, upgrade
+
+__all__ = ["current_version", "ensure_schema", "history", "latest_version", "upgrade"]
@@ -0,0 +1,30 @@
+"""
+마이그레이션 CLI (python -m app.db.migrations [upgrade|current|history])
+"""
+
+import argparse
+import logging
+
+from ..session import engine
+from . import current_version, history, latest_version, upgrade
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션")
+    parser.add_argument("command", choices=["upgrade", "current", "history"], nargs="?", default="upgrade")
+    parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == "upgrade":
+        applied = upgrade(engine, args.target)
+        print(f"✅ 적용: {applied or '없음'} (현재 버전 {current_version(engine)})")
+    elif args.command == "current":
+        print(f"현재 버전 {current_version(engine)} / 최신 버전 {latest_version()}")
+    else:
+        for row in history(engine):
+            print(f"{row['version']:04d}  {row['applied_at']}  {row['duration_ms']}ms  {row['description']}")
+
+
+if __name__ == "__main__":
+    main()
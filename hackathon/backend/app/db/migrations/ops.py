@@ -0,0 +1,138 @@
+"""
+마이그레이션 작업 도우미
+모든 작업은 이미 적용된 상태면 건너뛰므로 create_all로 만든 기존 DB나 중간에 중단된 마이그레이션에도 다시 실행할 수 있다.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import Column, Index, MetaData, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+logger = logging.getLogger(__name__)
+
+
+def has_table(connection: Connection, table_name: str) -> bool:
+    return inspect(connection).has_table(table_name)
+
+
+def column_names(connection: Connection, table_name: str) -> set:
+    return {column["name"] for column in inspect(connection).get_columns(table_name)}
+
+
+def add_column(connection: Connection, table_name: str, column_name: str, column_type: str) -> bool:
+    """nullable 컬럼 추가 (이미 있으면 건너뜀)
+
+    여러 워커가 같은 TRANSACTIONAL = False 마이그레이션을 동시에 실행할 수 있으므로
+    PostgreSQL은 IF NOT EXISTS로, SQLite는 다른 워커가 먼저 추가해 실패하면 다시 확인해 건너뛴다.
+    """
+    if not has_table(connection, table_name) or column_name in column_names(connection, table_name):
+        return False
+    if connection.dialect.name == "postgresql":
+        connection.execute(text(f'ALTER TABLE "{table_name}" ADD COLUMN IF NOT EXISTS "{column_name}" {column_type}'))
+        return True
+    try:
+        connection.execute(text(f'ALTER TABLE "{table_name}" ADD COLUMN "{column_name}" {column_type}'))
+    except OperationalError:
+        if column_name in column_names(connection, table_name):
+            return False
+        raise
+    return True
+
+
+def table_index(table_name: str, name: str, columns: Sequence[str], unique: bool = False) -> Index:
+    """마이그레이션에 고정한 인덱스 정의 (앱 모델을 읽지 않고 테이블/컬럼 이름만으로 생성)"""
+    table = Table(table_name, MetaData(), *(Column(column) for column in columns))
+    return Index(name, *(table.c[column] for column in columns), unique=unique)
+
+
+def create_index(engine: Engine, index: Index) -> bool:
+    """인덱스 생성 (이미 있거나 컬럼이 없으면 건너뜀)
+
+    PostgreSQL은 CREATE INDEX CONCURRENTLY로 쓰기를 막지 않고 만들고,
+    SQLite는 인덱스 하나당 짧은 트랜잭션으로 만들어 쓰기 잠금 시간을 최소화한다.
+    기존 데이터에 중복이 있어 유니크 인덱스를 만들 수 없으면 마이그레이션을 실패시킨다
+    (ON CONFLICT 대상/중복 방지가 유니크 인덱스에 의존하므로 일반 인덱스로 대체하지 않음).
+    PostgreSQL에서 실패한 CONCURRENTLY가 남긴 INVALID 인덱스는 지우고 다시 만든다.
+    """
+    table = index.table
+    if engine.dialect.name == "postgresql":
+        _drop_invalid_index(engine, index.name)
+    with engine.connect() as connection:
+        if not has_table(connection, table.name):
+            return False
+        inspector = inspect(connection)
+        if index.name in {existing["name"] for existing in inspector.get_indexes(table.name)}:
+            return False
+        if not {column.name for column in index.columns} <= column_names(connection, table.name):
+            logger.warning(f"인덱스 {index.name} 건너뜀: {table.name} 테이블에 컬럼 없음")
+            return False
+
+    columns = ", ".join(f'"{column.name}"' for column in index.columns)
+    started = time.monotonic()
+    try:
+        _execute_index_ddl(engine, index.name, table.name, columns, index.unique)
+    except IntegrityError as error:
+        if engine.dialect.name == "postgresql":
+            _drop_invalid_index(engine, index.name)
+        raise RuntimeError(
+            f"유니크 인덱스 {index.name} 생성 실패: {table.name} ({columns})에 중복 행이 있습니다. "
+            "중복을 정리한 뒤 마이그레이션을 다시 실행하세요"
+        ) from error
+    logger.info(f"인덱스 {index.name} 생성 ({time.monotonic() - started:.2f}초)")
+    return True
+
+
+def _drop_invalid_index(engine: Engine, name: str) -> None:
+    """실패한 CREATE INDEX CONCURRENTLY가 남긴 INVALID 인덱스 삭제 (PostgreSQL)"""
+    with engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        invalid = connection.execute(text(
+            "SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+            "WHERE pg_class.relname = :name AND NOT pg_index.indisvalid"
+        ), {"name": name}).first()
+        if invalid:
+            logger.warning(f"INVALID 인덱스 {name} 삭제 후 다시 생성")
+            connection.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+
+def _execute_index_ddl(engine: Engine, name: str, table_name: str, columns: str, unique: bool) -> None:
+    unique_sql = "UNIQUE " if unique else ""
+    if engine.dialect.name == "postgresql":
+        # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+        with engine.connect() as connection:
+            connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+            connection.execute(text(
+                f'CREATE {unique_sql}INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table_name}" ({columns})'
+            ))
+        return
+    with engine.begin() as connection:
+        connection.execute(text(f'CREATE {unique_sql}INDEX IF NOT EXISTS "{name}" ON "{table_name}" ({columns})'))
+
+
+def backfill_in_batches(engine: Engine, table_name: str, statement: str, batch_size: int,
+                        params: Optional[Dict[str, Any]] = None, pause: float = 0.0) -> int:
+    """id 구간별 배치 backfill
+
+    statement는 :start, :end (id 범위, 양끝 포함) 파라미터를 사용하는 UPDATE/INSERT 문.
+    배치마다 별도 트랜잭션으로 커밋하므로 앱의 쓰기가 배치 사이에 끼어들 수 있고,
+    중간에 중단되어도 다시 실행하면 남은 행만 처리되도록 statement를 작성한다.
+    """
+    with engine.connect() as connection:
+        bounds = connection.execute(text(f'SELECT MIN(id), MAX(id) FROM "{table_name}"')).one()
+    if bounds[0] is None:
+        return 0
+
+    affected = 0
+    start, last = bounds
+    while start <= last:
+        end = start + batch_size - 1
+        with engine.begin() as connection:
+            result = connection.execute(text(statement), {**(params or {}), "start": start, "end": end})
+            affected += max(result.rowcount or 0, 0)
+        start = end + 1
+        if pause:
+            time.sleep(pause)
+    return affected
@@ -0,0 +1,145 @@
+"""
+스키마 마이그레이션 실행기
+적용한 버전을 schema_version 테이블에 기록하고, 현재 버전보다 높은 마이그레이션만 순서대로 실행
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from ...core.config import settings
+from .versions import MIGRATIONS
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION_TABLE = "schema_version"
+# PostgreSQL advisory lock 키 (여러 워커가 동시에 시작해도 한 프로세스만 마이그레이션)
+MIGRATION_LOCK_KEY = 72_015_301
+
+
+def latest_version() -> int:
+    return MIGRATIONS[-1].VERSION
+
+
+def current_version(bind) -> int:
+    """기록된 스키마 버전 (schema_version 테이블이 없으면 0)"""
+    try:
+        with bind.connect() as connection:
+            return _version(connection)
+    except (OperationalError, ProgrammingError):
+        return 0
+
+
+def _version(connection: Connection) -> int:
+    return connection.execute(text(f"SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE}")).scalar() or 0
+
+
+def _create_version_table(engine: Engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} ("
+            "version INTEGER PRIMARY KEY, "
+            "description VARCHAR(200) NOT NULL, "
+            "applied_at TIMESTAMP NOT NULL, "
+            "duration_ms FLOAT)"
+        ))
+
+
+@contextmanager
+def _migration_transaction(engine: Engine) -> Iterator[Connection]:
+    """마이그레이션 하나를 감싸는 잠금 트랜잭션
+
+    SQLite 드라이버는 DDL 앞에서 트랜잭션을 시작하지 않으므로 BEGIN IMMEDIATE를 직접 실행해
+    DDL과 버전 기록을 한 트랜잭션으로 묶고, 다른 워커의 마이그레이션은 쓰기 잠금에서 기다리게 한다.
+    """
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as connection:
+            connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.exec_driver_sql("ROLLBACK")
+                raise
+            connection.exec_driver_sql("COMMIT")
+        return
+
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        yield connection
+
+
+def _record(connection: Connection, migration, duration_ms: float) -> None:
+    connection.execute(
+        text(f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description, applied_at, duration_ms) "
+             "VALUES (:version, :description, :applied_at, :duration_ms)"),
+        {"version": migration.VERSION, "description": migration.DESCRIPTION,
+         "applied_at": datetime.utcnow(), "duration_ms": round(duration_ms, 1)},
+    )
+
+
+def upgrade(engine: Engine, target: Optional[int] = None) -> List[int]:
+    """target 버전(기본: 최신)까지 마이그레이션 실행, 새로 적용한 버전 목록 반환
+
+    TRANSACTIONAL 마이그레이션은 upgrade(connection)을 버전 기록과 같은 트랜잭션에서 실행하고,
+    TRANSACTIONAL = False인 마이그레이션(대용량 인덱스, 배치 backfill)은 upgrade(engine)이
+    짧은 트랜잭션을 스스로 나누어 실행한 뒤 버전을 기록한다 (중단 후 재실행해도 안전하게 작성).
+    """
+    target = target or latest_version()
+    _create_version_table(engine)
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.VERSION > target:
+            break
+        if migration.VERSION <= current_version(engine):
+            continue
+
+        started = time.monotonic()
+        logger.info(f"마이그레이션 {migration.VERSION:04d} 시작: {migration.DESCRIPTION}")
+        if getattr(migration, "TRANSACTIONAL", True):
+            with _migration_transaction(engine) as connection:
+                if _version(connection) >= migration.VERSION:
+                    continue
+                migration.upgrade(connection)
+                _record(connection, migration, (time.monotonic() - started) * 1000)
+        else:
+            migration.upgrade(engine)
+            with _migration_transaction(engine) as connection:
+                if _version(connection) >= migration.VERSION:
+                    continue
+                _record(connection, migration, (time.monotonic() - started) * 1000)
+
+        logger.info(f"마이그레이션 {migration.VERSION:04d} 완료 ({time.monotonic() - started:.2f}초)")
+        applied.append(migration.VERSION)
+    return applied
+
+
+def ensure_schema(engine: Engine) -> None:
+    """시작 시 스키마 버전 확인 (최신이면 쿼리 한 번으로 끝)"""
+    version = current_version(engine)
+    if version >= latest_version():
+        return
+    if not settings.DATABASE_AUTO_MIGRATE:
+        raise RuntimeError(
+            f"DB 스키마 버전 {version} < {latest_version()}: `python -m app.db.migrations upgrade`를 먼저 실행하세요"
+        )
+    upgrade(engine)
+
+
+def history(engine: Engine) -> List[dict]:
+    """적용된 마이그레이션 기록"""
+    try:
+        with engine.connect() as connection:
+            rows = connection.execute(text(
+                f"SELECT version, description, applied_at, duration_ms FROM {SCHEMA_VERSION_TABLE} ORDER BY version"
+            )).mappings().all()
+            return [dict(row) for row in rows]
+    except (OperationalError, ProgrammingError):
+        return []
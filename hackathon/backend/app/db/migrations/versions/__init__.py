@@ -0,0 +1,34 @@
+"""
+마이그레이션 목록 (버전 순서)
+새 마이그레이션은 mNNNN_설명.py로 추가하고 MIGRATIONS 끝에 등록
+"""
+
+from . import (
+    m0001_baseline,
+    m0002_transaction_external_id,
+    m0003_hot_lookup_indexes,
+    m0004_backfill_user_xp,
+    m0005_xp_activity_idempotency,
+    m0006_chronicle_json_columns,
+    m0007_chronicle_feed,
+    m0008_chronicle_search,
+    m0009_user_financial_summary,
+    m0010_monthly_category_rollup,
+    m0011_transaction_external_unique,
+    m0012_user_xp_version,
+)
+
+MIGRATIONS = [
+    m0001_baseline,
+    m0002_transaction_external_id,
+    m0003_hot_lookup_indexes,
+    m0004_backfill_user_xp,
+    m0005_xp_activity_idempotency,
+    m0006_chronicle_json_columns,
+    m0007_chronicle_feed,
+    m0008_chronicle_search,
+    m0009_user_financial_summary,
+    m0010_monthly_category_rollup,
+    m0011_transaction_external_unique,
+    m0012_user_xp_version,
+]
@@ -0,0 +1,299 @@
+"""
+기준 스키마: 마이그레이션 도입 시점의 테이블 (이후 모델 변경과 무관하게 고정)
+기존에 create_all로 만든 DB는 없는 테이블만 추가되고 나머지는 그대로 유지된다.
+이후의 컬럼/인덱스/테이블 변경은 각 마이그레이션이 담당하므로 여기에는 추가하지 않는다.
+"""
+
+from sqlalchemy import (
+    Boolean, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, MetaData, String, Table, UniqueConstraint,
+)
+
+VERSION = 1
+DESCRIPTION = "baseline tables"
+
+metadata = MetaData()
+
+Table(
+    "financialproduct", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("product_code", String, nullable=False),
+    Column("product_name", String, nullable=False),
+    Column("product_type", String, nullable=False),
+    Column("bank_name", String, nullable=False),
+    Column("interest_rate", Float, nullable=False),
+    Column("min_amount", Integer, nullable=False),
+    Column("max_amount", Integer, nullable=False),
+    Column("term_months", Integer, nullable=False),
+    Column("description", String, nullable=True),
+    Column("features", String, nullable=True),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    UniqueConstraint("product_code"),
+)
+
+Table(
+    "university", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("english_name", String, nullable=True),
+    Column("university_type", Enum("NATIONAL", "PUBLIC", "PRIVATE", "SPECIALIZED", name="universitytype"), nullable=False),
+    Column("establishment_year", Integer, nullable=True),
+    Column("location", String, nullable=True),
+    Column("address", String, nullable=True),
+    Column("phone", String, nullable=True),
+    Column("website", String, nullable=True),
+    Column("course_page_url", String, nullable=True),
+    Column("last_crawled_at", DateTime, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_university_name", "name"),
+)
+
+Table(
+    "user", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("email", String, nullable=False),
+    Column("password_hash", String, nullable=False),
+    Column("firebase_uid", String, nullable=True),
+    Column("ssafy_user_id", String, nullable=True),
+    Column("ssafy_user_key", String, nullable=True),
+    Column("ssafy_user_name", String, nullable=True),
+    Column("ssafy_institution_code", String, nullable=True),
+    Column("display_name", String, nullable=True),
+    Column("profile_image", String, nullable=True),
+    Column("current_university", String, nullable=True),
+    Column("current_department", String, nullable=True),
+    Column("grade_level", Integer, nullable=True),
+    Column("holland_type", String, nullable=True),
+    Column("holland_score", Integer, nullable=True),
+    Column("holland_analysis_date", DateTime, nullable=True),
+    Column("is_active", Boolean, nullable=False),
+    Column("is_verified", Boolean, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Column("last_login_at", DateTime, nullable=True),
+    Index("ix_user_email", "email", unique=True),
+    Index("ix_user_firebase_uid", "firebase_uid", unique=True),
+    Index("ix_user_ssafy_user_id", "ssafy_user_id", unique=True),
+    Index("ix_user_ssafy_user_key", "ssafy_user_key"),
+)
+
+Table(
+    "academicrecord", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("user.id"), nullable=False),
+    Column("student_id", String, nullable=False),
+    Column("university", String, nullable=False),
+    Column("department", String, nullable=False),
+    Column("major", String, nullable=True),
+    Column("grade_level", Integer, nullable=False),
+    Column("semester", Integer, nullable=False),
+    Column("enrollment_status", String, nullable=False),
+    Column("total_credits", Float, nullable=False),
+    Column("required_credits", Float, nullable=False),
+    Column("gpa", Float, nullable=False),
+    Column("major_gpa", Float, nullable=True),
+    Column("expected_graduation", DateTime, nullable=True),
+    Column("graduation_date", DateTime, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+Table(
+    "bankaccount", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("user.id"), nullable=False),
+    Column("account_number", String, nullable=False),
+    Column("bank_name", String, nullable=False),
+    Column("account_type", String, nullable=False),
+    Column("account_name", String, nullable=False),
+    Column("balance", Integer, nullable=False),
+    Column("currency", String, nullable=False),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_date", DateTime, nullable=False),
+    Column("last_transaction_date", DateTime, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    UniqueConstraint("account_number"),
+    Index("ix_bankaccount_user_id", "user_id"),
+)
+
+Table(
+    "chronicle_posts", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("user.id"), nullable=False),
+    Column("type", String, nullable=False),
+    Column("title", String, nullable=False),
+    Column("description", String, nullable=True),
+    Column("timestamp", DateTime, nullable=False),
+    Column("rewards", String, nullable=True),
+    Column("user_content", String, nullable=True),
+    Index("ix_chronicle_posts_timestamp", "timestamp"),
+    Index("ix_chronicle_posts_user_timestamp", "user_id", "timestamp"),
+)
+
+Table(
+    "creditscore", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("user.id"), nullable=False),
+    Column("score", Integer, nullable=False),
+    Column("grade", String, nullable=False),
+    Column("last_updated", DateTime, nullable=False),
+    Column("credit_limit", Integer, nullable=False),
+    Column("used_credit", Integer, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_creditscore_user_id", "user_id"),
+)
+
+Table(
+    "department", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("english_name", String, nullable=True),
+    Column("university_id", Integer, ForeignKey("university.id"), nullable=False),
+    Column("college_name", String, nullable=True),
+    Column("degree_type", String, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_department_name", "name"),
+)
+
+Table(
+    "scholarship", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("user.id"), nullable=False),
+    Column("scholarship_name", String, nullable=False),
+    Column("scholarship_type", String, nullable=False),
+    Column("amount", Integer, nullable=False),
+    Column("semester", String, nullable=False),
+    Column("year", Integer, nullable=False),
+    Column("status", String, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+Table(
+    "user_xp", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("user.id"), nullable=False),
+    Column("current_level", Integer, nullable=False),
+    Column("credo_score", Integer, nullable=False),
+    Column("current_xp", Integer, nullable=False),
+    Column("total_xp", Integer, nullable=False),
+    Column("last_activity_at", DateTime, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_user_xp_credo_score", "credo_score"),
+    Index("ix_user_xp_user_id", "user_id", unique=True),
+)
+
+Table(
+    "course", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("academic_record_id", Integer, ForeignKey("academicrecord.id"), nullable=False),
+    Column("course_code", String, nullable=False),
+    Column("course_name", String, nullable=False),
+    Column("course_type", String, nullable=False),
+    Column("credits", Float, nullable=False),
+    Column("grade", String, nullable=False),
+    Column("grade_point", Float, nullable=False),
+    Column("year", Integer, nullable=False),
+    Column("semester", Integer, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+Table(
+    "ledger_sync_state", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("account_id", Integer, ForeignKey("bankaccount.id"), nullable=False),
+    Column("last_transaction_unique_no", String, nullable=True),
+    Column("last_transaction_date", String, nullable=True),
+    Column("last_synced_at", DateTime, nullable=True),
+    Column("synced_count", Integer, nullable=False),
+    UniqueConstraint("account_id"),
+)
+
+Table(
+    "transaction", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("account_id", Integer, ForeignKey("bankaccount.id"), nullable=False),
+    Column("transaction_type", String, nullable=False),
+    Column("amount", Integer, nullable=False),
+    Column("balance_after", Integer, nullable=False),
+    Column("description", String, nullable=False),
+    Column("category", String, nullable=False),
+    Column("transaction_date", DateTime, nullable=False),
+    Column("external_id", String, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_transaction_account_date", "account_id", "transaction_date"),
+)
+
+Table(
+    "universitycourse", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("course_code", String, nullable=False),
+    Column("course_name", String, nullable=False),
+    Column("english_name", String, nullable=True),
+    Column("university_id", Integer, ForeignKey("university.id"), nullable=False),
+    Column("department_id", Integer, ForeignKey("department.id"), nullable=True),
+    Column("course_type", Enum("MAJOR_REQUIRED", "MAJOR_ELECTIVE", "GENERAL_REQUIRED", "GENERAL_ELECTIVE", "TEACHING", name="coursetype"), nullable=False),
+    Column("credits", Integer, nullable=True),
+    Column("professor", String, nullable=True),
+    Column("class_times", String, nullable=True),
+    Column("classroom", String, nullable=True),
+    Column("capacity", Integer, nullable=True),
+    Column("enrolled", Integer, nullable=True),
+    Column("semester", String, nullable=False),
+    Column("grade_level", Integer, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_universitycourse_course_code", "course_code"),
+    Index("ix_universitycourse_course_name", "course_name"),
+)
+
+Table(
+    "userproduct", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("user.id"), nullable=False),
+    Column("product_id", Integer, ForeignKey("financialproduct.id"), nullable=False),
+    Column("account_id", Integer, ForeignKey("bankaccount.id"), nullable=False),
+    Column("amount", Integer, nullable=False),
+    Column("start_date", DateTime, nullable=False),
+    Column("end_date", DateTime, nullable=False),
+    Column("status", String, nullable=False),
+    Column("total_interest", Integer, nullable=False),
+    Column("last_interest_date", DateTime, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Index("ix_userproduct_user_id", "user_id"),
+)
+
+Table(
+    "xp_activity", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_xp_id", Integer, ForeignKey("user_xp.id"), nullable=False),
+    Column("activity_type", Enum("TRANSACTION", "SAVING", "INVESTMENT", "BUDGET_PLANNING", "FINANCIAL_GOAL", "QUEST_COMPLETE", "DAILY_QUEST", "WEEKLY_QUEST", "ACHIEVEMENT", "FINANCIAL_EDUCATION", "ARTICLE_READ", "COURSE_COMPLETE", "POST_SHARE", "COMMENT", "LIKE", "DAILY_LOGIN", "STREAK_BONUS", name="xpactivitytype"), nullable=False),
+    Column("description", String, nullable=True),
+    Column("xp_gained", Integer, nullable=False),
+    Column("credo_gained", Integer, nullable=False),
+    Column("activity_metadata", String, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_xp_activity_user_xp_created", "user_xp_id", "created_at"),
+)
+
+Table(
+    "courseschedule", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("course_id", Integer, ForeignKey("universitycourse.id"), nullable=False),
+    Column("day_of_week", Integer, nullable=False),
+    Column("start_time", String, nullable=False),
+    Column("end_time", String, nullable=False),
+    Column("building", String, nullable=True),
+    Column("room", String, nullable=True),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(connection)
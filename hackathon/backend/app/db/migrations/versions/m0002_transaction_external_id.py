@@ -0,0 +1,12 @@
+"""
+Transaction.external_id (SSAFY 거래고유번호) 컬럼 추가
+"""
+
+from ..ops import add_column
+
+VERSION = 2
+DESCRIPTION = "transaction.external_id"
+
+
+def upgrade(connection):
+    add_column(connection, "transaction", "external_id", "VARCHAR")
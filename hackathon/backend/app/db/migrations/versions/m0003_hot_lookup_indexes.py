@@ -0,0 +1,31 @@
+"""
+사용자별/계좌별 조회 인덱스
+인덱스마다 짧은 트랜잭션(PostgreSQL은 CONCURRENTLY)으로 만들어 큰 테이블에서도 앱 쓰기를 오래 막지 않음
+"""
+
+from ..ops import create_index, table_index
+
+VERSION = 3
+DESCRIPTION = "hot lookup indexes"
+TRANSACTIONAL = False
+
+# 테이블 → (인덱스명, 컬럼, 유니크) (적용 시점의 정의로 고정)
+INDEXES = {
+    "transaction": [("ix_transaction_account_date", ("account_id", "transaction_date"), False)],
+    "bankaccount": [("ix_bankaccount_user_id", ("user_id",), False)],
+    "user_xp": [("ix_user_xp_user_id", ("user_id",), True), ("ix_user_xp_credo_score", ("credo_score",), False)],
+    "xp_activity": [("ix_xp_activity_user_xp_created", ("user_xp_id", "created_at"), False)],
+    "chronicle_posts": [
+        ("ix_chronicle_posts_user_timestamp", ("user_id", "timestamp"), False),
+        ("ix_chronicle_posts_timestamp", ("timestamp",), False),
+    ],
+    "creditscore": [("ix_creditscore_user_id", ("user_id",), False)],
+    "userproduct": [("ix_userproduct_user_id", ("user_id",), False)],
+    "user": [("ix_user_ssafy_user_key", ("ssafy_user_key",), False)],
+}
+
+
+def upgrade(engine):
+    for table_name, indexes in INDEXES.items():
+        for name, columns, unique in indexes:
+            create_index(engine, table_index(table_name, name, columns, unique))
@@ -0,0 +1,26 @@
+"""
+크레도 정보가 없는 기존 사용자에게 UserXP 행 생성 (기존 create_xp_tables.py 대체)
+사용자 id 구간별 배치로 나누어 커밋
+"""
+
+from ....core.config import settings
+from ..ops import backfill_in_batches, has_table
+
+VERSION = 4
+DESCRIPTION = "backfill user_xp for existing users"
+TRANSACTIONAL = False
+
+STATEMENT = """
+INSERT INTO user_xp (user_id, current_level, credo_score, current_xp, total_xp, created_at, updated_at)
+SELECT u.id, 1, 0, 0, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+FROM "user" u
+WHERE u.id BETWEEN :start AND :end
+  AND NOT EXISTS (SELECT 1 FROM user_xp x WHERE x.user_id = u.id)
+"""
+
+
+def upgrade(engine):
+    with engine.connect() as connection:
+        if not has_table(connection, "user") or not has_table(connection, "user_xp"):
+            return
+    backfill_in_batches(engine, "user", STATEMENT, settings.MIGRATION_BATCH_SIZE)
@@ -0,0 +1,15 @@
+"""
+XPActivity.idempotency_key 컬럼과 (user_xp_id, idempotency_key) 유니크 인덱스 (배치 적립 중복 방지)
+"""
+
+from ..ops import add_column, create_index, table_index
+
+VERSION = 5
+DESCRIPTION = "xp_activity.idempotency_key"
+TRANSACTIONAL = False
+
+
+def upgrade(engine):
+    with engine.begin() as connection:
+        add_column(connection, "xp_activity", "idempotency_key", "VARCHAR(100)")
+    create_index(engine, table_index("xp_activity", "ux_xp_activity_idempotency", ("user_xp_id", "idempotency_key"), unique=True))
@@ -0,0 +1,55 @@
+"""
+ChroniclePost.rewards / user_content를 JSON 문자열 컬럼에서 JSON 컬럼으로 전환
+
+SQLite는 JSON 컬럼도 텍스트로 저장하므로 테이블을 다시 만들지 않고 값만 정리한다.
+비어 있거나 깨진 값, 'null'은 NULL로 바꾸고 두 번 인코딩된 문자열은 한 번 풀어서,
+조회 시 컬럼 텍스트를 다시 파싱하지 않고 그대로 응답에 넣을 수 있게 한다 (id 구간별 배치).
+PostgreSQL은 컬럼 타입을 JSON으로 바꾼다.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.types import JSON
+
+from ....core.config import settings
+from ..ops import backfill_in_batches, has_table
+
+VERSION = 6
+DESCRIPTION = "chronicle_posts JSON columns"
+TRANSACTIONAL = False
+
+COLUMNS = ("rewards", "user_content")
+
+SQLITE_STATEMENT = """
+UPDATE chronicle_posts SET {column} = CASE
+    WHEN {column} = '' OR NOT json_valid({column}) OR json_type({column}) = 'null' THEN NULL
+    WHEN json_valid(json_extract({column}, '$')) THEN json(json_extract({column}, '$'))
+    ELSE {column}
+END
+WHERE id BETWEEN :start AND :end AND {column} IS NOT NULL AND CASE
+    WHEN {column} = '' OR NOT json_valid({column}) THEN 1
+    ELSE json_type({column}) IN ('null', 'text')
+END
+"""
+
+POSTGRES_STATEMENT = """
+ALTER TABLE chronicle_posts ALTER COLUMN {column} TYPE JSON
+USING CASE WHEN {column} IS NULL OR {column} IN ('', 'null') THEN NULL ELSE {column}::json END
+"""
+
+
+def upgrade(engine):
+    with engine.connect() as connection:
+        if not has_table(connection, "chronicle_posts"):
+            return
+        column_types = {column["name"]: column["type"] for column in inspect(connection).get_columns("chronicle_posts")}
+
+    for column in COLUMNS:
+        if column not in column_types:
+            continue
+        if engine.dialect.name == "postgresql":
+            if not isinstance(column_types[column], JSON):
+                with engine.begin() as connection:
+                    connection.execute(text(POSTGRES_STATEMENT.format(column=column)))
+        else:
+            backfill_in_batches(engine, "chronicle_posts", SQLITE_STATEMENT.format(column=column),
+                                settings.MIGRATION_BATCH_SIZE)
@@ -0,0 +1,43 @@
+"""
+크로니클 피드 테이블: 팔로우 관계, 작성자별 전파 방식, 홈 타임라인
+(create_all로 만든 기존 DB에 이미 있으면 없는 테이블만 생성)
+"""
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, MetaData, Table
+
+VERSION = 7
+DESCRIPTION = "chronicle feed tables"
+
+# 적용 시점의 정의로 고정 (FK 대상 테이블은 이름만 선언)
+metadata = MetaData()
+Table("user", metadata, Column("id", Integer, primary_key=True))
+Table("chronicle_posts", metadata, Column("id", Integer, primary_key=True))
+
+chronicle_follows = Table(
+    "chronicle_follows", metadata,
+    Column("follower_id", Integer, ForeignKey("user.id"), primary_key=True),
+    Column("followee_id", Integer, ForeignKey("user.id"), primary_key=True),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_chronicle_follows_followee", "followee_id", "follower_id"),
+)
+
+chronicle_authors = Table(
+    "chronicle_authors", metadata,
+    Column("user_id", Integer, ForeignKey("user.id"), primary_key=True),
+    Column("follower_count", Integer, nullable=False),
+    Column("pull_feed", Boolean, nullable=False),
+)
+
+chronicle_timeline = Table(
+    "chronicle_timeline", metadata,
+    Column("user_id", Integer, ForeignKey("user.id"), primary_key=True),
+    Column("post_id", Integer, ForeignKey("chronicle_posts.id"), primary_key=True),
+    Column("author_id", Integer, ForeignKey("user.id"), nullable=False),
+    Column("timestamp", DateTime, nullable=False),
+    Index("ix_chronicle_timeline_post", "post_id"),
+    Index("ix_chronicle_timeline_user_timestamp", "user_id", "timestamp", "post_id"),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(connection, tables=[chronicle_follows, chronicle_authors, chronicle_timeline])
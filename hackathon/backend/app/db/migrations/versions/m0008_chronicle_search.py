@@ -0,0 +1,79 @@
+"""
+크로니클 포스트 전문 검색 인덱스 (SQLite FTS5)
+
+chronicle_search는 원문을 저장하지 않는(contentless) FTS5 테이블로, rowid = chronicle_posts.id이고
+title / body(description + user_content 문자열 값) 컬럼에 한글 바이그램 토큰 문자열(app.db.fts)을 넣는다.
+filter 컬럼에는 작성자/유형 토큰('u<user_id>', 't<type hex>')을 넣어 작성자/유형 필터도 색인 안에서 교집합으로 처리한다
+(일치 포스트마다 chronicle_posts를 조회해 거르지 않도록).
+chronicle_posts의 INSERT/UPDATE/DELETE 트리거가 같은 트랜잭션에서 인덱스를 갱신하고,
+기본 순위는 제목에 가중치를 둔 bm25로 설정한다.
+테이블/트리거를 먼저 만든 뒤 기존 포스트를 id 구간별 배치로 색인한다 (아직 색인되지 않은 행만 넣으므로
+배치 사이에 트리거로 색인된 새 포스트가 중복되지 않고, 중단 후 재실행하거나 여러 워커가 동시에 실행해도 이어서 처리).
+PostgreSQL에는 FTS5가 없어 건너뛴다 (검색 API는 SQLite에서만 제공).
+
+트리거와 색인은 app.db.fts의 search_index_text / search_json_index_text 함수를 호출하는데,
+이 함수는 create_app_engine / create_async_app_engine 커넥션에만 등록된다.
+sqlite3 CLI 등 다른 도구로 chronicle_posts를 수정하면 "no such function" 오류가 나므로
+그 커넥션에 app.db.fts.install_search_functions를 먼저 호출해야 한다.
+"""
+
+from sqlalchemy.exc import OperationalError
+
+from ....core.config import settings
+from ..ops import backfill_in_batches, has_table
+
+VERSION = 8
+DESCRIPTION = "chronicle_search FTS5 index"
+TRANSACTIONAL = False
+
+TITLE_WEIGHT = 4.0
+BODY_WEIGHT = 1.0
+FILTER_WEIGHT = 0.0  # 필터 토큰은 순위에 반영하지 않음
+
+_NEW_ROW = "search_index_text(new.title), " \
+           "search_index_text(new.description) || ' ' || search_json_index_text(new.user_content), " \
+           "'u' || new.user_id || ' t' || hex(new.type)"
+_OLD_ROW = _NEW_ROW.replace("new.", "old.")
+
+STATEMENTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS chronicle_search USING fts5("
+    "title, body, filter, content='', tokenize='unicode61 remove_diacritics 0')",
+    "INSERT INTO chronicle_search (chronicle_search, rank) "
+    f"VALUES ('rank', 'bm25({TITLE_WEIGHT}, {BODY_WEIGHT}, {FILTER_WEIGHT})')",
+    f"""CREATE TRIGGER IF NOT EXISTS chronicle_search_insert AFTER INSERT ON chronicle_posts BEGIN
+        INSERT INTO chronicle_search (rowid, title, body, filter) VALUES (new.id, {_NEW_ROW});
+    END""",
+    # contentless 테이블의 삭제는 색인했던 값을 그대로 넘겨야 함
+    f"""CREATE TRIGGER IF NOT EXISTS chronicle_search_update
+    AFTER UPDATE OF user_id, type, title, description, user_content ON chronicle_posts BEGIN
+        INSERT INTO chronicle_search (chronicle_search, rowid, title, body, filter) VALUES ('delete', old.id, {_OLD_ROW});
+        INSERT INTO chronicle_search (rowid, title, body, filter) VALUES (new.id, {_NEW_ROW});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS chronicle_search_delete AFTER DELETE ON chronicle_posts BEGIN
+        INSERT INTO chronicle_search (chronicle_search, rowid, title, body, filter) VALUES ('delete', old.id, {_OLD_ROW});
+    END""",
+)
+
+BACKFILL = f"""
+INSERT INTO chronicle_search (rowid, title, body, filter)
+SELECT id, {_NEW_ROW.replace('new.', '')} FROM chronicle_posts
+WHERE id BETWEEN :start AND :end
+  AND NOT EXISTS (SELECT 1 FROM chronicle_search WHERE chronicle_search.rowid = chronicle_posts.id)
+"""
+
+
+def upgrade(engine):
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as connection:
+        if not has_table(connection, "chronicle_posts"):
+            return
+        try:
+            connection.exec_driver_sql("SELECT search_index_text('')")
+        except OperationalError as error:
+            raise RuntimeError(
+                "검색 인덱스 함수가 등록되지 않은 커넥션입니다: create_app_engine으로 만든 엔진에서 마이그레이션을 실행하세요"
+            ) from error
+        for statement in STATEMENTS:
+            connection.exec_driver_sql(statement)
+    backfill_in_batches(engine, "chronicle_posts", BACKFILL, settings.MIGRATION_BATCH_SIZE)
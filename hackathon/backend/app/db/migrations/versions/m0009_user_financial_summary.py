@@ -0,0 +1,67 @@
+"""
+사용자별 금융 집계 테이블(user_financial_summary) 생성 및 기존 계좌로 채우기
+이후에는 계좌/거래 변경 flush마다 FinancialAggregateService가 같은 트랜잭션에서 갱신한다.
+테이블 정의와 backfill SQL은 적용 시점의 집계 기준으로 고정 (서비스 코드가 바뀌어도 이 마이그레이션은 그대로).
+"""
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, MetaData, Table, text
+
+from ..ops import has_table
+
+VERSION = 9
+DESCRIPTION = "user_financial_summary"
+
+metadata = MetaData()
+Table("user", metadata, Column("id", Integer, primary_key=True))
+
+user_financial_summary = Table(
+    "user_financial_summary", metadata,
+    Column("user_id", Integer, ForeignKey("user.id"), primary_key=True),
+    Column("total_balance", Integer, nullable=False),
+    Column("total_assets", Integer, nullable=False),
+    Column("total_liabilities", Integer, nullable=False),
+    Column("net_worth", Integer, nullable=False),
+    Column("savings_balance", Integer, nullable=False),
+    Column("account_count", Integer, nullable=False),
+    Column("account_type_balances", JSON, nullable=False),
+    Column("last_transaction_date", DateTime, nullable=True),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+# 계좌구분별로 묶은 뒤 사용자별로 합산
+# (수시입출금 = total_balance, 수시입출금/예금/적금 = 자산, 대출 = 부채, 예금/적금 = savings_balance)
+BACKFILL = """
+INSERT INTO user_financial_summary (
+    user_id, total_balance, total_assets, total_liabilities, net_worth, savings_balance,
+    account_count, account_type_balances, last_transaction_date, updated_at
+)
+SELECT user_id,
+       SUM(CASE WHEN account_type = '수시입출금' THEN balance ELSE 0 END),
+       SUM(CASE WHEN account_type IN ('수시입출금', '예금', '적금') THEN balance ELSE 0 END),
+       SUM(CASE WHEN account_type = '대출' THEN balance ELSE 0 END),
+       SUM(CASE WHEN account_type IN ('수시입출금', '예금', '적금') THEN balance
+                WHEN account_type = '대출' THEN -balance ELSE 0 END),
+       SUM(CASE WHEN account_type IN ('예금', '적금') THEN balance ELSE 0 END),
+       SUM(account_count),
+       {json_object}(account_type, balance),
+       MAX(last_transaction_date),
+       CURRENT_TIMESTAMP
+FROM (
+    SELECT b.user_id, b.account_type, COUNT(*) AS account_count, SUM(b.balance) AS balance,
+           MAX(t.last_transaction_date) AS last_transaction_date
+    FROM bankaccount b
+    LEFT JOIN (
+        SELECT account_id, MAX(transaction_date) AS last_transaction_date FROM "transaction" GROUP BY account_id
+    ) t ON t.account_id = b.id
+    GROUP BY b.user_id, b.account_type
+) account_types
+GROUP BY user_id
+"""
+
+
+def upgrade(connection):
+    metadata.create_all(connection, tables=[user_financial_summary])
+    if has_table(connection, "bankaccount") and has_table(connection, "transaction"):
+        connection.execute(text("DELETE FROM user_financial_summary"))
+        json_object = "json_object_agg" if connection.dialect.name == "postgresql" else "json_group_object"
+        connection.execute(text(BACKFILL.format(json_object=json_object)))
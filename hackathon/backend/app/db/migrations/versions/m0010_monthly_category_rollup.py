@@ -0,0 +1,52 @@
+"""
+월간 카테고리별 수입/지출 집계 테이블(monthly_category_rollup) 생성 및 기존 거래로 채우기
+기존 거래는 INSERT ... SELECT 한 문장으로 묶어 넣고, 이후에는 거래 변경 flush마다 SpendingRollupService가 같은 트랜잭션에서 증감한다.
+테이블 정의와 backfill SQL은 적용 시점의 집계 기준으로 고정 (달력 월, 양수 금액은 수입 / 0 이하는 지출).
+"""
+
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, String, Table, text
+
+from ..ops import has_table
+
+VERSION = 10
+DESCRIPTION = "monthly_category_rollup"
+
+metadata = MetaData()
+Table("user", metadata, Column("id", Integer, primary_key=True))
+Table("bankaccount", metadata, Column("id", Integer, primary_key=True))
+
+monthly_category_rollup = Table(
+    "monthly_category_rollup", metadata,
+    Column("user_id", Integer, ForeignKey("user.id"), primary_key=True),
+    Column("year_month", String, primary_key=True),
+    Column("account_id", Integer, ForeignKey("bankaccount.id"), primary_key=True),
+    Column("category", String, primary_key=True),
+    Column("direction", String, primary_key=True),
+    Column("amount", Integer, nullable=False),
+    Column("transaction_count", Integer, nullable=False),
+)
+
+BACKFILL = """
+INSERT INTO monthly_category_rollup (user_id, year_month, account_id, category, direction, amount, transaction_count)
+SELECT b.user_id, {year_month}, t.account_id, t.category,
+       CASE WHEN t.amount > 0 THEN 'income' ELSE 'expense' END,
+       SUM(ABS(t.amount)), COUNT(*)
+FROM "transaction" t JOIN bankaccount b ON b.id = t.account_id
+GROUP BY b.user_id, {year_month}, t.account_id, t.category, CASE WHEN t.amount > 0 THEN 'income' ELSE 'expense' END
+"""
+
+
+def backfill(connection) -> int:
+    """거래 테이블에서 집계 행을 다시 채우기"""
+    connection.execute(text("DELETE FROM monthly_category_rollup"))
+    if connection.dialect.name == "postgresql":
+        year_month = "to_char(t.transaction_date, 'YYYY-MM')"
+    else:
+        year_month = "strftime('%Y-%m', t.transaction_date)"
+    return connection.execute(text(BACKFILL.format(year_month=year_month))).rowcount
+
+
+def upgrade(connection):
+    metadata.create_all(connection, tables=[monthly_category_rollup])
+    if has_table(connection, "transaction") and has_table(connection, "bankaccount"):
+        backfill(connection)
@@ -0,0 +1,41 @@
+"""
+(account_id, external_id) 유니크 인덱스 (원장 동기화 중복 방지)
+동시 동기화로 이미 중복 저장된 SSAFY 거래는 가장 먼저 저장된 행만 남기고 지운 뒤
+(지운 행이 있으면 월간 카테고리 집계를 m0010과 같은 SQL로 다시 채움) 인덱스를 만든다.
+중복 정리와 인덱스 생성 사이에 동기화가 새 중복을 넣지 못하도록 한 트랜잭션(SQLite는 BEGIN IMMEDIATE 쓰기 잠금,
+PostgreSQL은 CONCURRENTLY 없이 CREATE UNIQUE INDEX로 테이블 쓰기 잠금)에서 실행하고,
+그래도 인덱스를 만들 수 없으면 마이그레이션을 실패시킨다.
+원장 동기화는 이 인덱스에 INSERT ... ON CONFLICT DO NOTHING으로 거래를 넣는다.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from ..ops import has_table, table_index
+from .m0010_monthly_category_rollup import backfill
+
+VERSION = 11
+DESCRIPTION = "transaction (account_id, external_id) unique"
+
+DELETE_DUPLICATES = """
+DELETE FROM "transaction"
+WHERE external_id IS NOT NULL
+  AND id NOT IN (
+    SELECT MIN(id) FROM "transaction" WHERE external_id IS NOT NULL GROUP BY account_id, external_id
+  )
+"""
+
+
+def upgrade(connection):
+    if not has_table(connection, "transaction"):
+        return
+    removed = connection.execute(text(DELETE_DUPLICATES)).rowcount or 0
+    if removed > 0 and has_table(connection, "monthly_category_rollup"):
+        backfill(connection)
+    try:
+        table_index("transaction", "ux_transaction_account_external", ("account_id", "external_id"),
+                    unique=True).create(connection, checkfirst=True)
+    except IntegrityError as error:
+        raise RuntimeError(
+            "유니크 인덱스 ux_transaction_account_external 생성 실패: 중복 거래 정리 후에도 중복 행이 있습니다"
+        ) from error
@@ -0,0 +1,12 @@
+"""
+UserXP.version 컬럼 추가 (갱신마다 1씩 증가, 크레도 리더보드가 오래된 점수를 덮어쓰지 않도록 비교)
+"""
+
+from ..ops import add_column
+
+VERSION = 12
+DESCRIPTION = "user_xp.version"
+
+
+def upgrade(connection):
+    add_column(connection, "user_xp", "version", "INTEGER NOT NULL DEFAULT 0")
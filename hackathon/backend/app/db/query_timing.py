@@ -0,0 +1,78 @@
+"""
+SQL 실행 시간 측정
+echo 대신 엔진 이벤트(before/after_cursor_execute)로 문장별 실행 시간을 집계하고 느린 쿼리만 로그로 남김
+"""
+
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+slow_query_logger = logging.getLogger("app.db.slow")
+
+# 집계 키가 무한히 늘지 않도록 IN (...) 목록과 공백 정규화
+_IN_LIST = re.compile(r"IN \((?:[^()]*)\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+MAX_TRACKED_STATEMENTS = 500
+
+
+def normalize_statement(statement: str) -> str:
+    return _IN_LIST.sub("IN (...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryTimer:
+    """문장별 실행 횟수 / 누적·최대 시간 집계"""
+
+    def __init__(self, slow_query_ms: float = 0.0):
+        self.slow_query_ms = slow_query_ms
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start"].pop()) * 1000
+        key = normalize_statement(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= MAX_TRACKED_STATEMENTS:
+                    key = "<other>"
+                    stats = self._stats.setdefault(key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+                else:
+                    stats = self._stats[key] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+        if self.slow_query_ms and elapsed_ms >= self.slow_query_ms:
+            slow_query_logger.warning("느린 쿼리 %.1fms: %s", elapsed_ms, key[:500])
+
+    def top(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """누적 시간이 큰 순서로 문장별 통계"""
+        with self._lock:
+            items = [(key, dict(stats)) for key, stats in self._stats.items()]
+        items.sort(key=lambda item: item[1]["total_ms"], reverse=True)
+        return [
+            {
+                "statement": key,
+                "count": int(stats["count"]),
+                "total_ms": round(stats["total_ms"], 2),
+                "mean_ms": round(stats["total_ms"] / stats["count"], 3),
+                "max_ms": round(stats["max_ms"], 2),
+            }
+            for key, stats in items[:limit]
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -1,20 +1,161 @@
 from __future__ import annotations
-from typing import Dict, Generator
-from sqlmodel import SQLModel, create_engine, Session
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ..core.config import settings
+from .fts import install_search_functions
+from .query_timing import QueryTimer
+
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """DATABASE_URL 방언별 엔진 옵션 (SQLite 파일 / 인메모리 SQLite / PostgreSQL 등)"""
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"echo": settings.DATABASE_ECHO}
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # 인메모리 DB는 커넥션마다 별도 DB이므로 풀 설정을 적용하지 않음
+        return options
+    options.update(
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    )
+    if url.get_backend_name() == "sqlite":
+        # 스레드풀에서 실행되는 동기 엔드포인트가 풀의 커넥션을 나눠 쓰므로 스레드 검사 해제
+        options["connect_args"] = {"check_same_thread": False}
+    else:
+        # 서버 DB는 유휴 커넥션이 끊길 수 있으므로 사용 전 확인 및 주기적 재연결
+        options.update(pool_pre_ping=True, pool_recycle=settings.DATABASE_POOL_RECYCLE)
+    return options
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """SQLite 커넥션마다 적용할 PRAGMA (WAL: 읽기와 쓰기가 서로 막지 않음)"""
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "cache_size": -settings.SQLITE_CACHE_SIZE_KB,  # 음수는 KiB 단위
+        "mmap_size": settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024,
+        "temp_store": "MEMORY",
+    }
+
+def _install_pragmas(sync_engine) -> None:
+    if sync_engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+        # 크로니클 검색 인덱스 트리거가 사용하는 함수
+        install_search_functions(dbapi_connection)
+
+logger = logging.getLogger(__name__)
+
+class SyncSessionOnEventLoopError(RuntimeError):
+    """async 라우트가 동기 엔진으로 쿼리를 실행함 (SYNC_DB_ON_EVENT_LOOP=raise)"""
+
+def _install_event_loop_guard(sync_engine) -> None:
+    """이벤트 루프 스레드에서 동기 엔진 쿼리가 실행되면 경고/예외
+
+    동기 세션의 쓰기는 SQLite 잠금을 기다리는 동안(busy_timeout) 이벤트 루프 전체를 멈춘다.
+    특히 같은 루프의 aiosqlite 쓰기가 잠금을 잡고 있으면 그 커밋도 루프를 기다리므로
+    busy_timeout이 끝날 때까지 모든 요청이 멈춘다.
+    동기 세션을 쓰는 핸들러는 def로 선언하거나 run_in_threadpool로 감싸야 한다.
+    """
+    warned = set()
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _check_event_loop(conn, cursor, statement, parameters, context, executemany):
+        mode = settings.SYNC_DB_ON_EVENT_LOOP
+        if mode == "off":
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if mode == "raise":
+            raise SyncSessionOnEventLoopError(f"이벤트 루프에서 동기 엔진 쿼리 실행: {statement[:200]}")
+        if statement not in warned:
+            warned.add(statement)
+            logger.warning("이벤트 루프에서 동기 엔진 쿼리 실행 (def 핸들러 또는 run_in_threadpool 사용): %s", statement[:200])
+
+def create_app_engine(database_url: str):
+    """설정을 반영한 엔진 생성 (SQLite PRAGMA, 쿼리 시간 측정, 이벤트 루프 사용 검사 포함)"""
+    app_engine = create_engine(database_url, **engine_options(database_url))
+    _install_pragmas(app_engine)
+    _install_event_loop_guard(app_engine)
+    query_timer.install(app_engine)
+    return app_engine
+
+# 비동기 드라이버 (동기 URL의 드라이버 부분만 바꿈)
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+def async_database_url(database_url: str) -> str:
+    """동기 DATABASE_URL을 비동기 드라이버 URL로 변환 (sqlite → sqlite+aiosqlite, postgresql → postgresql+asyncpg)"""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"비동기 드라이버를 알 수 없는 DB입니다: {backend} (DATABASE_ASYNC_URL을 직접 지정하세요)")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+def create_async_app_engine(database_url: str) -> AsyncEngine:
+    """비동기 엔진 생성 (동기 엔진과 같은 풀 설정/PRAGMA/쿼리 시간 측정)"""
+    async_url = database_url if "+" in make_url(database_url).drivername else async_database_url(database_url)
+    app_engine = create_async_engine(async_url, **engine_options(async_url))
+    _install_pragmas(app_engine.sync_engine)
+    query_timer.install(app_engine.sync_engine)
+    return app_engine
+
+# 문장별 실행 시간 집계 (GET /api/health/db)
+query_timer = QueryTimer(slow_query_ms=settings.DATABASE_SLOW_QUERY_MS)
 
 # SQLModel 엔진 및 세션 설정
-engine = create_engine(settings.DATABASE_URL, echo=True)
+engine = create_app_engine(settings.DATABASE_URL)
 
-def create_db_and_tables():
-    """데이터베이스 테이블 생성"""
-    SQLModel.metadata.create_all(engine)
+# 계좌/거래 변경 시 사용자별 금융 집계와 월간 카테고리 집계를 같은 트랜잭션에서 갱신하는 세션 이벤트 등록
+from ..services import financial_aggregate_service, spending_rollup_service  # noqa: E402,F401
 
 def get_session() -> Generator[Session, None, None]:
-    """데이터베이스 세션 의존성"""
+    """데이터베이스 세션 의존성
+
+    동기 세션이므로 async def 라우트 본문에서 직접 쿼리하지 않는다 (def 핸들러로 선언하거나
+    run_in_threadpool로 감쌈). async 라우트는 get_async_session을 사용
+    """
     with Session(engine) as session:
         yield session
 
+# 비동기 엔진은 처음 사용할 때 생성 (비동기 라우트가 없는 스크립트는 드라이버가 없어도 동작)
+_async_engine: Optional[AsyncEngine] = None
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_app_engine(settings.DATABASE_ASYNC_URL or settings.DATABASE_URL)
+    return _async_engine
+
+async def dispose_async_engine() -> None:
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션 의존성 (async 라우트에서 이벤트 루프를 막지 않음)
+
+    커밋 후에도 응답 직렬화에서 속성을 읽을 수 있도록 expire_on_commit=False
+    """
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
+
 # 인메모리 진행상황 저장 (기존 코드 유지)
 DUMMY_PROGRESS: Dict[int, Dict[str, int]] = {
     1: {"level": 1, "xp": 0, "xp_to_next": 100},
@@ -1,6 +1,8 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
+from .core.responses import AppJSONResponse
 from .api.health import router as health_router
 from .api.auth import router as auth_router
 from .api.auth_v2 import router as auth_v2_router
@@ -16,21 +18,54 @@ from .api.academic import router as academic_router
 from .api.financial import router as financial_router
 from .api.chronicle import router as chronicle_router
 from .api.xp import router as xp_router
-from .db.session import create_db_and_tables
+from .db.session import engine, dispose_async_engine
+from .db.migrations import ensure_schema
+from .services.leaderboard_service import rebuild_credo_leaderboard
+from .services.score_distribution import score_distribution
+from .services.ssafy_api_service import close_async_transport
+from .services.ssafy_resilience import set_request_deadline, reset_request_deadline
 
 # 모델들을 임포트하여 테이블 생성 시 인식되도록 함
 from .models.user import User
 from .models.university import University, Department, UniversityCourse, CourseSchedule
 from .models.academic import AcademicRecord, Course as AcademicCourse, Scholarship
-from .models.financial import BankAccount, Transaction, FinancialProduct, UserProduct, CreditScore
+from .models.financial import BankAccount, Transaction, FinancialProduct, UserProduct, CreditScore, LedgerSyncState
 from .models.xp import UserXP, XPActivity
 
-app = FastAPI(title="Hackathon Backend", version="1.0.0")
+app = FastAPI(title="Hackathon Backend", version="1.0.0", default_response_class=AppJSONResponse)  # orjson 응답
 
-# 데이터베이스 테이블 생성
+# 데이터베이스 스키마 버전 확인 (최신이 아니면 남은 마이그레이션 적용) 후 메모리 순위표/점수 분포 구성
+def prepare_database():
+    ensure_schema(engine)
+    rebuild_credo_leaderboard(engine)
+    score_distribution.rebuild(engine)
+
+# 동기 엔진 작업이므로 이벤트 루프가 아닌 스레드풀에서 실행
 @app.on_event("startup")
-def on_startup():
-    create_db_and_tables()
+async def on_startup():
+    await run_in_threadpool(prepare_database)
+
+# SSAFY API 공유 커넥션 풀, 비동기 DB 커넥션 풀 종료
+@app.on_event("shutdown")
+async def on_shutdown():
+    await close_async_transport()
+    await dispose_async_engine()
+
+# 요청 기한 설정: 이 요청에서 나가는 SSAFY 호출은 남은 기한 안에서만 실행
+@app.middleware("http")
+async def request_deadline(request: Request, call_next):
+    budget = settings.REQUEST_DEADLINE
+    requested = request.headers.get("x-request-timeout")
+    if requested:
+        try:
+            budget = min(budget, max(0.0, float(requested)))
+        except ValueError:
+            pass
+    token = set_request_deadline(budget)
+    try:
+        return await call_next(request)
+    finally:
+        reset_request_deadline(token)
 
 app.add_middleware(
     CORSMiddleware,
@@ -38,6 +73,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Has-More"],  # 크로니클 피드 페이지네이션
 )
 
 # 라우터 등록
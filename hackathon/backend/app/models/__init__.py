@@ -1,6 +1,6 @@
 from .user import User
 from .university import University, Department, UniversityCourse, CourseSchedule
 from .academic import AcademicRecord, Course as AcademicCourse, Scholarship
-from .financial import BankAccount, Transaction, FinancialProduct, UserProduct, CreditScore
-from .chronicle import ChroniclePost
+from .financial import BankAccount, Transaction, FinancialProduct, UserProduct, CreditScore, LedgerSyncState, UserFinancialSummary, MonthlyCategoryRollup
+from .chronicle import ChroniclePost, ChronicleFollow, ChronicleAuthor, ChronicleTimelineEntry
 from .xp import UserXP
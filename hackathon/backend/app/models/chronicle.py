@@ -1,18 +1,62 @@
+from sqlalchemy import Index, JSON
 from sqlmodel import SQLModel, Field
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
 
 class ChroniclePost(SQLModel, table=True):
     __tablename__ = "chronicle_posts"
+    # 사용자별 타임라인 (user_id = ? ORDER BY timestamp DESC)
+    __table_args__ = (Index("ix_chronicle_posts_user_timestamp", "user_id", "timestamp"),)
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")
     type: str = Field(default="user_post", max_length=50)
     title: str = Field(max_length=200)
     description: Optional[str] = Field(default=None)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    rewards: Optional[str] = Field(default=None)  # JSON 문자열로 저장 (호환성 유지)
-    user_content: Optional[str] = Field(default=None)  # JSON 문자열로 저장 (호환성 유지)
+    timestamp: datetime = Field(default_factory=datetime.utcnow, index=True)  # 공개 피드 최신순
+    # JSON 컬럼 (None은 JSON 'null'이 아닌 SQL NULL로 저장)
+    rewards: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSON(none_as_null=True))
+    user_content: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSON(none_as_null=True))
     
     def __repr__(self):
         return f"<ChroniclePost(id={self.id}, user_id={self.user_id}, type={self.type})>"
+
+
+class ChronicleFollow(SQLModel, table=True):
+    """크로니클 팔로우 관계 (follower가 followee의 포스트를 홈 타임라인에서 봄)"""
+    __tablename__ = "chronicle_follows"
+    # 작성자의 팔로워 목록 (쓰기 시 전파 대상)
+    __table_args__ = (Index("ix_chronicle_follows_followee", "followee_id", "follower_id"),)
+
+    follower_id: int = Field(foreign_key="user.id", primary_key=True)
+    followee_id: int = Field(foreign_key="user.id", primary_key=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ChronicleAuthor(SQLModel, table=True):
+    """작성자별 피드 전파 방식
+
+    팔로워 수가 CHRONICLE_FANOUT_FOLLOWER_LIMIT를 넘으면 pull_feed로 바뀌어 포스트를 팔로워 타임라인에 쓰지 않고,
+    팔로워가 읽을 때 작성자 포스트를 직접 병합한다. 한 번 바뀌면 유지한다 (이미 병합으로 보여주던 포스트가 빠지지 않도록).
+    """
+    __tablename__ = "chronicle_authors"
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True)
+    follower_count: int = Field(default=0)
+    pull_feed: bool = Field(default=False)
+
+
+class ChronicleTimelineEntry(SQLModel, table=True):
+    """홈 타임라인 항목 (쓰기 시 전파된 포스트)"""
+    __tablename__ = "chronicle_timeline"
+    __table_args__ = (
+        # 홈 타임라인 최신순 (user_id = ? ORDER BY timestamp DESC, post_id DESC)
+        Index("ix_chronicle_timeline_user_timestamp", "user_id", "timestamp", "post_id"),
+        # 포스트 삭제 시 전파된 항목 제거
+        Index("ix_chronicle_timeline_post", "post_id"),
+    )
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True)
+    post_id: int = Field(foreign_key="chronicle_posts.id", primary_key=True)
+    author_id: int = Field(foreign_key="user.id")
+    timestamp: datetime
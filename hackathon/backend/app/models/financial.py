@@ -1,5 +1,6 @@
+from sqlalchemy import Index, JSON
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Dict, TYPE_CHECKING
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -13,7 +14,7 @@ class BankAccount(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # 사용자 정보
-    user_id: int = Field(foreign_key="user.id", description="사용자 ID")
+    user_id: int = Field(foreign_key="user.id", index=True, description="사용자 ID")
     
     # 계좌 기본 정보
     account_number: str = Field(unique=True, description="계좌번호")
@@ -39,6 +40,13 @@ class BankAccount(SQLModel, table=True):
 
 class Transaction(SQLModel, table=True):
     """거래 내역 모델"""
+    # 계좌별 최신 거래 조회 (account_id = ? ORDER BY transaction_date DESC),
+    # 원장 동기화 중복 방지 (계좌별 SSAFY 거래고유번호 유일, external_id가 NULL인 거래는 제외)
+    __table_args__ = (
+        Index("ix_transaction_account_date", "account_id", "transaction_date"),
+        Index("ux_transaction_account_external", "account_id", "external_id", unique=True),
+    )
+    
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # 계좌 정보
@@ -54,10 +62,29 @@ class Transaction(SQLModel, table=True):
     # 거래 시간
     transaction_date: datetime = Field(description="거래일시")
     
+    # SSAFY 원장 동기화 정보
+    external_id: Optional[str] = Field(default=None, description="SSAFY 거래고유번호 (transactionUniqueNo)")
+    
     # 타임스탬프
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class LedgerSyncState(SQLModel, table=True):
+    """계좌별 SSAFY 거래내역 동기화 상태 (하이 워터마크)"""
+    __tablename__ = "ledger_sync_state"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    account_id: int = Field(foreign_key="bankaccount.id", unique=True, description="계좌 ID")
+    
+    # 마지막으로 반영한 SSAFY 거래
+    last_transaction_unique_no: Optional[str] = Field(default=None, description="마지막 거래고유번호")
+    last_transaction_date: Optional[str] = Field(default=None, description="마지막 거래일자 (YYYYMMDD)")
+    
+    # 동기화 이력
+    last_synced_at: Optional[datetime] = Field(default=None, description="마지막 동기화 시간")
+    synced_count: int = Field(default=0, description="누적 동기화 거래 수")
+
+
 class FinancialProduct(SQLModel, table=True):
     """금융 상품 모델"""
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -94,7 +121,7 @@ class UserProduct(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # 사용자 및 상품 정보
-    user_id: int = Field(foreign_key="user.id", description="사용자 ID")
+    user_id: int = Field(foreign_key="user.id", index=True, description="사용자 ID")
     product_id: int = Field(foreign_key="financialproduct.id", description="상품 ID")
     account_id: int = Field(foreign_key="bankaccount.id", description="계좌 ID")
     
@@ -123,7 +150,7 @@ class CreditScore(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # 사용자 정보
-    user_id: int = Field(foreign_key="user.id", description="사용자 ID")
+    user_id: int = Field(foreign_key="user.id", index=True, description="사용자 ID")
     
     # 신용점수 정보
     score: int = Field(description="신용점수")
@@ -139,6 +166,50 @@ class CreditScore(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class UserFinancialSummary(SQLModel, table=True):
+    """사용자별 금융 집계 (계좌/거래가 바뀌는 flush에서 같은 트랜잭션으로 다시 계산, FinancialAggregateService)
+
+    계좌가 없는 사용자는 행이 없으며 모든 값이 0인 것으로 본다.
+    """
+    __tablename__ = "user_financial_summary"
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True, description="사용자 ID")
+
+    # 잔액 합계 (1원 단위)
+    total_balance: int = Field(default=0, description="수시입출금 잔액 합")
+    total_assets: int = Field(default=0, description="수시입출금/예금/적금 잔액 합")
+    total_liabilities: int = Field(default=0, description="대출 잔액 합")
+    net_worth: int = Field(default=0, description="순자산 (자산 - 부채)")
+    savings_balance: int = Field(default=0, description="예금/적금 잔액 합")
+
+    # 계좌 구성
+    account_count: int = Field(default=0, description="계좌 수")
+    account_type_balances: Dict[str, int] = Field(
+        default_factory=dict, sa_type=JSON, description="계좌구분별 잔액 합 (계좌가 있는 구분만)"
+    )
+    last_transaction_date: Optional[datetime] = Field(default=None, description="최근 거래일시")
+
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+
+class MonthlyCategoryRollup(SQLModel, table=True):
+    """계좌/월/카테고리/방향별 거래 금액 집계 (거래가 추가·수정·삭제되는 flush에서 같은 트랜잭션으로 증감, SpendingRollupService)
+
+    기본키 순서가 (user_id, year_month, ...)라 사용자의 최근 N개월 조회가 기본키 범위 한 번으로 끝난다.
+    """
+    __tablename__ = "monthly_category_rollup"
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True, description="사용자 ID")
+    year_month: str = Field(primary_key=True, description="거래 월 (YYYY-MM, 거래일시 기준)")
+    account_id: int = Field(foreign_key="bankaccount.id", primary_key=True, description="계좌 ID")
+    category: str = Field(primary_key=True, description="거래 카테고리")
+    direction: str = Field(primary_key=True, description="income(양수 금액) / expense(0 이하 금액)")
+
+    amount: int = Field(default=0, description="거래금액 합 (절댓값, 1원 단위)")
+    transaction_count: int = Field(default=0, description="거래 수")
+
+
 # Pydantic 모델들 (API 요청/응답용)
 class BankAccountResponse(BaseModel):
     """은행 계좌 응답 모델"""
@@ -223,3 +294,19 @@ class FinancialSummaryResponse(BaseModel):
     accounts: List[BankAccountResponse]
     recent_transactions: List[TransactionResponse]
     products: List[UserProductResponse]
+
+
+class MonthlyCategoryAmount(BaseModel):
+    """월별 분석의 카테고리별 금액"""
+    category: str
+    income: int
+    expense: int
+
+
+class MonthlyAnalyticsResponse(BaseModel):
+    """월별 수입/지출 분석 응답 모델"""
+    year_month: str
+    income: int
+    expense: int
+    net: int
+    categories: List[MonthlyCategoryAmount]
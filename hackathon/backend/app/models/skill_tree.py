@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 from typing import Optional, List
 from datetime import datetime
@@ -49,6 +50,7 @@ class HollandType(SQLModel, table=True):
 
 class UserSkill(SQLModel, table=True):
     """사용자별 스킬 레벨 및 XP"""
+    __table_args__ = (Index("ix_userskill_user_category", "user_id", "skill_category_id"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     
     # 사용자 및 스킬 연결
@@ -20,7 +20,7 @@ class User(SQLModel, table=True):
     
     # SSAFY 연동 정보
     ssafy_user_id: Optional[str] = Field(default=None, unique=True, index=True, description="SSAFY API userId")
-    ssafy_user_key: Optional[str] = Field(default=None, description="SSAFY API userKey")
+    ssafy_user_key: Optional[str] = Field(default=None, index=True, description="SSAFY API userKey")
     ssafy_user_name: Optional[str] = Field(default=None, description="SSAFY API userName")
     ssafy_institution_code: Optional[str] = Field(default=None, description="SSAFY API institutionCode")
     
@@ -1,3 +1,5 @@
+from pydantic import BaseModel, Field as PydanticField
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -40,15 +42,17 @@ class UserXP(SQLModel, table=True):
     __tablename__ = "user_xp"
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="user.id", description="사용자 ID")
+    user_id: int = Field(foreign_key="user.id", unique=True, index=True, description="사용자 ID")
     
     # 크레도 기반 레벨 시스템 (주요 성장 지표)
     current_level: int = Field(default=1, description="현재 레벨")
-    credo_score: int = Field(default=0, description="현재 크레도 점수")
+    credo_score: int = Field(default=0, index=True, description="현재 크레도 점수")
     
     # XP 시스템 (보조 지표)
     current_xp: int = Field(default=0, description="현재 XP")
     total_xp: int = Field(default=0, description="총 획득 XP")
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"},
+                         description="갱신마다 1씩 증가 (리더보드 반영 순서 확인)")
     
     # 메타데이터
     last_activity_at: Optional[datetime] = Field(default=None, description="마지막 활동 시간")
@@ -63,6 +67,12 @@ class UserXP(SQLModel, table=True):
 class XPActivity(SQLModel, table=True):
     """XP 활동 기록"""
     __tablename__ = "xp_activity"
+    __table_args__ = (
+        # 사용자별 최근 활동 조회 (user_xp_id = ? ORDER BY created_at DESC)
+        Index("ix_xp_activity_user_xp_created", "user_xp_id", "created_at"),
+        # 배치 적립 재전송 시 중복 방지
+        Index("ux_xp_activity_idempotency", "user_xp_id", "idempotency_key", unique=True),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_xp_id: int = Field(foreign_key="user_xp.id", description="사용자 XP ID")
@@ -77,6 +87,7 @@ class XPActivity(SQLModel, table=True):
     
     # 메타데이터 (JSON 문자열로 저장)
     activity_metadata: str = Field(default="{}", description="활동 메타데이터 (JSON)")
+    idempotency_key: Optional[str] = Field(default=None, max_length=100, description="클라이언트 중복 방지 키")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="생성 시간")
     
     # 관계 설정
@@ -94,13 +105,50 @@ class XPActivity(SQLModel, table=True):
         self.activity_metadata = json.dumps(data, ensure_ascii=False)
 
 
-class XPAddRequest(SQLModel):
+# 요청 모델은 pydantic BaseModel (SQLModel을 상속하면 metadata 필드가 SQLModel.metadata를 가림)
+class XPAddRequest(BaseModel):
     """XP 추가 요청 모델"""
     activity_type: XPActivityType
     description: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
 
+class XPBatchItem(XPAddRequest):
+    """배치 적립 항목"""
+    occurred_at: Optional[datetime] = None  # 클라이언트에서 활동이 발생한 시각 (UTC)
+    idempotency_key: Optional[str] = PydanticField(default=None, max_length=100)  # 같은 키는 한 번만 적립
+
+
+class XPBatchRequest(BaseModel):
+    """XP 배치 적립 요청 모델"""
+    items: List[XPBatchItem] = PydanticField(min_length=1, max_length=500)
+
+
+class XPBatchItemResult(SQLModel):
+    """배치 항목별 처리 결과"""
+    index: int
+    idempotency_key: Optional[str] = None
+    applied: bool  # False면 이미 적립된 키 (중복)
+    credo_gained: int
+    level: int  # 이 항목 적립 후 레벨
+    leveled_up: bool
+
+
+class XPBatchResponse(SQLModel):
+    """XP 배치 적립 응답 모델"""
+    level: int
+    xp: int
+    xp_to_next: int
+    total_xp: int
+    credo_score: int
+    progress: float
+    leveled_up: bool
+    applied: int
+    duplicates: int
+    items: List[XPBatchItemResult]
+    recent_activities: List[Dict[str, Any]]
+
+
 class XPResponse(SQLModel):
     """XP 응답 모델"""
     level: int
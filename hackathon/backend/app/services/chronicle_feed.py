@@ -0,0 +1,258 @@
+"""
+크로니클 피드 서비스
+- 공개 피드: 페이지별로 인코딩한 응답 본문을 버전과 함께 캐시하고, 포스트 생성/삭제 시 버전을 올려 무효화
+- 홈 타임라인: 팔로워가 적은 작성자의 포스트는 쓰기 시 팔로워 타임라인(chronicle_timeline)에 전파하고(push),
+  팔로워가 많은 작성자(pull_feed)의 포스트는 읽을 때 작성자별로 조회해 병합한다(pull).
+  읽기는 타임라인 인덱스 범위 조회 한 번 + 팔로우 중인 pull 작성자 수만큼의 인덱스 조회로 끝난다.
+"""
+
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, exists, insert, literal, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..core.config import settings
+from ..models.chronicle import ChronicleAuthor, ChronicleFollow, ChroniclePost, ChronicleTimelineEntry
+from .chronicle_service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ChronicleService
+
+Page = Tuple[bytes, Optional[str], bool]  # (JSON 배열 본문, 다음 페이지 커서, has_more)
+
+TIMELINE_BACKFILL = MAX_PAGE_SIZE  # 팔로우 시 타임라인에 채워 넣을 작성자의 최근 포스트 수
+
+
+class PublicFeedCache:
+    """공개 피드 페이지 캐시 (프로세스 공용)
+
+    (limit, cursor)별로 인코딩된 본문을 저장하고, 포스트 생성/삭제 시 invalidate()로 버전을 올린다.
+    버전이 바뀐 뒤에는 이전 버전으로 조회한 결과를 저장하지 않는다.
+    다른 워커의 쓰기는 알 수 없으므로 ttl이 지난 페이지도 다시 조회한다.
+    """
+
+    def __init__(self, ttl: float, max_pages: int):
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self._pages: "OrderedDict[Tuple[int, Optional[str]], Tuple[int, float, Page]]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def get(self, limit: int, cursor: Optional[str]) -> Optional[Page]:
+        key = (limit, cursor)
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is not None and entry[0] == self._version and time.monotonic() - entry[1] < self.ttl:
+                self._pages.move_to_end(key)
+                self._counters["hits"] += 1
+                return entry[2]
+            self._counters["misses"] += 1
+            return None
+
+    def store(self, limit: int, cursor: Optional[str], version: int, page: Page) -> None:
+        with self._lock:
+            if version != self._version:
+                return
+            self._pages[(limit, cursor)] = (version, time.monotonic(), page)
+            self._pages.move_to_end((limit, cursor))
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._pages.clear()
+            self._counters["invalidations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._counters, "version": self._version, "cached_pages": len(self._pages)}
+
+
+class ChronicleFeedService:
+    """팔로우 관계와 홈 타임라인 관리 (변경 메서드는 커밋하지 않으므로 호출자가 커밋)"""
+
+    # ==================== 공개 피드 ====================
+
+    @staticmethod
+    async def public_page(db: AsyncSession, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        page = public_feed_cache.get(limit, cursor)
+        if page is None:
+            version = public_feed_cache.version
+            page = await ChronicleService.get_page(db, None, limit, cursor)
+            public_feed_cache.store(limit, cursor, version, page)
+        return page
+
+    # ==================== 팔로우 ====================
+
+    @staticmethod
+    async def _pull_feed(db: AsyncSession, user_id: int) -> Optional[bool]:
+        """작성자의 pull 방식 여부 (작성자 행이 없으면 None)"""
+        return (await db.exec(select(ChronicleAuthor.pull_feed).where(ChronicleAuthor.user_id == user_id))).first()
+
+    @staticmethod
+    def _insert(db: AsyncSession):
+        return pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+    @staticmethod
+    async def follow(db: AsyncSession, follower_id: int, followee_id: int) -> bool:
+        """팔로우 (이미 팔로우 중이면 False)
+
+        push 작성자면 최근 포스트를 팔로워 타임라인에 채워 넣고,
+        팔로워 수가 한도를 넘으면 작성자를 pull 방식으로 바꾼다.
+        """
+        if follower_id == followee_id:
+            raise ValueError("자기 자신은 팔로우할 수 없습니다")
+        # 같은 팔로우/첫 팔로워가 동시에 들어와도 기본키 충돌 없이 한쪽만 INSERT
+        insert_ignore = ChronicleFeedService._insert(db)
+        inserted = (await db.exec(
+            insert_ignore(ChronicleFollow)
+            .values(follower_id=follower_id, followee_id=followee_id, created_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=["follower_id", "followee_id"])
+        )).rowcount
+        if inserted != 1:
+            return False
+        await db.exec(
+            insert_ignore(ChronicleAuthor)
+            .values(user_id=followee_id, follower_count=0, pull_feed=False)
+            .on_conflict_do_nothing(index_elements=["user_id"])
+        )
+        # 동시 팔로우에도 개수가 어긋나지 않도록 UPDATE ... RETURNING으로 증가
+        pull_feed = (await db.exec(
+            update(ChronicleAuthor)
+            .where(ChronicleAuthor.user_id == followee_id)
+            .values(
+                follower_count=ChronicleAuthor.follower_count + 1,
+                pull_feed=or_(ChronicleAuthor.pull_feed,
+                              ChronicleAuthor.follower_count + 1 > settings.CHRONICLE_FANOUT_FOLLOWER_LIMIT)
+            )
+            .returning(ChronicleAuthor.pull_feed)
+        )).scalar_one()
+
+        if not pull_feed:
+            recent = (
+                select(literal(follower_id), ChroniclePost.id, ChroniclePost.user_id, ChroniclePost.timestamp)
+                .where(ChroniclePost.user_id == followee_id)
+                .where(~exists().where(
+                    ChronicleTimelineEntry.user_id == follower_id, ChronicleTimelineEntry.post_id == ChroniclePost.id
+                ))
+                .order_by(ChroniclePost.timestamp.desc(), ChroniclePost.id.desc())
+                .limit(TIMELINE_BACKFILL)
+            )
+            await db.exec(insert(ChronicleTimelineEntry).from_select(
+                ["user_id", "post_id", "author_id", "timestamp"], recent
+            ))
+        return True
+
+    @staticmethod
+    async def unfollow(db: AsyncSession, follower_id: int, followee_id: int) -> bool:
+        """언팔로우 (팔로우 중이 아니면 False), 타임라인에 전파된 작성자의 포스트도 제거"""
+        follow = await db.get(ChronicleFollow, (follower_id, followee_id))
+        if follow is None:
+            return False
+        await db.delete(follow)
+        await db.exec(
+            update(ChronicleAuthor)
+            .where(ChronicleAuthor.user_id == followee_id, ChronicleAuthor.follower_count > 0)
+            .values(follower_count=ChronicleAuthor.follower_count - 1)
+        )
+        await db.exec(delete(ChronicleTimelineEntry).where(
+            ChronicleTimelineEntry.user_id == follower_id, ChronicleTimelineEntry.author_id == followee_id
+        ))
+        return True
+
+    # ==================== 쓰기 시 전파 ====================
+
+    @staticmethod
+    async def fan_out(db: AsyncSession, post: ChroniclePost) -> None:
+        """새 포스트를 작성자 본인과 (push 작성자면) 팔로워 타임라인에 추가 (post.id가 있어야 함)"""
+        db.add(ChronicleTimelineEntry(user_id=post.user_id, post_id=post.id, author_id=post.user_id,
+                                      timestamp=post.timestamp))
+        if await ChronicleFeedService._pull_feed(db, post.user_id) in (None, True):  # 팔로워 없음 / pull 작성자
+            return
+        followers = (
+            select(ChronicleFollow.follower_id, literal(post.id), literal(post.user_id), literal(post.timestamp))
+            .where(ChronicleFollow.followee_id == post.user_id)
+        )
+        await db.exec(insert(ChronicleTimelineEntry).from_select(
+            ["user_id", "post_id", "author_id", "timestamp"], followers
+        ))
+
+    @staticmethod
+    async def remove_post(db: AsyncSession, post_id: int) -> None:
+        """삭제되는 포스트를 모든 타임라인에서 제거"""
+        await db.exec(delete(ChronicleTimelineEntry).where(ChronicleTimelineEntry.post_id == post_id))
+
+    # ==================== 홈 타임라인 ====================
+
+    @staticmethod
+    async def home_page(
+        db: AsyncSession,
+        user_id: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """본인과 팔로우 중인 작성자의 포스트 최신순 한 페이지"""
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+
+        pushed = (
+            select(ChronicleTimelineEntry.post_id.label("id"), ChronicleTimelineEntry.timestamp)
+            .where(ChronicleTimelineEntry.user_id == user_id)
+        )
+        if cursor:
+            pushed = pushed.where(ChronicleService.before_cursor(
+                ChronicleTimelineEntry.timestamp, ChronicleTimelineEntry.post_id, cursor))
+        pushed = pushed.order_by(ChronicleTimelineEntry.timestamp.desc(), ChronicleTimelineEntry.post_id.desc())
+        sources: List[List[Any]] = [(await db.exec(pushed.limit(limit + 1))).all()]
+
+        pull_authors = (await db.exec(
+            select(ChronicleFollow.followee_id)
+            .join(ChronicleAuthor, ChronicleAuthor.user_id == ChronicleFollow.followee_id)
+            .where(ChronicleFollow.follower_id == user_id, ChronicleAuthor.pull_feed == True)  # noqa: E712
+        )).all()
+        for author_id in pull_authors:
+            pulled = select(ChroniclePost.id, ChroniclePost.timestamp).where(ChroniclePost.user_id == author_id)
+            if cursor:
+                pulled = pulled.where(ChronicleService.before_cursor(ChroniclePost.timestamp, ChroniclePost.id, cursor))
+            pulled = pulled.order_by(ChroniclePost.timestamp.desc(), ChroniclePost.id.desc()).limit(limit + 1)
+            sources.append((await db.exec(pulled)).all())
+
+        # 각 목록은 이미 최신순이므로 병합만 하면 됨 (pull 전환 전에 전파된 포스트는 중복 제거)
+        entries: List[Any] = []
+        for entry in heapq.merge(*sources, key=lambda row: (row.timestamp, row.id), reverse=True):
+            if entries and entries[-1].id == entry.id:
+                continue
+            entries.append(entry)
+            if len(entries) > limit:
+                break
+
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        if not entries:
+            return b"[]", None, False
+        rows = (await db.exec(
+            ChronicleService.columns_statement()
+            .where(ChroniclePost.id.in_([entry.id for entry in entries]))
+            .order_by(ChroniclePost.timestamp.desc(), ChroniclePost.id.desc())
+        )).all()
+        next_cursor = ChronicleService.encode_cursor(entries[-1]) if has_more else None
+        return ChronicleService.encode_rows(rows), next_cursor, has_more
+
+
+# 프로세스 공용 공개 피드 캐시 (워커마다 따로 유지)
+public_feed_cache = PublicFeedCache(
+    ttl=settings.CHRONICLE_PUBLIC_FEED_TTL,
+    max_pages=settings.CHRONICLE_PUBLIC_FEED_CACHE_PAGES
+)
@@ -0,0 +1,189 @@
+"""
+크로니클 포스트 전문 검색
+chronicle_search FTS5 인덱스(m0008, 한글 바이그램)에서 찾고 작성자/유형/기간으로 거른 뒤 한 페이지만 본문을 조회한다.
+- recent: 최근 작성순(id 역순), FTS5가 rowid 순서로 바로 내놓으므로 정렬 없이 limit에서 멈춘다
+- relevance: bm25 순위(제목 가중) 순, 커서는 (순위, id, 순위 범위 하한)
+  순위는 일치하는 포스트를 모두 계산해야 정렬할 수 있어 흔한 검색어일수록 느려지므로,
+  최근 일치 포스트 CHRONICLE_SEARCH_RANK_WINDOW개(rowid 하한) 안에서만 매긴다. 하한은 첫 페이지에서 정해 커서로 넘긴다.
+- 작성자/유형 필터는 색인의 filter 컬럼 토큰과 교집합으로, 기간 필터는 해당 기간 포스트의 id 범위로 바꿔
+  FTS5가 조건 밖의 문서를 읽지 않게 한다.
+순위 점수는 인덱스 전체 통계로 계산되므로 페이지를 넘기는 사이 포스트가 추가되면 순서가 조금 바뀔 수 있다.
+"""
+
+import base64
+import binascii
+from datetime import date, datetime, time, timedelta
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, column, func, literal_column, or_, table
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..core.config import settings
+from ..db.fts import match_expression
+from ..models.chronicle import ChroniclePost
+from .chronicle_service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ChronicleService, InvalidCursorError
+
+Page = Tuple[bytes, Optional[str], bool]  # (JSON 배열 본문, 다음 페이지 커서, has_more)
+
+SEARCH_SORTS = ("relevance", "recent")
+
+# FTS5 가상 테이블 (rank: 마이그레이션에서 설정한 bm25 순위, 작을수록 관련도 높음)
+chronicle_search = table("chronicle_search", column("rowid"), column("rank"))
+_MATCH = literal_column("chronicle_search").op("MATCH")
+
+
+class SearchUnavailableError(RuntimeError):
+    """전문 검색 인덱스가 없는 DB (SQLite FTS5 전용)"""
+
+
+class SearchCursor:
+    """검색 페이지 커서 (recent: id / relevance: 순위, id, 순위 범위 하한)"""
+
+    def __init__(self, post_id: int, score: Optional[float] = None, floor: int = 0):
+        self.post_id = post_id
+        self.score = score
+        self.floor = floor
+
+    def encode(self) -> str:
+        raw = str(self.post_id) if self.score is None else f"{self.score!r}|{self.post_id}|{self.floor}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, sort: str, cursor: str) -> "SearchCursor":
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            if sort == "relevance":
+                score, post_id, floor = raw.split("|")
+                return cls(int(post_id), float(score), int(floor))
+            return cls(int(raw))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCursorError("잘못된 페이지 커서입니다") from e
+
+
+class ChronicleSearchService:
+    """크로니클 포스트 검색"""
+
+    @staticmethod
+    def full_match(match: str, user_id: Optional[int] = None, post_type: Optional[str] = None) -> str:
+        """검색어 MATCH 식은 본문 컬럼에만 적용하고 작성자/유형 필터 토큰을 AND로 추가 (m0008 filter 컬럼)"""
+        terms = [f"{{title body}} : ({match})"]
+        if user_id is not None:
+            terms.append(f'filter : "u{int(user_id)}"')
+        if post_type:
+            terms.append(f'filter : "t{post_type.encode().hex()}"')
+        return " AND ".join(terms)
+
+    @staticmethod
+    def date_range(start_date: Optional[date], end_date: Optional[date]) -> list:
+        filters = []
+        if start_date:
+            filters.append(ChroniclePost.timestamp >= datetime.combine(start_date, time.min))
+        if end_date:  # 종료일 포함
+            filters.append(ChroniclePost.timestamp < datetime.combine(end_date + timedelta(days=1), time.min))
+        return filters
+
+    @staticmethod
+    def search_statement(
+        match: str,
+        limit: int,
+        sort: str = "relevance",
+        cursor: Optional[SearchCursor] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None
+    ):
+        """검색 결과 (id, score) 한 페이지 조회문 (has_more 판단을 위해 limit + 1개)
+
+        match는 full_match로 만든 식, min_id / max_id는 FTS5가 바로 적용하는 rowid 범위 (기간의 id 범위, 순위 범위 하한)
+        """
+        rowid, rank = chronicle_search.c.rowid, chronicle_search.c.rank
+        # 최신순에서는 rank를 조회하지 않음 (bm25는 검색어의 전체 일치 문서 수를 세므로 limit에서 멈추지 못함)
+        score = rank if sort == "relevance" else literal_column("NULL")
+        statement = select(rowid.label("id"), score.label("score")).where(_MATCH(match))
+        if min_id is not None:
+            statement = statement.where(rowid >= min_id)
+        if max_id is not None:
+            statement = statement.where(rowid <= max_id)
+
+        filters = ChronicleSearchService.date_range(start_date, end_date)
+        if filters:  # id 범위 안에서 실제 작성 시각 확인
+            statement = statement.join(ChroniclePost, ChroniclePost.id == rowid).where(*filters)
+
+        if sort == "relevance":
+            if cursor:
+                statement = statement.where(or_(
+                    rank > cursor.score, and_(rank == cursor.score, rowid < cursor.post_id)
+                ))
+            return statement.order_by(rank, rowid.desc()).limit(limit + 1)
+        if cursor:
+            statement = statement.where(rowid < cursor.post_id)
+        return statement.order_by(rowid.desc()).limit(limit + 1)
+
+    @staticmethod
+    async def rank_floor(db: AsyncSession, match: str, max_id: Optional[int] = None) -> int:
+        """순위를 매길 최근 일치 포스트 범위의 rowid 하한 (일치 수가 범위보다 적으면 0)"""
+        rowid = chronicle_search.c.rowid
+        statement = select(rowid).where(_MATCH(match))
+        if max_id is not None:
+            statement = statement.where(rowid <= max_id)
+        statement = statement.order_by(rowid.desc()).offset(settings.CHRONICLE_SEARCH_RANK_WINDOW - 1).limit(1)
+        return (await db.exec(statement)).first() or 0
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        sort: str = "relevance",
+        user_id: Optional[int] = None,
+        post_type: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Page:
+        """검색 결과 한 페이지 (목록 API와 같은 포스트 JSON 배열)"""
+        if db.bind.dialect.name != "sqlite":
+            raise SearchUnavailableError("전문 검색은 SQLite DB에서만 지원합니다")
+        if sort not in SEARCH_SORTS:
+            raise ValueError(f"지원하지 않는 정렬입니다: {sort}")
+        position = SearchCursor.decode(sort, cursor) if cursor else None
+        match = match_expression(query)
+        if match is None:
+            return b"[]", None, False
+        match = ChronicleSearchService.full_match(match, user_id, post_type)
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+
+        min_id = max_id = None
+        if start_date or end_date:
+            min_id, max_id = (await db.exec(
+                select(func.min(ChroniclePost.id), func.max(ChroniclePost.id))
+                .where(*ChronicleSearchService.date_range(start_date, end_date))
+            )).one()
+            if min_id is None:
+                return b"[]", None, False
+        floor = 0
+        if sort == "relevance":
+            floor = position.floor if position else await ChronicleSearchService.rank_floor(db, match, max_id)
+            if floor:
+                min_id = max(min_id or 0, floor)
+
+        entries = (await db.exec(ChronicleSearchService.search_statement(
+            match, limit, sort, position, start_date, end_date, min_id, max_id
+        ))).all()
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        if not entries:
+            return b"[]", None, False
+
+        rows = (await db.exec(
+            ChronicleService.columns_statement().where(ChroniclePost.id.in_([entry.id for entry in entries]))
+        )).all()
+        by_id = {row.id: row for row in rows}
+        ordered: List[Any] = [by_id[entry.id] for entry in entries if entry.id in by_id]
+        next_cursor = None
+        if has_more:
+            last = entries[-1]
+            next_cursor = SearchCursor(last.id, last.score if sort == "relevance" else None, floor).encode()
+        return ChronicleService.encode_rows(ordered), next_cursor, has_more
@@ -0,0 +1,113 @@
+"""
+크로니클 포스트 조회 서비스
+(timestamp, id) 기준 keyset 페이지네이션: 다음 페이지는 마지막 항목보다 오래된 행부터 인덱스로 바로 찾으므로
+몇 번째 페이지든 첫 페이지와 같은 비용으로 조회된다.
+목록 응답은 ORM 객체/dict를 거치지 않고 행을 바로 JSON 본문으로 인코딩하며,
+rewards/user_content JSON 컬럼은 DB에 저장된 텍스트를 파싱하지 않고 그대로 붙인다.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import Text, and_, cast, or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..core.responses import dumps_json
+from ..models.chronicle import ChroniclePost
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 페이지 커서"""
+
+
+class ChronicleService:
+    """크로니클 포스트 조회"""
+
+    @staticmethod
+    def encode_cursor(post: Any) -> str:
+        """마지막 항목의 (timestamp, id)를 불투명 커서 문자열로 변환"""
+        raw = f"{post.timestamp.isoformat()}|{post.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            timestamp, post_id = raw.rsplit("|", 1)
+            return datetime.fromisoformat(timestamp), int(post_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCursorError("잘못된 페이지 커서입니다") from e
+
+    @staticmethod
+    def before_cursor(timestamp_column, id_column, cursor: str):
+        """커서 위치보다 오래된 행 조건: (timestamp, id) < 커서"""
+        timestamp, post_id = ChronicleService.decode_cursor(cursor)
+        return or_(timestamp_column < timestamp, and_(timestamp_column == timestamp, id_column < post_id))
+
+    @staticmethod
+    def columns_statement():
+        """목록 응답용 컬럼 조회문"""
+        return select(
+            ChroniclePost.id, ChroniclePost.user_id, ChroniclePost.type, ChroniclePost.title,
+            ChroniclePost.description, ChroniclePost.timestamp,
+            # JSON 컬럼을 텍스트 그대로 조회 (드라이버/SQLAlchemy의 json.loads 생략)
+            cast(ChroniclePost.rewards, Text).label("rewards"),
+            cast(ChroniclePost.user_content, Text).label("user_content"),
+        )
+
+    @staticmethod
+    def page_statement(user_id: Optional[int], limit: int, cursor: Optional[str] = None):
+        """최신순 한 페이지 조회문 (has_more 판단을 위해 limit + 1개 조회)
+
+        (user_id, timestamp) / (timestamp) 인덱스에는 rowid(id)가 포함되어 있어
+        ORDER BY timestamp DESC, id DESC를 정렬 없이 인덱스 순서대로 읽는다.
+        """
+        statement = ChronicleService.columns_statement()
+        if user_id is not None:
+            statement = statement.where(ChroniclePost.user_id == user_id)
+        if cursor:
+            statement = statement.where(ChronicleService.before_cursor(ChroniclePost.timestamp, ChroniclePost.id, cursor))
+        return statement.order_by(ChroniclePost.timestamp.desc(), ChroniclePost.id.desc()).limit(limit + 1)
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        user_id: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> Tuple[bytes, Optional[str], bool]:
+        """(JSON 배열 본문, 다음 페이지 커서, has_more) - user_id가 없으면 전체 공개 피드"""
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        rows = (await db.exec(ChronicleService.page_statement(user_id, limit, cursor))).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = ChronicleService.encode_cursor(rows[-1]) if has_more else None
+        return ChronicleService.encode_rows(rows), next_cursor, has_more
+
+    @staticmethod
+    def encode_rows(rows: Sequence[Any]) -> bytes:
+        """page_statement 결과 행들을 포스트 JSON 배열로 인코딩
+
+        JSON 컬럼 값은 m0006 마이그레이션 이후 항상 유효한 JSON 텍스트(또는 NULL)라 그대로 이어 붙인다.
+        """
+        parts = []
+        for row in rows:
+            head = dumps_json({
+                "id": row.id,
+                "user_id": row.user_id,
+                "type": row.type,
+                "title": row.title,
+                "description": row.description,
+                "timestamp": row.timestamp.isoformat() if row.timestamp else None,
+            })
+            parts.append(b"".join((
+                head[:-1], b',"rewards":', (row.rewards or "{}").encode(),
+                b',"user_content":', (row.user_content or "{}").encode(), b"}"
+            )))
+        return b"[" + b",".join(parts) + b"]"
@@ -0,0 +1,146 @@
+"""
+사용자별 금융 집계 (user_financial_summary) 유지
+BankAccount / Transaction이 추가·수정·삭제되는 flush마다 영향을 받은 사용자의 집계 행을 같은 트랜잭션에서 다시 계산한다.
+세션 이벤트(after_flush)로 처리하므로 원장 동기화, 회원가입 계좌 생성, 목업 데이터 등 어느 경로로 바꿔도 반영되고,
+커밋되지 않은 변경은 집계와 함께 롤백된다.
+계산은 사용자의 계좌 행만 계좌구분별로 묶어 읽고(계좌마다 최근 거래일시는 (account_id, transaction_date) 인덱스로 조회)
+거래 내역 전체를 다시 합하지 않는다.
+ORM을 거치지 않는 일괄 UPDATE/INSERT 문은 이벤트가 없으므로 refresh()를 직접 호출해야 한다.
+"""
+
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import delete, event, func, inspect as sa_inspect, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from ..models.financial import BankAccount, Transaction, UserFinancialSummary
+
+# 요약 API의 기존 계산과 같은 계좌구분
+DEMAND_TYPES = ("수시입출금",)
+ASSET_TYPES = ("수시입출금", "예금", "적금")
+LIABILITY_TYPES = ("대출",)
+SAVINGS_TYPES = ("예금", "적금")
+
+# 집계에 영향을 주는 속성 (그 외 속성만 바뀐 계좌/거래는 다시 계산하지 않음)
+ACCOUNT_FIELDS = ("user_id", "account_type", "balance")
+TRANSACTION_FIELDS = ("account_id", "transaction_date")
+
+
+class FinancialAggregateService:
+    """사용자별 금융 집계 조회/갱신"""
+
+    @staticmethod
+    def build_rows(groups: Iterable[Any], now: datetime) -> Dict[int, Dict[str, Any]]:
+        """(user_id, account_type, count, balance, last_transaction_date) 묶음 → 사용자별 집계 행"""
+        rows: Dict[int, Dict[str, Any]] = {}
+        for user_id, account_type, count, balance, last_transaction_date in groups:
+            row = rows.setdefault(user_id, {
+                "user_id": user_id, "total_balance": 0, "total_assets": 0, "total_liabilities": 0,
+                "net_worth": 0, "savings_balance": 0, "account_count": 0, "account_type_balances": {},
+                "last_transaction_date": None, "updated_at": now,
+            })
+            balance = int(balance or 0)
+            row["account_count"] += count
+            row["account_type_balances"][account_type] = balance
+            if account_type in DEMAND_TYPES:
+                row["total_balance"] += balance
+            if account_type in ASSET_TYPES:
+                row["total_assets"] += balance
+            if account_type in LIABILITY_TYPES:
+                row["total_liabilities"] += balance
+            if account_type in SAVINGS_TYPES:
+                row["savings_balance"] += balance
+            if last_transaction_date and (row["last_transaction_date"] is None
+                                          or last_transaction_date > row["last_transaction_date"]):
+                row["last_transaction_date"] = last_transaction_date
+        for row in rows.values():
+            row["net_worth"] = row["total_assets"] - row["total_liabilities"]
+        return rows
+
+    @staticmethod
+    def refresh(connection: Connection, user_ids: Iterable[int]) -> int:
+        """user_ids의 집계 행을 계좌 테이블에서 다시 계산 (호출한 커넥션의 트랜잭션 안에서 실행)
+
+        기존 행을 먼저 지워 같은 사용자를 동시에 갱신하는 트랜잭션이 행 잠금에서 기다린 뒤 최신 계좌를 읽게 한다.
+        """
+        user_ids = sorted(set(user_ids))
+        if not user_ids:
+            return 0
+        connection.execute(delete(UserFinancialSummary).where(UserFinancialSummary.user_id.in_(user_ids)))
+
+        last_transaction = (
+            select(func.max(Transaction.transaction_date))
+            .where(Transaction.account_id == BankAccount.id)
+            .scalar_subquery()
+        )
+        groups = connection.execute(
+            select(BankAccount.user_id, BankAccount.account_type, func.count(), func.sum(BankAccount.balance),
+                   func.max(last_transaction))
+            .where(BankAccount.user_id.in_(user_ids))
+            .group_by(BankAccount.user_id, BankAccount.account_type)
+        ).all()
+        rows = FinancialAggregateService.build_rows(groups, datetime.utcnow())
+        if rows:
+            connection.execute(insert(UserFinancialSummary), list(rows.values()))
+        return len(rows)
+
+    @staticmethod
+    def rebuild(connection: Connection, batch_size: int = 1000) -> int:
+        """계좌가 있는 모든 사용자의 집계 행 다시 계산 (마이그레이션 backfill)"""
+        user_ids = connection.execute(
+            select(BankAccount.user_id).distinct().order_by(BankAccount.user_id)
+        ).scalars().all()
+        refreshed = 0
+        for start in range(0, len(user_ids), batch_size):
+            refreshed += FinancialAggregateService.refresh(connection, user_ids[start:start + batch_size])
+        return refreshed
+
+    @staticmethod
+    def get(db: Session, user_id: int) -> Optional[UserFinancialSummary]:
+        """사용자 집계 행 (계좌가 없으면 None)
+
+        같은 세션에서 이미 읽은 행이 flush 이벤트로 갱신됐을 수 있으므로 identity map 값을 덮어쓴다.
+        """
+        return db.execute(
+            select(UserFinancialSummary).where(UserFinancialSummary.user_id == user_id)
+            .execution_options(populate_existing=True)
+        ).scalars().first()
+
+
+def _changed(obj: Any, fields: Iterable[str]) -> bool:
+    attrs = sa_inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+def _previous(obj: Any, field: str) -> Set[Any]:
+    """flush 전 값 (속성이 바뀐 경우)"""
+    return {value for value in sa_inspect(obj).attrs[field].history.deleted if value is not None}
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_after_flush(session: Session, flush_context) -> None:
+    user_ids: Set[int] = set()
+    account_ids: Set[int] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, BankAccount):
+            if obj in session.dirty and not _changed(obj, ACCOUNT_FIELDS):
+                continue
+            user_ids.add(obj.user_id)
+            user_ids |= _previous(obj, "user_id")
+        elif isinstance(obj, Transaction):
+            if obj in session.dirty and not _changed(obj, TRANSACTION_FIELDS):
+                continue
+            account_ids.add(obj.account_id)
+            account_ids |= _previous(obj, "account_id")
+    if not user_ids and not account_ids:
+        return
+
+    connection = session.connection()
+    if account_ids:
+        user_ids |= set(connection.execute(
+            select(BankAccount.user_id).where(BankAccount.id.in_(account_ids))
+        ).scalars())
+    FinancialAggregateService.refresh(connection, (user_id for user_id in user_ids if user_id is not None))
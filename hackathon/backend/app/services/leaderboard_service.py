@@ -0,0 +1,175 @@
+"""
+순위표(리더보드) 서비스
+카테고리별로 정렬 상태를 유지하는 순서 통계 구조(SortedList)를 두고 점수가 바뀔 때마다 갱신
+상위 N명, 내 순위, 내 위/아래 N명을 모두 O(log n)으로 조회
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from sortedcontainers import SortedList
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from ..core.xp_rules import total_credo
+
+logger = logging.getLogger(__name__)
+
+Score = Union[int, float, Tuple[Union[int, float], ...]]
+
+# credo: UserXP 누적 크레도 (DB), 나머지: 게이미피케이션 프로필
+CATEGORIES = ("credo", "level", "credits", "streak", "achievements")
+
+
+class Leaderboard:
+    """카테고리 하나의 순위표
+
+    정렬 키는 (-점수..., member) 평탄한 튜플이라 점수 내림차순, 동점이면 member 오름차순.
+    점수는 숫자 또는 (레벨, XP)처럼 앞 값부터 비교하는 튜플.
+    version을 함께 넘기면 이미 반영한 것보다 오래된 버전의 점수는 무시한다
+    (커밋 순서와 반영 순서가 뒤바뀌어도 마지막 커밋 값이 남음).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._ranking = SortedList()
+        self._entries: Dict[Hashable, Tuple[tuple, Score, Dict[str, Any]]] = {}
+        self._versions: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(member: Hashable, score: Score) -> tuple:
+        if isinstance(score, tuple):
+            return (*(-value for value in score), member)
+        return -score, member
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(self, member: Hashable, score: Score, version: Optional[int] = None, **info: Any) -> bool:
+        """점수 반영 (없으면 추가), info는 조회 결과에 함께 돌려줄 값, 오래된 버전이라 무시하면 False"""
+        key = self._key(member, score)
+        with self._lock:
+            if version is not None:
+                if version < self._versions.get(member, version):
+                    return False
+                self._versions[member] = version
+            self._set(member, key, score, info)
+            return True
+
+    def _set(self, member: Hashable, key: tuple, score: Score, info: Dict[str, Any]) -> None:
+        previous = self._entries.get(member)
+        if previous is not None and previous[0] != key:
+            self._ranking.remove(previous[0])
+        if previous is None or previous[0] != key:
+            self._ranking.add(key)
+        self._entries[member] = (key, score, info)
+
+    def remove(self, member: Hashable) -> bool:
+        with self._lock:
+            previous = self._entries.pop(member, None)
+            if previous is None:
+                return False
+            self._ranking.remove(previous[0])
+            return True
+
+    def load(self, items: Iterable[Tuple[Hashable, Score, Dict[str, Any]]],
+             versions: Optional[Dict[Hashable, int]] = None) -> int:
+        """전체 교체 (시작 시 DB에서 다시 만들 때), 정렬은 한 번만 수행
+
+        versions를 넘기면 DB를 읽는 동안 update()로 더 새 버전이 반영된 사용자와
+        읽은 뒤에 처음 생겨 스냅샷에 없는 사용자는 메모리의 값을 유지한다.
+        """
+        entries = {member: (self._key(member, score), score, info) for member, score, info in items}
+        ranking = SortedList(entry[0] for entry in entries.values())
+        merge = versions is not None
+        versions = dict(versions or {})
+        with self._lock:
+            current, self._entries, self._ranking = self._entries, entries, ranking
+            for member, version in self._versions.items():
+                if merge and member in current and version > versions.get(member, -1):
+                    _, score, info = current[member]
+                    self._set(member, current[member][0], score, info)
+                    versions[member] = version
+            self._versions = versions
+        return len(entries)
+
+    def rank(self, member: Hashable) -> Optional[int]:
+        """1부터 시작하는 순위 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(member)
+            return None if entry is None else self._ranking.index(entry[0]) + 1
+
+    def top(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+        with self._lock:
+            keys = list(self._ranking.islice(offset, offset + limit))
+            return [self._row(key, offset + i + 1) for i, key in enumerate(keys)]
+
+    def around(self, member: Hashable, above: int = 5, below: int = 5) -> Optional[Dict[str, Any]]:
+        """내 순위와 내 위 above명, 아래 below명"""
+        with self._lock:
+            entry = self._entries.get(member)
+            if entry is None:
+                return None
+            position = self._ranking.index(entry[0])
+            start = max(position - above, 0)
+            keys = list(self._ranking.islice(start, position + below + 1))
+            return {
+                "rank": position + 1,
+                "total": len(self._ranking),
+                "entries": [self._row(key, start + i + 1) for i, key in enumerate(keys)],
+            }
+
+    def _row(self, key: tuple, rank: int) -> Dict[str, Any]:
+        member = key[-1]
+        _, score, info = self._entries[member]
+        return {"rank": rank, "user_id": member, "score": score, **info}
+
+
+class LeaderboardRegistry:
+    """카테고리별 순위표 모음 (프로세스 공용)"""
+
+    def __init__(self, categories: Iterable[str] = CATEGORIES):
+        self._boards = {category: Leaderboard(category) for category in categories}
+
+    def __getitem__(self, category: str) -> Leaderboard:
+        if category not in self._boards:
+            raise ValueError(f"지원하지 않는 리더보드 카테고리: {category} (가능: {', '.join(self._boards)})")
+        return self._boards[category]
+
+    def categories(self) -> List[str]:
+        return list(self._boards)
+
+
+# 프로세스 공용 순위표 (워커마다 따로 유지되며, 이 프로세스를 거친 점수 변경만 즉시 반영)
+leaderboards = LeaderboardRegistry()
+
+
+def publish_credo(user_id: int, level: int, credo_score: int, total_xp: int, version: Optional[int] = None) -> bool:
+    """UserXP 변경을 크레도 순위표에 반영 (순위는 누적 크레도 기준)
+
+    version은 UserXP.version (갱신마다 1씩 증가), 커밋 후 반영 순서가 뒤바뀐 오래된 값은 무시한다.
+    """
+    return leaderboards["credo"].update(
+        user_id, total_credo(level, credo_score), version=version,
+        level=level, credo_score=credo_score, total_xp=total_xp
+    )
+
+
+def rebuild_credo_leaderboard(engine: Engine, batch_size: int = 50_000) -> int:
+    """UserXP 전체로 크레도 순위표를 다시 만듦 (서버 시작/레벨 곡선 조정 후)"""
+    started = time.monotonic()
+    items, versions = [], {}
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(
+            text("SELECT user_id, current_level, credo_score, total_xp, version FROM user_xp")
+        )
+        for user_id, level, credo_score, total_xp, version in result:
+            items.append((user_id, total_credo(level, credo_score),
+                          {"level": level, "credo_score": credo_score, "total_xp": total_xp}))
+            versions[user_id] = version
+    count = leaderboards["credo"].load(items, versions)
+    logger.info(f"크레도 리더보드 재구성: {count}명 ({time.monotonic() - started:.2f}초)")
+    return count
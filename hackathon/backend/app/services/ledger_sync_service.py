@@ -0,0 +1,362 @@
+"""
+SSAFY 거래내역 → 로컬 원장 동기화 서비스
+계좌별 하이 워터마크(마지막 거래고유번호/거래일자) 이후의 거래만 가져와 Transaction 테이블에 반영
+"""
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select, func
+from starlette.concurrency import run_in_threadpool
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timedelta
+import logging
+
+from ..core.config import settings
+from ..models.user import User
+from ..models.financial import BankAccount, Transaction, LedgerSyncState
+from .financial_aggregate_service import FinancialAggregateService
+from .spending_rollup_service import UPSERT_BATCH, RollupKey, SpendingRollupService, direction, month_key
+from .ssafy_api_service import AsyncSSAFYAPIService
+
+logger = logging.getLogger(__name__)
+
+# 거래요약으로 구분하는 지출 카테고리 (simulate_transactions.py 의 요약과 동일)
+SPENDING_CATEGORIES = (
+    "식비", "교통비", "생활비", "학비", "편의점", "카페",
+    "온라인 쇼핑", "도서", "영화/문화", "운동", "취미",
+)
+
+# SSAFY 거래구분 코드
+SSAFY_DEPOSIT_TYPE = "1"  # 입금 (출금은 "2")
+
+
+def extract_records(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """SSAFY 응답에서 레코드 목록 추출 (REC.list / REC / dataSearch.content)"""
+    rec = response.get("REC")
+    if isinstance(rec, dict):
+        return rec.get("list") or []
+    if isinstance(rec, list):
+        return rec
+    return response.get("dataSearch", {}).get("content") or []
+
+
+def categorize(summary: Optional[str], is_deposit: bool) -> str:
+    """거래요약 기반 카테고리 분류"""
+    if is_deposit:
+        return "수입"
+    for category in SPENDING_CATEGORIES:
+        if summary and category in summary:
+            return category
+    return "기타"
+
+
+def record_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    """SSAFY 거래 레코드 → Transaction 필드 (출금은 음수 금액)"""
+    is_deposit = str(record.get("transactionType")) == SSAFY_DEPOSIT_TYPE
+    amount = int(record.get("transactionBalance") or 0)
+    summary = record.get("transactionSummary") or record.get("transactionTypeName") or ""
+    return {
+        "transaction_type": "입금" if is_deposit else "출금",
+        "amount": amount if is_deposit else -amount,
+        "balance_after": int(record.get("transactionAfterBalance") or 0),
+        "description": summary,
+        "category": categorize(summary, is_deposit),
+        "transaction_date": datetime.strptime(
+            f"{record.get('transactionDate')}{record.get('transactionTime') or '000000'}", "%Y%m%d%H%M%S"
+        ),
+        "external_id": str(record.get("transactionUniqueNo")),
+    }
+
+
+class LedgerSyncError(Exception):
+    """로컬 원장에 반영할 수 없는 계좌 (다른 사용자의 계좌번호 등)"""
+
+
+class LedgerSyncService:
+    """SSAFY 수시입출금 거래내역을 로컬 Transaction 테이블로 미러링
+
+    DB 작업은 스레드풀에서 요청 세션과 같은 엔진의 별도 세션으로 실행해 이벤트 루프를 막지 않고,
+    업스트림 조회 중에는 DB 잠금을 잡지 않는다. 같은 계좌를 동시에 동기화해도
+    기록 단계가 쓰기 잠금(SQLite) / 계좌 행 잠금(PostgreSQL) 아래에서 워터마크를 다시 읽고,
+    거래는 (account_id, external_id) 유니크 인덱스에 ON CONFLICT DO NOTHING으로 넣으므로 중복되지 않는다.
+    """
+
+    service = AsyncSSAFYAPIService()
+
+    @staticmethod
+    def _unique_no(record: Dict[str, Any]) -> int:
+        try:
+            return int(record.get("transactionUniqueNo") or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _insert(db: Session):
+        return pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+    @staticmethod
+    def _is_fresh(state: Optional[LedgerSyncState], max_age: Optional[float], now: datetime) -> bool:
+        return bool(max_age and state and state.last_synced_at
+                    and (now - state.last_synced_at).total_seconds() < max_age)
+
+    @staticmethod
+    def _read_state(engine: Engine, user_id: int, account_no: str) -> Optional[LedgerSyncState]:
+        """사용자 계좌의 동기화 상태 (없으면 None)"""
+        with Session(engine, expire_on_commit=False) as db:
+            return db.exec(
+                select(LedgerSyncState)
+                .join(BankAccount, BankAccount.id == LedgerSyncState.account_id)
+                .where(BankAccount.user_id == user_id, BankAccount.account_number == account_no)
+            ).first()
+
+    @staticmethod
+    def _lock_account(db: Session, user: User, record: Dict[str, Any]) -> Tuple[BankAccount, bool]:
+        """로컬 계좌를 (없으면 만들고) 잠근 뒤 (계좌, 새로 만들었는지) 반환
+
+        INSERT ... ON CONFLICT DO NOTHING은 SQLite에서 트랜잭션의 쓰기 잠금을 먼저 잡으므로
+        이후 조회는 다른 동기화의 커밋 이후 상태를 읽는다.
+        """
+        created_date = record.get("accountCreatedDate")
+        now = datetime.utcnow()
+        created = db.execute(
+            LedgerSyncService._insert(db)(BankAccount).values(
+                user_id=user.id,
+                account_number=record["accountNo"],
+                bank_name=record.get("bankName") or "신한은행",
+                account_type="수시입출금",
+                account_name=record.get("accountName") or "수시입출금 계좌",
+                balance=int(record.get("accountBalance") or 0),
+                currency=record.get("currency") or "KRW",
+                is_active=True,
+                created_date=datetime.strptime(created_date, "%Y%m%d") if created_date else now,
+                created_at=now,
+                updated_at=now,
+            ).on_conflict_do_nothing(index_elements=["account_number"])
+        ).rowcount == 1
+        account = db.exec(
+            select(BankAccount)
+            .where(BankAccount.account_number == record["accountNo"], BankAccount.user_id == user.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).first()
+        if account is None:
+            raise LedgerSyncError(f"다른 사용자의 계좌번호입니다: {record['accountNo']}")
+        return account, created
+
+    @staticmethod
+    def _insert_transactions(db: Session, user: User, account: BankAccount,
+                             records: List[Dict[str, Any]], now: datetime) -> int:
+        """거래 일괄 INSERT (이미 있는 거래고유번호는 건너뜀) 후 월간 집계 반영, 새로 넣은 거래 수 반환
+
+        Core INSERT는 flush 이벤트가 없으므로 월간 카테고리 집계는 넣은 행으로 직접 증감한다.
+        """
+        connection = db.connection()
+        deltas: Dict[RollupKey, Tuple[int, int]] = {}
+        inserted = 0
+        for start in range(0, len(records), UPSERT_BATCH):
+            rows = [
+                {"account_id": account.id, "created_at": now, **record_fields(record)}
+                for record in records[start:start + UPSERT_BATCH]
+            ]
+            statement = LedgerSyncService._insert(db)(Transaction).values(rows).on_conflict_do_nothing(
+                index_elements=["account_id", "external_id"]
+            ).returning(Transaction.transaction_date, Transaction.category, Transaction.amount)
+            for transaction_date, category, amount in connection.execute(statement):
+                key = (user.id, month_key(transaction_date), account.id, category, direction(amount))
+                total, count = deltas.get(key, (0, 0))
+                deltas[key] = (total + abs(amount), count + 1)
+                inserted += 1
+        SpendingRollupService.apply(connection, deltas)
+        return inserted
+
+    @staticmethod
+    def _apply_history(engine: Engine, user: User, account_record: Dict[str, Any],
+                       records: List[Dict[str, Any]], max_age: Optional[float]) -> int:
+        """조회한 거래내역을 한 트랜잭션으로 기록 (잠금 아래에서 워터마크를 다시 읽음)"""
+        now = datetime.utcnow()
+        with Session(engine) as db:
+            account, created = LedgerSyncService._lock_account(db, user, account_record)
+            state = db.exec(
+                select(LedgerSyncState)
+                .where(LedgerSyncState.account_id == account.id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            ).first()
+            if LedgerSyncService._is_fresh(state, max_age, now):
+                # 조회하는 동안 다른 요청이 먼저 동기화함
+                db.commit()
+                return 0
+            state = state or LedgerSyncState(account_id=account.id)
+
+            watermark = int(state.last_transaction_unique_no or 0)
+            new_records = sorted(
+                (r for r in records if LedgerSyncService._unique_no(r) > watermark),
+                key=LedgerSyncService._unique_no
+            )
+            inserted = LedgerSyncService._insert_transactions(db, user, account, new_records, now)
+
+            if new_records:
+                last_record = new_records[-1]
+                last_fields = record_fields(last_record)
+                account.balance = last_fields["balance_after"]
+                account.last_transaction_date = last_fields["transaction_date"]
+                account.updated_at = now
+                db.add(account)
+                state.last_transaction_unique_no = str(last_record.get("transactionUniqueNo"))
+                state.last_transaction_date = last_record.get("transactionDate")
+                state.synced_count += inserted
+
+            state.last_synced_at = now
+            db.add(state)
+            db.flush()
+            if created or inserted:
+                # Core INSERT로 만든 계좌/거래는 flush 이벤트가 없으므로 사용자 집계를 직접 갱신
+                FinancialAggregateService.refresh(db.connection(), [user.id])
+            db.commit()
+            return inserted
+
+    @staticmethod
+    async def sync_account(db: Session, user: User, account_record: Dict[str, Any],
+                           max_age: Optional[float] = None) -> int:
+        """계좌 하나를 워터마크 이후로 동기화하고 새로 반영한 거래 수 반환
+
+        db는 엔진을 얻는 데만 사용하고, 조회/기록은 스레드풀에서 별도 세션으로 실행한다.
+        """
+        engine = db.get_bind()
+        account_no = account_record["accountNo"]
+        state = await run_in_threadpool(LedgerSyncService._read_state, engine, user.id, account_no)
+        if LedgerSyncService._is_fresh(state, max_age, datetime.utcnow()):
+            return 0
+
+        # 워터마크 거래일자부터 조회 (같은 날짜의 이미 반영된 거래는 거래고유번호로 제외)
+        start_date = (state.last_transaction_date if state else None) or (
+            datetime.now() - timedelta(days=settings.LEDGER_SYNC_INITIAL_DAYS)
+        ).strftime("%Y%m%d")
+        end_date = datetime.now().strftime("%Y%m%d")
+
+        # 업스트림 조회 중에는 DB 쓰기 잠금을 잡지 않도록 조회 후에 기록
+        response = await LedgerSyncService.service.get_transaction_history(
+            account_no, start_date, end_date, "A", "ASC", user.ssafy_user_key
+        )
+        return await run_in_threadpool(
+            LedgerSyncService._apply_history, engine, user, account_record, extract_records(response), max_age
+        )
+
+    @staticmethod
+    def _oldest_sync(engine: Engine, user_id: int) -> Optional[datetime]:
+        with Session(engine) as db:
+            return db.exec(
+                select(func.min(LedgerSyncState.last_synced_at))
+                .join(BankAccount, BankAccount.id == LedgerSyncState.account_id)
+                .where(BankAccount.user_id == user_id)
+            ).first()
+
+    @staticmethod
+    async def sync_user(db: Session, user: User, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """사용자의 모든 수시입출금 계좌 동기화
+
+        max_age(초) 이내에 동기화한 계좌는 업스트림 조회 없이 건너뛴다.
+        """
+        if not user.ssafy_user_key:
+            return {"synced_accounts": 0, "new_transactions": 0, "failed_accounts": []}
+
+        # 모든 계좌가 max_age 이내에 동기화되었으면 계좌 목록 조회도 생략
+        if max_age:
+            oldest_sync = await run_in_threadpool(LedgerSyncService._oldest_sync, db.get_bind(), user.id)
+            if oldest_sync and (datetime.utcnow() - oldest_sync).total_seconds() < max_age:
+                return {"synced_accounts": 0, "new_transactions": 0, "failed_accounts": []}
+
+        accounts = await LedgerSyncService.service.get_demand_deposit_accounts(user.ssafy_user_key)
+
+        new_transactions = 0
+        synced_accounts = 0
+        failed_accounts = []
+        for account_record in extract_records(accounts):
+            if not account_record.get("accountNo"):
+                continue
+            try:
+                new_transactions += await LedgerSyncService.sync_account(db, user, account_record, max_age)
+                synced_accounts += 1
+            except Exception as e:
+                failed_accounts.append(account_record["accountNo"])
+                logger.warning(f"원장 동기화 실패 ({account_record['accountNo']}): {str(e)}")
+
+        return {
+            "synced_accounts": synced_accounts,
+            "new_transactions": new_transactions,
+            "failed_accounts": failed_accounts
+        }
+
+    # ==================== 로컬 원장 조회 ====================
+
+    @staticmethod
+    def has_synced_ledger(db: Session, user_id: int) -> bool:
+        """동기화된 계좌가 하나라도 있는지 확인"""
+        return db.exec(
+            select(LedgerSyncState.id)
+            .join(BankAccount, BankAccount.id == LedgerSyncState.account_id)
+            .where(BankAccount.user_id == user_id)
+            .limit(1)
+        ).first() is not None
+
+    @staticmethod
+    def get_recent_transactions(db: Session, user_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+        """로컬 원장에서 최근 거래 조회 (대시보드 응답 형식)"""
+        rows = db.exec(
+            select(Transaction, BankAccount.account_type, BankAccount.account_name)
+            .join(BankAccount, BankAccount.id == Transaction.account_id)
+            .where(BankAccount.user_id == user_id)
+            .order_by(Transaction.transaction_date.desc())
+            .limit(limit)
+        ).all()
+
+        return [
+            {
+                "transactionUniqueNo": transaction.external_id,
+                "transactionDate": transaction.transaction_date.isoformat(),
+                "amount": transaction.amount,
+                "memo": transaction.description,
+                "category": transaction.category,
+                "balance_after": transaction.balance_after,
+                "account_type": account_type,
+                "account_name": account_name
+            }
+            for transaction, account_type, account_name in rows
+        ]
+
+    @staticmethod
+    def get_monthly_summary(db: Session, user_id: int, months: int = 3) -> Dict[str, Dict[str, int]]:
+        """로컬 원장에서 월별 수입/지출 집계 (최근 months개월, 달력 기준)"""
+        year, month = datetime.now().year, datetime.now().month
+        month_keys = []
+        for i in range(months):
+            month_keys.append(f"{year:04d}-{month:02d}")
+            if i < months - 1:
+                year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+
+        monthly_data = {
+            month_key: {"income": 0, "expense": 0, "net": 0}
+            for month_key in month_keys
+        }
+
+        rows = db.exec(
+            select(Transaction.transaction_date, Transaction.amount)
+            .join(BankAccount, BankAccount.id == Transaction.account_id)
+            .where(BankAccount.user_id == user_id)
+            .where(Transaction.transaction_date >= datetime(year, month, 1))
+        ).all()
+
+        for transaction_date, amount in rows:
+            month_data = monthly_data.get(transaction_date.strftime("%Y-%m"))
+            if month_data is None:
+                continue
+            if amount > 0:
+                month_data["income"] += amount
+            else:
+                month_data["expense"] += abs(amount)
+
+        for month_data in monthly_data.values():
+            month_data["net"] = month_data["income"] - month_data["expense"]
+
+        return monthly_data
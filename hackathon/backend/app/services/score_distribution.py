@@ -0,0 +1,178 @@
+"""
+캠퍼스 크레도 점수 분포 서비스
+총점/세부 점수(학사, 금융, 스킬, 활동)별로 고정 구간 히스토그램을 유지해 상위 백분율을 계산
+전체와 대학교별 코호트를 따로 집계하고, 사용자의 점수가 다시 계산될 때마다 이전 값을 빼고 새 값을 더한다.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 점수 항목별 최댓값 (SkillTreeService의 점수 계산 상한)
+METRIC_MAX_SCORES = {
+    "total": 4000,
+    "academic": 1000,
+    "financial": 1000,
+    "skill": 1000,
+    "activity": 1000,
+}
+ALL_COHORT = "__all__"
+
+
+class ScoreHistogram:
+    """0~max_score 정수 점수 히스토그램
+
+    점수가 정수라 구간 폭 1로 두면 근사 없이 정확한 순위가 나오고,
+    누적 개수는 펜윅 트리로 관리해 갱신/조회 모두 O(log 구간 수)다.
+    같은 범위의 히스토그램끼리는 구간별로 더해 합칠 수 있다 (워커별 집계 병합).
+    """
+
+    def __init__(self, max_score: int):
+        self.max_score = max_score
+        self._counts = [0] * (max_score + 1)
+        self._tree = [0] * (max_score + 2)
+        self.total = 0
+
+    def _clamp(self, score: int) -> int:
+        return min(max(int(score), 0), self.max_score)
+
+    def add(self, score: int, count: int = 1) -> None:
+        index = self._clamp(score)
+        self._counts[index] += count
+        self.total += count
+        index += 1
+        while index < len(self._tree):
+            self._tree[index] += count
+            index += index & -index
+
+    def remove(self, score: int) -> None:
+        self.add(score, -1)
+
+    def count_below(self, score: int) -> int:
+        """score 미만인 점수 개수"""
+        index, count = self._clamp(score), 0
+        while index > 0:
+            count += self._tree[index]
+            index -= index & -index
+        return count
+
+    def top_percentage(self, score: int) -> float:
+        """상위 백분율: score 이상인 사람의 비율 (1등이면 가장 작고, 꼴찌면 100)"""
+        return self.percentage(self.total, self.count_below(score))
+
+    @staticmethod
+    def percentage(total: int, below: int) -> float:
+        if total <= 0:
+            return 100.0
+        return round(max(total - below, 1) / total * 100, 2)
+
+    def merge(self, other: "ScoreHistogram") -> None:
+        if other.max_score != self.max_score:
+            raise ValueError("점수 범위가 다른 히스토그램은 합칠 수 없습니다")
+        for score, count in enumerate(other._counts):
+            if count:
+                self.add(score, count)
+
+
+class ScoreDistribution:
+    """항목 × 코호트(전체, 대학교)별 히스토그램 모음 (프로세스 공용)"""
+
+    def __init__(self, metric_max_scores: Dict[str, int] = METRIC_MAX_SCORES):
+        self.metric_max_scores = dict(metric_max_scores)
+        self._histograms: Dict[Tuple[str, str], ScoreHistogram] = {}
+        self._users: Dict[int, Tuple[Optional[str], Dict[str, int]]] = {}
+        self._lock = threading.Lock()
+
+    def _histogram(self, metric: str, cohort: str) -> ScoreHistogram:
+        key = (metric, cohort)
+        if key not in self._histograms:
+            self._histograms[key] = ScoreHistogram(self.metric_max_scores[metric])
+        return self._histograms[key]
+
+    def _cohorts(self, university: Optional[str]) -> Iterable[str]:
+        return (ALL_COHORT, university) if university else (ALL_COHORT,)
+
+    def record(self, user_id: int, scores: Dict[str, int], university: Optional[str] = None) -> None:
+        """사용자 점수 반영 (이전에 기록한 점수는 빼고 새 점수를 더함)"""
+        scores = {metric: scores[metric] for metric in self.metric_max_scores if metric in scores}
+        with self._lock:
+            previous = self._users.get(user_id)
+            if previous is not None:
+                old_university, old_scores = previous
+                for cohort in self._cohorts(old_university):
+                    for metric, score in old_scores.items():
+                        self._histogram(metric, cohort).remove(score)
+            for cohort in self._cohorts(university):
+                for metric, score in scores.items():
+                    self._histogram(metric, cohort).add(score)
+            self._users[user_id] = (university, scores)
+
+    def top_percentage(self, metric: str, score: int, university: Optional[str] = None,
+                       user_id: Optional[int] = None) -> float:
+        """상위 백분율 (university를 주면 같은 대학교 안에서)
+
+        user_id를 주면 그 사용자의 점수를 score로 기록한 것처럼 계산한다 (분포는 바꾸지 않음).
+        DB에 저장하기 전에 새 점수의 순위를 구하고, 커밋한 뒤에 record하는 데 사용
+        """
+        if metric not in self.metric_max_scores:
+            raise ValueError(f"지원하지 않는 점수 항목: {metric}")
+        cohort = university or ALL_COHORT
+        with self._lock:
+            histogram = self._histograms.get((metric, cohort))
+            total = histogram.total if histogram else 0
+            below = histogram.count_below(score) if histogram else 0
+            if user_id is not None:
+                previous = self._users.get(user_id)
+                if previous is not None and cohort in self._cohorts(previous[0]) and metric in previous[1]:
+                    total -= 1
+                    if histogram._clamp(previous[1][metric]) < histogram._clamp(score):
+                        below -= 1
+                total += 1
+        return ScoreHistogram.percentage(total, below)
+
+    def percentiles(self, scores: Dict[str, int], university: Optional[str] = None,
+                    user_id: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+        """항목별 전체/대학교 상위 백분율 (user_id는 top_percentage와 같음)"""
+        result = {}
+        for metric, score in scores.items():
+            if metric not in self.metric_max_scores:
+                continue
+            result[metric] = {"overall": self.top_percentage(metric, score, user_id=user_id)}
+            if university:
+                result[metric]["university"] = self.top_percentage(metric, score, university, user_id)
+        return result
+
+    def size(self, university: Optional[str] = None) -> int:
+        with self._lock:
+            histogram = self._histograms.get(("total", university or ALL_COHORT))
+            return histogram.total if histogram else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._users.clear()
+
+    def rebuild(self, engine: Engine) -> int:
+        """campuscredo 테이블 전체로 다시 집계 (서버 시작 시, 테이블이 없으면 0)"""
+        with engine.connect() as connection:
+            if not inspect(connection).has_table("campuscredo"):
+                return 0
+            rows = connection.execute(text(
+                "SELECT c.user_id, c.total_score, c.academic_score, c.financial_score, c.skill_score, "
+                'c.activity_score, u.current_university FROM campuscredo c LEFT JOIN "user" u ON u.id = c.user_id'
+            )).all()
+        self.clear()
+        for user_id, total, academic, financial, skill, activity, university in rows:
+            self.record(user_id, {"total": total, "academic": academic, "financial": financial,
+                                  "skill": skill, "activity": activity}, university)
+        logger.info(f"캠퍼스 크레도 분포 재집계: {len(rows)}명")
+        return len(rows)
+
+
+# 프로세스 공용 분포 (워커마다 따로 유지)
+score_distribution = ScoreDistribution()
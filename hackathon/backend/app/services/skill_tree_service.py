@@ -10,7 +10,10 @@ from ..models.skill_tree import (
     GrowthActivity, Quest, UserQuest, CampusCredo
 )
 from ..models.academic import AcademicRecord, Course, Scholarship
-from ..models.financial import BankAccount, Transaction, FinancialProduct, UserProduct, CreditScore
+from ..models.financial import Transaction, FinancialProduct, UserProduct, CreditScore
+from ..models.user import User
+from .financial_aggregate_service import FinancialAggregateService
+from .score_distribution import score_distribution
 
 logger = logging.getLogger(__name__)
 
@@ -644,16 +647,28 @@ class SkillTreeService:
         
         total_score = academic_score + financial_score + skill_score + activity_score
         
+        # 순위는 새 점수로 바뀐 분포 기준으로 계산 (분포 자체는 커밋 후 반영)
+        user = self.db.get(User, user_id)
+        university = user.current_university if user else None
+        scores = {
+            "total": total_score,
+            "academic": academic_score,
+            "financial": financial_score,
+            "skill": skill_score,
+            "activity": activity_score
+        }
+        
         # 등급 결정
         grade = self.determine_grade(total_score)
-        rank_percentage = self.calculate_rank_percentage(total_score)
+        rank_percentage = self.calculate_rank_percentage(total_score, university, user_id)
         
-        # 점수 세부 분석
+        # 점수 세부 분석 (항목별 전체/같은 대학교 내 상위 백분율 포함)
         score_breakdown = {
             "academic": academic_score,
             "financial": financial_score,
             "skill": skill_score,
-            "activity": activity_score
+            "activity": activity_score,
+            "percentiles": score_distribution.percentiles(scores, university, user_id)
         }
         
         # 개선 제안
@@ -675,10 +690,7 @@ class SkillTreeService:
             existing_credo.calculated_at = datetime.now()
             existing_credo.updated_at = datetime.now()
             
-            self.db.add(existing_credo)
-            self.db.commit()
-            self.db.refresh(existing_credo)
-            return existing_credo
+            credo = existing_credo
         else:
             credo = CampusCredo(
                 user_id=user_id,
@@ -695,11 +707,13 @@ class SkillTreeService:
                 created_at=datetime.now(),
                 updated_at=datetime.now()
             )
-            
-            self.db.add(credo)
-            self.db.commit()
-            self.db.refresh(credo)
-            return credo
+        
+        self.db.add(credo)
+        self.db.commit()
+        self.db.refresh(credo)
+        # 커밋된 점수만 점수 분포에 반영 (이전 점수는 빠지고 새 점수로 집계)
+        score_distribution.record(user_id, scores, university)
+        return credo
     
     def calculate_academic_score(self, user_id: int) -> int:
         """학사 점수 계산"""
@@ -730,24 +744,20 @@ class SkillTreeService:
     
     def calculate_financial_score(self, user_id: int) -> int:
         """금융 점수 계산"""
-        # 금융 정보 조회
-        accounts = self.db.exec(
-            select(BankAccount).where(BankAccount.user_id == user_id)
-        ).all()
+        # 금융 정보 조회 (계좌/거래 변경 시 갱신되는 사용자별 집계 행)
+        aggregate = FinancialAggregateService.get(self.db, user_id)
         
-        if not accounts:
+        if not aggregate:
             return 0
         
         score = 0
         
         # 저축 계좌 점수 (최대 400점)
-        savings_balance = sum(acc.balance for acc in accounts if acc.account_type in ["예금", "적금"])
-        savings_score = int(min(savings_balance / 1000000, 1) * 400)  # 100만원 기준
+        savings_score = int(min(aggregate.savings_balance / 1000000, 1) * 400)  # 100만원 기준
         score += savings_score
         
         # 계좌 다양성 점수 (최대 300점)
-        account_types = set(acc.account_type for acc in accounts)
-        diversity_score = len(account_types) * 75
+        diversity_score = len(aggregate.account_type_balances) * 75
         score += diversity_score
         
         # 신용 점수 (최대 300점)
@@ -826,23 +836,13 @@ class SkillTreeService:
         else:
             return "C"
     
-    def calculate_rank_percentage(self, total_score: int) -> float:
-        """점수에 따른 상위 백분율 계산 (목업)"""
-        # 실제로는 전체 사용자와 비교해야 함
-        if total_score >= 3500:
-            return 5.0  # 상위 5%
-        elif total_score >= 3000:
-            return 15.0  # 상위 15%
-        elif total_score >= 2500:
-            return 30.0  # 상위 30%
-        elif total_score >= 2000:
-            return 50.0  # 상위 50%
-        elif total_score >= 1500:
-            return 70.0  # 상위 70%
-        elif total_score >= 1000:
-            return 85.0  # 상위 85%
-        else:
-            return 95.0  # 상위 95%
+    def calculate_rank_percentage(self, total_score: int, university: Optional[str] = None,
+                                  user_id: Optional[int] = None) -> float:
+        """점수에 따른 상위 백분율 계산 (대학교가 있으면 같은 대학교 코호트, 없으면 전체 분포 기준)
+
+        user_id를 주면 그 사용자의 이전 점수 대신 total_score로 계산 (분포 반영 전)
+        """
+        return score_distribution.top_percentage("total", total_score, university, user_id)
     
     def generate_improvement_suggestions(
         self, academic_score: int, financial_score: int, skill_score: int, activity_score: int
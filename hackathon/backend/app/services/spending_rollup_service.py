@@ -0,0 +1,207 @@
+"""
+월간 카테고리별 수입/지출 집계 (monthly_category_rollup) 유지 및 조회
+거래가 추가·수정·삭제되는 flush마다 바뀐 거래의 (사용자, 월, 계좌, 카테고리, 방향) 행만 증감하고
+(거래 수가 0이 된 행은 삭제), 계좌가 다른 사용자로 옮겨지거나 삭제되면 그 계좌의 행을 옮기거나 지운다.
+모두 같은 트랜잭션에서 실행되므로 커밋되지 않은 변경은 집계와 함께 롤백된다.
+월 구분은 거래일시의 달력 월(YYYY-MM)이고, 금액이 양수면 수입, 0 이하면 지출로 본다 (홈 대시보드 월별 분석과 같은 기준).
+ORM을 거치지 않는 일괄 INSERT/UPDATE/DELETE 문은 이벤트가 없으므로 rebuild()를 직접 호출해야 한다.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import case, delete, event, func, inspect as sa_inspect, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from ..models.financial import BankAccount, MonthlyCategoryRollup, Transaction
+
+INCOME = "income"
+EXPENSE = "expense"
+
+MAX_ANALYTICS_MONTHS = 24
+UPSERT_BATCH = 500
+
+# 집계 키/금액에 영향을 주는 거래 속성
+TRANSACTION_FIELDS = ("account_id", "amount", "category", "transaction_date")
+
+RollupKey = Tuple[int, str, int, str, str]  # (user_id, year_month, account_id, category, direction)
+
+
+def month_key(value: datetime) -> str:
+    return value.strftime("%Y-%m")
+
+
+def recent_months(count: int, now: Optional[datetime] = None) -> List[str]:
+    """이번 달부터 거슬러 올라간 달력 월 count개 (최신 월 먼저)"""
+    now = now or datetime.now()
+    year, month = now.year, now.month
+    months = []
+    for _ in range(count):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return months
+
+
+def direction(amount: int) -> str:
+    return INCOME if amount > 0 else EXPENSE
+
+
+class SpendingRollupService:
+    """월간 카테고리별 수입/지출 집계 조회/갱신"""
+
+    @staticmethod
+    def apply(connection: Connection, deltas: Dict[RollupKey, Tuple[int, int]]) -> None:
+        """집계 행에 (금액, 거래 수) 증감 반영 (없는 행은 생성, 거래 수가 0 이하가 된 행은 삭제)"""
+        deltas = {key: delta for key, delta in deltas.items() if delta != (0, 0)}
+        if not deltas:
+            return
+        upsert = pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+        rows = [
+            {"user_id": user_id, "year_month": year_month, "account_id": account_id, "category": category,
+             "direction": flow, "amount": amount, "transaction_count": count}
+            for (user_id, year_month, account_id, category, flow), (amount, count) in sorted(deltas.items())
+        ]
+        for start in range(0, len(rows), UPSERT_BATCH):  # 문장당 바인드 변수 수 제한
+            statement = upsert(MonthlyCategoryRollup).values(rows[start:start + UPSERT_BATCH])
+            connection.execute(statement.on_conflict_do_update(
+                index_elements=[column.name for column in MonthlyCategoryRollup.__table__.primary_key.columns],
+                set_={
+                    "amount": MonthlyCategoryRollup.amount + statement.excluded.amount,
+                    "transaction_count": MonthlyCategoryRollup.transaction_count + statement.excluded.transaction_count,
+                },
+            ))
+        if any(count < 0 for _, count in deltas.values()):
+            connection.execute(delete(MonthlyCategoryRollup).where(
+                MonthlyCategoryRollup.user_id.in_({key[0] for key in deltas}),
+                MonthlyCategoryRollup.transaction_count <= 0,
+            ))
+
+    @staticmethod
+    def rebuild(connection: Connection, account_ids: Optional[Iterable[int]] = None) -> int:
+        """거래 테이블에서 집계 행을 한 번의 INSERT ... SELECT로 다시 생성 (account_ids가 없으면 전체, 마이그레이션 backfill)"""
+        if connection.dialect.name == "postgresql":
+            year_month = func.to_char(Transaction.transaction_date, "YYYY-MM")
+        else:
+            year_month = func.strftime("%Y-%m", Transaction.transaction_date)
+        flow = case((Transaction.amount > 0, literal(INCOME)), else_=literal(EXPENSE))
+        source = (
+            select(BankAccount.user_id, year_month, Transaction.account_id, Transaction.category, flow,
+                   func.sum(func.abs(Transaction.amount)), func.count())
+            .join(BankAccount, BankAccount.id == Transaction.account_id)
+            .group_by(BankAccount.user_id, year_month, Transaction.account_id, Transaction.category, flow)
+        )
+        clear = delete(MonthlyCategoryRollup)
+        if account_ids is not None:
+            account_ids = sorted(set(account_ids))
+            if not account_ids:
+                return 0
+            source = source.where(Transaction.account_id.in_(account_ids))
+            clear = clear.where(MonthlyCategoryRollup.account_id.in_(account_ids))
+        connection.execute(clear)
+        columns = ["user_id", "year_month", "account_id", "category", "direction", "amount", "transaction_count"]
+        return connection.execute(MonthlyCategoryRollup.__table__.insert().from_select(columns, source)).rowcount
+
+    @staticmethod
+    def monthly_statement(user_id: int, first_month: str, last_month: str, account_id: Optional[int] = None):
+        """사용자의 월 범위 (월, 카테고리, 방향)별 금액 합 조회문 ((user_id, year_month) 기본키 범위 탐색)"""
+        statement = (
+            select(MonthlyCategoryRollup.year_month, MonthlyCategoryRollup.category, MonthlyCategoryRollup.direction,
+                   func.sum(MonthlyCategoryRollup.amount))
+            .where(MonthlyCategoryRollup.user_id == user_id,
+                   MonthlyCategoryRollup.year_month >= first_month, MonthlyCategoryRollup.year_month <= last_month)
+            .group_by(MonthlyCategoryRollup.year_month, MonthlyCategoryRollup.category, MonthlyCategoryRollup.direction)
+        )
+        if account_id is not None:
+            statement = statement.where(MonthlyCategoryRollup.account_id == account_id)
+        return statement
+
+    @staticmethod
+    def monthly(db: Session, user_id: int, months: int, account_id: Optional[int] = None,
+                now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """최근 months개월(최신 월 먼저)의 수입/지출/순수입과 카테고리별 금액 (거래가 없는 월도 0으로 채움)"""
+        keys = recent_months(min(max(months, 1), MAX_ANALYTICS_MONTHS), now)
+        statement = SpendingRollupService.monthly_statement(user_id, keys[-1], keys[0], account_id)
+
+        categories: Dict[str, Dict[str, Dict[str, int]]] = {key: {} for key in keys}
+        for year_month, category, flow, amount in db.execute(statement):
+            totals = categories[year_month].setdefault(category, {INCOME: 0, EXPENSE: 0})
+            totals[flow] += int(amount or 0)
+
+        result = []
+        for key in keys:
+            breakdown = sorted(
+                ({"category": category, **totals} for category, totals in categories[key].items()),
+                key=lambda item: (-item[EXPENSE], -item[INCOME], item["category"])
+            )
+            income = sum(item[INCOME] for item in breakdown)
+            expense = sum(item[EXPENSE] for item in breakdown)
+            result.append({"year_month": key, "income": income, "expense": expense, "net": income - expense,
+                           "categories": breakdown})
+        return result
+
+
+def _before(obj: Any, field: str) -> Any:
+    """flush 전 DB에 있던 값 (바뀌지 않았으면 현재 값)"""
+    history = sa_inspect(obj).attrs[field].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(obj, field)
+
+
+def _changed(obj: Any, fields: Iterable[str]) -> bool:
+    attrs = sa_inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Session, "after_flush")
+def _rollup_after_flush(session: Session, flush_context) -> None:
+    # (account_id, year_month, category, direction) → (금액, 거래 수) 증감
+    changes: Dict[Tuple[int, str, str, str], List[int]] = defaultdict(lambda: [0, 0])
+
+    def add(account_id, transaction_date, category, amount, sign: int) -> None:
+        if account_id is None or transaction_date is None or amount is None:
+            return
+        totals = changes[(account_id, month_key(transaction_date), category, direction(amount))]
+        totals[0] += sign * abs(amount)
+        totals[1] += sign
+
+    moved: Dict[int, int] = {}
+    removed: Set[int] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Transaction):
+            if obj in session.new:
+                add(obj.account_id, obj.transaction_date, obj.category, obj.amount, 1)
+            elif obj in session.deleted:
+                add(*(_before(obj, field) for field in ("account_id", "transaction_date", "category", "amount")), -1)
+            elif _changed(obj, TRANSACTION_FIELDS):
+                add(*(_before(obj, field) for field in ("account_id", "transaction_date", "category", "amount")), -1)
+                add(obj.account_id, obj.transaction_date, obj.category, obj.amount, 1)
+        elif isinstance(obj, BankAccount) and obj.id is not None:
+            if obj in session.deleted:
+                removed.add(obj.id)
+            elif obj in session.dirty and _changed(obj, ("user_id",)):
+                moved[obj.id] = obj.user_id
+    if not changes and not moved and not removed:
+        return
+
+    connection = session.connection()
+    for account_id, user_id in moved.items():
+        connection.execute(
+            update(MonthlyCategoryRollup).where(MonthlyCategoryRollup.account_id == account_id).values(user_id=user_id)
+        )
+    if changes:
+        owners = dict(connection.execute(
+            select(BankAccount.id, BankAccount.user_id).where(BankAccount.id.in_({key[0] for key in changes}))
+        ).all())
+        deltas: Dict[RollupKey, Tuple[int, int]] = {}
+        for (account_id, year_month, category, flow), (amount, count) in changes.items():
+            if account_id in owners:  # 같은 flush에서 삭제된 계좌는 아래에서 행을 지움
+                deltas[(owners[account_id], year_month, account_id, category, flow)] = (amount, count)
+        SpendingRollupService.apply(connection, deltas)
+    if removed:
+        connection.execute(delete(MonthlyCategoryRollup).where(MonthlyCategoryRollup.account_id.in_(removed)))
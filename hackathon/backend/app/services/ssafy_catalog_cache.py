@@ -0,0 +1,226 @@
+"""
+SSAFY 상품/코드 카탈로그 캐시
+TTL 동안은 캐시를 그대로 반환하고, TTL이 지난 뒤에는 캐시를 반환하면서 백그라운드에서 갱신
+(stale-while-revalidate), 키별 업스트림 조회는 동시에 하나만 실행
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogCache:
+    """프로세스 공용 카탈로그 캐시
+
+    - 나이 < ttl: 캐시 반환 (hit)
+    - ttl <= 나이 < ttl + stale_ttl: 캐시 반환 후 백그라운드 갱신 (stale hit)
+    - 그 이상이거나 캐시 없음: 업스트림 조회 후 저장 (miss)
+
+    키별 업스트림 조회는 항상 하나만 진행되고, 동시에 들어온 miss는 진행 중인 조회 결과를 기다린다.
+    비동기 조회 Task는 요청 컨텍스트(요청 마감 시각 등)를 물려받지 않도록 빈 Context에서 시작하며,
+    기다리던 요청이 취소되어도 조회는 계속되어 다른 대기자와 캐시에 반영된다.
+    반환되는 dict는 모든 호출자가 공유하므로 수정하지 않아야 한다.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+        self._refreshing: Set[str] = set()  # 동기 백그라운드 갱신 중인 키
+        self._key_locks: Dict[str, threading.Lock] = {}  # 동기 miss 조회 직렬화
+        self._loads: Dict[str, asyncio.Task] = {}  # 진행 중인 비동기 조회 (miss/갱신 공용)
+        self._lock = threading.Lock()
+        self._generation = 0  # 무효화 이전에 시작된 조회 결과가 저장되지 않도록 구분
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "invalidations": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """(캐시값, 갱신 필요 여부) 반환 - 사용할 수 없으면 (None, False)"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None, False
+
+        value, fetched_at = entry
+        age = time.monotonic() - fetched_at
+        if age < self.ttl:
+            return value, False
+        if age < self.ttl + self.stale_ttl:
+            return value, True
+        return None, False
+
+    def _current_generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def _store(self, key: str, value: Any, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (value, time.monotonic())
+
+    def _begin_refresh(self, key: str) -> bool:
+        """같은 키의 백그라운드 갱신이 이미 진행 중이면 False"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def _load(self, key: str, value: Any, generation: int) -> Any:
+        """업스트림 조회 결과 저장 (갱신 횟수 집계)"""
+        self._store(key, value, generation)
+        self._count("refreshes")
+        return value
+
+    # ==================== 동기 ====================
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """캐시 조회 (동기 loader, 갱신은 백그라운드 스레드)"""
+        value, needs_refresh = self._lookup(key)
+        if value is None:
+            self._count("misses")
+            with self._lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                # 먼저 잠금을 잡은 스레드가 채운 값이 있으면 그대로 사용
+                value, _ = self._lookup(key)
+                if value is not None:
+                    return value
+                generation = self._current_generation()
+                try:
+                    return self._load(key, loader(), generation)
+                except Exception:
+                    self._count("refresh_errors")
+                    raise
+
+        if needs_refresh:
+            self._count("stale_hits")
+            if self._begin_refresh(key):
+                threading.Thread(
+                    target=self._refresh_sync,
+                    args=(key, loader, self._current_generation()),
+                    daemon=True
+                ).start()
+        else:
+            self._count("hits")
+        return value
+
+    def _refresh_sync(self, key: str, loader: Callable[[], Any], generation: int) -> None:
+        try:
+            self._load(key, loader(), generation)
+        except Exception as e:
+            self._count("refresh_errors")
+            logger.warning(f"카탈로그 캐시 갱신 실패 ({key}): {str(e)}")
+        finally:
+            self._end_refresh(key)
+
+    # ==================== 비동기 ====================
+
+    async def get_async(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 조회 (비동기 loader, miss와 갱신 모두 키별 단일 Task로 조회)"""
+        value, needs_refresh = self._lookup(key)
+        if value is None:
+            self._count("misses")
+            return await asyncio.shield(self._load_task(key, loader))
+
+        if needs_refresh:
+            self._count("stale_hits")
+            self._load_task(key, loader)
+        else:
+            self._count("hits")
+        return value
+
+    def _load_task(self, key: str, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """키별 진행 중인 조회 Task 반환 (없으면 빈 Context에서 새로 시작)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._loads.get(key)
+            if task is not None and not task.done() and task.get_loop() is loop:
+                return task
+            coroutine = self._load_async(key, loader, self._generation)
+            # 요청 마감 시각 등 호출한 요청의 contextvar를 물려받지 않음
+            task = contextvars.Context().run(loop.create_task, coroutine)
+            self._loads[key] = task
+        task.add_done_callback(lambda done: self._finish_load(key, done))
+        return task
+
+    def _finish_load(self, key: str, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._loads.get(key) is task:
+                del self._loads[key]
+        if not task.cancelled():
+            # 백그라운드 갱신 실패는 기다리는 쪽이 없으므로 여기서 확인 (경고 방지)
+            task.exception()
+
+    async def _load_async(self, key: str, loader: Callable[[], Awaitable[Any]], generation: int) -> Any:
+        try:
+            return self._load(key, await loader(), generation)
+        except Exception as e:
+            self._count("refresh_errors")
+            logger.warning(f"카탈로그 캐시 조회 실패 ({key}): {str(e)}")
+            raise
+
+    # ==================== 관리 ====================
+
+    def invalidate(self, keys: Optional[Iterable[str]] = None) -> None:
+        """캐시 무효화 (keys가 없으면 전체)
+
+        진행 중인 조회는 기다리는 호출자에게만 결과를 주고 저장하지 않으며,
+        이후의 miss는 새 조회를 시작한다.
+        """
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+                self._loads.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+                    self._loads.pop(key, None)
+            self._generation += 1
+            self._counters["invalidations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (절약된 업스트림 호출 수 포함)"""
+        with self._lock:
+            counters = dict(self._counters)
+            cached_keys = sorted(self._entries.keys())
+
+        lookups = counters["hits"] + counters["stale_hits"] + counters["misses"]
+        served_from_cache = counters["hits"] + counters["stale_hits"]
+        return {
+            **counters,
+            "ttl_seconds": self.ttl,
+            "stale_ttl_seconds": self.stale_ttl,
+            "cached_keys": cached_keys,
+            "hit_rate": (served_from_cache / lookups) if lookups else 0.0,
+            # 조회마다 업스트림을 호출했을 때 대비 줄어든 호출 수 (miss 조회와 백그라운드 갱신 모두 refreshes/refresh_errors)
+            "upstream_calls_saved": lookups - counters["refreshes"] - counters["refresh_errors"],
+        }
+
+
+# 프로세스 공용 카탈로그 캐시
+catalog_cache = CatalogCache(
+    ttl=settings.SSAFY_CATALOG_TTL,
+    stale_ttl=settings.SSAFY_CATALOG_STALE_TTL
+)
@@ -0,0 +1,56 @@
+"""
+요청 단위 SSAFY 조회 계획
+하나의 요청 안에서 같은 조회(메서드 + 인자)는 한 번만 실행하고 결과를 공유
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from .ssafy_api_service import AsyncSSAFYAPIService
+
+
+class SSAFYFetchPlan:
+    """요청 단위 메모이제이션 조회 계층
+
+    `get_*` 조회 메서드는 (메서드명, 인자) 단위로 하나의 Task로 실행되고,
+    같은 조회를 다시 요청하면 진행 중이거나 완료된 Task를 그대로 공유한다.
+    Task는 shield로 감싸서 반환하므로, 한 섹션이 시간 초과로 취소되어도
+    같은 조회를 기다리는 다른 섹션에는 영향을 주지 않는다.
+    """
+
+    def __init__(self, service: AsyncSSAFYAPIService):
+        self._service = service
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.fetch_count = 0  # 실제로 실행된 SSAFY 조회 수
+
+    def run_once(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+        """key 기준으로 factory를 한 번만 실행하고 결과를 공유"""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+        return asyncio.shield(task)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        # 조회 메서드만 메모이제이션 (생성/이체 등 변경 API는 노출하지 않음)
+        if not name.startswith("get_"):
+            raise AttributeError(name)
+
+        method = getattr(self._service, name)
+
+        def fetch(*args, **kwargs) -> Awaitable[Any]:
+            key = (name, args, tuple(sorted(kwargs.items())))
+            if key not in self._tasks:
+                self.fetch_count += 1
+            return self.run_once(key, lambda: method(*args, **kwargs))
+
+        return fetch
+
+    def close(self) -> None:
+        """요청 종료 시 아직 끝나지 않은 조회 취소"""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # 결과를 아무도 기다리지 않은 실패 Task의 경고 방지
+                task.exception()
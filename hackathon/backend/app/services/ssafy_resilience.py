@@ -0,0 +1,251 @@
+"""
+SSAFY API 호출 안정화 계층
+- 엔드포인트별 서킷 브레이커 (연속 실패 시 차단, 일정 시간 후 한 건만 시험 호출)
+- 조회(inquire*) API에 한해 지터를 준 지수 백오프 재시도
+- 인바운드 요청 기한(deadline)을 아웃바운드 호출 타임아웃에 반영
+"""
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SSAFYTransientError(Exception):
+    """일시적인 업스트림 장애 (타임아웃, 연결 오류, 5xx, 429) - 재시도/차단 대상"""
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 호출하지 않고 바로 실패"""
+
+
+class DeadlineExceededError(Exception):
+    """인바운드 요청 기한이 지나 아웃바운드 호출을 시작하지 않음"""
+
+
+def is_transient_status(status: int) -> bool:
+    """재시도/차단 대상 HTTP 상태 (5xx, 429)"""
+    return status >= 500 or status == 429
+
+
+# ==================== 요청 기한 ====================
+
+# 현재 요청의 기한 (time.monotonic 기준, 없으면 기한 없음)
+_request_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "ssafy_request_deadline", default=None
+)
+
+
+def set_request_deadline(seconds: float) -> contextvars.Token:
+    """현재 컨텍스트에 요청 기한 설정 (기존 기한보다 늘리지 않음)"""
+    deadline = time.monotonic() + seconds
+    current = _request_deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    return _request_deadline.set(deadline)
+
+
+def reset_request_deadline(token: contextvars.Token) -> None:
+    _request_deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """요청 기한까지 남은 시간 (초, 기한이 없으면 None)"""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def request_timeout(endpoint: str) -> float:
+    """이번 호출에 사용할 타임아웃 (기본 타임아웃과 남은 기한 중 작은 값)"""
+    remaining = remaining_time()
+    if remaining is None:
+        return settings.SSAFY_HTTP_TIMEOUT
+    if remaining <= 0:
+        raise DeadlineExceededError(f"SSAFY API 요청 기한 초과: {endpoint}")
+    return min(settings.SSAFY_HTTP_TIMEOUT, remaining)
+
+
+# ==================== 서킷 브레이커 ====================
+
+class CircuitBreaker:
+    """엔드포인트 단위 서킷 브레이커
+
+    - closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+    - open: reset_timeout 동안 호출 없이 바로 실패
+    - half_open: 시험 호출 한 건만 허용, 성공하면 closed / 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.rejected_calls = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """호출 허용 여부 확인 (허용하지 않으면 CircuitOpenError)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self.rejected_calls += 1
+        raise CircuitOpenError(f"SSAFY API 일시 차단 (장애 감지): {self.name}")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"SSAFY API 서킷 복구: {self.name}")
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"SSAFY API 서킷 차단: {self.name} (연속 실패 {self.consecutive_failures}회)")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """결과 없이 끝난 시험 호출 반납 (취소 등)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "rejected_calls": self.rejected_calls
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """엔드포인트별 서킷 브레이커 (프로세스 공용)"""
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                endpoint,
+                failure_threshold=settings.SSAFY_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=settings.SSAFY_BREAKER_RESET_TIMEOUT
+            )
+            _breakers[endpoint] = breaker
+        return breaker
+
+
+def circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
+
+
+def reset_circuit_breakers() -> None:
+    with _breakers_lock:
+        _breakers.clear()
+
+
+# ==================== 재시도 ====================
+
+def max_attempts(api_name: str) -> int:
+    """조회 API만 재시도 (변경 API는 중복 실행 위험이 있어 한 번만 호출)"""
+    if api_name.startswith("inquire"):
+        return 1 + settings.SSAFY_RETRY_ATTEMPTS
+    return 1
+
+
+def retry_delay(attempt: int) -> Optional[float]:
+    """attempt번째 실패 후 대기 시간 (full jitter), 남은 기한 안에 재시도할 수 없으면 None"""
+    delay = random.uniform(0, min(settings.SSAFY_RETRY_MAX_DELAY, settings.SSAFY_RETRY_BASE_DELAY * (2 ** (attempt - 1))))
+    remaining = remaining_time()
+    if remaining is not None and delay >= remaining:
+        return None
+    return delay
+
+
+def call_with_resilience(endpoint: str, api_name: str,
+                         send: Callable[[float], Any], on_retry: Callable[[], None]) -> Any:
+    """동기 호출 (send(timeout)는 일시 장애 시 SSAFYTransientError 발생)"""
+    breaker = get_circuit_breaker(endpoint)
+    attempts = max_attempts(api_name)
+    attempt = 0
+    while True:
+        timeout = request_timeout(endpoint)
+        breaker.before_call()
+        attempt += 1
+        try:
+            result = send(timeout)
+        except SSAFYTransientError:
+            breaker.record_failure()
+            delay = retry_delay(attempt) if attempt < attempts else None
+            if delay is None:
+                raise
+            logger.warning(f"SSAFY API 재시도 {attempt}/{attempts - 1}: {api_name}")
+            time.sleep(delay)
+            on_retry()
+            continue
+        except Exception:
+            # 업스트림은 응답했으므로 (4xx, 파싱 오류 등) 장애로 보지 않음
+            breaker.record_success()
+            raise
+        breaker.record_success()
+        return result
+
+
+async def call_with_resilience_async(endpoint: str, api_name: str,
+                                     send: Callable[[float], Awaitable[Any]], on_retry: Callable[[], None]) -> Any:
+    """비동기 호출 (call_with_resilience와 동일한 정책)"""
+    breaker = get_circuit_breaker(endpoint)
+    attempts = max_attempts(api_name)
+    attempt = 0
+    while True:
+        timeout = request_timeout(endpoint)
+        breaker.before_call()
+        attempt += 1
+        try:
+            result = await send(timeout)
+        except SSAFYTransientError:
+            breaker.record_failure()
+            delay = retry_delay(attempt) if attempt < attempts else None
+            if delay is None:
+                raise
+            logger.warning(f"SSAFY API 재시도 {attempt}/{attempts - 1}: {api_name}")
+            await asyncio.sleep(delay)
+            on_retry()
+            continue
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception:
+            breaker.record_success()
+            raise
+        breaker.record_success()
+        return result
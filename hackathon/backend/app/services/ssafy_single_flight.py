@@ -0,0 +1,129 @@
+"""
+SSAFY 조회 요청 single-flight
+동시에 진행 중인 동일한 조회(apiName + 인자)는 업스트림 호출 하나를 공유
+"""
+
+import asyncio
+import copy
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+# 요청마다 달라지는 헤더 필드 (동일 조회 판단에서 제외)
+VOLATILE_HEADER_FIELDS = frozenset({"transmissionDate", "transmissionTime", "institutionTransactionUniqueNo"})
+
+# 공유하면 안 되는 변경 API (조회처럼 보이지 않더라도 명시적으로 제외)
+MUTATING_API_NAMES = frozenset({
+    "issuedApiKey", "reIssuedApiKey",
+    "createDemandDeposit", "createDemandDepositAccount", "deleteDemandDepositAccount",
+    "updateDemandDepositAccountWithdrawal", "updateDemandDepositAccountDeposit",
+    "updateDemandDepositAccountTransfer", "updateTransferLimit", "transactionMemo",
+    "createDepositProduct", "createDepositAccount", "deleteDepositAccount",
+    "createProduct", "createAccount", "deleteAccount",
+    "createLoanProduct", "createLoanApplication", "createLoanAccount",
+    "updateRepaymentLoanBalanceInFull",
+    "openAccountAuth", "checkAuthCode",
+})
+
+
+def is_coalescible(api_name: str) -> bool:
+    """조회(inquire*) API만 공유 대상"""
+    return api_name.startswith("inquire") and api_name not in MUTATING_API_NAMES
+
+
+def request_key(base_url: str, endpoint: str, payload: Dict[str, Any]) -> str:
+    """동일 조회 판단 키 (헤더의 전송일시/기관거래고유번호 제외)"""
+    header = payload.get("Header") or {}
+    canonical = dict(payload)
+    canonical["Header"] = {k: v for k, v in header.items() if k not in VOLATILE_HEADER_FIELDS}
+    return f"{base_url}{endpoint}:{json.dumps(canonical, sort_keys=True, ensure_ascii=False, default=str)}"
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """진행 중인 동일 키 호출 공유
+
+    첫 호출자(leader)만 업스트림을 호출하고, 그 사이에 들어온 호출자는 같은 결과를 받는다.
+    호출이 끝나면 키를 지우므로 결과를 캐시하지는 않는다.
+    leader 외 호출자에게는 결과 사본을 돌려주어 호출자 간에 응답 dict를 공유하지 않는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._counters = {"leader_calls": 0, "coalesced_calls": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """동기 호출 공유 (스레드 간)"""
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+                self._counters["leader_calls"] += 1
+            else:
+                self._counters["coalesced_calls"] += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """비동기 호출 공유 (같은 이벤트 루프 안)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is not None and task.get_loop() is loop and not task.done():
+                self._counters["coalesced_calls"] += 1
+                is_leader = False
+            else:
+                task = loop.create_task(factory())
+                self._tasks[key] = task
+                task.add_done_callback(lambda t: self._forget(key, t))
+                self._counters["leader_calls"] += 1
+                is_leader = True
+
+        # 한 호출자가 취소되어도 공유 중인 업스트림 호출은 계속 진행
+        result = await asyncio.shield(task)
+        return result if is_leader else copy.deepcopy(result)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # 기다리던 호출자가 모두 취소된 경우의 미확인 예외 경고 방지
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            in_flight = len(self._calls) + len(self._tasks)
+        return {**counters, "in_flight": in_flight}
+
+
+# 프로세스 공용 single-flight
+ssafy_single_flight = SingleFlight()
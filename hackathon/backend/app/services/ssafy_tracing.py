@@ -0,0 +1,130 @@
+"""
+SSAFY API 아웃바운드 호출 트레이싱
+호출 단위로 엔드포인트/상태/소요시간을 구조화된 필드로 기록
+- 싱크(app.ssafy.trace 로거)가 꺼져 있거나 샘플링에서 빠지면 아무 것도 계산하지 않음
+- 본문/메시지 직렬화는 로그가 실제로 출력될 때만 수행
+- userKey, apiKey 값은 마스킹
+"""
+
+import json
+import random
+import time
+import logging
+from typing import Any, Dict, Optional
+
+from ..core.config import settings
+
+trace_logger = logging.getLogger("app.ssafy.trace")
+
+# 마스킹할 필드 (요청 Header 및 MEMBER API 본문)
+MASKED_FIELDS = frozenset({"userKey", "apiKey"})
+
+
+def mask_secrets(value: Any) -> Any:
+    """userKey/apiKey 값을 마스킹한 사본 반환"""
+    if isinstance(value, dict):
+        return {
+            key: _mask(item) if key in MASKED_FIELDS else mask_secrets(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [mask_secrets(item) for item in value]
+    return value
+
+
+def _mask(value: Any) -> str:
+    text = str(value)
+    return f"***{text[-4:]}" if len(text) > 8 else "***"
+
+
+class _LazyJSON:
+    """로그 레코드가 실제로 포맷될 때 직렬화"""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        fields = dict(self.fields)
+        # 원문 텍스트로 기록된 본문도 마스킹할 수 있도록 JSON이면 파싱
+        for key in ("request", "response"):
+            if isinstance(fields.get(key), str):
+                try:
+                    fields[key] = json.loads(fields[key])
+                except ValueError:
+                    pass
+        return json.dumps(mask_secrets(fields), ensure_ascii=False, default=str)
+
+
+class _NoopSpan:
+    """트레이싱이 꺼져 있을 때 사용하는 빈 span"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    async def __aenter__(self) -> "_NoopSpan":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def record(self, **fields: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """아웃바운드 호출 하나의 트레이스 (with 블록 단위로 소요시간 측정)"""
+
+    __slots__ = ("fields", "_started")
+
+    def __init__(self, endpoint: str, payload: Optional[Dict[str, Any]]):
+        self.fields: Dict[str, Any] = {
+            "endpoint": endpoint,
+            "api_name": ((payload or {}).get("Header") or {}).get("apiName"),
+        }
+        if settings.SSAFY_TRACE_BODIES:
+            self.fields["request"] = payload
+        self._started = 0.0
+
+    def __enter__(self) -> "Span":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.fields["duration_ms"] = round((time.perf_counter() - self._started) * 1000, 2)
+        if exc is not None:
+            self.fields["error_type"] = exc_type.__name__
+            self.fields["error"] = str(exc)
+        trace_logger.info("ssafy_call %s", _LazyJSON(self.fields))
+        return False
+
+    # `async with trace_call(...) as span, session.post(...) as response:` 형태로도 사용
+    async def __aenter__(self) -> "Span":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return self.__exit__(exc_type, exc, tb)
+
+    def record(self, **fields: Any) -> None:
+        """응답 상태 등 필드 기록 (response 본문은 SSAFY_TRACE_BODIES일 때만 유지)"""
+        if not settings.SSAFY_TRACE_BODIES:
+            fields.pop("response", None)
+        self.fields.update(fields)
+
+
+def trace_call(endpoint: str, payload: Optional[Dict[str, Any]] = None):
+    """아웃바운드 호출 span 시작 (싱크 비활성/샘플 제외 시 NOOP_SPAN)"""
+    if not settings.SSAFY_TRACE_ENABLED or not trace_logger.isEnabledFor(logging.INFO):
+        return NOOP_SPAN
+    if random.random() >= settings.SSAFY_TRACE_SAMPLE_RATE:
+        return NOOP_SPAN
+    return Span(endpoint, payload)
@@ -2,6 +2,7 @@ import aiohttp
 import requests
 from typing import Optional, Dict, Any, List
 from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime, timedelta
 import jwt
 import logging
@@ -17,6 +18,7 @@ from ..models.user import (
 )
 from ..db.session import get_session
 from ..models.financial import BankAccount, Transaction, CreditScore
+from .ssafy_tracing import trace_call, mask_secrets
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +30,7 @@ class SSAFYAPIService:
     async def check_email_exists(email: str) -> Dict[str, Any]:
         """SSAFY API에서 이메일 존재 여부 확인 (MEMBER_02)"""
         try:
-            logger.info(f"🔍 SSAFY API 이메일 중복 확인 시작: {email}")
+            logger.debug(f"🔍 SSAFY API 이메일 중복 확인 시작: {email}")
             
             # SSAFY API MEMBER_02 (사용자 계정 조회) 요청
             body = {
@@ -36,19 +38,15 @@ class SSAFYAPIService:
                 "userId": email
             }
             
-            logger.info(f"📤 SSAFY API 요청 전송: {settings.SSAFY_EMAIL_CHECK_URL}")
-            logger.info(f"📋 요청 본문: {body}")
-            
             async with aiohttp.ClientSession() as session:
-                async with session.post(
+                async with trace_call(settings.SSAFY_EMAIL_CHECK_URL, body) as span, session.post(
                     settings.SSAFY_EMAIL_CHECK_URL,  # 올바른 엔드포인트 사용
                     json=body, 
                     timeout=10
                 ) as response:
                     
                     response_text = await response.text()
-                    logger.info(f"📥 SSAFY API 응답 상태: {response.status}")
-                    logger.info(f"📥 SSAFY API 응답 내용: {response_text}")
+                    span.record(status=response.status, response=response_text)
                     
                     if response.status == 200:
                         try:
@@ -85,7 +83,7 @@ class SSAFYAPIService:
     async def create_user_account(email: str) -> Dict[str, Any]:
         """SSAFY API에 새 사용자 계정 생성 (MEMBER_01)"""
         try:
-            logger.info(f"🏭 SSAFY API 사용자 계정 생성 시작: {email}")
+            logger.debug(f"🏭 SSAFY API 사용자 계정 생성 시작: {email}")
             
             # SSAFY API MEMBER_01 요청 본문 구성 (단순한 형식)
             payload = {
@@ -93,12 +91,9 @@ class SSAFYAPIService:
                 "userId": email
             }
             
-            logger.info(f"📤 SSAFY API 요청 전송: {settings.SSAFY_API_BASE_URL}/member/")
-            logger.info(f"📋 요청 본문: {payload}")
-            
             # SSAFY API 호출
             async with aiohttp.ClientSession() as session:
-                async with session.post(
+                async with trace_call(f"{settings.SSAFY_API_BASE_URL}/member/", payload) as span, session.post(
                     f"{settings.SSAFY_API_BASE_URL}/member/",
                     json=payload,
                     timeout=30,
@@ -109,8 +104,7 @@ class SSAFYAPIService:
                 ) as response:
                     
                     response_text = await response.text()
-                    logger.info(f"📥 SSAFY API 응답 상태: {response.status}")
-                    logger.info(f"📥 SSAFY API 응답 내용: {response_text}")
+                    span.record(status=response.status, response=response_text)
                     
                     if response.status == 200:
                         try:
@@ -120,7 +114,7 @@ class SSAFYAPIService:
                             if data.get("responseCode") == "0000":  # 성공 코드
                                 user_key = data.get("userKey")
                                 if user_key:
-                                    logger.info(f"✅ SSAFY API 계정 생성 성공: {email} -> {user_key}")
+                                    logger.info(f"✅ SSAFY API 계정 생성 성공: {email}")
                                     return {
                                         "success": True,
                                         "user_key": user_key,
@@ -128,7 +122,7 @@ class SSAFYAPIService:
                                         "ssafy_data": data
                                     }
                                 else:
-                                    logger.error(f"❌ SSAFY API 응답에 userKey가 없음: {data}")
+                                    logger.error(f"❌ SSAFY API 응답에 userKey가 없음: {mask_secrets(data)}")
                                     return {
                                         "success": False,
                                         "message": "SSAFY API 응답에 userKey가 포함되지 않았습니다.",
@@ -233,10 +227,8 @@ class UserService:
     async def check_email_availability(self, email: str) -> EmailCheckResponse:
         """이메일 사용 가능 여부 확인 (SSAFY API + 자체 DB 확인)"""
         
-        # 1. 자체 DB에서 이메일 중복 확인
-        existing_user = self.db.exec(
-            select(User).where(User.email == email)
-        ).first()
+        # 1. 자체 DB에서 이메일 중복 확인 (동기 세션은 스레드풀에서)
+        existing_user = await run_in_threadpool(self.get_user_by_email, email)
         
         if existing_user:
             return EmailCheckResponse(
@@ -289,10 +281,9 @@ class UserService:
             # 2. SSAFY API에 사용자 등록
             ssafy_result = await SSAFYAPIService.register_to_ssafy(email)
             
-            # 3. 자체 DB에 사용자 생성
+            # 3. 자체 DB에 사용자 생성 (비밀번호 해시와 커밋은 스레드풀에서)
             new_user = User(
                 email=email,
-                password_hash=User.hash_password(password),
                 firebase_uid=firebase_uid,  # Firebase UID 저장
                 display_name=display_name or email.split('@')[0],  # 기본 표시명
                 current_university=university,
@@ -303,19 +294,7 @@ class UserService:
                 ssafy_user_name=ssafy_result.get("ssafy_data", {}).get("userName"),
                 ssafy_institution_code=ssafy_result.get("ssafy_data", {}).get("institutionCode")
             )
-            
-            self.db.add(new_user)
-            self.db.commit()
-            self.db.refresh(new_user)
-            
-            # 사용자 가입 시 자동으로 기본 계좌 및 거래 내역 생성
-            try:
-                logger.info(f"🏦 사용자 {new_user.id} 기본 계좌 자동 생성 시작")
-                account_setup_result = UserAccountSetupService.setup_user_financial_accounts(new_user.id, self.db)
-                logger.info(f"✅ 계좌 자동 생성 완료: {account_setup_result['message']}")
-            except Exception as account_error:
-                logger.error(f"⚠️ 계좌 자동 생성 실패 (사용자 생성은 성공): {account_error}")
-                # 계좌 생성 실패해도 사용자 생성은 성공으로 처리
+            await run_in_threadpool(self._insert_user, new_user, password)
             
             user_response = UserResponse(
                 id=new_user.id,
@@ -338,12 +317,31 @@ class UserService:
             
         except Exception as e:
             logger.error(f"사용자 생성 실패: {e}")
-            self.db.rollback()
+            await run_in_threadpool(self.db.rollback)
             return SignupResponse(
                 success=False,
                 message=f"회원가입 중 오류가 발생했습니다: {str(e)}"
             )
     
+    def _insert_user(self, new_user: User, password: str) -> None:
+        """비밀번호 해시 후 사용자 행 저장과 기본 계좌 생성 (스레드풀에서 실행)"""
+        new_user.password_hash = User.hash_password(password)
+        self.db.add(new_user)
+        self.db.commit()
+        self.db.refresh(new_user)
+        self._setup_default_accounts(new_user)
+        self.db.refresh(new_user)  # 계좌 생성 커밋으로 만료된 속성을 여기서 다시 읽음 (응답 생성 시 루프에서 조회하지 않도록)
+    
+    def _setup_default_accounts(self, new_user: User) -> None:
+        # 사용자 가입 시 자동으로 기본 계좌 및 거래 내역 생성
+        try:
+            logger.info(f"🏦 사용자 {new_user.id} 기본 계좌 자동 생성 시작")
+            account_setup_result = UserAccountSetupService.setup_user_financial_accounts(new_user.id, self.db)
+            logger.info(f"✅ 계좌 자동 생성 완료: {account_setup_result['message']}")
+        except Exception as account_error:
+            logger.error(f"⚠️ 계좌 자동 생성 실패 (사용자 생성은 성공): {account_error}")
+            # 계좌 생성 실패해도 사용자 생성은 성공으로 처리
+    
     def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """사용자 인증 (이메일 + 비밀번호)"""
         user = self.db.exec(
@@ -383,7 +381,15 @@ class UserService:
         firebase_uid: str,
         display_name: Optional[str] = None
     ) -> SignupResponse:
-        """Firebase 인증으로 새 사용자 생성"""
+        """Firebase 인증으로 새 사용자 생성 (DB 작업뿐이므로 전부 스레드풀에서 실행)"""
+        return await run_in_threadpool(self._create_user_from_firebase, email, firebase_uid, display_name)
+    
+    def _create_user_from_firebase(
+        self,
+        email: str,
+        firebase_uid: str,
+        display_name: Optional[str]
+    ) -> SignupResponse:
         try:
             # 1. 이메일 중복 확인
             existing_user = self.db.exec(
@@ -431,15 +437,7 @@ class UserService:
             self.db.add(new_user)
             self.db.commit()
             self.db.refresh(new_user)
-            
-            # 사용자 가입 시 자동으로 기본 계좌 및 거래 내역 생성
-            try:
-                logger.info(f"🏦 사용자 {new_user.id} 기본 계좌 자동 생성 시작")
-                account_setup_result = UserAccountSetupService.setup_user_financial_accounts(new_user.id, self.db)
-                logger.info(f"✅ 계좌 자동 생성 완료: {account_setup_result['message']}")
-            except Exception as account_error:
-                logger.error(f"⚠️ 계좌 자동 생성 실패 (사용자 생성은 성공): {account_error}")
-                # 계좌 생성 실패해도 사용자 생성은 성공으로 처리
+            self._setup_default_accounts(new_user)
             
             user_response = UserResponse(
                 id=new_user.id,
@@ -1,12 +1,20 @@
 from sqlmodel import Session, select, func
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from sqlalchemy import bindparam, case, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Optional, List, Dict, Any, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 import json
 from ..models.xp import (
-    UserXP, XPActivity, XPActivityType, XPAddRequest, XPResponse, UserProgress
+    UserXP, XPActivity, XPActivityType, XPAddRequest, XPResponse, UserProgress,
+    XPBatchItem, XPBatchItemResult, XPBatchResponse
 )
-from ..core.xp_rules import add_credo, to_response
-from ..db.session import get_session
+from ..core import xp_rules
+from ..core.xp_rules import add_credo, compute_credo_to_next, to_response, total_credo
+from ..db.session import engine, get_session
+from .leaderboard_service import leaderboards, publish_credo, rebuild_credo_leaderboard
 
 
 class XPService:
@@ -84,8 +92,35 @@ class XPService:
     @staticmethod
     def get_user_progress(user_id: int) -> UserProgress:
         """사용자 진행률 정보 가져오기"""
-        user_xp = XPService.get_or_create_user_xp(user_id)
+        return XPService._progress(user_id, XPService.get_or_create_user_xp(user_id))
+
+    @staticmethod
+    async def get_or_create_user_xp_async(session: AsyncSession, user_id: int) -> UserXP:
+        """사용자 크레도 데이터 가져오기 또는 생성 (비동기 세션)"""
+        statement = select(UserXP).where(UserXP.user_id == user_id)
+        user_xp = (await session.exec(statement)).first()
+        if user_xp:
+            return user_xp
         
+        now = datetime.utcnow()
+        session.add(UserXP(
+            user_id=user_id, current_level=1, current_xp=0, total_xp=0, credo_score=0,
+            created_at=now, updated_at=now
+        ))
+        try:
+            await session.commit()
+        except IntegrityError:
+            # 동시에 다른 요청이 먼저 생성한 경우
+            await session.rollback()
+        return (await session.exec(statement)).one()
+
+    @staticmethod
+    async def get_user_progress_async(session: AsyncSession, user_id: int) -> UserProgress:
+        """사용자 진행률 정보 가져오기 (비동기 세션)"""
+        return XPService._progress(user_id, await XPService.get_or_create_user_xp_async(session, user_id))
+
+    @staticmethod
+    def _progress(user_id: int, user_xp: UserXP) -> UserProgress:
         # 크레도 기반 레벨업 계산
         credo_to_next = XPService._calculate_credo_to_next(user_xp.current_level)
         progress = (user_xp.credo_score / credo_to_next * 100) if credo_to_next > 0 else 100
@@ -95,7 +130,7 @@ class XPService:
             current_level=user_xp.current_level,
             current_credo=user_xp.credo_score,
             credo_to_next=credo_to_next,
-            total_credo=user_xp.credo_score,
+            total_credo=total_credo(user_xp.current_level, user_xp.credo_score),
             current_xp=user_xp.current_xp,
             total_xp=user_xp.total_xp,
             progress=progress,
@@ -107,62 +142,259 @@ class XPService:
         user_id: int, 
         activity_type: XPActivityType, 
         description: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None
     ) -> XPResponse:
-        """활동에 따른 크레도 점수 추가"""
-        user_xp = XPService.get_or_create_user_xp(user_id)
-        
+        """활동에 따른 크레도 점수 추가
+
+        UserXP 생성/상대 증가/레벨업 반영, 활동 기록, 최근 활동 조회를 한 트랜잭션(커넥션 하나)에서 처리
+        session을 넘기면 요청 세션을 그대로 사용
+        """
         # 크레도와 XP 점수 계산
         credo_gained = XPService.ACTIVITY_CREDO_SCORES.get(activity_type, 0)
         xp_gained = XPService.ACTIVITY_XP_SCORES.get(activity_type, 0)
         
-        # 크레도 기반 레벨업 계산
-        old_level = user_xp.current_level
-        new_level, new_credo, credo_to_next, leveled_up = add_credo(
-            user_xp.current_level, user_xp.credo_score, credo_gained
-        )
-        
-        # 데이터베이스 업데이트
-        session = next(get_session())
-        try:
-            # UserXP 업데이트
-            user_xp.current_level = new_level
-            user_xp.current_xp += xp_gained
-            user_xp.total_xp += xp_gained
-            user_xp.credo_score = new_credo
-            user_xp.last_activity_at = datetime.utcnow()
-            user_xp.updated_at = datetime.utcnow()
+        with XPService._unit_of_work(session) as uow:
+            now = datetime.utcnow()
+            row = XPService._increment_user_xp(
+                uow, user_id, now,
+                credo_score=UserXP.credo_score + credo_gained,
+                current_xp=UserXP.current_xp + xp_gained,
+                total_xp=UserXP.total_xp + xp_gained
+            )
             
-            session.add(user_xp)
+            # 크레도 기반 레벨업 계산 (행 잠금을 잡은 상태에서 증가된 값으로 계산)
+            new_level, new_credo, credo_to_next, leveled_up = add_credo(row.current_level, row.credo_score, 0)
+            if leveled_up:
+                uow.execute(
+                    update(UserXP)
+                    .where(UserXP.id == row.id)
+                    .values(current_level=new_level, credo_score=new_credo)
+                    .execution_options(synchronize_session=False)
+                )
             
             # 활동 기록
             XPService._record_activity(
-                session, user_xp.id, activity_type, xp_gained, credo_gained, description, metadata
+                uow, row.id, activity_type, xp_gained, credo_gained, description, metadata, now
             )
-            
-            session.commit()
-            session.refresh(user_xp)
-        finally:
-            session.close()
+            recent_activities = XPService._get_recent_activities(uow, row.id)
+        publish_credo(user_id, new_level, new_credo, row.total_xp, row.version)
         
         # 진행률 계산
         progress = (new_credo / credo_to_next * 100) if credo_to_next > 0 else 100
         
         return XPResponse(
             level=new_level,
-            xp=user_xp.current_xp,
+            xp=row.current_xp,
             xp_to_next=credo_to_next,
-            total_xp=user_xp.total_xp,
-            credo_score=user_xp.credo_score,
+            total_xp=row.total_xp,
+            credo_score=new_credo,
             progress=progress,
             leveled_up=leveled_up,
-            recent_activities=XPService._get_recent_activities(user_xp.id)
+            recent_activities=recent_activities
+        )
+
+    @staticmethod
+    def add_credo_batch(
+        user_id: int,
+        items: List[XPBatchItem],
+        session: Optional[Session] = None
+    ) -> XPBatchResponse:
+        """여러 활동의 크레도 점수를 한 번에 추가
+
+        이미 적립된 idempotency_key 항목은 건너뛰고, 나머지 활동은 한 번에 bulk insert 한 뒤
+        합산한 크레도/XP를 한 번의 UPDATE로 반영한다. 항목별 레벨업 여부는 발생 시각 순서로 계산한다.
+        """
+        with XPService._unit_of_work(session) as uow:
+            now = datetime.utcnow()
+            # 사용자 행 잠금: 같은 사용자의 동시 배치는 순서대로 처리되어 중복 키 확인이 정확함
+            row = XPService._increment_user_xp(uow, user_id, now)
+            
+            keys = {item.idempotency_key for item in items if item.idempotency_key}
+            seen = set(uow.exec(
+                select(XPActivity.idempotency_key)
+                .where(XPActivity.user_xp_id == row.id, XPActivity.idempotency_key.in_(keys))
+            ).all()) if keys else set()
+            
+            occurred = [XPService._activity_time(item.occurred_at, now) for item in items]
+            results: List[Optional[XPBatchItemResult]] = [None] * len(items)
+            activities = []
+            level, credo_gained_total, xp_gained_total = row.current_level, 0, 0
+            for index in sorted(range(len(items)), key=lambda i: occurred[i]):
+                item = items[index]
+                if item.idempotency_key and item.idempotency_key in seen:
+                    results[index] = XPBatchItemResult(
+                        index=index, idempotency_key=item.idempotency_key, applied=False,
+                        credo_gained=0, level=level, leveled_up=False
+                    )
+                    continue
+                if item.idempotency_key:
+                    seen.add(item.idempotency_key)
+                
+                credo_gained = XPService.ACTIVITY_CREDO_SCORES.get(item.activity_type, 0)
+                xp_gained = XPService.ACTIVITY_XP_SCORES.get(item.activity_type, 0)
+                credo_gained_total += credo_gained
+                xp_gained_total += xp_gained
+                item_level = add_credo(row.current_level, row.credo_score, credo_gained_total)[0]
+                results[index] = XPBatchItemResult(
+                    index=index, idempotency_key=item.idempotency_key, applied=True,
+                    credo_gained=credo_gained, level=item_level, leveled_up=item_level > level
+                )
+                level = item_level
+                activities.append({
+                    "user_xp_id": row.id,
+                    "activity_type": item.activity_type,
+                    "xp_gained": xp_gained,
+                    "credo_gained": credo_gained,
+                    "description": item.description,
+                    "activity_metadata": json.dumps(item.metadata or {}, ensure_ascii=False),
+                    "idempotency_key": item.idempotency_key,
+                    "created_at": occurred[index]
+                })
+            
+            # 합산 크레도로 레벨업 한 번에 계산
+            new_level, new_credo, credo_to_next, _ = add_credo(row.current_level, row.credo_score, credo_gained_total)
+            if activities:
+                uow.execute(insert(XPActivity), activities)
+                uow.execute(
+                    update(UserXP)
+                    .where(UserXP.id == row.id)
+                    .values(
+                        current_level=new_level,
+                        credo_score=new_credo,
+                        current_xp=UserXP.current_xp + xp_gained_total,
+                        total_xp=UserXP.total_xp + xp_gained_total
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            recent_activities = XPService._get_recent_activities(uow, row.id)
+        publish_credo(user_id, new_level, new_credo, row.total_xp + xp_gained_total, row.version)
+        
+        progress = (new_credo / credo_to_next * 100) if credo_to_next > 0 else 100
+        
+        return XPBatchResponse(
+            level=new_level,
+            xp=row.current_xp + xp_gained_total,
+            xp_to_next=credo_to_next,
+            total_xp=row.total_xp + xp_gained_total,
+            credo_score=new_credo,
+            progress=progress,
+            leveled_up=new_level > row.current_level,
+            applied=len(activities),
+            duplicates=len(items) - len(activities),
+            items=results,
+            recent_activities=recent_activities
+        )
+
+    @staticmethod
+    def retune_level_curve(
+        base_credo: int,
+        multiplier: float,
+        session: Optional[Session] = None,
+        batch_size: int = 5000
+    ) -> int:
+        """레벨 곡선(BASE_CREDO/MULTIPLIER) 변경 후 모든 UserXP의 레벨/잔여 크레도 재계산
+
+        기존 곡선으로 누적 크레도를 구한 뒤 새 곡선으로 레벨을 다시 나누므로 사용자가 모은 크레도는 유지된다.
+        변환은 새 곡선을 담은 로컬 LevelCurve로 xp_rules.totals_for/resolve_totals를 전체 행에 한 번에 계산하고
+        (NumPy 벡터 연산), 결과는 id 기준 executemany UPDATE로 batch_size씩 반영하면서 바뀐 행의 version을 올린다.
+        이 프로세스의 곡선은 커밋이 끝난 뒤에 교체하므로 실패해 롤백되면 기존 곡선이 그대로 남는다.
+        값이 바뀐 행 수를 반환한다. 다른 워커 프로세스는 xp_rules의 상수를 같은 값으로 바꿔 재시작해야 한다.
+        """
+        curve = xp_rules.LevelCurve(base_credo, multiplier)
+        with XPService._unit_of_work(session) as uow:
+            rows = uow.exec(select(UserXP.id, UserXP.current_level, UserXP.credo_score)).all()
+            changes = []
+            if rows:
+                ids, levels, credos = zip(*rows)
+                resolved = xp_rules.resolve_totals(xp_rules.totals_for(levels, credos), curve=curve)
+
+                now = datetime.utcnow()
+                changes = [
+                    {"row_id": row_id, "new_level": level, "new_credo": credo, "now": now}
+                    for row_id, old_level, old_credo, level, credo
+                    in zip(ids, levels, credos, resolved["level"], resolved["credo"])
+                    if (level, credo) != (old_level, old_credo)
+                ]
+                # version도 올려 이전 곡선으로 계산해 아직 반영 중인 publish_credo가 재구성한 순위를 덮지 않도록 함
+                table = UserXP.__table__
+                statement = (
+                    update(table)
+                    .where(table.c.id == bindparam("row_id"))
+                    .values(current_level=bindparam("new_level"), credo_score=bindparam("new_credo"),
+                            updated_at=bindparam("now"), version=table.c.version + 1)
+                )
+                for start in range(0, len(changes), batch_size):
+                    uow.execute(statement, changes[start:start + batch_size])
+            bind = uow.get_bind()
+        xp_rules.configure(curve=curve)
+        if rows:
+            rebuild_credo_leaderboard(bind)
+        return len(changes)
+
+    @staticmethod
+    def _activity_time(occurred_at: Optional[datetime], now: datetime) -> datetime:
+        """클라이언트 발생 시각을 UTC naive로 변환 (없거나 미래면 현재 시각)"""
+        if occurred_at is None:
+            return now
+        if occurred_at.tzinfo is not None:
+            occurred_at = occurred_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return min(occurred_at, now)
+
+    @staticmethod
+    @contextmanager
+    def _unit_of_work(session: Optional[Session] = None) -> Iterator[Session]:
+        """한 트랜잭션으로 실행 (성공 시 커밋, 실패 시 롤백)"""
+        owned = session is None
+        session = session or Session(engine)
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if owned:
+                session.close()
+
+    @staticmethod
+    def _increment_user_xp(session: Session, user_id: int, now: datetime, **values):
+        """UserXP 상대 갱신 (UPDATE ... SET credo_score = credo_score + :delta) 후 갱신된 행 반환
+
+        UPDATE가 행 잠금(SQLite는 쓰기 잠금)을 잡으므로 동시 요청의 증가분이 사라지지 않는다.
+        version도 같은 UPDATE에서 올리므로 커밋 순서대로 증가하고, 리더보드는 더 큰 version만 반영한다.
+        행이 없으면 생성 후 다시 갱신한다.
+        """
+        statement = (
+            update(UserXP)
+            .where(UserXP.user_id == user_id)
+            .values(last_activity_at=now, updated_at=now, version=UserXP.version + 1, **values)
+            .returning(UserXP.id, UserXP.current_level, UserXP.credo_score, UserXP.current_xp, UserXP.total_xp,
+                       UserXP.version)
+            .execution_options(synchronize_session=False)
         )
+        row = session.execute(statement).first()
+        if row is None:
+            XPService._insert_user_xp(session, user_id, now)
+            row = session.execute(statement).one()
+        return row
+
+    @staticmethod
+    def _insert_user_xp(session: Session, user_id: int, now: datetime) -> None:
+        """UserXP 행 생성 (동시에 생성된 경우 무시)"""
+        values = dict(
+            user_id=user_id, current_level=1, current_xp=0, total_xp=0, credo_score=0,
+            created_at=now, updated_at=now
+        )
+        if session.get_bind().dialect.name == "postgresql":
+            session.execute(pg_insert(UserXP).values(**values).on_conflict_do_nothing(index_elements=["user_id"]))
+        else:
+            # SQLite는 앞선 UPDATE가 이미 쓰기 잠금을 잡고 있어 다른 요청이 끼어들 수 없음
+            session.execute(insert(UserXP).values(**values))
 
     @staticmethod
     def _calculate_credo_to_next(level: int) -> int:
         """다음 레벨까지 필요한 크레도 점수 계산"""
-        from ..core.xp_rules import compute_credo_to_next
         return compute_credo_to_next(level)
 
     @staticmethod
@@ -173,7 +405,8 @@ class XPService:
         xp_gained: int,
         credo_gained: int,
         description: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime] = None
     ):
         """활동 기록 저장"""
         # 메타데이터를 JSON 문자열로 변환
@@ -186,108 +419,102 @@ class XPService:
             credo_gained=credo_gained,
             description=description,
             activity_metadata=metadata_json,
-            created_at=datetime.utcnow()
+            created_at=created_at or datetime.utcnow()
         )
         session.add(activity)
 
     @staticmethod
-    def _get_recent_activities(user_xp_id: int) -> List[Dict[str, Any]]:
+    def _get_recent_activities(session: Session, user_xp_id: int) -> List[Dict[str, Any]]:
         """최근 활동 내역 가져오기"""
-        session = next(get_session())
-        try:
-            activities = session.exec(
-                select(XPActivity)
-                .where(XPActivity.user_xp_id == user_xp_id)
-                .order_by(XPActivity.created_at.desc())
-                .limit(10)
-            ).all()
-            
-            return [
-                {
-                    "type": activity.activity_type,
-                    "xp_gained": activity.xp_gained,
-                    "credo_gained": activity.credo_gained,
-                    "description": activity.description,
-                    "created_at": activity.created_at.isoformat()
-                }
-                for activity in activities
-            ]
-        finally:
-            session.close()
+        activities = session.exec(
+            select(XPActivity)
+            .where(XPActivity.user_xp_id == user_xp_id)
+            .order_by(XPActivity.created_at.desc())
+            .limit(10)
+        ).all()
+        
+        return [
+            {
+                "type": activity.activity_type,
+                "xp_gained": activity.xp_gained,
+                "credo_gained": activity.credo_gained,
+                "description": activity.description,
+                "created_at": activity.created_at.isoformat()
+            }
+            for activity in activities
+        ]
 
     @staticmethod
-    def get_leaderboard(limit: int = 10) -> List[Dict[str, Any]]:
-        """크레도 점수 기반 리더보드"""
-        session = next(get_session())
-        try:
-            users = session.exec(
-                select(UserXP)
-                .order_by(UserXP.credo_score.desc())
-                .limit(limit)
-            ).all()
-            
-            return [
-                {
-                    "user_id": user.user_id,
-                    "credo_score": user.credo_score,
-                    "level": user.current_level,
-                    "total_xp": user.total_xp
-                }
-                for user in users
-            ]
-        finally:
-            session.close()
+    def get_leaderboard(limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+        """누적 크레도 기반 리더보드 (메모리 순위표에서 조회)"""
+        return [
+            XPService._leaderboard_row(entry)
+            for entry in leaderboards["credo"].top(limit, offset)
+        ]
+
+    @staticmethod
+    def get_my_rank(user_id: int, above: int = 5, below: int = 5) -> Optional[Dict[str, Any]]:
+        """내 순위와 위/아래 사용자 (활동 기록이 없으면 None)"""
+        around = leaderboards["credo"].around(user_id, above, below)
+        if around is None:
+            return None
+        around["entries"] = [XPService._leaderboard_row(entry) for entry in around["entries"]]
+        return around
+
+    @staticmethod
+    def _leaderboard_row(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "rank": entry["rank"],
+            "user_id": entry["user_id"],
+            "total_credo": entry["score"],
+            "credo_score": entry["credo_score"],
+            "level": entry["level"],
+            "total_xp": entry["total_xp"]
+        }
 
     @staticmethod
     def deduct_credo_for_post_deletion(
         user_id: int,
         post_id: str,
-        description: str = "크로니클 포스트 삭제"
+        description: str = "크로니클 포스트 삭제",
+        session: Optional[Session] = None
     ) -> XPResponse:
         """포스트 삭제 시 크레도 점수 차감"""
-        user_xp = XPService.get_or_create_user_xp(user_id)
-        
         # 삭제 시 차감할 크레도 점수 (기본값: 2점)
         credo_deduction = 2
         
-        # 크레도 점수 차감 (음수 방지)
-        old_credo = user_xp.credo_score
-        new_credo = max(0, old_credo - credo_deduction)
-        
-        # 데이터베이스 업데이트
-        session = next(get_session())
-        try:
-            # UserXP 업데이트
-            user_xp.credo_score = new_credo
-            user_xp.last_activity_at = datetime.utcnow()
-            user_xp.updated_at = datetime.utcnow()
-            
-            session.add(user_xp)
+        with XPService._unit_of_work(session) as uow:
+            now = datetime.utcnow()
+            # 크레도 점수 차감 (음수 방지)
+            row = XPService._increment_user_xp(
+                uow, user_id, now,
+                credo_score=case(
+                    (UserXP.credo_score > credo_deduction, UserXP.credo_score - credo_deduction),
+                    else_=0
+                )
+            )
             
             # 삭제 활동 기록 (차감된 점수를 음수로 기록)
             XPService._record_activity(
-                session, user_xp.id, XPActivityType.POST_SHARE, 0, -credo_deduction, 
-                description, {"post_id": post_id, "action": "delete", "deduction": credo_deduction}
+                uow, row.id, XPActivityType.POST_SHARE, 0, -credo_deduction, 
+                description, {"post_id": post_id, "action": "delete", "deduction": credo_deduction}, now
             )
-            
-            session.commit()
-            session.refresh(user_xp)
-        finally:
-            session.close()
+            recent_activities = XPService._get_recent_activities(uow, row.id)
+        publish_credo(user_id, row.current_level, row.credo_score, row.total_xp, row.version)
         
         # 진행률 계산
-        credo_to_next = XPService._calculate_credo_to_next(user_xp.current_level)
-        progress = (new_credo / credo_to_next * 100) if credo_to_next > 0 else 100
+        credo_to_next = XPService._calculate_credo_to_next(row.current_level)
+        progress = (row.credo_score / credo_to_next * 100) if credo_to_next > 0 else 100
         
         return XPResponse(
-            level=user_xp.current_level,
-            xp=user_xp.current_xp,
+            level=row.current_level,
+            xp=row.current_xp,
             xp_to_next=credo_to_next,
-            total_xp=user_xp.total_xp,
-            credo_score=user_xp.credo_score,
+            total_xp=row.total_xp,
+            credo_score=row.credo_score,
             progress=progress,
             leveled_up=False,
-            recent_activities=XPService._get_recent_activities(user_xp.id)
+            recent_activities=recent_activities
         )
 
     @staticmethod
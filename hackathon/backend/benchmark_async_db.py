@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+동기/비동기 DB 세션 벤치마크
+async 라우트에서 동기 Session을 직접 호출하면 느린 쿼리 하나가 이벤트 루프 전체를 막는다.
+느린 쿼리(전체 스캔)와 빠른 쿼리(기본키 조회)가 섞인 요청을 일정한 속도로 도착시키고,
+동기 세션(기존 방식)과 비동기 세션(aiosqlite/asyncpg)의 처리량과 요청 지연 시간(대기 포함)을 비교한다.
+
+쓰기 혼합: 비동기 세션 쓰기와 동기 Session 쓰기가 같은 SQLite 파일에 섞이면, 이벤트 루프에서 실행한
+동기 쓰기는 잠금을 잡은 aiosqlite 쓰기가 커밋하기를 기다리는데 그 커밋은 막힌 루프를 기다린다.
+busy_timeout이 끝날 때까지 루프 전체가 멈추고 동기 쓰기는 "database is locked"로 실패한다.
+같은 요청을 동기 쓰기만 스레드풀로 옮겨 실행한 결과와 비교한다.
+
+실행:
+    python benchmark_async_db.py --rows 200000 --rate 100 --duration 10 --slow-ratio 0.05 --write-ratio 0.5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.session import create_app_engine, create_async_app_engine
+from load_test import percentile
+
+SLOW_QUERY = text("SELECT COUNT(*) FROM bench a JOIN bench b ON b.id = a.value + 1 WHERE (a.value * 7 + b.id) % 13 = 5")
+FAST_QUERY = text("SELECT value FROM bench WHERE id = :id")
+CREATE_WRITES = text("CREATE TABLE IF NOT EXISTS bench_writes (id INTEGER PRIMARY KEY, source TEXT NOT NULL, value INTEGER NOT NULL)")
+WRITE_QUERY = text("INSERT INTO bench_writes (source, value) VALUES (:source, :value)")
+
+
+def seed(database_url: str, rows: int) -> None:
+    engine = create_app_engine(database_url)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE bench (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)"))
+        conn.execute(text("INSERT INTO bench (id, value) VALUES (:id, :value)"),
+                     [{"id": i, "value": i * 31 % 1000} for i in range(1, rows + 1)])
+    engine.dispose()
+
+
+async def _drive(run_query, rate: float, duration: float, slow_ratio: float,
+                 rows: int, seed_value: int, labels=("slow", "fast")) -> Dict[str, Any]:
+    """초당 rate건씩 요청을 도착시키고 (open-loop), 요청별 지연 = 완료 시각 - 도착 예정 시각
+
+    slow_ratio 비율의 요청은 labels[0], 나머지는 labels[1]로 집계 (잠금 대기 시간 초과는 errors)
+    """
+    rng = random.Random(seed_value)
+    latencies: Dict[str, List[float]] = {label: [] for label in labels}
+    errors = 0
+    tasks = []
+
+    async def request(slow: bool, row_id: int, arrival: float):
+        nonlocal errors
+        try:
+            await run_query(slow, row_id)
+        except OperationalError:
+            errors += 1
+        latencies[labels[0] if slow else labels[1]].append((time.perf_counter() - arrival) * 1000)
+
+    started = time.perf_counter()
+    arrival = started
+    while arrival < started + duration:
+        arrival += rng.expovariate(rate)
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(request(rng.random() < slow_ratio, rng.randrange(1, rows + 1), arrival)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    stats: Dict[str, Any] = {"requests_per_sec": len(tasks) / elapsed, "requests": len(tasks),
+                             "errors": errors, "labels": labels}
+    for kind, values in latencies.items():
+        values.sort()
+        stats[kind] = {"count": len(values), "p50_ms": percentile(values, 50),
+                       "p95_ms": percentile(values, 95), "p99_ms": percentile(values, 99)}
+    return stats
+
+
+async def run_sync_sessions(database_url: str, **options) -> Dict[str, Any]:
+    """기존 방식: async 함수 안에서 동기 Session 호출 (이벤트 루프 스레드에서 실행)"""
+    engine = create_app_engine(database_url)
+
+    async def run_query(slow: bool, row_id: int):
+        with Session(engine) as session:
+            if slow:
+                session.execute(SLOW_QUERY).scalar()
+            else:
+                session.execute(FAST_QUERY, {"id": row_id}).scalar()
+
+    try:
+        return await _drive(run_query, **options)
+    finally:
+        engine.dispose()
+
+
+async def run_async_sessions(database_url: str, **options) -> Dict[str, Any]:
+    """비동기 세션: 쿼리를 기다리는 동안 다른 요청이 진행됨"""
+    engine = create_async_app_engine(database_url)
+
+    async def run_query(slow: bool, row_id: int):
+        async with AsyncSession(engine) as session:
+            if slow:
+                (await session.execute(SLOW_QUERY)).scalar()
+            else:
+                (await session.execute(FAST_QUERY, {"id": row_id})).scalar()
+
+    try:
+        return await _drive(run_query, **options)
+    finally:
+        await engine.dispose()
+
+
+async def run_mixed_writes(database_url: str, sync_writes_in_threadpool: bool, **options) -> Dict[str, Any]:
+    """쓰기 혼합: 쓰기 절반은 비동기 세션, 절반은 동기 Session (이벤트 루프에서 직접 또는 스레드풀에서)"""
+    sync_engine = create_app_engine(database_url)
+    async_engine = create_async_app_engine(database_url)
+    with sync_engine.begin() as conn:
+        conn.execute(CREATE_WRITES)
+
+    def sync_write(row_id: int):
+        with Session(sync_engine) as session:
+            session.execute(WRITE_QUERY, {"source": "sync", "value": row_id})
+            session.commit()
+
+    async def run_query(write: bool, row_id: int):
+        if write and row_id % 2 == 0:
+            if sync_writes_in_threadpool:
+                await run_in_threadpool(sync_write, row_id)
+            else:
+                sync_write(row_id)
+            return
+        async with AsyncSession(async_engine) as session:
+            if write:
+                await session.execute(WRITE_QUERY, {"source": "async", "value": row_id})
+                await session.commit()
+            else:
+                (await session.execute(FAST_QUERY, {"id": row_id})).scalar()
+
+    try:
+        return await _drive(run_query, labels=("write", "read"), **options)
+    finally:
+        await async_engine.dispose()
+        sync_engine.dispose()
+
+
+def _print(name: str, stats: Dict[str, Any]) -> None:
+    print(f"{name:<6} {stats['requests_per_sec']:>7,.0f} req/s 완료 ({stats['requests']:,}건, 실패 {stats['errors']:,}건)")
+    for kind in reversed(stats["labels"]):
+        kind_stats = stats[kind]
+        print(f"       {kind:<5} {kind_stats['count']:>6,}건  p50 {kind_stats['p50_ms']:>8.1f}ms  "
+              f"p95 {kind_stats['p95_ms']:>8.1f}ms  p99 {kind_stats['p99_ms']:>8.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="동기/비동기 DB 세션 벤치마크")
+    parser.add_argument("--database-url", help="비우면 임시 SQLite 파일 생성 후 시딩")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--rate", type=float, default=100.0, help="초당 요청 도착 수")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--slow-ratio", type=float, default=0.05)
+    parser.add_argument("--write-ratio", type=float, default=0.5, help="쓰기 혼합 비교의 쓰기 요청 비율 (0은 생략)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    logging.getLogger("app.db.slow").setLevel(logging.ERROR)  # 느린 쿼리 경고는 의도된 것
+    logging.getLogger("app.db.session").setLevel(logging.ERROR)  # 이벤트 루프에서 동기 엔진 사용 경고도 의도된 것
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = args.database_url
+        if not database_url:
+            database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+            seed(database_url, args.rows)
+        options = dict(rate=args.rate, duration=args.duration,
+                       slow_ratio=args.slow_ratio, rows=args.rows, seed_value=args.seed)
+        sync_stats = asyncio.run(run_sync_sessions(database_url, **options))
+        _print("sync", sync_stats)
+        async_stats = asyncio.run(run_async_sessions(database_url, **options))
+        _print("async", async_stats)
+        print(f"빠른 쿼리 p95 {sync_stats['fast']['p95_ms']:.1f}ms → {async_stats['fast']['p95_ms']:.1f}ms, "
+              f"p99 {sync_stats['fast']['p99_ms']:.1f}ms → {async_stats['fast']['p99_ms']:.1f}ms")
+
+        if args.write_ratio > 0:
+            options["slow_ratio"] = args.write_ratio
+            print("\n쓰기 혼합 (비동기 세션 쓰기 + 동기 Session 쓰기)")
+            loop_stats = asyncio.run(run_mixed_writes(database_url, False, **options))
+            _print("loop", loop_stats)
+            pool_stats = asyncio.run(run_mixed_writes(database_url, True, **options))
+            _print("pool", pool_stats)
+            print(f"읽기 p99 {loop_stats['read']['p99_ms']:.1f}ms → {pool_stats['read']['p99_ms']:.1f}ms, "
+                  f"실패 {loop_stats['errors']}건 → {pool_stats['errors']}건")
+
+
+if __name__ == "__main__":
+    main()
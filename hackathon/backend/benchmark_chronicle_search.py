@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+크로니클 검색 벤치마크
+LIKE '%검색어%' 전체 스캔과 chronicle_search FTS5(한글 바이그램) 검색의 검색어별 응답 시간 비교
+
+    색인: 트리거로 색인하며 포스트를 넣는 속도, DB 파일 크기
+    검색: 흔한/드문 검색어, 한 글자, 작성자/기간 필터별 중앙값 (한 페이지 limit=50)
+
+실행:
+    python benchmark_chronicle_search.py --posts 1000000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, create_async_app_engine
+from app.services.chronicle_search import ChronicleSearchService
+from app.services.chronicle_service import DEFAULT_PAGE_SIZE
+
+USERS = 1_000
+BATCH = 20_000
+BASE_TIME = datetime(2024, 1, 1)
+
+SUBJECTS = ["도서관에서", "카페에서", "스터디룸에서", "집에서", "학교 앞에서"]
+ACTIVITIES = ["알고리즘 공부를 했다", "적금을 새로 가입했다", "용돈 기입장을 정리했다", "과제를 제출했다",
+              "동아리 모임에 갔다", "아르바이트를 마쳤다", "시험 준비를 했다", "교통비를 아꼈다"]
+RARE = ["국가장학금 신청 완료", "SSAFY 최종 합격", "청년도약계좌 개설"]  # 약 0.1%
+
+# (이름, 검색어, 추가 필터)
+QUERIES = [
+    ("흔한 단어", "공부", {}),
+    ("흔한 단어 + 작성자", "공부", {"user_id": 7}),
+    ("흔한 단어 + 기간", "적금", {"start_date": date(2024, 1, 3), "end_date": date(2024, 1, 4)}),
+    ("드문 단어", "국가장학금", {}),
+    ("드문 여러 단어", "청년 계좌", {}),
+    ("영문 접두어", "ssa", {}),
+    ("한 글자", "합", {}),
+]
+
+
+def _post(rng: random.Random, i: int) -> Dict[str, Any]:
+    title = f"{rng.choice(SUBJECTS)} {rng.choice(ACTIVITIES)}"
+    if rng.random() < 0.001:
+        title = rng.choice(RARE)
+    return {
+        "user_id": rng.randrange(1, USERS + 1),
+        "title": title,
+        "description": f"{rng.choice(ACTIVITIES)}. 오늘도 {rng.randrange(1, 100)}점 달성",
+        "timestamp": (BASE_TIME + timedelta(seconds=i * 10)).strftime("%Y-%m-%d %H:%M:%S.%f"),
+        "user_content": '{"text": "%s", "isUserGenerated": true}' % rng.choice(ACTIVITIES),
+    }
+
+
+def seed(database_url: str, path: str, posts: int) -> None:
+    engine = create_app_engine(database_url)
+    upgrade(engine)
+    rng = random.Random(1)
+    with engine.begin() as conn:
+        conn.execute(text(
+            'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+            "VALUES (:email, 'x', 1, 0, '2024-01-01', '2024-01-01')"
+        ), [{"email": f"search{i}@ssafy.com"} for i in range(USERS)])
+
+    started = time.perf_counter()
+    for offset in range(0, posts, BATCH):
+        with engine.begin() as conn:  # 트리거가 같은 트랜잭션에서 색인
+            conn.execute(text(
+                "INSERT INTO chronicle_posts (user_id, type, title, description, timestamp, rewards, user_content) "
+                "VALUES (:user_id, 'user_post', :title, :description, :timestamp, '{\"credo\": 5}', :user_content)"
+            ), [_post(rng, i) for i in range(offset, min(offset + BATCH, posts))])
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+    print(f"포스트 {posts:,}개 입력 (색인 포함) {elapsed:.1f}초, {posts / elapsed:,.0f}행/초, "
+          f"DB {os.path.getsize(path) / 1024 / 1024:,.0f}MB")
+
+
+async def _like_page(session: AsyncSession, query: str, filters: Dict[str, Any]) -> int:
+    """기존 방식이라면: 제목/설명 LIKE 검색 (최신순, 선행 와일드카드라 인덱스 사용 불가)"""
+    conditions = ["(title LIKE :pattern OR description LIKE :pattern)"]
+    params: Dict[str, Any] = {"pattern": f"%{query}%", "limit": DEFAULT_PAGE_SIZE}
+    if "user_id" in filters:
+        conditions.append("user_id = :user_id")
+        params["user_id"] = filters["user_id"]
+    if "start_date" in filters:
+        conditions.append("timestamp >= :start AND timestamp < :end")
+        params["start"] = str(filters["start_date"])
+        params["end"] = str(filters["end_date"] + timedelta(days=1))
+    rows = (await session.execute(text(
+        f"SELECT id FROM chronicle_posts WHERE {' AND '.join(conditions)} "
+        "ORDER BY timestamp DESC, id DESC LIMIT :limit"
+    ), params)).all()
+    return len(rows)
+
+
+async def _median_ms(call: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    await call()
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def run(database_url: str, repeat: int) -> None:
+    engine = create_async_app_engine(database_url)
+    try:
+        async with AsyncSession(engine) as session:
+            print(f"{'검색':<22} {'LIKE':>10} {'FTS 관련도':>11} {'FTS 최신':>10} {'결과':>6}")
+            for name, query, filters in QUERIES:
+                async def fts(sort: str):
+                    return await ChronicleSearchService.search(session, query, DEFAULT_PAGE_SIZE, sort=sort, **filters)
+
+                like_ms = await _median_ms(lambda: _like_page(session, query, filters), repeat)
+                relevance_ms = await _median_ms(lambda: fts("relevance"), repeat)
+                recent_ms = await _median_ms(lambda: fts("recent"), repeat)
+                found = (await fts("recent"))[0].count(b'"id":')
+                print(f"{name + ' ' + repr(query):<22} {like_ms:>8.1f}ms {relevance_ms:>9.1f}ms {recent_ms:>8.1f}ms "
+                      f"{found:>6}")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="크로니클 검색 벤치마크")
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger("app.db.slow").disabled = True  # 배치 입력이 느린 쿼리로 기록되지 않도록
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "bench.db")
+        database_url = f"sqlite:///{path}"
+        seed(database_url, path, args.posts)
+        asyncio.run(run(database_url, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+크로니클 목록 직렬화 벤치마크
+기존 방식(행마다 JSON 문자열 파싱/dict 생성 → FastAPI response_model(List[dict]) 검증 → JSONResponse)과
+현재 방식(컬럼 행 → JSON 컬럼 텍스트를 그대로 이어 붙여 본문 인코딩)의 포스트 1,000개당 비용 비교
+
+    직렬화만: 이미 조회한 행 → 응답 본문 바이트
+    페이지 전체: 조회 + 직렬화 (limit=100 페이지 반복)
+
+실행:
+    python benchmark_chronicle_serialization.py --posts 20000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import func, text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, create_async_app_engine
+from app.models.chronicle import ChroniclePost
+from app.services.chronicle_service import ChronicleService, MAX_PAGE_SIZE
+
+RESPONSE_FIELD = create_response_field(name="Response_get_public_chronicles", type_=List[dict])
+
+
+def seed(database_url: str, posts: int) -> None:
+    """기존 방식 그대로 JSON 문자열을 넣은 뒤 마이그레이션으로 정리"""
+    engine = create_app_engine(database_url)
+    upgrade(engine, target=5)
+    rng = random.Random(1)
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(text(
+            'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+            "VALUES ('bench@ssafy.com', 'x', 1, 0, '2024-01-01', '2024-01-01')"
+        ))
+        conn.execute(text(
+            "INSERT INTO chronicle_posts (user_id, type, title, description, timestamp, rewards, user_content) "
+            "VALUES (1, 'user_post', :title, :description, :timestamp, :rewards, :user_content)"
+        ), [{
+            "title": f"오늘의 기록 {i}",
+            "description": "도서관에서 알고리즘 공부",
+            "timestamp": (now - timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S.%f"),
+            "rewards": json.dumps({"credo": rng.randrange(5, 30),
+                                   "skillXp": {"skillName": "학업", "amount": rng.randrange(10, 60)}}),
+            "user_content": json.dumps({"text": "백준에서 DP 문제를 풀었어요. " * 3, "image": None,
+                                        "isUserGenerated": True, "tags": ["알고리즘", "DP", "백준"]}),
+        } for i in range(posts)])
+    upgrade(engine)
+    engine.dispose()
+
+
+def _legacy_dict(post: Any) -> Dict[str, Any]:
+    """기존 라우트의 행별 변환 (JSON 문자열 컬럼이면 파싱)"""
+    try:
+        rewards = post.rewards if isinstance(post.rewards, dict) else (json.loads(post.rewards) if post.rewards else {})
+        user_content = post.user_content if isinstance(post.user_content, dict) else (json.loads(post.user_content) if post.user_content else {})
+    except (json.JSONDecodeError, TypeError):
+        rewards = {}
+        user_content = {}
+    return {
+        "id": post.id,
+        "user_id": post.user_id,
+        "type": post.type,
+        "title": post.title,
+        "description": post.description,
+        "timestamp": post.timestamp.isoformat() if post.timestamp else None,
+        "rewards": rewards,
+        "user_content": user_content,
+    }
+
+
+async def legacy_body(posts: List[Any]) -> bytes:
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=[_legacy_dict(post) for post in posts])
+    return JSONResponse(content).body
+
+
+async def legacy_page(session: AsyncSession, limit: int) -> bytes:
+    statement = select(ChroniclePost).order_by(ChroniclePost.timestamp.desc(), ChroniclePost.id.desc()).limit(limit)
+    return await legacy_body((await session.exec(statement)).all())
+
+
+async def run(database_url: str, repeat: int, pages: int) -> None:
+    engine = create_async_app_engine(database_url)
+    try:
+        async with AsyncSession(engine) as session:
+            count = (await session.exec(select(func.count()).select_from(ChroniclePost))).one()
+            # 기존 모델처럼 JSON 컬럼을 문자열로 받은 행 (기존 방식은 행마다 json.loads)
+            rows = (await session.exec(ChronicleService.page_statement(None, count))).all()
+            assert json.loads(await legacy_body(rows)) == json.loads(ChronicleService.encode_rows(rows))
+
+            results = {}
+            started = time.perf_counter()
+            for _ in range(repeat):
+                await legacy_body(rows)
+            results["before"] = (time.perf_counter() - started) / repeat / count * 1000 * 1000
+            started = time.perf_counter()
+            for _ in range(repeat):
+                ChronicleService.encode_rows(rows)
+            results["after"] = (time.perf_counter() - started) / repeat / count * 1000 * 1000
+            print(f"직렬화만 (포스트 {count:,}개 × {repeat}회)")
+            print(f"  before {results['before']:8.2f}ms / 1k posts")
+            print(f"  after  {results['after']:8.2f}ms / 1k posts  ({results['before'] / results['after']:.1f}배)")
+
+            for name, page in (("before", lambda: legacy_page(session, MAX_PAGE_SIZE)),
+                               ("after", lambda: ChronicleService.get_page(session, None, MAX_PAGE_SIZE))):
+                await page()
+                started = time.perf_counter()
+                for _ in range(pages):
+                    await page()
+                    session.expunge_all()
+                results[name] = (time.perf_counter() - started) / (pages * MAX_PAGE_SIZE) * 1000 * 1000
+            print(f"페이지 조회 + 직렬화 (limit={MAX_PAGE_SIZE} × {pages}회)")
+            print(f"  before {results['before']:8.2f}ms / 1k posts")
+            print(f"  after  {results['after']:8.2f}ms / 1k posts  ({results['before'] / results['after']:.1f}배)")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="크로니클 목록 직렬화 벤치마크")
+    parser.add_argument("--posts", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        seed(database_url, args.posts)
+        asyncio.run(run(database_url, args.repeat, args.pages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+리더보드 벤치마크
+사용자 N명(기본 100만)의 순위표를 만든 뒤 점수 갱신/내 순위/상위 N/주변 조회 지연 시간을 측정하고,
+기존 방식(요청마다 전체 정렬)과 비교한다.
+
+실행:
+    python benchmark_leaderboard.py --users 1000000 --ops 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.leaderboard_service import Leaderboard
+from load_test import percentile
+
+
+def _measure(name: str, ops: int, fn: Callable[[int], object]) -> Dict[str, float]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for i in range(ops):
+        op_started = time.perf_counter()
+        fn(i)
+        latencies.append((time.perf_counter() - op_started) * 1_000_000)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    stats = {
+        "ops_per_sec": ops / elapsed if elapsed else 0.0,
+        "p50_us": percentile(latencies, 50),
+        "p99_us": percentile(latencies, 99),
+    }
+    print(f"{name:<14} {stats['ops_per_sec']:>12,.0f} ops/s   p50 {stats['p50_us']:>8.1f}µs   p99 {stats['p99_us']:>8.1f}µs")
+    return stats
+
+
+def run(users: int, ops: int, seed: int) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(seed)
+    scores = {user_id: rng.randrange(1_000_000) for user_id in range(1, users + 1)}
+    board = Leaderboard("credo")
+
+    started = time.perf_counter()
+    board.load((user_id, score, {}) for user_id, score in scores.items())
+    print(f"순위표 구성: {users:,}명 {time.perf_counter() - started:.2f}초")
+
+    targets = [rng.randrange(1, users + 1) for _ in range(ops)]
+    deltas = [rng.randrange(1, 50) for _ in range(ops)]
+
+    def update(i):
+        user_id = targets[i]
+        scores[user_id] += deltas[i]
+        board.update(user_id, scores[user_id])
+
+    results = {
+        "update": _measure("update", ops, update),
+        "rank": _measure("rank", ops, lambda i: board.rank(targets[i])),
+        "top10": _measure("top10", ops, lambda i: board.top(10)),
+        "around5": _measure("around(5,5)", ops, lambda i: board.around(targets[i], 5, 5)),
+    }
+
+    # 기존 방식: 요청마다 전체 목록 정렬 후 상위 100명 (몇 번만 실행)
+    results["full_sort"] = _measure(
+        "full sort", 3,
+        lambda i: sorted(scores.items(), key=lambda item: item[1], reverse=True)[:100]
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리더보드 벤치마크")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    run(args.users, args.ops, args.seed)
+
+
+if __name__ == "__main__":
+    main()
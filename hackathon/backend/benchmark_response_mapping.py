@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+조회 API 응답 직렬화 마이크로벤치마크 (엔드포인트별)
+기존: ORM 객체 → 응답 모델 필드별 복사(Pydantic 검증) → FastAPI response_model 재검증 → 표준 json JSONResponse
+현재: ORM 객체 → 캐시된 필드 접근자로 dict 변환(to_response) → fast_response(orjson)
+DB 조회는 제외하고 같은 ORM 객체 목록으로 요청 하나의 응답 본문을 만드는 시간만 비교한다.
+
+실행:
+    python benchmark_response_mapping.py --repeat 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import typing
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Type
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+
+from app.api.auth_v2 import UserListResponse
+from app.core.responses import fast_response, to_response, to_response_list
+from app.models.academic import (
+    AcademicRecord, Course, Scholarship,
+    AcademicRecordResponse, AcademicSummaryResponse, CourseResponse, ScholarshipResponse
+)
+from app.models.financial import (
+    BankAccount, CreditScore, FinancialProduct, Transaction, UserProduct,
+    BankAccountResponse, CreditScoreResponse, FinancialSummaryResponse, TransactionResponse, UserProductResponse
+)
+from app.models.user import User, UserResponse
+
+BASE_TIME = datetime(2024, 3, 1, 9, 0, 0, 123456)
+
+
+def _value(annotation: Any, name: str, i: int) -> Any:
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if typing.get_origin(annotation) is typing.Union and args:
+        annotation = args[0]
+    if annotation is int:
+        return 1000 + i
+    if annotation is float:
+        return 3.5 + i % 10 / 10
+    if annotation is bool:
+        return True
+    if annotation is datetime:
+        return BASE_TIME + timedelta(hours=i)
+    return f"{name}-{i}"
+
+
+def fake(orm_class: Type[Any], response_model: Type[BaseModel], i: int, **relations: Any) -> Any:
+    """응답 모델 필드 값을 채운 ORM 객체 (DB 없이)"""
+    values = {name: _value(field.annotation, name, i) for name, field in response_model.model_fields.items()
+              if name not in relations}
+    obj = orm_class(**values)
+    for name, related in relations.items():
+        setattr(obj, name, related)
+    return obj
+
+
+def legacy_build(model: Type[BaseModel], obj: Any) -> BaseModel:
+    """기존 핸들러의 필드별 복사: Model(field=obj.field, ...) (중첩 응답 모델도 같은 방식)"""
+    values = {}
+    for name, field in model.model_fields.items():
+        value = getattr(obj, name)
+        origin, args = typing.get_origin(field.annotation), typing.get_args(field.annotation)
+        if isinstance(field.annotation, type) and issubclass(field.annotation, BaseModel):
+            value = legacy_build(field.annotation, value)
+        elif origin in (list, List) and args and issubclass(args[0], BaseModel):
+            value = [legacy_build(args[0], item) for item in value]
+        values[name] = value
+    return model(**values)
+
+
+def scenarios(rows: int) -> Dict[str, Dict[str, Any]]:
+    accounts = [fake(BankAccount, BankAccountResponse, i) for i in range(5)]
+    transactions = [fake(Transaction, TransactionResponse, i) for i in range(rows)]
+    user_products = [
+        fake(UserProduct, UserProductResponse, i,
+             product=fake(FinancialProduct, UserProductResponse.model_fields["product"].annotation, i),
+             account=accounts[i % len(accounts)])
+        for i in range(rows // 5)
+    ]
+    credit_score = fake(CreditScore, CreditScoreResponse, 1)
+    record = fake(AcademicRecord, AcademicRecordResponse, 1)
+    courses = [fake(Course, CourseResponse, i) for i in range(rows // 2)]
+    scholarships = [fake(Scholarship, ScholarshipResponse, i) for i in range(5)]
+    users = [fake(User, UserResponse, i) for i in range(rows)]
+
+    def summary(build: Callable, build_list: Callable) -> Dict[str, Any]:
+        return {"total_balance": 1, "total_assets": 2, "total_liabilities": 0, "net_worth": 2,
+                "credit_score": build(CreditScoreResponse, credit_score),
+                "accounts": build_list(BankAccountResponse, accounts),
+                "recent_transactions": build_list(TransactionResponse, transactions[:10]),
+                "products": build_list(UserProductResponse, user_products)}
+
+    def academic(build: Callable, build_list: Callable) -> Dict[str, Any]:
+        return {"academic_record": build(AcademicRecordResponse, record),
+                "courses": build_list(CourseResponse, courses),
+                "scholarships": build_list(ScholarshipResponse, scholarships),
+                "credit_progress": 75.0, "graduation_progress": 75.0}
+
+    def user_list(build: Callable, build_list: Callable) -> Dict[str, Any]:
+        return {"users": build_list(UserResponse, users), "total_count": rows, "page": 1, "page_size": rows}
+
+    def listing(model: Type[BaseModel], objs: List[Any]) -> Callable:
+        return lambda build, build_list: build_list(model, objs)
+
+    return {
+        f"GET /financial/transactions ({rows})": {"model": List[TransactionResponse],
+                                                  "content": listing(TransactionResponse, transactions)},
+        f"GET /financial/user-products ({len(user_products)})": {"model": List[UserProductResponse],
+                                                                 "content": listing(UserProductResponse, user_products)},
+        "GET /financial/summary": {"model": FinancialSummaryResponse, "content": summary},
+        "GET /academic/summary": {"model": AcademicSummaryResponse, "content": academic},
+        f"GET /auth/users ({rows})": {"model": UserListResponse, "content": user_list},
+    }
+
+
+async def legacy_body(field: Any, content: Callable) -> bytes:
+    response_content = content(legacy_build, lambda model, objs: [legacy_build(model, obj) for obj in objs])
+    return JSONResponse(await serialize_response(field=field, response_content=response_content)).body
+
+
+def mapped_body(content: Callable) -> bytes:
+    return fast_response(content(to_response, to_response_list)).body
+
+
+async def run(rows: int, repeat: int) -> None:
+    print(f"{'엔드포인트':<38} {'기존':>10} {'현재':>10} {'배수':>6}")
+    for name, scenario in scenarios(rows).items():
+        field = create_response_field(name=f"Response_{name}", type_=scenario["model"])
+        content = scenario["content"]
+        assert json.loads(await legacy_body(field, content)) == json.loads(mapped_body(content)), name
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await legacy_body(field, content)
+        legacy_us = (time.perf_counter() - started) / repeat * 1_000_000
+        started = time.perf_counter()
+        for _ in range(repeat):
+            mapped_body(content)
+        mapped_us = (time.perf_counter() - started) / repeat * 1_000_000
+        print(f"{name:<38} {legacy_us:>8,.0f}µs {mapped_us:>8,.0f}µs {legacy_us / mapped_us:>5.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="조회 API 응답 직렬화 마이크로벤치마크")
+    parser.add_argument("--rows", type=int, default=100, help="목록 API 한 페이지 행 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,6 @@ from app.models.chronicle import ChroniclePost
 from app.models.user import User
 from app.db.session import engine
 from datetime import datetime, timedelta
-import json
 
 def create_sample_chronicle_posts():
     """샘플 크로니클 포스트 생성"""
@@ -36,8 +35,8 @@ def create_sample_chronicle_posts():
                 "title": "오늘의 학습 성과",
                 "description": "알고리즘 문제 3개를 해결했습니다!",
                 "timestamp": datetime.now() - timedelta(hours=2),
-                "rewards": json.dumps({"credo": 15, "skillXp": {"skillName": "학업", "amount": 30}}),
-                "user_content": json.dumps({"text": "백준 온라인 저지에서 DP 문제들을 풀었어요.", "image": None, "isUserGenerated": True})
+                "rewards": {"credo": 15, "skillXp": {"skillName": "학업", "amount": 30}},
+                "user_content": {"text": "백준 온라인 저지에서 DP 문제들을 풀었어요.", "image": None, "isUserGenerated": True}
             },
             {
                 "user_id": 2,
@@ -45,8 +44,8 @@ def create_sample_chronicle_posts():
                 "description": "도서관에서 4시간 공부",
                 "title": "집중력 향상의 비밀",
                 "timestamp": datetime.now() - timedelta(days=1),
-                "rewards": json.dumps({"credo": 20, "skillXp": {"skillName": "자기계발", "amount": 40}}),
-                "user_content": json.dumps({"text": "중앙도서관에서 데이터베이스 설계 공부를 했습니다.", "image": None, "isUserGenerated": True})
+                "rewards": {"credo": 20, "skillXp": {"skillName": "자기계발", "amount": 40}},
+                "user_content": {"text": "중앙도서관에서 데이터베이스 설계 공부를 했습니다.", "image": None, "isUserGenerated": True}
             },
             {
                 "user_id": 2,
@@ -54,8 +53,8 @@ def create_sample_chronicle_posts():
                 "title": "팀 프로젝트 진행상황",
                 "description": "프론트엔드 UI 구현 완료!",
                 "timestamp": datetime.now() - timedelta(days=2),
-                "rewards": json.dumps({"credo": 25, "skillXp": {"skillName": "대외활동", "amount": 50}}),
-                "user_content": json.dumps({"text": "React Native로 모바일 앱 UI를 완성했습니다.", "image": None, "isUserGenerated": True})
+                "rewards": {"credo": 25, "skillXp": {"skillName": "대외활동", "amount": 50}},
+                "user_content": {"text": "React Native로 모바일 앱 UI를 완성했습니다.", "image": None, "isUserGenerated": True}
             }
         ]
         
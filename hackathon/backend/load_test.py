@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+백엔드 HTTP 부하 테스트 / 지연 시간 벤치마크
+임시 SQLite DB와 SSAFY 시뮬레이터를 시딩한 뒤 app.main:app을 uvicorn으로 띄우고,
+실제 사용 비율에 가까운 요청 조합을 동시에 보내 경로별 처리량과 p50/p95/p99를 측정한다.
+결과를 JSON 기준값으로 저장해 두면 다음 실행에서 회귀 여부를 비교할 수 있다.
+
+실행:
+    python load_test.py --users 50 --concurrency 32 --duration 30 --save-baseline load_test_baseline.json
+    python load_test.py --duration 30 --compare load_test_baseline.json --max-regression 20
+    python load_test.py --mix chronicle_list=5,xp_add=1 --latency-ms 80 --latency-dist lognormal
+    python load_test.py --scenario dashboard_write --latency-ms 80
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from ssafy_simulator import SSAFYSimulator, FaultConfig, start_simulator
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+SEED_PASSWORD = "loadtest1234"
+
+HOME_DASHBOARD_PATH = "/api/home/dashboard"
+SOCIAL_TRANSFER_PATH = "/api/social/transfer"
+
+# 기본 요청 비율 (가중치)
+DEFAULT_MIX = {
+    "login": 5,
+    "xp_add": 15,
+    "chronicle_list": 20,
+    "chronicle_public": 10,
+    "chronicle_create": 10,
+    "financial_summary": 15,
+    "home_dashboard": 15,
+    "social_transfer": 10,
+}
+
+# 이름으로 고르는 요청 조합 (--scenario)
+SCENARIOS = {
+    "default": DEFAULT_MIX,
+    # 원장 동기화가 있는 대시보드 조회와 SQLite 쓰기(크로니클 작성)가 섞일 때 이벤트 루프/쓰기 잠금 경합 확인
+    "dashboard_write": {"home_dashboard": 1, "chronicle_create": 1},
+}
+
+XP_ACTIVITIES = ["transaction", "saving", "budget_planning", "daily_quest", "quest_complete"]
+SEED_SPENDING = [("스타벅스 강남점", 4500), ("GS25 편의점", 3200), ("교보문고", 18000), ("지하철 교통카드 충전", 20000)]
+
+
+@dataclass
+class SeedUser:
+    """시딩된 사용자 (로그인/요청 생성에 필요한 정보)"""
+    id: int
+    email: str
+    user_key: str
+    account_no: str
+    token: Optional[str] = None
+
+
+@dataclass
+class Sample:
+    route: str
+    latency: float
+    status: int
+
+
+@dataclass
+class RunConfig:
+    users: int = 20
+    posts_per_user: int = 5
+    concurrency: int = 16
+    duration: float = 10.0
+    warmup: float = 2.0
+    max_requests: int = 0
+    workers: int = 1
+    mix: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    seed: int = 42
+
+
+# ==================== 통계 ====================
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """nearest-rank 백분위수 (sorted_values는 오름차순)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _route_stats(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+    }
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict[str, Any]:
+    """경로별/전체 처리량과 지연 분위수 (5xx와 연결 실패(status 0)는 오류로 집계)"""
+    by_route: Dict[str, List[float]] = {}
+    errors: Counter = Counter()
+    statuses: Dict[str, Counter] = {}
+    for sample in samples:
+        by_route.setdefault(sample.route, []).append(sample.latency)
+        statuses.setdefault(sample.route, Counter())[str(sample.status)] += 1
+        if sample.status == 0 or sample.status >= 500:
+            errors[sample.route] += 1
+
+    routes = {}
+    for route in sorted(by_route):
+        routes[route] = _route_stats(by_route[route], errors[route], elapsed)
+        routes[route]["statuses"] = dict(statuses[route])
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "total": _route_stats([s.latency for s in samples], sum(errors.values()), elapsed),
+        "routes": routes,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[Dict[str, Any]]:
+    """기준값 대비 변화율(%) 계산, max_regression(%)을 넘는 지연 증가/처리량 감소는 regression 표시"""
+    rows = []
+    for route, stats in {"total": current["total"], **current["routes"]}.items():
+        base = baseline["total"] if route == "total" else baseline.get("routes", {}).get(route)
+        if not base:
+            continue
+        for metric in ("rps", "p50_ms", "p95_ms", "p99_ms"):
+            before, after = base.get(metric, 0.0), stats.get(metric, 0.0)
+            if not before:
+                continue
+            change = (after - before) / before * 100
+            # 처리량은 감소, 지연은 증가가 회귀
+            worse = -change if metric == "rps" else change
+            rows.append({
+                "route": route,
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "change_pct": round(change, 1),
+                "regression": metric != "p50_ms" and worse > max_regression,
+            })
+    return rows
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    print(f"\n📊 결과 ({result['elapsed_s']}초)")
+    print(f"{'route':<20}{'count':>8}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for route, stats in {**result["routes"], "TOTAL": result["total"]}.items():
+        print(f"{route:<20}{stats['count']:>8}{stats['errors']:>6}{stats['rps']:>9.1f}"
+              f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}{stats['max_ms']:>9.1f}")
+
+
+def print_comparison(rows: List[Dict[str, Any]]) -> None:
+    print("\n📈 기준값 대비")
+    print(f"{'route':<20}{'metric':>8}{'baseline':>11}{'current':>11}{'change':>9}")
+    for row in rows:
+        mark = "  ❌" if row["regression"] else ""
+        print(f"{row['route']:<20}{row['metric']:>8}{row['baseline']:>11.1f}{row['current']:>11.1f}"
+              f"{row['change_pct']:>+8.1f}%{mark}")
+
+
+# ==================== 시딩 ====================
+
+def seed_database(simulator: SSAFYSimulator, config: RunConfig) -> List[SeedUser]:
+    """DB(DATABASE_URL)와 시뮬레이터에 사용자/계좌/거래/크로니클 포스트 생성"""
+    from sqlmodel import Session
+    from app.db.session import engine
+    from app.db.migrations import upgrade
+    from app.models.user import User
+    from app.models.chronicle import ChroniclePost
+
+    upgrade(engine)
+    rng = random.Random(config.seed)
+    password_hash = User.hash_password(SEED_PASSWORD)
+    now = datetime.utcnow()
+
+    seeded = []
+    with Session(engine) as db:
+        for i in range(config.users):
+            email = f"loadtest{i:04d}@ssafy.com"
+            ssafy_user = simulator.create_user(email, f"부하{i:04d}")
+            account = simulator.open_demand_account(ssafy_user["userKey"], balance=10_000_000)
+            for summary, amount in rng.sample(SEED_SPENDING, k=2):
+                simulator._post(account, "2", "출금", amount, summary)
+
+            user = User(
+                email=email,
+                password_hash=password_hash,
+                display_name=f"부하{i:04d}",
+                current_university="싸피대학교",
+                ssafy_user_id=email,
+                ssafy_user_key=ssafy_user["userKey"],
+                ssafy_user_name=ssafy_user["userName"],
+                ssafy_institution_code=ssafy_user["institutionCode"],
+            )
+            db.add(user)
+            db.flush()
+            for j in range(config.posts_per_user):
+                db.add(ChroniclePost(
+                    user_id=user.id,
+                    type="user_post",
+                    title=f"부하 테스트 포스트 {j}",
+                    description="시딩된 포스트",
+                    timestamp=now - timedelta(minutes=rng.randrange(60 * 24 * 30)),
+                    rewards={"credo": 5},
+                    user_content={},
+                ))
+            seeded.append(SeedUser(user.id, email, ssafy_user["userKey"], account["accountNo"]))
+        db.commit()
+    return seeded
+
+
+# ==================== 서버 ====================
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(env: Dict[str, str], workers: int, log_path: str) -> Tuple[subprocess.Popen, str]:
+    """app.main:app을 uvicorn 하위 프로세스로 실행 (프로세스, base URL)"""
+    port = _free_port()
+    command = [
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+    ]
+    log_file = open(log_path, "w")
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+    return process, f"http://127.0.0.1:{port}"
+
+
+async def wait_until_ready(session: aiohttp.ClientSession, base_url: str, process: subprocess.Popen,
+                           timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 시작 중 종료됨 (exit {process.returncode})")
+        try:
+            async with session.get(f"{base_url}/api/health") as response:
+                if response.status == 200:
+                    return
+        except aiohttp.ClientError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("서버 시작 대기 시간 초과")
+
+
+# ==================== 시나리오 ====================
+
+def _auth(user: SeedUser) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {user.token}"}
+
+
+def build_request(route: str, user: SeedUser, users: List[SeedUser], rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+    """경로 이름 -> (method, path, aiohttp 요청 인자)"""
+    if route == "login":
+        return "POST", "/api/auth/login", {"json": {"email": user.email, "password": SEED_PASSWORD}}
+    if route == "xp_add":
+        return "POST", "/api/xp/add", {
+            "headers": _auth(user),
+            "json": {"activity_type": rng.choice(XP_ACTIVITIES), "description": "부하 테스트 활동"},
+        }
+    if route == "chronicle_list":
+        return "GET", "/api/chronicle/posts", {"headers": _auth(user)}
+    if route == "chronicle_public":
+        return "GET", "/api/chronicle/posts/public", {}
+    if route == "chronicle_create":
+        return "POST", "/api/chronicle/posts", {
+            "headers": _auth(user),
+            "json": {"title": "부하 테스트 기록", "type": "user_post", "description": "오늘의 기록"},
+        }
+    if route == "financial_summary":
+        return "GET", "/api/financial/summary", {"headers": _auth(user)}
+    if route == "home_dashboard":
+        return "GET", HOME_DASHBOARD_PATH, {"params": {"user_key": user.user_key}}
+    if route == "social_transfer":
+        friend = rng.choice(users)
+        return "POST", SOCIAL_TRANSFER_PATH, {"params": {
+            "from_user_id": user.user_key,
+            "to_user_id": friend.user_key,
+            "amount": rng.randrange(1, 20) * 1000,
+            "memo": "더치페이",
+            "account_no": user.account_no,
+        }}
+    raise ValueError(f"알 수 없는 경로: {route}")
+
+
+async def login_all(session: aiohttp.ClientSession, base_url: str, users: List[SeedUser]) -> None:
+    async def login(user: SeedUser):
+        async with session.post(f"{base_url}/api/auth/login",
+                                json={"email": user.email, "password": SEED_PASSWORD}) as response:
+            if response.status != 200:
+                raise RuntimeError(f"로그인 실패 ({user.email}): {response.status} {await response.text()}")
+            user.token = (await response.json())["access_token"]
+
+    await asyncio.gather(*[login(user) for user in users])
+
+
+async def drive_load(session: aiohttp.ClientSession, base_url: str, users: List[SeedUser],
+                     config: RunConfig) -> Tuple[List[Sample], float]:
+    """closed-loop 부하: concurrency개의 가상 사용자가 응답을 받는 즉시 다음 요청 전송"""
+    routes = [route for route, weight in config.mix.items() if weight > 0]
+    weights = [config.mix[route] for route in routes]
+    samples: List[Sample] = []
+    started = time.monotonic()
+    measure_from = started + config.warmup
+    stop_at = measure_from + config.duration
+    issued = 0
+
+    async def virtual_user(index: int):
+        nonlocal issued
+        rng = random.Random(config.seed * 1000 + index)
+        while time.monotonic() < stop_at:
+            if config.max_requests and issued >= config.max_requests:
+                return
+            route = rng.choices(routes, weights)[0]
+            method, path, kwargs = build_request(route, rng.choice(users), users, rng)
+            begin = time.monotonic()
+            try:
+                async with session.request(method, f"{base_url}{path}", **kwargs) as response:
+                    await response.read()
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                status = 0
+            end = time.monotonic()
+            if begin >= measure_from:
+                issued += 1
+                samples.append(Sample(route, end - begin, status))
+
+    await asyncio.gather(*[virtual_user(i) for i in range(config.concurrency)])
+    elapsed = max(1e-9, min(time.monotonic(), stop_at) - measure_from)
+    return samples, elapsed
+
+
+# ==================== 실행 ====================
+
+async def run(config: RunConfig, faults: FaultConfig) -> Dict[str, Any]:
+    simulator = SSAFYSimulator(faults, seed=config.seed)
+    runner, ssafy_base_url = await start_simulator(simulator)
+    workdir_handle = tempfile.TemporaryDirectory(prefix="load_test_")
+    workdir = workdir_handle.name
+    env = dict(os.environ)
+    env.update({
+        "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'load_test.db')}",
+        "SSAFY_API_BASE_URL": ssafy_base_url,
+        "SSAFY_LOGIN_URL": f"{ssafy_base_url}/member/",
+        "SSAFY_EMAIL_CHECK_URL": f"{ssafy_base_url}/member/search",
+        "SSAFY_TRACE_ENABLED": "false",
+    })
+    os.environ.update(env)
+
+    process = None
+    try:
+        print(f"🌱 시딩: 사용자 {config.users}명, 포스트 {config.users * config.posts_per_user}개 ({workdir})")
+        users = await asyncio.to_thread(seed_database, simulator, config)  # 동기 엔진 작업은 루프 밖에서
+
+        process, base_url = start_server(env, config.workers, os.path.join(workdir, "server.log"))
+        connector = aiohttp.TCPConnector(limit=config.concurrency)
+        timeout = aiohttp.ClientTimeout(total=60)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            await wait_until_ready(session, base_url, process)
+            await login_all(session, base_url, users)
+            print(f"🚀 부하 시작: 동시 {config.concurrency}, 워밍업 {config.warmup}초, 측정 {config.duration}초")
+            samples, elapsed = await drive_load(session, base_url, users, config)
+
+        result = summarize(samples, elapsed)
+        result["meta"] = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "users": config.users,
+            "posts_per_user": config.posts_per_user,
+            "concurrency": config.concurrency,
+            "duration_s": config.duration,
+            "workers": config.workers,
+            "mix": config.mix,
+            "ssafy_faults": {name: getattr(faults, name) for name in ("latency_ms", "latency_dist", "error_rate")},
+            "ssafy_calls": simulator.stats.get("requests"),
+            "python": sys.version.split()[0],
+        }
+        return result
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        await runner.cleanup()
+        workdir_handle.cleanup()
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"알 수 없는 경로: {name} (가능: {', '.join(DEFAULT_MIX)})")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백엔드 HTTP 부하 테스트 / 지연 시간 벤치마크")
+    parser.add_argument("--users", type=int, default=20, help="시딩할 사용자 수")
+    parser.add_argument("--posts-per-user", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 워밍업 시간 (초)")
+    parser.add_argument("--max-requests", type=int, default=0, help="측정 요청 수 상한 (0은 시간 기준)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="default", help="미리 정한 요청 조합")
+    parser.add_argument("--mix", type=parse_mix, default=None, help="경로별 가중치 (예: login=1,xp_add=3, --scenario보다 우선)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="SSAFY 시뮬레이터 지연 (ms)")
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "normal", "lognormal"], default="fixed")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="SSAFY 시뮬레이터 5xx 비율")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--save-baseline", help="결과를 기준값 JSON으로 저장")
+    parser.add_argument("--compare", help="비교할 기준값 JSON")
+    parser.add_argument("--max-regression", type=float, default=20.0,
+                        help="허용 회귀율(%%): p95/p99 증가나 처리량 감소가 이를 넘으면 exit 1")
+    args = parser.parse_args()
+
+    config = RunConfig(
+        users=args.users,
+        posts_per_user=args.posts_per_user,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        warmup=args.warmup,
+        max_requests=args.max_requests,
+        workers=args.workers,
+        mix=args.mix or dict(SCENARIOS[args.scenario]),
+        seed=args.seed,
+    )
+    faults = FaultConfig(latency_ms=args.latency_ms, latency_dist=args.latency_dist, error_rate=args.error_rate)
+    result = asyncio.run(run(config, faults))
+    print_report(result)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"💾 저장: {path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(result, baseline, args.max_regression)
+        print_comparison(rows)
+        if any(row["regression"] for row in rows):
+            print(f"❌ 기준값 대비 {args.max_regression}% 넘는 회귀 발견")
+            sys.exit(1)
+        print("✅ 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
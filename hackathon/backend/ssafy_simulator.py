@@ -0,0 +1,834 @@
+#!/usr/bin/env python3
+"""
+SSAFY 금융 API(finopenapi) 로컬 시뮬레이터
+/edu/... 와 /member/... 엔드포인트를 같은 Header/응답 형식(REC, dataSearch.content)으로 흉내내고
+계좌/거래내역은 메모리에 보관한다. 지연 분포, 오류율, 호출 제한을 설정해 부하/장애 테스트에 사용한다.
+
+실행:
+    python ssafy_simulator.py --port 8800 --latency-ms 80 --latency-dist lognormal --error-rate 0.01
+
+백엔드를 시뮬레이터로 연결 (.env):
+    SSAFY_API_BASE_URL=http://127.0.0.1:8800/ssafy/api/v1
+    SSAFY_LOGIN_URL=http://127.0.0.1:8800/ssafy/api/v1/member/
+    SSAFY_EMAIL_CHECK_URL=http://127.0.0.1:8800/ssafy/api/v1/member/search
+
+실행 중 설정 변경/통계:
+    POST /_simulator/config  {"latency_ms": 200, "error_rate": 0.1, "rate_limit_rps": 50}
+    GET  /_simulator/stats
+    POST /_simulator/reset
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+# 실제 API와 같은 경로 구조 (base URL: http://host:port/ssafy/api/v1)
+API_PREFIX = "/ssafy/api/v1"
+INSTITUTION_CODE = "00100"
+DEFAULT_BANK_CODE = "088"
+
+BANKS = [
+    {"bankCode": "001", "bankName": "한국은행"},
+    {"bankCode": "002", "bankName": "산업은행"},
+    {"bankCode": "003", "bankName": "기업은행"},
+    {"bankCode": "004", "bankName": "국민은행"},
+    {"bankCode": "011", "bankName": "농협은행"},
+    {"bankCode": "020", "bankName": "우리은행"},
+    {"bankCode": "023", "bankName": "SC제일은행"},
+    {"bankCode": "027", "bankName": "시티은행"},
+    {"bankCode": "032", "bankName": "대구은행"},
+    {"bankCode": "034", "bankName": "광주은행"},
+    {"bankCode": "035", "bankName": "제주은행"},
+    {"bankCode": "037", "bankName": "전북은행"},
+    {"bankCode": "039", "bankName": "경남은행"},
+    {"bankCode": "045", "bankName": "새마을금고"},
+    {"bankCode": "081", "bankName": "KEB하나은행"},
+    {"bankCode": "088", "bankName": "신한은행"},
+    {"bankCode": "090", "bankName": "카카오뱅크"},
+    {"bankCode": "999", "bankName": "싸피은행"},
+]
+BANK_NAMES = {bank["bankCode"]: bank["bankName"] for bank in BANKS}
+
+CURRENCIES = [
+    {"currency": "KRW", "currencyName": "원화"},
+    {"currency": "USD", "currencyName": "달러"},
+    {"currency": "EUR", "currencyName": "유로"},
+    {"currency": "JPY", "currencyName": "엔화"},
+    {"currency": "CNY", "currencyName": "위안화"},
+]
+
+# 자산 기준 신용등급 (총자산 하한)
+CREDIT_RATINGS = [
+    {"ratingName": "A", "demandDepositAssetValue": "5000000", "depositSavingsAssetValue": "5000000", "totalAssetValue": "10000000"},
+    {"ratingName": "B", "demandDepositAssetValue": "2500000", "depositSavingsAssetValue": "2500000", "totalAssetValue": "5000000"},
+    {"ratingName": "C", "demandDepositAssetValue": "1000000", "depositSavingsAssetValue": "1000000", "totalAssetValue": "2000000"},
+    {"ratingName": "D", "demandDepositAssetValue": "500000", "depositSavingsAssetValue": "500000", "totalAssetValue": "1000000"},
+    {"ratingName": "E", "demandDepositAssetValue": "0", "depositSavingsAssetValue": "0", "totalAssetValue": "0"},
+]
+
+# 오류 코드 (HTTP 400 본문 형식: {"responseCode", "responseMessage"})
+ERRORS = {
+    "H1000": "HEADER 정보가 유효하지 않습니다.",
+    "H1007": "기관거래고유번호가 중복된 값입니다.",
+    "E4002": "이미 존재하는 ID입니다.",
+    "E4003": "존재하지 않는 ID입니다.",
+    "E4004": "API KEY가 유효하지 않습니다.",
+    "A1003": "계좌번호가 유효하지 않습니다.",
+    "A1011": "상품 고유번호가 유효하지 않습니다.",
+    "A1014": "계좌잔액이 부족하여 거래가 실패했습니다.",
+    "A1016": "이체 한도를 초과했습니다.",
+    "A1087": "인증코드가 일치하지 않습니다.",
+    "Q1000": "요청 본문이 유효하지 않습니다.",
+    "U1001": "userKey가 유효하지 않습니다.",
+}
+
+
+class SimulatorError(Exception):
+    """시뮬레이터 업무 오류 (HTTP 400 + responseCode)"""
+
+    def __init__(self, code: str, message: Optional[str] = None):
+        super().__init__(message or ERRORS.get(code, code))
+        self.code = code
+        self.message = message or ERRORS.get(code, code)
+
+
+# ==================== 장애 주입 ====================
+
+class FaultConfig:
+    """지연 분포 / 오류율 / 호출 제한 설정 (실행 중 변경 가능)"""
+
+    FIELDS = (
+        "latency_ms", "latency_jitter_ms", "latency_sigma", "latency_dist",
+        "error_rate", "error_statuses", "rate_limit_rps", "rate_limit_burst",
+    )
+
+    def __init__(self, latency_ms: float = 0.0, latency_jitter_ms: float = 0.0,
+                 latency_sigma: float = 0.5, latency_dist: str = "fixed",
+                 error_rate: float = 0.0, error_statuses: Tuple[int, ...] = (500, 503),
+                 rate_limit_rps: float = 0.0, rate_limit_burst: int = 0):
+        self.latency_ms = latency_ms  # fixed/uniform: 평균, lognormal: 중앙값
+        self.latency_jitter_ms = latency_jitter_ms  # uniform/normal: 폭(표준편차)
+        self.latency_sigma = latency_sigma  # lognormal: 로그 표준편차 (꼬리 두께)
+        self.latency_dist = latency_dist  # fixed | uniform | normal | lognormal
+        self.error_rate = error_rate  # 0~1, 요청 중 5xx로 응답할 비율
+        self.error_statuses = tuple(error_statuses)
+        self.rate_limit_rps = rate_limit_rps  # 0이면 제한 없음
+        self.rate_limit_burst = rate_limit_burst or int(math.ceil(rate_limit_rps))
+
+    def update(self, values: Dict[str, Any]) -> None:
+        for key, value in values.items():
+            if key not in self.FIELDS:
+                raise ValueError(f"알 수 없는 설정: {key}")
+            setattr(self, key, tuple(value) if key == "error_statuses" else value)
+        if "rate_limit_rps" in values and "rate_limit_burst" not in values:
+            self.rate_limit_burst = int(math.ceil(self.rate_limit_rps))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """이번 요청의 지연 시간 (초)"""
+        if self.latency_ms <= 0:
+            return 0.0
+        if self.latency_dist == "uniform":
+            millis = rng.uniform(self.latency_ms - self.latency_jitter_ms, self.latency_ms + self.latency_jitter_ms)
+        elif self.latency_dist == "normal":
+            millis = rng.gauss(self.latency_ms, self.latency_jitter_ms)
+        elif self.latency_dist == "lognormal":
+            millis = rng.lognormvariate(math.log(self.latency_ms), self.latency_sigma)
+        else:
+            millis = self.latency_ms
+        return max(0.0, millis) / 1000
+
+
+class TokenBucket:
+    """초당 호출 제한 (burst만큼 순간 허용)"""
+
+    def __init__(self):
+        self.tokens = math.inf  # 첫 호출 시 burst로 맞춰짐
+        self.updated_at = time.monotonic()
+
+    def try_acquire(self, rate: float, burst: int) -> bool:
+        now = time.monotonic()
+        self.tokens = min(float(burst), self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+# ==================== 시뮬레이터 ====================
+
+class SSAFYSimulator:
+    """메모리 기반 SSAFY 금융 API"""
+
+    def __init__(self, faults: Optional[FaultConfig] = None, seed: Optional[int] = None,
+                 api_key: Optional[str] = None):
+        self.faults = faults or FaultConfig()
+        self.rng = random.Random(seed)
+        self.api_key = api_key  # 지정하면 다른 API KEY 요청은 E4004
+        self.stats: Counter = Counter()
+        self.bucket = TokenBucket()
+        self.reset()
+        self._routes = self.routes()
+
+    def reset(self) -> None:
+        """사용자/계좌/거래내역 초기화 (기본 상품은 다시 등록)"""
+        self.users: Dict[str, Dict[str, Any]] = {}  # userId -> 사용자
+        self.user_keys: Dict[str, str] = {}  # userKey -> userId
+        self.products: Dict[str, Dict[str, Any]] = {}  # accountTypeUniqueNo -> 상품
+        self.accounts: Dict[str, Dict[str, Any]] = {}  # accountNo -> 계좌
+        self.loan_applications: Dict[str, List[Dict[str, Any]]] = {}
+        self.auth_codes: Dict[Tuple[str, str], str] = {}  # (accountNo, authText) -> 인증코드
+        self.seen_unique_nos: set = set()
+        self.next_transaction_no = 1
+        self.stats.clear()
+        self._seed_products()
+
+    def _seed_products(self) -> None:
+        self._add_product("1", "수시입출금", {"accountName": "한국은행 수시입출금 상품명", "accountDescription": "한국은행 수시입출금 상품설명"}, "001")
+        self._add_product("1", "수시입출금", {"accountName": "신한 쏠편한 입출금통장", "accountDescription": "SSAFY 학생 전용 입출금통장"}, DEFAULT_BANK_CODE)
+        self._add_product("2", "예금", {
+            "accountName": "신한 청년 정기예금", "accountDescription": "청년 전용 정기예금",
+            "subscriptionPeriod": "365", "minSubscriptionBalance": "100000", "maxSubscriptionBalance": "10000000",
+            "interestRate": "3.5", "rateDescription": "기본금리 3.5%"
+        }, DEFAULT_BANK_CODE)
+        self._add_product("3", "적금", {
+            "accountName": "신한 청년 적금", "accountDescription": "매일 납입 적금",
+            "subscriptionPeriod": "180", "minSubscriptionBalance": "10000", "maxSubscriptionBalance": "1000000",
+            "interestRate": "4.5", "rateDescription": "기본금리 4.5%"
+        }, DEFAULT_BANK_CODE)
+        self._add_product("4", "대출", {
+            "accountName": "신한 학자금 대출", "accountDescription": "대학생 학자금 대출",
+            "ratingUniqueNo": "C", "loanPeriod": "365", "minLoanBalance": "100000", "maxLoanBalance": "5000000",
+            "interestRate": "4.0"
+        }, DEFAULT_BANK_CODE)
+
+    def _add_product(self, type_code: str, type_name: str, fields: Dict[str, Any], bank_code: str) -> Dict[str, Any]:
+        unique_no = f"{bank_code}-{type_code}-{uuid.uuid4().hex[:16]}"
+        product = {
+            "accountTypeUniqueNo": unique_no,
+            "bankCode": bank_code,
+            "bankName": BANK_NAMES.get(bank_code, "알 수 없는 은행"),
+            "accountTypeCode": type_code,
+            "accountTypeName": type_name,
+            **{key: value for key, value in fields.items() if key != "Header"},
+        }
+        self.products[unique_no] = product
+        return product
+
+    # ==================== 공용 도우미 ====================
+
+    def create_user(self, user_id: str, user_name: Optional[str] = None) -> Dict[str, Any]:
+        """사용자 생성 (부하 테스트 시딩에도 사용)"""
+        if user_id in self.users:
+            raise SimulatorError("E4002")
+        now = datetime.now().isoformat(timespec="seconds")
+        user = {
+            "userId": user_id,
+            "userName": user_name or user_id.split("@")[0],
+            "institutionCode": INSTITUTION_CODE,
+            "userKey": str(uuid.uuid4()),
+            "created": now,
+            "modified": now,
+        }
+        self.users[user_id] = user
+        self.user_keys[user["userKey"]] = user_id
+        return user
+
+    def open_demand_account(self, user_key: str, balance: int = 0,
+                            account_type_unique_no: Optional[str] = None) -> Dict[str, Any]:
+        """수시입출금 계좌 개설 (시딩용, balance만큼 입금)"""
+        product = self.products.get(account_type_unique_no) if account_type_unique_no else next(
+            p for p in self.products.values() if p["accountTypeCode"] == "1" and p["bankCode"] == DEFAULT_BANK_CODE
+        )
+        if not product or product["accountTypeCode"] != "1":
+            raise SimulatorError("A1011")
+        account = self._new_account(user_key, product, "demand")
+        account.update({"dailyTransferLimit": 5000000, "oneTimeTransferLimit": 1000000, "transferredToday": 0})
+        if balance:
+            self._post(account, "1", "입금", balance, "초기 입금")
+        return account
+
+    def _user_of(self, header: Dict[str, Any]) -> Dict[str, Any]:
+        user_id = self.user_keys.get(header.get("userKey") or "")
+        if not user_id:
+            raise SimulatorError("U1001")
+        return self.users[user_id]
+
+    def _new_account(self, user_key: str, product: Dict[str, Any], kind: str) -> Dict[str, Any]:
+        while True:
+            account_no = f"{product['bankCode'][-3:]}{self.rng.randrange(10 ** 12, 10 ** 13)}"
+            if account_no not in self.accounts:
+                break
+        today = datetime.now()
+        account = {
+            "accountNo": account_no,
+            "kind": kind,
+            "userKey": user_key,
+            "product": product,
+            "balance": 0,
+            "status": "ACTIVE",
+            "createdDate": today.strftime("%Y%m%d"),
+            "expiryDate": (today + timedelta(days=int(product.get("subscriptionPeriod") or product.get("loanPeriod") or 365 * 5))).strftime("%Y%m%d"),
+            "lastTransactionDate": "",
+            "ledger": [],
+        }
+        self.accounts[account_no] = account
+        return account
+
+    def _account(self, header: Dict[str, Any], account_no: Optional[str], kind: Optional[str] = None) -> Dict[str, Any]:
+        account = self.accounts.get(account_no or "")
+        if (not account or account["status"] != "ACTIVE"
+                or account["userKey"] != header.get("userKey") or (kind and account["kind"] != kind)):
+            raise SimulatorError("A1003")
+        return account
+
+    def _post(self, account: Dict[str, Any], tx_type: str, type_name: str, amount: int, summary: str,
+              counterpart: str = "") -> Dict[str, Any]:
+        """거래 기록 (tx_type: "1" 입금, "2" 출금)"""
+        if amount <= 0:
+            raise SimulatorError("Q1000", "거래금액이 유효하지 않습니다.")
+        if tx_type == "2" and account["balance"] < amount:
+            raise SimulatorError("A1014")
+        account["balance"] += amount if tx_type == "1" else -amount
+        now = datetime.now()
+        transaction = {
+            "transactionUniqueNo": str(self.next_transaction_no),
+            "transactionDate": now.strftime("%Y%m%d"),
+            "transactionTime": now.strftime("%H%M%S"),
+            "transactionType": tx_type,
+            "transactionTypeName": type_name,
+            "transactionAccountNo": counterpart,
+            "transactionBalance": str(amount),
+            "transactionAfterBalance": str(account["balance"]),
+            "transactionSummary": summary,
+            "transactionMemo": "",
+        }
+        self.next_transaction_no += 1
+        account["ledger"].append(transaction)
+        account["lastTransactionDate"] = transaction["transactionDate"]
+        return transaction
+
+    def _demand_view(self, account: Dict[str, Any]) -> Dict[str, Any]:
+        product = account["product"]
+        return {
+            "bankCode": product["bankCode"],
+            "bankName": product["bankName"],
+            "userName": self.users[self.user_keys[account["userKey"]]]["userName"],
+            "accountNo": account["accountNo"],
+            "accountName": product["accountName"],
+            "accountTypeCode": product["accountTypeCode"],
+            "accountTypeName": product["accountTypeName"],
+            "accountCreatedDate": account["createdDate"],
+            "accountExpiryDate": account["expiryDate"],
+            "dailyTransferLimit": str(account.get("dailyTransferLimit", 0)),
+            "oneTimeTransferLimit": str(account.get("oneTimeTransferLimit", 0)),
+            "accountBalance": str(account["balance"]),
+            "lastTransactionDate": account["lastTransactionDate"],
+            "currency": "KRW",
+        }
+
+    def _product_account_view(self, account: Dict[str, Any]) -> Dict[str, Any]:
+        product = account["product"]
+        return {
+            "bankCode": product["bankCode"],
+            "bankName": product["bankName"],
+            "userName": self.users[self.user_keys[account["userKey"]]]["userName"],
+            "accountNo": account["accountNo"],
+            "accountName": product["accountName"],
+            "accountDescription": product.get("accountDescription"),
+            "withdrawalBankCode": DEFAULT_BANK_CODE,
+            "withdrawalAccountNo": account.get("withdrawalAccountNo", ""),
+            "subscriptionPeriod": product.get("subscriptionPeriod") or product.get("loanPeriod"),
+            "interestRate": product.get("interestRate"),
+            "accountCreateDate": account["createdDate"],
+            "accountExpiryDate": account["expiryDate"],
+            "depositBalance": str(account["balance"]),
+            "totalBalance": str(account["balance"]),
+            "loanBalance": str(account["balance"]),
+            "status": account["status"],
+            "installmentNumber": str(len(account["ledger"])),
+        }
+
+    def _user_accounts(self, header: Dict[str, Any], kind: str) -> List[Dict[str, Any]]:
+        user_key = self._user_of(header)["userKey"]
+        return [
+            account for account in self.accounts.values()
+            if account["userKey"] == user_key and account["kind"] == kind and account["status"] == "ACTIVE"
+        ]
+
+    def _withdraw_for(self, header: Dict[str, Any], account_no: str, amount: int, summary: str) -> None:
+        source = self._account(header, account_no, "demand")
+        self._post(source, "2", "출금", amount, summary)
+
+    def _interest(self, account: Dict[str, Any], early: bool) -> Dict[str, Any]:
+        rate = float(account["product"].get("interestRate") or 0)
+        ratio = 0.5 if early else 1.0
+        interest = int(account["balance"] * rate / 100 * ratio)
+        key = "earlyTerminationInterest" if early else "expiryInterest"
+        return {
+            "accountNo": account["accountNo"],
+            "interestRate": str(rate),
+            "depositBalance": str(account["balance"]),
+            key: str(interest),
+            ("earlyTerminationBalance" if early else "expiryTotalBalance"): str(account["balance"] + interest),
+        }
+
+    def _credit_rating(self, header: Dict[str, Any]) -> Dict[str, Any]:
+        demand = sum(a["balance"] for a in self._user_accounts(header, "demand"))
+        saved = sum(a["balance"] for a in self._user_accounts(header, "deposit") + self._user_accounts(header, "savings"))
+        total = demand + saved
+        rating = next(r for r in CREDIT_RATINGS if total >= int(r["totalAssetValue"]))
+        return {
+            "ratingName": rating["ratingName"],
+            "demandDepositAssetValue": str(demand),
+            "depositSavingsAssetValue": str(saved),
+            "totalAssetValue": str(total),
+        }
+
+    # ==================== 엔드포인트 ====================
+
+    def handle(self, path: str, body: Dict[str, Any]) -> Any:
+        """경로별 처리 (REC에 들어갈 값 반환)"""
+        handler = self._routes.get(path)
+        if handler is None:
+            raise web.HTTPNotFound(text=f"지원하지 않는 API: {path}")
+        return handler(body.get("Header") or {}, body)
+
+    def routes(self) -> Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Any]]:
+        return {
+            # 관리자
+            "/edu/app/issuedApiKey": self._issue_api_key,
+            "/edu/app/reIssuedApiKey": self._issue_api_key,
+            # 은행/코드
+            "/edu/bank/inquireBankCodes": lambda h, b: BANKS,
+            "/edu/bank/inquireBankCurrency": lambda h, b: CURRENCIES,
+            # 수시입출금
+            "/edu/demandDeposit/createDemandDeposit": lambda h, b: self._add_product("1", "수시입출금", b, b.get("bankCode") or DEFAULT_BANK_CODE),
+            "/edu/demandDeposit/inquireDemandDepositList": lambda h, b: self._products("1"),
+            "/edu/demandDeposit/createDemandDepositAccount": self._create_demand_account,
+            "/edu/demandDeposit/inquireDemandDepositAccountList": lambda h, b: [self._demand_view(a) for a in self._user_accounts(h, "demand")],
+            "/edu/demandDeposit/inquireDemandDepositAccount": lambda h, b: self._demand_view(self._account(h, b.get("accountNo"), "demand")),
+            "/edu/demandDeposit/inquireDemandDepositAccountHolderName": self._holder_name,
+            "/edu/demandDeposit/inquireDemandDepositAccountBalance": self._balance,
+            "/edu/demandDeposit/updateDemandDepositAccountWithdrawal": lambda h, b: self._single_post(h, b, "2", "출금"),
+            "/edu/demandDeposit/updateDemandDepositAccountDeposit": lambda h, b: self._single_post(h, b, "1", "입금"),
+            "/edu/demandDeposit/updateDemandDepositAccountTransfer": self._transfer,
+            "/edu/demandDeposit/updateTransferLimit": self._update_transfer_limit,
+            "/edu/demandDeposit/inquireTransactionHistoryList": self._transaction_history,
+            "/edu/demandDeposit/inquireTransactionHistory": self._single_transaction,
+            "/edu/demandDeposit/deleteDemandDepositAccount": self._close_demand_account,
+            # 예금
+            "/edu/deposit/createDepositProduct": lambda h, b: self._add_product("2", "예금", b, b.get("bankCode") or DEFAULT_BANK_CODE),
+            "/edu/deposit/inquireDepositProducts": lambda h, b: self._products("2"),
+            "/edu/deposit/createDepositAccount": lambda h, b: self._create_product_account(h, b, "2", "deposit"),
+            "/edu/deposit/inquireDepositInfoList": lambda h, b: [self._product_account_view(a) for a in self._user_accounts(h, "deposit")],
+            "/edu/deposit/inquireDepositInfoDetail": lambda h, b: self._product_account_view(self._account(h, b.get("accountNo"), "deposit")),
+            "/edu/deposit/inquireDepositPayment": lambda h, b: self._payments(h, b, "deposit"),
+            "/edu/deposit/inquireDepositExpiryInterest": lambda h, b: self._interest(self._account(h, b.get("accountNo"), "deposit"), False),
+            "/edu/deposit/inquireDepositEarlyTerminationInterest": lambda h, b: self._interest(self._account(h, b.get("accountNo"), "deposit"), True),
+            "/edu/deposit/deleteDepositAccount": lambda h, b: self._close_product_account(h, b, "deposit"),
+            # 적금
+            "/edu/savings/createProduct": lambda h, b: self._add_product("3", "적금", b, b.get("bankCode") or DEFAULT_BANK_CODE),
+            "/edu/savings/inquireSavingsProducts": lambda h, b: self._products("3"),
+            "/edu/savings/createAccount": lambda h, b: self._create_product_account(h, b, "3", "savings"),
+            "/edu/savings/inquireAccountList": lambda h, b: [self._product_account_view(a) for a in self._user_accounts(h, "savings")],
+            "/edu/savings/inquireAccount": lambda h, b: self._product_account_view(self._account(h, b.get("accountNo"), "savings")),
+            "/edu/savings/inquirePayment": lambda h, b: self._payments(h, b, "savings"),
+            "/edu/savings/inquireExpiryInterest": lambda h, b: self._interest(self._account(h, b.get("accountNo"), "savings"), False),
+            "/edu/savings/inquireEarlyTerminationInterest": lambda h, b: self._interest(self._account(h, b.get("accountNo"), "savings"), True),
+            "/edu/savings/deleteAccount": lambda h, b: self._close_product_account(h, b, "savings"),
+            # 대출
+            "/edu/loan/inquireAssetBasedCreditRatingList": lambda h, b: CREDIT_RATINGS,
+            "/edu/loan/createLoanProduct": lambda h, b: self._add_product("4", "대출", b, b.get("bankCode") or DEFAULT_BANK_CODE),
+            "/edu/loan/inquireLoanProductList": lambda h, b: self._products("4"),
+            "/edu/loan/inquireMyCreditRating": lambda h, b: self._credit_rating(h),
+            "/edu/loan/createLoanApplication": self._create_loan_application,
+            "/edu/loan/inquireLoanApplicationList": lambda h, b: self.loan_applications.get(self._user_of(h)["userKey"], []),
+            "/edu/loan/createLoanAccount": self._create_loan_account,
+            "/edu/loan/inquireLoanAccountList": lambda h, b: [self._product_account_view(a) for a in self._user_accounts(h, "loan")],
+            "/edu/loan/inquireRepaymentRecords": lambda h, b: self._payments(h, b, "loan"),
+            "/edu/loan/updateRepaymentLoanBalanceInFull": self._repay_loan,
+            # 계좌 인증 / 메모
+            "/edu/accountAuth/openAccountAuth": self._open_account_auth,
+            "/edu/accountAuth/checkAuthCode": self._check_auth_code,
+            "/edu/transactionMemo": self._transaction_memo,
+        }
+
+    def _issue_api_key(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        today = datetime.now()
+        return {
+            "managerId": body.get("managerId"),
+            "apiKey": uuid.uuid4().hex,
+            "creationDate": today.strftime("%Y%m%d"),
+            "expirationDate": (today + timedelta(days=365)).strftime("%Y%m%d"),
+        }
+
+    def _products(self, type_code: str) -> List[Dict[str, Any]]:
+        return [product for product in self.products.values() if product["accountTypeCode"] == type_code]
+
+    def _create_demand_account(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        self._user_of(header)
+        account = self.open_demand_account(header["userKey"], 0, body.get("accountTypeUniqueNo"))
+        return {
+            "bankCode": account["product"]["bankCode"],
+            "accountNo": account["accountNo"],
+            "currency": {"currency": "KRW", "currencyName": "원화"},
+        }
+
+    def _holder_name(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        account = self.accounts.get(body.get("accountNo") or "")
+        if not account:
+            raise SimulatorError("A1003")
+        return {
+            "bankCode": account["product"]["bankCode"],
+            "bankName": account["product"]["bankName"],
+            "accountNo": account["accountNo"],
+            "userName": self.users[self.user_keys[account["userKey"]]]["userName"],
+        }
+
+    def _balance(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), "demand")
+        return {
+            "bankCode": account["product"]["bankCode"],
+            "accountNo": account["accountNo"],
+            "accountBalance": str(account["balance"]),
+            "accountCreatedDate": account["createdDate"],
+            "accountExpiryDate": account["expiryDate"],
+            "lastTransactionDate": account["lastTransactionDate"],
+            "currency": "KRW",
+        }
+
+    def _single_post(self, header: Dict[str, Any], body: Dict[str, Any], tx_type: str, type_name: str) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), "demand")
+        transaction = self._post(account, tx_type, type_name, int(body.get("transactionBalance") or 0),
+                                 body.get("transactionSummary") or type_name)
+        return {"transactionUniqueNo": transaction["transactionUniqueNo"], "transactionDate": transaction["transactionDate"]}
+
+    def _transfer(self, header: Dict[str, Any], body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        source = self._account(header, body.get("withdrawalAccountNo"), "demand")
+        target = self.accounts.get(body.get("depositAccountNo") or "")
+        if not target or target["status"] != "ACTIVE" or target["kind"] != "demand":
+            raise SimulatorError("A1003")
+        amount = int(body.get("transactionBalance") or 0)
+        if amount > source.get("oneTimeTransferLimit", amount) or \
+                source.get("transferredToday", 0) + amount > source.get("dailyTransferLimit", amount):
+            raise SimulatorError("A1016")
+
+        withdrawal = self._post(source, "2", "출금(이체)", amount,
+                                body.get("withdrawalTransactionSummary") or "출금(이체)", target["accountNo"])
+        deposit = self._post(target, "1", "입금(이체)", amount,
+                             body.get("depositTransactionSummary") or "입금(이체)", source["accountNo"])
+        source["transferredToday"] = source.get("transferredToday", 0) + amount
+        return [
+            {"transactionUniqueNo": tx["transactionUniqueNo"], "accountNo": account["accountNo"],
+             "transactionDate": tx["transactionDate"], "transactionType": tx["transactionType"],
+             "transactionTypeName": tx["transactionTypeName"], "transactionAccountNo": tx["transactionAccountNo"]}
+            for tx, account in ((withdrawal, source), (deposit, target))
+        ]
+
+    def _update_transfer_limit(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), "demand")
+        account["oneTimeTransferLimit"] = int(body.get("oneTimeTransferLimit") or account["oneTimeTransferLimit"])
+        account["dailyTransferLimit"] = int(body.get("dailyTransferLimit") or account["dailyTransferLimit"])
+        return self._demand_view(account)
+
+    def _transaction_history(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), "demand")
+        start, end = body.get("startDate") or "00000000", body.get("endDate") or "99999999"
+        tx_type = body.get("transactionType") or "A"
+        transactions = [
+            tx for tx in account["ledger"]
+            if start <= tx["transactionDate"] <= end
+            and (tx_type == "A" or (tx_type == "M" and tx["transactionType"] == "1") or (tx_type == "D" and tx["transactionType"] == "2"))
+        ]
+        if (body.get("orderByType") or "ASC") == "DESC":
+            transactions = transactions[::-1]
+        return {"totalCount": str(len(transactions)), "list": transactions}
+
+    def _single_transaction(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), "demand")
+        for transaction in account["ledger"]:
+            if transaction["transactionUniqueNo"] == str(body.get("transactionUniqueNo")):
+                return transaction
+        raise SimulatorError("Q1000", "거래고유번호가 유효하지 않습니다.")
+
+    def _close_demand_account(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), "demand")
+        balance = account["balance"]
+        refund_account_no = body.get("refundAccountNo") or ""
+        if balance and refund_account_no:
+            refund = self._account(header, refund_account_no, "demand")
+            self._post(account, "2", "출금(이체)", balance, "계좌해지 잔액 이체", refund_account_no)
+            self._post(refund, "1", "입금(이체)", balance, "계좌해지 잔액 입금", account["accountNo"])
+        account["status"] = "CLOSED"
+        return {"status": "CLOSED", "accountBalance": str(balance), "refundAccountNo": refund_account_no}
+
+    def _create_product_account(self, header: Dict[str, Any], body: Dict[str, Any], type_code: str, kind: str) -> Dict[str, Any]:
+        self._user_of(header)
+        product = self.products.get(body.get("accountTypeUniqueNo") or "")
+        if not product or product["accountTypeCode"] != type_code:
+            raise SimulatorError("A1011")
+        amount = int(body.get("depositBalance") or 0)
+        self._withdraw_for(header, body.get("withdrawalAccountNo"), amount, f"{product['accountName']} 가입")
+        account = self._new_account(header["userKey"], product, kind)
+        account["withdrawalAccountNo"] = body.get("withdrawalAccountNo")
+        self._post(account, "1", "입금", amount, "가입 납입")
+        return self._product_account_view(account)
+
+    def _payments(self, header: Dict[str, Any], body: Dict[str, Any], kind: str) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), kind)
+        records = [
+            {"paymentUniqueNo": tx["transactionUniqueNo"], "paymentDate": tx["transactionDate"],
+             "paymentTime": tx["transactionTime"], "paymentBalance": tx["transactionBalance"], "status": "SUCCESS"}
+            for tx in account["ledger"]
+        ]
+        key = {"deposit": "paymentInfo", "savings": "paymentInfo", "loan": "repaymentRecords"}[kind]
+        return {**self._product_account_view(account), key: records}
+
+    def _close_product_account(self, header: Dict[str, Any], body: Dict[str, Any], kind: str) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), kind)
+        interest = self._interest(account, True)
+        payout = int(interest["earlyTerminationBalance"])
+        refund = self.accounts.get(account.get("withdrawalAccountNo") or "")
+        if refund and refund["status"] == "ACTIVE":
+            self._post(refund, "1", "입금", payout, f"{account['product']['accountName']} 해지")
+        account["status"] = "CLOSED"
+        return {"status": "CLOSED", "accountNo": account["accountNo"], "earlyTerminationBalance": str(payout)}
+
+    def _create_loan_application(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        user = self._user_of(header)
+        product = self.products.get(body.get("accountTypeUniqueNo") or "")
+        if not product or product["accountTypeCode"] != "4":
+            raise SimulatorError("A1011")
+        rating = self._credit_rating(header)["ratingName"]
+        application = {
+            "accountTypeUniqueNo": product["accountTypeUniqueNo"],
+            "accountName": product["accountName"],
+            "ratingName": rating,
+            "status": "APPROVED" if rating <= (product.get("ratingUniqueNo") or "E") else "REJECTED",
+            "applicationDate": datetime.now().strftime("%Y%m%d"),
+        }
+        self.loan_applications.setdefault(user["userKey"], []).append(application)
+        return application
+
+    def _create_loan_account(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        self._user_of(header)
+        product = self.products.get(body.get("accountTypeUniqueNo") or "")
+        if not product or product["accountTypeCode"] != "4":
+            raise SimulatorError("A1011")
+        amount = int(body.get("loanBalance") or 0)
+        deposit_to = self._account(header, body.get("withdrawalAccountNo"), "demand")
+        account = self._new_account(header["userKey"], product, "loan")
+        account["withdrawalAccountNo"] = deposit_to["accountNo"]
+        account["balance"] = amount
+        self._post(deposit_to, "1", "입금", amount, f"{product['accountName']} 대출금")
+        return self._product_account_view(account)
+
+    def _repay_loan(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        account = self._account(header, body.get("accountNo"), "loan")
+        amount = account["balance"]
+        self._withdraw_for(header, account["withdrawalAccountNo"], amount, f"{account['product']['accountName']} 상환")
+        account["ledger"].append({"transactionUniqueNo": str(self.next_transaction_no),
+                                  "transactionDate": datetime.now().strftime("%Y%m%d"),
+                                  "transactionTime": datetime.now().strftime("%H%M%S"),
+                                  "transactionBalance": str(amount)})
+        self.next_transaction_no += 1
+        account["balance"] = 0
+        account["status"] = "CLOSED"
+        return {"accountNo": account["accountNo"], "repaymentBalance": str(amount), "status": "CLOSED"}
+
+    def _open_account_auth(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        account = self.accounts.get(body.get("accountNo") or "")
+        if not account or account["kind"] != "demand":
+            raise SimulatorError("A1003")
+        code = f"{self.rng.randrange(10000):04d}"
+        auth_text = body.get("authText") or "SSAFY"
+        self.auth_codes[(account["accountNo"], auth_text)] = code
+        transaction = self._post(account, "1", "입금", 1, f"{auth_text} {code}")
+        return {"transactionUniqueNo": transaction["transactionUniqueNo"], "accountNo": account["accountNo"]}
+
+    def _check_auth_code(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        key = (body.get("accountNo") or "", body.get("authText") or "SSAFY")
+        if self.auth_codes.get(key) != body.get("authCode"):
+            raise SimulatorError("A1087")
+        del self.auth_codes[key]
+        return {"status": "SUCCESS", "accountNo": key[0]}
+
+    def _transaction_memo(self, header: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        transaction = self._single_transaction(header, body)
+        transaction["transactionMemo"] = body.get("transactionMemo") or ""
+        return transaction
+
+    # ==================== 사용자 계정 (/member) ====================
+
+    def _check_api_key(self, body: Dict[str, Any]) -> None:
+        if self.api_key and body.get("apiKey") != self.api_key:
+            raise SimulatorError("E4004")
+
+    def member_create(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        self._check_api_key(body)
+        if not body.get("userId"):
+            raise SimulatorError("Q1000")
+        return {**self.create_user(body["userId"]), "responseCode": "0000", "responseMessage": "정상처리 되었습니다."}
+
+    def member_search(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        self._check_api_key(body)
+        user = self.users.get(body.get("userId") or "")
+        if not user:
+            raise SimulatorError("E4003")
+        return dict(user)
+
+    # ==================== HTTP ====================
+
+    def _response_header(self, header: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "responseCode": "H0000",
+            "responseMessage": "정상처리 되었습니다.",
+            **{key: header.get(key) for key in (
+                "apiName", "transmissionDate", "transmissionTime", "institutionCode",
+                "fintechAppNo", "apiServiceCode", "institutionTransactionUniqueNo"
+            )},
+        }
+
+    def _validate_header(self, header: Dict[str, Any]) -> None:
+        if not header or not header.get("apiName") or not header.get("institutionTransactionUniqueNo"):
+            raise SimulatorError("H1000")
+        if self.api_key and header.get("apiKey") != self.api_key:
+            raise SimulatorError("E4004")
+        # 실제 API처럼 같은 기관거래고유번호 재사용 거부
+        unique_no = header["institutionTransactionUniqueNo"]
+        if unique_no in self.seen_unique_nos:
+            raise SimulatorError("H1007")
+        self.seen_unique_nos.add(unique_no)
+
+    async def dispatch(self, request: web.Request) -> web.Response:
+        path = request.path[len(API_PREFIX):] if request.path.startswith(API_PREFIX) else request.path
+        self.stats["requests"] += 1
+
+        # 호출 제한 → 지연 → 오류 주입 순서로 적용
+        if self.faults.rate_limit_rps > 0 and not self.bucket.try_acquire(
+                self.faults.rate_limit_rps, self.faults.rate_limit_burst):
+            self.stats["rate_limited"] += 1
+            return web.json_response({"responseCode": "Q1429", "responseMessage": "요청 한도를 초과했습니다."}, status=429)
+
+        delay = self.faults.sample_latency(self.rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.faults.error_rate > 0 and self.rng.random() < self.faults.error_rate:
+            self.stats["injected_errors"] += 1
+            return web.Response(status=self.rng.choice(self.faults.error_statuses), text="simulated upstream failure")
+
+        try:
+            body = await request.json()
+        except ValueError:
+            return web.json_response({"responseCode": "Q1000", "responseMessage": ERRORS["Q1000"]}, status=400)
+
+        try:
+            if path in ("/member", "/member/"):
+                self.stats["member"] += 1
+                return web.json_response(self.member_create(body))
+            if path == "/member/search":
+                self.stats["member/search"] += 1
+                return web.json_response(self.member_search(body))
+
+            header = body.get("Header") or {}
+            self._validate_header(header)
+            self.stats[header["apiName"]] += 1
+            rec = self.handle(path, body)
+        except SimulatorError as e:
+            self.stats["business_errors"] += 1
+            return web.json_response({"responseCode": e.code, "responseMessage": e.message}, status=400)
+
+        response = {"Header": self._response_header(header), "REC": rec}
+        if isinstance(rec, list):
+            # 기존 코드가 읽는 dataSearch.content 형식도 함께 제공
+            response["dataSearch"] = {"content": rec}
+        return web.json_response(response)
+
+    async def _admin_config(self, request: web.Request) -> web.Response:
+        if request.method == "POST":
+            try:
+                self.faults.update(await request.json())
+            except ValueError as e:
+                return web.json_response({"error": str(e)}, status=400)
+        return web.json_response(self.faults.as_dict())
+
+    async def _admin_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "stats": dict(self.stats),
+            "users": len(self.users),
+            "accounts": len(self.accounts),
+            "transactions": self.next_transaction_no - 1,
+        })
+
+    async def _admin_reset(self, request: web.Request) -> web.Response:
+        self.reset()
+        return web.json_response({"reset": True})
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/_simulator/config", self._admin_config)
+        app.router.add_get("/_simulator/stats", self._admin_stats)
+        app.router.add_post("/_simulator/reset", self._admin_reset)
+        app.router.add_post("/{tail:.*}", self.dispatch)
+        return app
+
+
+async def start_simulator(simulator: Optional[SSAFYSimulator] = None, host: str = "127.0.0.1",
+                          port: int = 0) -> Tuple[web.AppRunner, str]:
+    """현재 이벤트 루프에서 시뮬레이터 실행 (runner, base URL) 반환 - 테스트/벤치마크용"""
+    simulator = simulator or SSAFYSimulator()
+    runner = web.AppRunner(simulator.build_app())
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}{API_PREFIX}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SSAFY 금융 API 로컬 시뮬레이터")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="평균(lognormal은 중앙값) 지연 (ms)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="uniform 폭 / normal 표준편차 (ms)")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="lognormal 로그 표준편차")
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "normal", "lognormal"], default="fixed")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx로 응답할 비율 (0~1)")
+    parser.add_argument("--rate-limit-rps", type=float, default=0.0, help="초당 허용 요청 수 (0은 무제한)")
+    parser.add_argument("--rate-limit-burst", type=int, default=0)
+    parser.add_argument("--api-key", default=None, help="지정하면 이 API KEY만 허용")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    simulator = SSAFYSimulator(
+        FaultConfig(
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            latency_sigma=args.latency_sigma,
+            latency_dist=args.latency_dist,
+            error_rate=args.error_rate,
+            rate_limit_rps=args.rate_limit_rps,
+            rate_limit_burst=args.rate_limit_burst,
+        ),
+        seed=args.seed,
+        api_key=args.api_key,
+    )
+    print(f"🏦 SSAFY 시뮬레이터 실행: http://{args.host}:{args.port}{API_PREFIX}")
+    web.run_app(simulator.build_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+비동기 DB 세션 테스트
+동기 URL → 비동기 드라이버 URL 변환, 비동기 엔진의 PRAGMA 적용, async 라우트(크로니클/크레도 조회)를
+비동기 세션으로 처리하는지, 크로니클 피드가 커서로 빠짐없이 이어서 조회되는지,
+동기 세션을 쓰는 인증 라우트가 이벤트 루프에서 동기 엔진 쿼리를 실행하지 않는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.session import (
+    SyncSessionOnEventLoopError, async_database_url, create_app_engine, create_async_app_engine,
+    get_async_session, get_session
+)
+from app.db.migrations import upgrade
+from app.main import app
+from app.models.chronicle import ChroniclePost
+from app.models.user import User
+from app.services.user_service import JWTService, SSAFYAPIService
+
+
+def test_async_url_conversion():
+    assert async_database_url("sqlite:///./hackathon.db") == "sqlite+aiosqlite:///./hackathon.db"
+    assert async_database_url("postgresql+psycopg2://u:pw@db:5432/app") == "postgresql+asyncpg://u:pw@db:5432/app"
+    with pytest.raises(ValueError):
+        async_database_url("mysql://u@db/app")
+
+
+def test_async_engine_applies_pragmas():
+    async def journal_mode(url):
+        engine = create_async_app_engine(url)
+        try:
+            async with engine.connect() as conn:
+                return (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+        finally:
+            await engine.dispose()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        assert asyncio.run(journal_mode(f"sqlite:///{os.path.join(workdir, 'a.db')}")).lower() == "wal"
+
+
+def test_async_routes_use_async_session():
+    with tempfile.TemporaryDirectory() as workdir:
+        url = f"sqlite:///{os.path.join(workdir, 'app.db')}"
+        engine = create_app_engine(url)
+        upgrade(engine)
+        with Session(engine) as session:
+            user = User(email="async@ssafy.com", password_hash="x")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            token = JWTService.create_access_token(user)
+
+        async_engine = create_async_app_engine(url)
+
+        async def override_async_session():
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                yield session
+
+        def override_session():
+            with Session(engine) as session:
+                yield session
+
+        async def scenario():
+            headers = {"Authorization": f"Bearer {token}"}
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                assert (await client.get("/api/chronicle/posts/public")).json() == []  # 캐시됨
+                created = await client.post("/api/chronicle/posts", headers=headers,
+                                            json={"title": "첫 기록", "user_content": {"text": "안녕"}})
+                assert created.status_code == 200, created.text
+                posts = (await client.get("/api/chronicle/posts", headers=headers)).json()
+                assert [(post["id"], post["title"], post["rewards"]) for post in posts] == \
+                    [(created.json()["id"], "첫 기록", {"credo": 5})]
+                # 생성 시 공개 피드 캐시 무효화, 본인 홈 타임라인에 전파
+                public = (await client.get("/api/chronicle/posts/public")).json()
+                feed = (await client.get("/api/chronicle/feed", headers=headers)).json()
+                assert [post["id"] for post in public] == [post["id"] for post in feed] == [created.json()["id"]]
+                bad = await client.get("/api/chronicle/posts", headers={"Authorization": "Bearer bad"})
+                assert bad.status_code == 401
+
+                progress = (await client.get("/api/xp/me", headers=headers)).json()
+                assert (progress["user_id"], progress["current_level"]) == (user.id, 1)
+
+                deleted = await client.delete(f"/api/chronicle/posts/{created.json()['id']}", headers=headers)
+                assert deleted.status_code == 200
+                assert (await client.get("/api/chronicle/posts/public")).json() == []
+            await async_engine.dispose()
+
+        app.dependency_overrides[get_async_session] = override_async_session
+        app.dependency_overrides[get_session] = override_session
+        try:
+            asyncio.run(scenario())
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+
+def test_chronicle_keyset_pagination():
+    with tempfile.TemporaryDirectory() as workdir:
+        url = f"sqlite:///{os.path.join(workdir, 'app.db')}"
+        engine = create_app_engine(url)
+        upgrade(engine)
+        with Session(engine) as session:
+            user = User(email="pages@ssafy.com", password_hash="x")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            token = JWTService.create_access_token(user)
+
+            # 같은 시각의 포스트가 페이지 경계에 걸려도 id로 이어서 읽어야 함
+            session.add_all([
+                ChroniclePost(user_id=user.id, title=f"포스트 {i}", timestamp=datetime(2024, 1, 1 + i // 2))
+                for i in range(7)
+            ])
+            session.commit()
+
+        async_engine = create_async_app_engine(url)
+
+        async def override_async_session():
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                yield session
+
+        def override_session():
+            with Session(engine) as session:
+                yield session
+
+        async def scenario():
+            headers = {"Authorization": f"Bearer {token}"}
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                for path, request_headers in (("/api/chronicle/posts", headers), ("/api/chronicle/posts/public", {})):
+                    titles, cursor = [], None
+                    while True:
+                        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+                        page = await client.get(path, headers=request_headers, params=params)
+                        assert page.status_code == 200, page.text
+                        titles += [post["title"] for post in page.json()]
+                        if page.headers["X-Has-More"] == "false":
+                            assert "X-Next-Cursor" not in page.headers
+                            break
+                        cursor = page.headers["X-Next-Cursor"]
+                    assert titles == [f"포스트 {i}" for i in range(6, -1, -1)]
+
+                assert (await client.get("/api/chronicle/posts/public", params={"cursor": "!!"})).status_code == 400
+                assert (await client.get("/api/chronicle/posts/public", params={"limit": 101})).status_code == 422
+            await async_engine.dispose()
+
+        app.dependency_overrides[get_async_session] = override_async_session
+        app.dependency_overrides[get_session] = override_session
+        try:
+            asyncio.run(scenario())
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+
+def test_auth_routes_keep_sync_session_off_event_loop(monkeypatch):
+    async def email_free(email):
+        return {"exists": False}
+
+    async def registered(email):
+        return {"ssafy_data": {"userKey": "key-1"}}
+
+    monkeypatch.setattr(settings, "SYNC_DB_ON_EVENT_LOOP", "raise")
+    monkeypatch.setattr(SSAFYAPIService, "check_email_exists", staticmethod(email_free))
+    monkeypatch.setattr(SSAFYAPIService, "register_to_ssafy", staticmethod(registered))
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'app.db')}")
+        upgrade(engine)
+
+        def override_session():
+            with Session(engine) as session:
+                yield session
+
+        async def scenario():
+            # 이벤트 루프에서 동기 엔진을 쓰면 예외
+            with pytest.raises(SyncSessionOnEventLoopError):
+                with Session(engine) as session:
+                    session.exec(text("SELECT 1"))
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                checked = await client.post("/api/auth/check-email", json={"email": "loop@ssafy.com"})
+                assert checked.json()["is_available"] is True, checked.text
+                signup = await client.post("/api/auth/signup", json={"email": "loop@ssafy.com", "password": "secret1"})
+                assert signup.json()["success"] is True, signup.text
+                login = await client.post("/api/auth/login", json={"email": "loop@ssafy.com", "password": "secret1"})
+                assert login.status_code == 200, login.text
+                headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+                assert (await client.get("/api/auth/me", headers=headers)).json()["email"] == "loop@ssafy.com"
+                profile = await client.put("/api/auth/profile", headers=headers, params={"display_name": "루프"})
+                assert profile.json()["display_name"] == "루프", profile.text
+                firebase = await client.post("/api/auth/firebase", json={"firebase_uid": "fb-1", "email": "fb@ssafy.com"})
+                assert firebase.status_code == 200, firebase.text
+                users = await client.get("/api/auth/users")
+                assert users.json()["total_count"] == 2, users.text
+
+        app.dependency_overrides[get_session] = override_session
+        try:
+            asyncio.run(scenario())
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+크로니클 피드 테스트
+팔로워가 적은 작성자는 쓰기 시 전파, 많은 작성자는 읽기 시 병합해도 홈 타임라인이 같은 순서로 이어지는지,
+동시 팔로우가 충돌 없이 한 번만 반영되는지, 공개 피드 캐시가 버전으로 무효화되는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import func, text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, create_async_app_engine
+from app.models.chronicle import ChronicleAuthor, ChronicleFollow, ChroniclePost, ChronicleTimelineEntry
+from app.services.chronicle_feed import ChronicleFeedService, PublicFeedCache
+
+BASE_TIME = datetime(2024, 5, 1)
+
+
+def _with_users(count, scenario):
+    with tempfile.TemporaryDirectory() as workdir:
+        url = f"sqlite:///{os.path.join(workdir, 'feed.db')}"
+        engine = create_app_engine(url)
+        upgrade(engine)
+        with engine.begin() as conn:
+            for i in range(count):
+                conn.execute(text(
+                    'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                    "VALUES (:email, 'x', 1, 0, '2024-01-01', '2024-01-01')"
+                ), {"email": f"feed{i}@ssafy.com"})
+        engine.dispose()
+
+        async def run():
+            async_engine = create_async_app_engine(url)
+            try:
+                async with AsyncSession(async_engine, expire_on_commit=False) as db:
+                    await scenario(db)
+            finally:
+                await async_engine.dispose()
+
+        asyncio.run(run())
+
+
+async def _post(db, user_id, minutes):
+    post = ChroniclePost(user_id=user_id, title=f"{user_id}번 {minutes}분", rewards={"credo": 5},
+                         timestamp=BASE_TIME + timedelta(minutes=minutes))
+    db.add(post)
+    await db.flush()
+    await ChronicleFeedService.fan_out(db, post)
+    await db.commit()
+    return post
+
+
+async def _read_all(db, user_id, limit):
+    titles, cursor = [], None
+    while True:
+        body, cursor, has_more = await ChronicleFeedService.home_page(db, user_id, limit, cursor)
+        titles += [post["title"] for post in json.loads(body)]
+        if not has_more:
+            return titles
+
+
+def test_push_fan_out_follow_and_unfollow():
+    async def scenario(db):
+        await _post(db, 2, 1)  # 팔로우 전 포스트는 팔로우 시 채워 넣음
+        assert await ChronicleFeedService.follow(db, 1, 2)
+        assert not await ChronicleFeedService.follow(db, 1, 2)
+        await db.commit()
+        await _post(db, 1, 2)
+        await _post(db, 2, 3)
+        await _post(db, 3, 4)  # 팔로우하지 않은 작성자
+
+        assert await _read_all(db, 1, 2) == ["2번 3분", "1번 2분", "2번 1분"]
+
+        post = (await db.exec(select(ChroniclePost).where(ChroniclePost.title == "2번 3분"))).one()
+        await ChronicleFeedService.remove_post(db, post.id)
+        await db.delete(post)
+        await ChronicleFeedService.unfollow(db, 1, 2)
+        await db.commit()
+        assert await _read_all(db, 1, 10) == ["1번 2분"]
+
+    _with_users(3, scenario)
+
+
+def test_pull_authors_are_merged_on_read():
+    original_limit = settings.CHRONICLE_FANOUT_FOLLOWER_LIMIT
+    settings.CHRONICLE_FANOUT_FOLLOWER_LIMIT = 1
+
+    async def scenario(db):
+        await ChronicleFeedService.follow(db, 1, 2)
+        await ChronicleFeedService.follow(db, 1, 3)
+        await db.commit()
+        await _post(db, 2, 1)  # 아직 push 작성자일 때 전파된 포스트
+        await ChronicleFeedService.follow(db, 4, 2)  # 팔로워 2명 → pull 작성자로 전환
+        await db.commit()
+        for minutes in range(2, 12):
+            await _post(db, 2 if minutes % 2 else 3, minutes)
+
+        author = (await db.exec(select(ChronicleAuthor).where(ChronicleAuthor.user_id == 2))).one()
+        assert (author.follower_count, author.pull_feed) == (2, True)
+        pushed_to_follower = (await db.exec(
+            select(func.count()).select_from(ChronicleTimelineEntry).where(ChronicleTimelineEntry.user_id == 1)
+        )).one()
+        assert pushed_to_follower == 6  # 3번 작성자 5개 + 전환 전 2번 작성자 1개
+
+        expected = [f"{2 if minutes % 2 else 3}번 {minutes}분" for minutes in range(11, 1, -1)] + ["2번 1분"]
+        for limit in (1, 3, 20):
+            assert await _read_all(db, 1, limit) == expected
+        assert await _read_all(db, 4, 20) == [title for title in expected if title.startswith("2번")]
+
+    try:
+        _with_users(4, scenario)
+    finally:
+        settings.CHRONICLE_FANOUT_FOLLOWER_LIMIT = original_limit
+
+
+def test_concurrent_follows_insert_once():
+    async def scenario(db):
+        async def follow(follower_id, followee_id):
+            async with AsyncSession(db.bind, expire_on_commit=False) as session:
+                followed = await ChronicleFeedService.follow(session, follower_id, followee_id)
+                await session.commit()
+                return followed
+
+        # 처음 팔로우되는 작성자에 같은 팔로우 중복 요청과 다른 팔로워들의 팔로우가 동시에 들어옴
+        for followee_id in range(1, 6):
+            followers = [i for i in range(1, 9) if i != followee_id]
+            results = await asyncio.gather(*[follow(followers[0], followee_id) for _ in range(8)],
+                                           *[follow(i, followee_id) for i in followers[1:]])
+            assert sorted(results) == [False] * 7 + [True] * len(followers)
+        follows = (await db.exec(select(func.count()).select_from(ChronicleFollow))).one()
+        authors = (await db.exec(select(ChronicleAuthor.user_id, ChronicleAuthor.follower_count))).all()
+        assert follows == 5 * 7
+        assert sorted(authors) == [(i, 7) for i in range(1, 6)]
+
+    _with_users(8, scenario)
+
+
+def test_public_feed_cache_versions():
+    cache = PublicFeedCache(ttl=60, max_pages=2)
+    page = (b"[]", None, False)
+    assert cache.get(50, None) is None
+    version = cache.version
+    cache.store(50, None, version, page)
+    assert cache.get(50, None) is page
+
+    stale_version = cache.version
+    cache.invalidate()
+    assert cache.get(50, None) is None
+    cache.store(50, None, stale_version, page)  # 무효화 전에 시작한 조회 결과는 저장하지 않음
+    assert cache.get(50, None) is None
+
+    for cursor in ("a", "b", "c"):
+        cache.store(50, cursor, cache.version, page)
+    assert cache.get(50, "a") is None and cache.get(50, "c") is page
+    assert cache.stats()["cached_pages"] == 2
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+크로니클 검색 테스트
+한글 바이그램 색인으로 조사가 붙은 단어/한 글자/영문 접두어를 찾는지, 트리거로 수정/삭제가 반영되는지,
+관련도순/최신순 페이지와 작성자/유형/기간 필터 확인
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.fts import index_text, json_index_text, match_expression
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, create_async_app_engine, get_async_session
+from app.main import app
+from app.models.chronicle import ChroniclePost
+from app.models.user import User
+
+
+def test_bigram_tokens_and_match_expression():
+    assert index_text("장학금을 받았다", "SSAFY 7기") == "장학 학금 금을 을 받았 았다 다 ssafy 7 기"
+    assert json_index_text('{"memo": "적금 만기", "amount": 1000, "tags": ["월급"]}') == "적금 금 만기 기 월급 급"
+    assert json_index_text("깨진 JSON") == ""
+    assert match_expression("장학금 SSA") == '"장학 학금" AND "ssa"*'
+    assert match_expression("금 SSAFY장학") == '"금"* AND "ssafy 장학"'
+    assert match_expression('"*) OR (') == '"or"*'  # FTS5 문법 문자는 버리고 단어로만 검색
+    assert match_expression('"*)(') is None
+
+
+def test_search_filters_triggers_and_pages():
+    with tempfile.TemporaryDirectory() as workdir:
+        url = f"sqlite:///{os.path.join(workdir, 'app.db')}"
+        engine = create_app_engine(url)
+        upgrade(engine, target=7)
+        with Session(engine) as session:
+            users = [User(email=f"search{i}@ssafy.com", password_hash="x") for i in range(2)]
+            session.add_all(users)
+            session.commit()
+            first, second = (user.id for user in users)
+            posts = [
+                ChroniclePost(user_id=first, title="장학금을 받았다", timestamp=datetime(2024, 3, 1)),
+                ChroniclePost(user_id=first, title="오늘의 소비", description="장학금으로 책 구매",
+                              timestamp=datetime(2024, 3, 2)),
+                ChroniclePost(user_id=second, type="quest", title="퀘스트 완료",
+                              user_content={"memo": "국가장학금 신청"}, timestamp=datetime(2024, 4, 1)),
+                ChroniclePost(user_id=second, title="SSAFY 적금 가입", timestamp=datetime(2024, 4, 2)),
+            ]
+            # 검색 인덱스 마이그레이션 전에 있던 포스트도 색인되어야 함
+            session.add_all(posts[:2])
+            session.commit()
+            upgrade(engine)
+            session.add_all(posts[2:])
+            session.commit()
+            ids = [post.id for post in posts]
+            posts[3].title = "SSAFY 예금 가입"  # 수정 트리거
+            session.add(posts[3])
+            session.commit()
+
+        async_engine = create_async_app_engine(url)
+
+        async def override_async_session():
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                yield session
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                async def search(**params):
+                    response = await client.get("/api/chronicle/search", params=params)
+                    assert response.status_code == 200, response.text
+                    return [post["id"] for post in response.json()], response.headers
+
+                # 제목 일치가 본문 일치보다 앞, 조사가 붙은 단어도 검색
+                found, _ = await search(q="장학금")
+                assert found[0] == ids[0] and set(found) == set(ids[:3])
+                assert (await search(q="금", sort="recent"))[0] == [ids[3], ids[2], ids[1], ids[0]]
+                assert (await search(q="ssa"))[0] == [ids[3]]
+                assert (await search(q="적금"))[0] == []
+                assert (await search(q="예금"))[0] == [ids[3]]
+
+                assert (await search(q="장학금", user_id=second))[0] == [ids[2]]
+                assert (await search(q="장학금", type="quest"))[0] == [ids[2]]
+                assert set((await search(q="장학금", start_date="2024-03-02", end_date="2024-04-01"))[0]) == set(ids[1:3])
+
+                for sort in ("relevance", "recent"):
+                    pages, cursor = [], None
+                    while True:
+                        found, headers = await search(q="장학금", sort=sort, limit=1, **({"cursor": cursor} if cursor else {}))
+                        pages += found
+                        if headers["X-Has-More"] == "false":
+                            break
+                        cursor = headers["X-Next-Cursor"]
+                    assert sorted(pages) == sorted(ids[:3]) and len(pages) == 3
+                assert pages == [ids[2], ids[1], ids[0]]
+
+                # 관련도순은 최근 일치 포스트 범위 안에서만 순위 (다음 페이지도 같은 범위)
+                original_window = settings.CHRONICLE_SEARCH_RANK_WINDOW
+                settings.CHRONICLE_SEARCH_RANK_WINDOW = 2
+                try:
+                    first_page, headers = await search(q="장학금", limit=1)
+                    second_page, _ = await search(q="장학금", limit=1, cursor=headers["X-Next-Cursor"])
+                    assert sorted(first_page + second_page) == sorted(ids[1:3])
+                finally:
+                    settings.CHRONICLE_SEARCH_RANK_WINDOW = original_window
+
+                response = await client.get("/api/chronicle/search", params={"q": "장학금", "cursor": "!!"})
+                assert response.status_code == 400
+
+                async with AsyncSession(async_engine) as session:  # 삭제 트리거
+                    await session.delete(await session.get(ChroniclePost, ids[0]))
+                    await session.commit()
+                assert set((await search(q="장학금"))[0]) == set(ids[1:3])
+            await async_engine.dispose()
+
+        app.dependency_overrides[get_async_session] = override_async_session
+        try:
+            asyncio.run(scenario())
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
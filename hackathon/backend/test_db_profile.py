@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 엔진 프로필 테스트
+SQLite WAL/PRAGMA 적용, 동시 쓰기, 쿼리 시간 집계, PostgreSQL 옵션, /health/db 인증 확인
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from sqlalchemy import text
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, create_async_app_engine, engine_options, get_async_session, query_timer
+from app.main import app
+from app.models.user import User
+from app.services.user_service import JWTService
+
+
+def test_sqlite_file_uses_wal_and_pool():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'profile.db')}")
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert engine.echo is False
+            assert engine.pool.size() == 10
+        finally:
+            engine.dispose()
+
+
+def test_concurrent_writers_do_not_lock():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'writers.db')}")
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE TABLE counter (id INTEGER PRIMARY KEY, value INTEGER)"))
+                conn.execute(text("INSERT INTO counter VALUES (1, 0)"))
+
+            errors = []
+
+            def writer():
+                try:
+                    for _ in range(25):
+                        with engine.begin() as conn:
+                            conn.execute(text("UPDATE counter SET value = value + 1 WHERE id = 1"))
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=writer) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert not errors
+            with engine.connect() as conn:
+                assert conn.execute(text("SELECT value FROM counter")).scalar() == 200
+            statements = [row["statement"] for row in query_timer.top(50)]
+            assert "UPDATE counter SET value = value + 1 WHERE id = 1" in statements
+        finally:
+            engine.dispose()
+
+
+def test_engine_options_by_dialect():
+    postgres = engine_options("postgresql+psycopg2://user:pw@localhost/hackathon")
+    assert postgres["pool_pre_ping"] is True and postgres["pool_size"] == 10
+    assert "connect_args" not in postgres
+
+    memory = engine_options("sqlite://")
+    assert "pool_size" not in memory and memory["echo"] is False
+
+
+def test_db_health_requires_login():
+    with tempfile.TemporaryDirectory() as workdir:
+        url = f"sqlite:///{os.path.join(workdir, 'app.db')}"
+        engine = create_app_engine(url)
+        upgrade(engine)
+        with Session(engine) as session:
+            user = User(email="health@ssafy.com", password_hash="x")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            token = JWTService.create_access_token(user)
+        engine.dispose()
+        async_engine = create_async_app_engine(url)
+
+        async def override_async_session():
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                yield session
+
+        async def scenario():
+            headers = {"Authorization": f"Bearer {token}"}
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                anonymous = [await client.get("/api/health/db"), await client.delete("/api/health/db/statements")]
+                assert [response.status_code for response in anonymous] == [403, 403]
+                assert query_timer.top(1)
+
+                # GET은 통계를 바꾸지 않고, 초기화는 DELETE로만
+                report = await client.get("/api/health/db", params={"reset": "true"}, headers=headers)
+                assert report.status_code == 200 and "statements" in report.json()
+                assert query_timer.top(1)
+                assert (await client.delete("/api/health/db/statements", headers=headers)).status_code == 200
+                assert query_timer.top(1) == []
+            await async_engine.dispose()
+
+        app.dependency_overrides[get_async_session] = override_async_session
+        try:
+            asyncio.run(scenario())
+        finally:
+            app.dependency_overrides.clear()
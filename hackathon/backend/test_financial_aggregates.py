@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+사용자별 금융 집계 테스트
+계좌/거래 추가·수정·삭제가 같은 트랜잭션에서 user_financial_summary에 반영되는지(롤백 포함),
+마이그레이션이 기존 계좌로 집계를 채우는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, create_async_app_engine
+from app.models.financial import BankAccount, Transaction, UserFinancialSummary
+from app.models.user import User
+from app.services.financial_aggregate_service import FinancialAggregateService
+
+
+def _account(user_id, number, account_type, balance):
+    return BankAccount(user_id=user_id, account_number=number, bank_name="신한은행", account_type=account_type,
+                       account_name=f"{account_type} 계좌", balance=balance, created_date=datetime(2024, 1, 1))
+
+
+def _transaction(account, day, amount=10_000):
+    return Transaction(account_id=account.id, transaction_type="입금", amount=amount,
+                       balance_after=account.balance + amount, description="용돈", category="기타",
+                       transaction_date=datetime(2024, 5, day))
+
+
+def _summary(session, user_id):
+    aggregate = FinancialAggregateService.get(session, user_id)
+    if aggregate is None:
+        return None
+    return (aggregate.total_balance, aggregate.total_assets, aggregate.total_liabilities, aggregate.net_worth,
+            aggregate.account_count, aggregate.account_type_balances, aggregate.last_transaction_date)
+
+
+def test_aggregate_follows_account_and_transaction_changes():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'app.db')}")
+        upgrade(engine)
+        with Session(engine) as session:
+            user = User(email="aggregate@ssafy.com", password_hash="x")
+            session.add(user)
+            session.commit()
+            assert _summary(session, user.id) is None
+
+            demand = _account(user.id, "110-1", "수시입출금", 100_000)
+            savings = _account(user.id, "110-2", "적금", 500_000)
+            loan = _account(user.id, "110-3", "대출", 200_000)
+            session.add_all([demand, savings, loan])
+            session.commit()
+            assert _summary(session, user.id) == (
+                100_000, 600_000, 200_000, 400_000, 3, {"수시입출금": 100_000, "적금": 500_000, "대출": 200_000}, None
+            )
+
+            session.add_all([_transaction(demand, 3), _transaction(savings, 7)])
+            demand.balance = 110_000
+            session.add(demand)
+            session.commit()
+            assert _summary(session, user.id)[:2] == (110_000, 610_000)
+            assert _summary(session, user.id)[-1] == datetime(2024, 5, 7)
+
+            # 커밋하지 않은 변경은 집계와 함께 롤백
+            demand.balance = 0
+            session.add(demand)
+            session.flush()
+            assert _summary(session, user.id)[0] == 0
+            session.rollback()
+            assert _summary(session, user.id)[0] == 110_000
+
+            latest = session.exec(select(Transaction).where(Transaction.account_id == savings.id)).one()
+            session.delete(latest)
+            session.delete(loan)
+            session.commit()
+            assert _summary(session, user.id) == (
+                110_000, 610_000, 0, 610_000, 2, {"수시입출금": 110_000, "적금": 500_000}, datetime(2024, 5, 3)
+            )
+        engine.dispose()
+
+
+def test_async_session_and_migration_backfill():
+    with tempfile.TemporaryDirectory() as workdir:
+        url = f"sqlite:///{os.path.join(workdir, 'app.db')}"
+        engine = create_app_engine(url)
+        upgrade(engine, target=8)
+        with engine.begin() as conn:
+            conn.execute(text(
+                'INSERT INTO "user" (id, email, password_hash, is_active, is_verified, created_at, updated_at) '
+                "VALUES (1, 'old@ssafy.com', 'x', 1, 0, '2024-01-01', '2024-01-01')"
+            ))
+            conn.execute(text(
+                "INSERT INTO bankaccount (user_id, account_number, bank_name, account_type, account_name, balance, "
+                "currency, is_active, created_date, created_at, updated_at) VALUES "
+                "(1, '1', '신한은행', '수시입출금', 'a', 30000, 'KRW', 1, '2024-01-01', '2024-01-01', '2024-01-01'), "
+                "(1, '2', '신한은행', '예금', 'b', 70000, 'KRW', 1, '2024-01-01', '2024-01-01', '2024-01-01')"
+            ))
+            conn.execute(text(
+                "INSERT INTO \"transaction\" (account_id, transaction_type, amount, balance_after, description, category, "
+                "transaction_date, created_at) VALUES (1, '입금', 30000, 30000, '', '수입', '2024-02-03 10:00:00', "
+                "'2024-02-03')"
+            ))
+        upgrade(engine)
+        with Session(engine) as session:
+            migrated = _summary(session, 1)
+            assert migrated[:5] == (30_000, 100_000, 0, 100_000, 2)
+            # 마이그레이션의 고정 SQL과 서비스의 계산 결과가 같음
+            FinancialAggregateService.refresh(session.connection(), [1])
+            assert _summary(session, 1) == migrated
+            assert migrated[5:] == ({"수시입출금": 30_000, "예금": 70_000}, datetime(2024, 2, 3, 10, 0))
+
+        async def scenario():
+            async_engine = create_async_app_engine(url)
+            try:
+                async with AsyncSession(async_engine, expire_on_commit=False) as db:
+                    db.add(_account(1, "3", "대출", 40_000))
+                    await db.commit()
+                    row = (await db.exec(select(UserFinancialSummary).where(UserFinancialSummary.user_id == 1))).one()
+                    assert (row.total_liabilities, row.net_worth, row.account_count) == (40_000, 60_000, 3)
+            finally:
+                await async_engine.dispose()
+
+        asyncio.run(scenario())
+        engine.dispose()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+홈 대시보드 테스트
+요청 단위 조회 계획(SSAFYFetchPlan)의 메모이제이션/shield/취소, 섹션 시간 예산과 partial_sections,
+시뮬레이터 기준 대시보드 섹션이 실제 SSAFY 응답으로 채워지는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlmodel import Session
+
+from app.api import home_dashboard
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine
+from app.services.ssafy_api_service import close_async_transport
+from app.services.ssafy_fetch_plan import SSAFYFetchPlan
+from app.services.ssafy_resilience import reset_circuit_breakers
+from ssafy_simulator import SSAFYSimulator, start_simulator
+
+
+class FakeService:
+    """호출 수를 세는 조회 서비스"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def get_accounts(self, user_key, page=1):
+        self.calls.append(("get_accounts", user_key, page))
+        await asyncio.sleep(self.delay)
+        return {"user_key": user_key, "page": page}
+
+    async def get_broken(self):
+        raise RuntimeError("upstream down")
+
+    async def create_account(self):
+        raise AssertionError("변경 API는 노출되지 않아야 함")
+
+
+def test_fetch_plan_memoizes_by_arguments():
+    async def scenario():
+        service = FakeService(delay=0.01)
+        plan = SSAFYFetchPlan(service)
+        first, second, other = await asyncio.gather(
+            plan.get_accounts("u1"), plan.get_accounts("u1"), plan.get_accounts("u1", page=2)
+        )
+        assert first == second == {"user_key": "u1", "page": 1}
+        assert other["page"] == 2
+        assert await plan.get_accounts("u1") == first
+        assert plan.fetch_count == 2
+        assert service.calls == [("get_accounts", "u1", 1), ("get_accounts", "u1", 2)]
+        try:
+            plan.create_account
+            assert False, "get_* 외 메서드는 AttributeError"
+        except AttributeError:
+            pass
+        plan.close()
+
+    asyncio.run(scenario())
+
+
+def test_fetch_plan_shield_and_close():
+    async def scenario():
+        service = FakeService(delay=0.05)
+        plan = SSAFYFetchPlan(service)
+
+        # 한 섹션이 시간 초과로 취소되어도 같은 조회를 기다리는 다른 섹션은 결과를 받음
+        try:
+            await asyncio.wait_for(plan.get_accounts("u1"), 0.001)
+            assert False, "시간 초과해야 함"
+        except asyncio.TimeoutError:
+            pass
+        assert await plan.get_accounts("u1") == {"user_key": "u1", "page": 1}
+        assert len(service.calls) == 1
+
+        # 실패한 조회는 기다리지 않아도 close()에서 경고 없이 정리, 진행 중인 조회는 취소
+        broken = plan.get_broken()
+        pending = plan.get_accounts("u2")
+        await asyncio.sleep(0)
+        plan.close()
+        await asyncio.sleep(0)
+        tasks = plan._tasks
+        assert tasks[("get_accounts", ("u2",), ())].cancelled()
+        assert isinstance(tasks[("get_broken", (), ())].exception(), RuntimeError)
+        for waiter in (broken, pending):
+            waiter.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_run_section_budget_fallback():
+    async def slow():
+        await asyncio.sleep(1)
+        return ["late"]
+
+    async def scenario():
+        budgets = dict(home_dashboard.SECTION_TIME_BUDGETS)
+        home_dashboard.SECTION_TIME_BUDGETS["recent_transactions"] = 0.01
+        try:
+            assert await home_dashboard._run_section("recent_transactions", slow()) == ([], False)
+            assert await home_dashboard._run_section("account_summary", home_dashboard._completed({"ok": 1})) == ({"ok": 1}, True)
+        finally:
+            home_dashboard.SECTION_TIME_BUDGETS.update(budgets)
+
+    asyncio.run(scenario())
+
+
+def _seed(simulator):
+    user_key = simulator.create_user("dashboard@ssafy.com")["userKey"]
+    header = {"userKey": user_key}
+    main = simulator.open_demand_account(user_key, 1_000_000)
+    simulator._post(main, "2", "출금", 4_500, "스타벅스 결제")
+    simulator._post(main, "1", "입금", 300_000, "용돈")
+    sub = simulator.open_demand_account(user_key, 50_000)
+    deposit_product = next(p for p in simulator.products.values() if p["accountTypeCode"] == "2")
+    simulator._create_product_account(header, {
+        "accountTypeUniqueNo": deposit_product["accountTypeUniqueNo"],
+        "withdrawalAccountNo": main["accountNo"], "depositBalance": 200_000,
+    }, "2", "deposit")
+    return user_key, main, sub
+
+
+def _run_dashboard(simulator, scenario):
+    async def wrapper():
+        runner, base_url = await start_simulator(simulator)
+        original_url = home_dashboard.ssafy_service.base_url
+        home_dashboard.ssafy_service.base_url = base_url
+        try:
+            with tempfile.TemporaryDirectory() as workdir:
+                engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'app.db')}")
+                upgrade(engine)
+                try:
+                    with Session(engine) as session:
+                        await scenario(session)
+                finally:
+                    engine.dispose()
+        finally:
+            home_dashboard.ssafy_service.base_url = original_url
+            await close_async_transport()
+            await runner.cleanup()
+
+    reset_circuit_breakers()
+    try:
+        asyncio.run(wrapper())
+    finally:
+        reset_circuit_breakers()
+
+
+def test_dashboard_sections_use_ssafy_responses():
+    simulator = SSAFYSimulator(seed=3)
+    user_key, main, sub = _seed(simulator)
+
+    async def scenario(session):
+        simulator.stats.clear()
+        dashboard = await home_dashboard.get_home_dashboard(user_key, db=session)
+        assert dashboard["partial_sections"] == []
+
+        summary = dashboard["account_summary"]
+        assert summary["account_counts"] == {"demand_deposit": 2, "deposit": 1, "savings": 0, "loan": 0}
+        assert summary["total_balance"] == 1_000_000 - 4_500 + 300_000 - 200_000 + 50_000 + 200_000
+        assert {d["account_no"]: d["balance"] for d in summary["account_details"]}[sub["accountNo"]] == 50_000
+
+        recent = dashboard["recent_transactions"]
+        assert recent[0]["memo"] in ("용돈", "초기 입금", "신한 청년 정기예금 가입")
+        assert {t["category"] for t in recent} == {"수입", "기타"}
+        assert sorted(t["amount"] for t in recent)[0] == -200_000
+
+        status = dashboard["financial_status"]
+        assert status["credit_grade"] == "D"  # 총자산 100만원 이상 200만원 미만
+        this_month = list(status["monthly_analysis"].values())[0]
+        assert this_month == {"income": 1_350_000, "expense": 204_500, "net": 1_145_500}
+        assert len(status["monthly_analysis"]) == home_dashboard.ANALYSIS_MONTHS
+
+        # 잔액 200만원 미만 → 예금 추천, D등급이므로 대출 추천 없음
+        assert [p["type"] for p in dashboard["recommended_products"]] == ["예금"]
+        assert dashboard["recommended_products"][0]["product"]["interestRate"] == "3.5"
+
+        # 거래 내역은 계좌별 한 번, 계좌 목록/신용등급도 섹션 간 공유
+        assert simulator.stats["inquireTransactionHistoryList"] == 2
+        assert simulator.stats["inquireDemandDepositAccountList"] == 1
+        assert simulator.stats["inquireMyCreditRating"] == 1
+
+        details = await home_dashboard.get_account_details(main["accountNo"], user_key)
+        assert details["account_type"] == "demand_deposit"
+        assert details["balance_info"] == {"balance": 1_095_500}
+        assert len(details["transactions"]) == 4
+
+    _run_dashboard(simulator, scenario)
+
+
+def test_dashboard_reports_partial_sections():
+    simulator = SSAFYSimulator(seed=4)
+    user_key, _, _ = _seed(simulator)
+
+    async def scenario(session):
+        budgets = dict(home_dashboard.SECTION_TIME_BUDGETS)
+        simulator.faults.update({"latency_ms": 200})
+        home_dashboard.SECTION_TIME_BUDGETS.update({"recent_transactions": 0.05, "financial_status": 0.05})
+        try:
+            dashboard = await home_dashboard.get_home_dashboard(user_key, db=session)
+        finally:
+            home_dashboard.SECTION_TIME_BUDGETS.update(budgets)
+        assert dashboard["partial"] is True
+        assert dashboard["partial_sections"] == ["recent_transactions", "financial_status"]
+        assert dashboard["recent_transactions"] == []
+        assert dashboard["financial_status"]["credit_grade"] == "N/A"
+        assert dashboard["account_summary"]["total_accounts"] == 3
+
+    _run_dashboard(simulator, scenario)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+리더보드 테스트
+점수 변경을 반복해도 순위/상위 N/주변 조회가 전체 정렬 결과와 같은지, DB에서 다시 만들 수 있는지,
+커밋 순서와 반영 순서가 뒤바뀐 오래된 점수(레벨 곡선 조정 전 값 포함)를 무시하는지 확인
+"""
+
+import sys
+import os
+import random
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.core import xp_rules
+from app.core.xp_rules import total_credo
+from app.db.session import create_app_engine
+from app.db.migrations import upgrade
+from app.models.xp import UserXP, XPActivityType
+from app.services.leaderboard_service import Leaderboard, leaderboards, publish_credo, rebuild_credo_leaderboard
+from app.services.xp_service import XPService
+
+
+def test_matches_full_sort_after_random_updates():
+    rng = random.Random(11)
+    board, scores = Leaderboard("test"), {}
+    for _ in range(5000):
+        member = rng.randrange(300)
+        if rng.random() < 0.05:
+            board.remove(member)
+            scores.pop(member, None)
+            continue
+        scores[member] = (rng.randrange(20), rng.randrange(50))
+        board.update(member, scores[member], tag=member)
+
+    expected = sorted(scores, key=lambda m: (-scores[m][0], -scores[m][1], m))
+    assert len(board) == len(expected)
+    assert [row["user_id"] for row in board.top(len(expected))] == expected
+    assert [row["user_id"] for row in board.top(10, offset=20)] == expected[20:30]
+    for position, member in enumerate(expected, start=1):
+        assert board.rank(member) == position
+
+    first, last = expected[0], expected[-1]
+    assert [row["rank"] for row in board.around(first, 3, 2)["entries"]] == [1, 2, 3]
+    assert [row["user_id"] for row in board.around(last, 2, 2)["entries"]] == expected[-3:]
+    middle = board.around(expected[50], 2, 2)
+    assert middle["rank"] == 51 and [row["rank"] for row in middle["entries"]] == [49, 50, 51, 52, 53]
+    assert board.around("missing") is None
+
+
+def test_stale_versions_are_ignored():
+    board = Leaderboard("test")
+    assert board.update(1, 300, version=3, level=3)
+    assert not board.update(1, 200, version=2, level=2)  # 늦게 도착한 이전 커밋
+    assert board.top(1)[0]["score"] == 300
+    assert board.update(1, 250, version=4, level=2)  # 차감도 새 버전이면 반영
+    assert board.update(2, 100)  # 버전 없는 갱신은 항상 반영
+
+    # DB를 읽는 동안 더 새 버전이 반영된 사용자는 재구성 후에도 그 값을 유지
+    assert board.update(2, 400, version=9)
+    board.load([(1, 250, {}), (2, 150, {})], versions={1: 4, 2: 8})
+    assert [(row["user_id"], row["score"]) for row in board.top(2)] == [(2, 400), (1, 250)]
+    assert not board.update(2, 150, version=8)
+
+    # DB를 읽은 뒤 처음 생긴 사용자(스냅샷에 없음)도 재구성 후 유지
+    assert board.update(3, 50, version=1)
+    board.load([(1, 250, {}), (2, 400, {})], versions={1: 4, 2: 9})
+    assert [row["user_id"] for row in board.top(3)] == [2, 1, 3]
+    assert not board.update(3, 10, version=0)
+
+
+def test_unknown_category_is_rejected():
+    with pytest.raises(ValueError):
+        leaderboards["unknown"]
+
+
+def test_credo_board_follows_xp_writes_and_rebuilds():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'rank.db')}")
+        upgrade(engine)
+        with engine.begin() as conn:
+            for i in range(4):
+                conn.execute(text(
+                    'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                    "VALUES (:email, 'x', 1, 0, '2024-01-01', '2024-01-01')"
+                ), {"email": f"rank{i}@ssafy.com"})
+        try:
+            assert rebuild_credo_leaderboard(engine) == 0
+
+            with Session(engine) as session:
+                for user_id, activity, times in [(2, XPActivityType.ACHIEVEMENT, 3), (3, XPActivityType.SAVING, 4),
+                                                 (4, XPActivityType.LIKE, 1)]:
+                    for _ in range(times):
+                        XPService.add_credo_for_activity(user_id, activity, session=session)
+                XPService.deduct_credo_for_post_deletion(4, "post", session=session)
+
+            live = XPService.get_leaderboard(10)
+            assert [row["user_id"] for row in live] == [2, 3, 4]
+            assert live[0]["total_credo"] == total_credo(live[0]["level"], live[0]["credo_score"]) == 150
+            me = XPService.get_my_rank(3, above=1, below=1)
+            assert me["rank"] == 2 and [row["user_id"] for row in me["entries"]] == [2, 3, 4]
+            assert XPService.get_my_rank(1) is None  # 활동 기록 없음
+
+            rebuild_credo_leaderboard(engine)
+            assert XPService.get_leaderboard(10) == live
+
+            # 먼저 커밋된 적립의 반영이 늦게 도착해도 마지막 값이 남음
+            with Session(engine) as session:
+                version = session.exec(select(UserXP.version).where(UserXP.user_id == 2)).one()
+            assert version == 3
+            assert not publish_credo(2, 1, 0, 0, version - 1)
+            assert XPService.get_leaderboard(1)[0]["total_credo"] == 150
+
+            # 곡선 조정은 바뀐 행의 version을 올리므로 이전 곡선으로 계산해 늦게 도착한 반영은 무시
+            try:
+                with Session(engine) as session:
+                    assert XPService.retune_level_curve(50, 1.1, session=session) > 0
+                    retuned = session.exec(select(UserXP).where(UserXP.user_id == 2)).one()
+                assert retuned.version == version + 1
+                assert not publish_credo(2, 2, 50, 0, version)
+                assert XPService.get_leaderboard(1)[0]["level"] == retuned.current_level
+            finally:
+                xp_rules.configure(100, 1.2)
+        finally:
+            leaderboards["credo"].load([])
+            engine.dispose()
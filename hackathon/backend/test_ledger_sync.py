@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+원장 동기화 테스트
+시뮬레이터 거래내역으로 최초 동기화(계좌 생성), 워터마크 이동과 같은 날짜 거래 중복 제외,
+max_age 이내 재동기화 생략, 동시 동기화의 중복 방지, 다른 사용자 계좌번호 거부와 POST /financial/sync 확인
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from sqlalchemy import text
+from sqlmodel import Session, select, func
+
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, get_session
+from app.main import app
+from app.models.financial import BankAccount, LedgerSyncState, Transaction
+from app.models.user import User
+from app.services.financial_aggregate_service import FinancialAggregateService
+from app.services.ledger_sync_service import LedgerSyncService
+from app.services.spending_rollup_service import SpendingRollupService
+from app.services.ssafy_api_service import close_async_transport
+from app.services.ssafy_resilience import reset_circuit_breakers
+from app.services.user_service import JWTService
+from ssafy_simulator import SSAFYSimulator, start_simulator
+
+
+def _user(engine, user_key, email="ledger@ssafy.com"):
+    with Session(engine, expire_on_commit=False) as session:
+        user = User(email=email, password_hash="x", ssafy_user_key=user_key)
+        session.add(user)
+        session.commit()
+        return user
+
+
+def _transactions(engine, account_no):
+    with Session(engine) as session:
+        return session.exec(
+            select(Transaction.external_id)
+            .join(BankAccount, BankAccount.id == Transaction.account_id)
+            .where(BankAccount.account_number == account_no)
+            .order_by(Transaction.id)
+        ).all()
+
+
+def _rollups(engine):
+    with engine.connect() as conn:
+        return sorted(tuple(row) for row in conn.execute(text(
+            "SELECT user_id, year_month, account_id, category, direction, amount, transaction_count "
+            "FROM monthly_category_rollup"
+        )))
+
+
+def _rebuilt_rollups(engine):
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        SpendingRollupService.rebuild(conn)
+        rows = sorted(tuple(row) for row in conn.execute(text(
+            "SELECT user_id, year_month, account_id, category, direction, amount, transaction_count "
+            "FROM monthly_category_rollup"
+        )))
+        transaction.rollback()
+    return rows
+
+
+def _run(simulator, scenario):
+    async def wrapper():
+        runner, base_url = await start_simulator(simulator)
+        original_url = LedgerSyncService.service.base_url
+        LedgerSyncService.service.base_url = base_url
+        try:
+            with tempfile.TemporaryDirectory() as workdir:
+                engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'app.db')}")
+                upgrade(engine)
+                try:
+                    await scenario(engine)
+                finally:
+                    engine.dispose()
+        finally:
+            LedgerSyncService.service.base_url = original_url
+            await close_async_transport()
+            await runner.cleanup()
+
+    reset_circuit_breakers()
+    try:
+        asyncio.run(wrapper())
+    finally:
+        reset_circuit_breakers()
+
+
+def test_first_sync_then_watermark():
+    simulator = SSAFYSimulator(seed=11)
+    user_key = simulator.create_user("ledger@ssafy.com")["userKey"]
+    account = simulator.open_demand_account(user_key, 500_000)
+    simulator._post(account, "2", "출금", 4_500, "카페 결제")
+
+    async def scenario(engine):
+        user = _user(engine, user_key)
+        with Session(engine) as session:
+            first = await LedgerSyncService.sync_user(session, user)
+        assert first == {"synced_accounts": 1, "new_transactions": 2, "failed_accounts": []}
+
+        with Session(engine) as session:
+            local = session.exec(select(BankAccount).where(BankAccount.account_number == account["accountNo"])).one()
+            assert (local.user_id, local.balance) == (user.id, 495_500)
+            state = session.exec(select(LedgerSyncState).where(LedgerSyncState.account_id == local.id)).one()
+            assert state.last_transaction_unique_no == account["ledger"][-1]["transactionUniqueNo"]
+            assert FinancialAggregateService.get(session, user.id).total_balance == 495_500
+
+        # 같은 날짜의 거래는 다시 조회되지만 워터마크 이후 거래만 반영
+        simulator._post(account, "1", "입금", 100_000, "용돈")
+        with Session(engine) as session:
+            second = await LedgerSyncService.sync_user(session, user)
+        assert second["new_transactions"] == 1
+        assert _transactions(engine, account["accountNo"]) == [tx["transactionUniqueNo"] for tx in account["ledger"]]
+        with Session(engine) as session:
+            assert FinancialAggregateService.get(session, user.id).total_balance == 595_500
+            state = session.exec(select(LedgerSyncState)).one()
+            assert (state.last_transaction_unique_no, state.synced_count) == (account["ledger"][-1]["transactionUniqueNo"], 3)
+        assert _rollups(engine) == _rebuilt_rollups(engine)
+
+    _run(simulator, scenario)
+
+
+def test_recent_sync_skips_upstream():
+    simulator = SSAFYSimulator(seed=12)
+    user_key = simulator.create_user("fresh@ssafy.com")["userKey"]
+    account = simulator.open_demand_account(user_key, 10_000)
+
+    async def scenario(engine):
+        user = _user(engine, user_key)
+        with Session(engine) as session:
+            await LedgerSyncService.sync_user(session, user, max_age=60)
+            simulator.stats.clear()
+            simulator._post(account, "1", "입금", 5_000, "용돈")
+            assert await LedgerSyncService.sync_user(session, user, max_age=60) == {
+                "synced_accounts": 0, "new_transactions": 0, "failed_accounts": []
+            }
+            assert await LedgerSyncService.sync_account(session, user, simulator._demand_view(account), max_age=60) == 0
+        assert simulator.stats["inquireTransactionHistoryList"] == 0
+        assert simulator.stats["inquireDemandDepositAccountList"] == 0
+        assert len(_transactions(engine, account["accountNo"])) == 1
+
+    _run(simulator, scenario)
+
+
+def test_concurrent_syncs_do_not_duplicate():
+    simulator = SSAFYSimulator(seed=13)
+    user_key = simulator.create_user("race@ssafy.com")["userKey"]
+    accounts = [simulator.open_demand_account(user_key, 100_000) for _ in range(2)]
+    for index in range(30):
+        simulator._post(accounts[index % 2], "2", "출금", 1_000, "편의점 결제")
+
+    async def scenario(engine):
+        user = _user(engine, user_key)
+        simulator.faults.update({"latency_ms": 20})
+
+        async def sync():
+            with Session(engine) as session:
+                return await LedgerSyncService.sync_user(session, user)
+
+        results = await asyncio.gather(*[sync() for _ in range(6)])
+        assert all(result["failed_accounts"] == [] for result in results)
+        assert sum(result["new_transactions"] for result in results) == 32
+        for account in accounts:
+            assert _transactions(engine, account["accountNo"]) == [tx["transactionUniqueNo"] for tx in account["ledger"]]
+        with Session(engine) as session:
+            assert session.exec(select(func.count()).select_from(BankAccount)).one() == 2
+            summary = FinancialAggregateService.get(session, user.id)
+            assert (summary.account_count, summary.total_balance) == (2, 200_000 - 30_000)
+        assert _rollups(engine) == _rebuilt_rollups(engine)
+
+    _run(simulator, scenario)
+
+
+def test_account_of_other_user_is_rejected():
+    simulator = SSAFYSimulator(seed=14)
+    user_key = simulator.create_user("owner@ssafy.com")["userKey"]
+    account = simulator.open_demand_account(user_key, 10_000)
+
+    async def scenario(engine):
+        other = _user(engine, "other-key", "other@ssafy.com")
+        with Session(engine) as session:
+            session.add(BankAccount(user_id=other.id, account_number=account["accountNo"], bank_name="신한은행",
+                                    account_type="수시입출금", account_name="기존 계좌", balance=0,
+                                    created_date=datetime(2024, 1, 1)))
+            session.commit()
+        user = _user(engine, user_key)
+        with Session(engine) as session:
+            result = await LedgerSyncService.sync_user(session, user)
+        assert result == {"synced_accounts": 0, "new_transactions": 0, "failed_accounts": [account["accountNo"]]}
+        assert _transactions(engine, account["accountNo"]) == []
+
+    _run(simulator, scenario)
+
+
+def test_sync_endpoint():
+    simulator = SSAFYSimulator(seed=15)
+    user_key = simulator.create_user("api@ssafy.com")["userKey"]
+    simulator.open_demand_account(user_key, 70_000)
+
+    async def scenario(engine):
+        user = _user(engine, user_key)
+        token = JWTService.create_access_token(user)
+
+        def override_session():
+            with Session(engine) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = override_session
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                headers = {"Authorization": f"Bearer {token}"}
+                first = await client.post("/api/financial/sync", headers=headers)
+                second = await client.post("/api/financial/sync", headers=headers)
+                anonymous = await client.post("/api/financial/sync")
+        finally:
+            app.dependency_overrides.clear()
+        assert first.status_code == 200, first.text
+        assert first.json() == {"synced_accounts": 1, "new_transactions": 1, "failed_accounts": []}
+        assert second.json()["new_transactions"] == 0
+        assert anonymous.status_code == 403
+
+    _run(simulator, scenario)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+부하 테스트 집계/비교 테스트
+경로별 분위수 계산과 기준값 대비 회귀 판정 확인
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from load_test import Sample, percentile, summarize, compare
+
+
+def test_percentile_nearest_rank():
+    values = [i / 1000 for i in range(1, 101)]
+    assert percentile(values, 50) == 0.05
+    assert percentile(values, 95) == 0.095
+    assert percentile(values, 99) == 0.099
+    assert percentile([], 99) == 0.0
+
+
+def test_summarize_and_compare():
+    samples = [Sample("chronicle_list", 0.010, 200) for _ in range(90)]
+    samples += [Sample("chronicle_list", 0.100, 200) for _ in range(10)]
+    samples += [Sample("xp_add", 0.020, 500), Sample("xp_add", 0.020, 0), Sample("xp_add", 0.020, 401)]
+    result = summarize(samples, elapsed=2.0)
+
+    route = result["routes"]["chronicle_list"]
+    assert route["count"] == 100 and route["rps"] == 50.0
+    assert route["p50_ms"] == 10.0 and route["p95_ms"] == 100.0
+    # 5xx와 연결 실패만 오류, 4xx는 상태 코드별로만 집계
+    assert result["routes"]["xp_add"]["errors"] == 2
+    assert result["routes"]["xp_add"]["statuses"] == {"500": 1, "0": 1, "401": 1}
+    assert result["total"]["count"] == 103
+
+    slower = summarize([Sample("chronicle_list", 0.2, 200) for _ in range(100)], elapsed=2.0)
+    rows = compare(slower, result, max_regression=20)
+    regressed = {(row["route"], row["metric"]) for row in rows if row["regression"]}
+    assert ("chronicle_list", "p95_ms") in regressed
+    assert ("chronicle_list", "rps") not in regressed
+    assert not compare(result, result, max_regression=20)[0]["regression"]
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+스키마 마이그레이션 테스트
+새 DB/기존 create_all DB 업그레이드, 크로니클 JSON 문자열 정리, 검색 인덱스 배치 색인, 중복 데이터로 유니크 인덱스를 만들 수 없을 때 실패, 중복 거래 정리 후 유니크 인덱스 생성, 시작 시 버전 확인 비용, 동시 실행 시 한 번만 적용되는지 확인
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import event, inspect, text
+from sqlmodel import Session, SQLModel, select
+
+from app.core.config import settings
+from app.db.fts import match_expression
+from app.db.session import create_app_engine
+from app.db.migrations import current_version, ensure_schema, history, latest_version, upgrade
+from app.db.migrations.ops import create_index, table_index
+from app.db.migrations.versions import m0008_chronicle_search
+from app.models.chronicle import ChroniclePost
+
+
+def _engine(workdir, name="app.db"):
+    return create_app_engine(f"sqlite:///{os.path.join(workdir, name)}")
+
+
+def test_fresh_database_upgrades_to_latest():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine(workdir)
+        try:
+            assert current_version(engine) == 0
+            assert upgrade(engine) == list(range(1, latest_version() + 1))
+            assert current_version(engine) == latest_version()
+            assert upgrade(engine) == []
+            assert [row["version"] for row in history(engine)] == list(range(1, latest_version() + 1))
+            assert "chronicle_posts" in inspect(engine).get_table_names()
+        finally:
+            engine.dispose()
+
+
+def test_migrated_schema_matches_models():
+    # 마이그레이션은 모델을 읽지 않으므로 모델에 추가한 테이블/컬럼/인덱스는 새 마이그레이션이 있어야 함
+    import app.models.user, app.models.university, app.models.academic  # noqa: F401
+    import app.models.financial, app.models.xp  # noqa: F401
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine(workdir)
+        try:
+            upgrade(engine)
+            inspector = inspect(engine)
+            for table in SQLModel.metadata.sorted_tables:
+                assert inspector.has_table(table.name), table.name
+                columns = {column["name"] for column in inspector.get_columns(table.name)}
+                assert {column.name for column in table.columns} <= columns, table.name
+                indexes = {index["name"]: index for index in inspector.get_indexes(table.name)}
+                for index in table.indexes:
+                    assert index.name in indexes, index.name
+                    assert bool(indexes[index.name]["unique"]) == bool(index.unique), index.name
+        finally:
+            engine.dispose()
+
+
+def test_legacy_create_all_database_is_adopted():
+    original_batch = settings.MIGRATION_BATCH_SIZE
+    settings.MIGRATION_BATCH_SIZE = 2
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine(workdir)
+        try:
+            # 마이그레이션 도입 전 방식으로 만든 DB: 컬럼/인덱스 없음, UserXP 없는 사용자
+            upgrade(engine, target=1)
+            with engine.begin() as conn:
+                conn.execute(text("DROP TABLE schema_version"))
+                conn.execute(text('DROP INDEX "ix_transaction_account_date"'))
+                conn.execute(text('ALTER TABLE "transaction" DROP COLUMN external_id'))
+                for i in range(5):
+                    conn.execute(text(
+                        'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                        "VALUES (:email, 'x', 1, 0, '2024-01-01', '2024-01-01')"
+                    ), {"email": f"legacy{i}@ssafy.com"})
+                conn.execute(text("INSERT INTO user_xp (user_id, current_level, credo_score, current_xp, total_xp, "
+                                  "created_at, updated_at) VALUES (1, 3, 250, 0, 0, '2024-01-01', '2024-01-01')"))
+
+            upgrade(engine)
+
+            inspector = inspect(engine)
+            assert "external_id" in {c["name"] for c in inspector.get_columns("transaction")}
+            assert "ix_transaction_account_date" in {i["name"] for i in inspector.get_indexes("transaction")}
+            with engine.connect() as conn:
+                rows = conn.execute(text("SELECT user_id, credo_score FROM user_xp ORDER BY user_id")).all()
+            assert [row[0] for row in rows] == [1, 2, 3, 4, 5]
+            assert rows[0][1] == 250  # 기존 데이터 유지
+        finally:
+            settings.MIGRATION_BATCH_SIZE = original_batch
+            engine.dispose()
+
+
+def test_chronicle_json_strings_are_normalized():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine(workdir)
+        try:
+            upgrade(engine, target=5)
+            legacy_values = ['{"credo": 5}', "", "not json", "null", json.dumps(json.dumps({"credo": 7})), None]
+            with engine.begin() as conn:
+                conn.execute(text(
+                    'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                    "VALUES ('chronicle@ssafy.com', 'x', 1, 0, '2024-01-01', '2024-01-01')"
+                ))
+                for value in legacy_values:
+                    conn.execute(text(
+                        "INSERT INTO chronicle_posts (user_id, type, title, timestamp, rewards, user_content) "
+                        "VALUES (1, 'user_post', '기존 포스트', '2024-01-01 00:00:00.000000', :value, '{}')"
+                    ), {"value": value})
+
+            upgrade(engine)
+
+            with Session(engine) as session:
+                posts = session.exec(select(ChroniclePost).order_by(ChroniclePost.id)).all()
+            # 깨진 값은 NULL, 두 번 인코딩된 문자열은 객체로
+            assert [post.rewards for post in posts] == [{"credo": 5}, None, None, None, {"credo": 7}, None]
+            assert all(post.user_content == {} for post in posts)
+        finally:
+            engine.dispose()
+
+
+def test_chronicle_search_index_backfills_in_batches():
+    original_batch = settings.MIGRATION_BATCH_SIZE
+    settings.MIGRATION_BATCH_SIZE = 2
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine(workdir)
+        try:
+            upgrade(engine, target=7)
+            with engine.begin() as conn:
+                conn.execute(text(
+                    'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                    "VALUES ('search@ssafy.com', 'x', 1, 0, '2024-01-01', '2024-01-01')"
+                ))
+                for i in range(7):
+                    conn.execute(text(
+                        "INSERT INTO chronicle_posts (user_id, type, title, timestamp, user_content) "
+                        "VALUES (1, 'user_post', :title, '2024-01-01 00:00:00.000000', '{}')"
+                    ), {"title": f"장학금 기록 {i}"})
+
+            statements = []
+            event.listen(engine, "before_cursor_execute",
+                         lambda conn, cursor, statement, *args: statements.append(statement))
+            upgrade(engine)
+            assert sum(statement.lstrip().startswith("INSERT INTO chronicle_search (rowid") for statement in statements) == 4
+            # 재실행(중단 후/동시 실행)해도 이미 색인된 포스트는 다시 넣지 않음
+            m0008_chronicle_search.upgrade(engine)
+
+            with engine.connect() as conn:
+                matched = conn.execute(text("SELECT rowid FROM chronicle_search WHERE chronicle_search MATCH :query"),
+                                       {"query": match_expression("장학금")}).scalars().all()
+            assert sorted(matched) == list(range(1, 8))
+        finally:
+            settings.MIGRATION_BATCH_SIZE = original_batch
+            engine.dispose()
+
+
+def test_unique_index_on_duplicates_fails():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine(workdir)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE TABLE dup (id INTEGER PRIMARY KEY, key INTEGER)"))
+                conn.execute(text("INSERT INTO dup (key) VALUES (1), (1), (2)"))
+            # 일반 인덱스로 대체하지 않고 실패 (ON CONFLICT 대상이 사라지지 않도록)
+            with pytest.raises(RuntimeError, match="ux_dup_key"):
+                create_index(engine, table_index("dup", "ux_dup_key", ("key",), unique=True))
+            with engine.connect() as conn:
+                assert inspect(conn).get_indexes("dup") == []
+        finally:
+            engine.dispose()
+
+
+def test_duplicate_transactions_removed_before_unique_index():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine(workdir)
+        try:
+            upgrade(engine, target=10)
+            with engine.begin() as conn:
+                conn.execute(text(
+                    'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                    "VALUES ('ledger@ssafy.com', 'x', 1, 0, '2024-01-01', '2024-01-01')"
+                ))
+                conn.execute(text(
+                    "INSERT INTO bankaccount (user_id, account_number, bank_name, account_type, account_name, balance, "
+                    "currency, is_active, created_date, created_at, updated_at) VALUES "
+                    "(1, '0880001', '신한은행', '수시입출금', '입출금', 0, 'KRW', 1, '2024-01-01', '2024-01-01', '2024-01-01')"
+                ))
+                # 동시 동기화로 같은 거래고유번호가 두 번 저장된 거래
+                for external_id in ("1", "2", "2", "3", "3", "3"):
+                    conn.execute(text(
+                        'INSERT INTO "transaction" (account_id, transaction_type, amount, balance_after, description, '
+                        "category, transaction_date, created_at, external_id) VALUES "
+                        "(1, '출금', -1000, 0, '편의점 결제', '편의점', '2024-03-01', '2024-03-01', :external_id)"
+                    ), {"external_id": external_id})
+
+            upgrade(engine)
+
+            with engine.connect() as conn:
+                remaining = conn.execute(text('SELECT id, external_id FROM "transaction" ORDER BY id')).all()
+                rollup_count = conn.execute(text("SELECT SUM(transaction_count) FROM monthly_category_rollup")).scalar()
+                indexes = {index["name"]: index for index in inspect(conn).get_indexes("transaction")}
+            assert [tuple(row) for row in remaining] == [(1, "1"), (2, "2"), (4, "3")]
+            assert rollup_count == 3
+            assert indexes["ux_transaction_account_external"]["unique"] in (1, True)
+        finally:
+            engine.dispose()
+
+
+def test_startup_check_is_a_single_query_when_current():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine(workdir)
+        try:
+            upgrade(engine)
+            statements = []
+            event.listen(engine, "before_cursor_execute",
+                         lambda conn, cursor, statement, *args: statements.append(statement))
+            ensure_schema(engine)
+            assert statements == ["SELECT MAX(version) FROM schema_version"]
+        finally:
+            engine.dispose()
+
+
+def test_concurrent_workers_apply_each_migration_once():
+    with tempfile.TemporaryDirectory() as workdir:
+        engines = [_engine(workdir) for _ in range(4)]
+        errors = []
+
+        def boot(engine):
+            try:
+                ensure_schema(engine)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=boot, args=(engine,)) for engine in engines]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        try:
+            assert not errors
+            assert [row["version"] for row in history(engines[0])] == list(range(1, latest_version() + 1))
+        finally:
+            for engine in engines:
+                engine.dispose()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+주요 조회 쿼리 실행 계획 테스트
+EXPLAIN QUERY PLAN으로 사용자별/계좌별 조회가 인덱스를 타는지 확인 (전체 테이블 스캔이면 실패)
+"""
+
+import sys
+import os
+import re
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import func, inspect, text
+from sqlmodel import SQLModel, select
+
+from app.db.session import create_app_engine
+from app.db.migrations.versions import m0003_hot_lookup_indexes
+from app.models import User, BankAccount, Transaction, UserProduct, CreditScore, LedgerSyncState, ChroniclePost
+from app.models.chronicle import ChronicleAuthor, ChronicleFollow, ChronicleTimelineEntry
+from app.models.xp import UserXP, XPActivity
+from app.services.chronicle_service import ChronicleService
+from app.services.spending_rollup_service import SpendingRollupService
+
+# 조건이 있는 조회는 모든 테이블을 SEARCH(인덱스 탐색)해야 하고, SCAN(테이블/인덱스 전체 읽기)이면 실패
+# 조건 없는 최신순 상위 N개 조회만 인덱스 순서대로 읽는 "SCAN t USING INDEX ..."를 허용
+SEARCH, SEARCH_SORTED, TOP_N = "search", "search_sorted", "top_n"
+ORDERED_INDEX_SCAN = re.compile(r"^SCAN \S+ USING (COVERING )?INDEX ")
+
+_CURSOR = ChronicleService.encode_cursor(ChroniclePost(id=100, user_id=1, title="", timestamp=datetime(2024, 1, 1)))
+
+HOT_QUERIES = {
+    # financial.py
+    "accounts_by_user": (select(BankAccount).where(BankAccount.user_id == 1), SEARCH),
+    "transactions_by_account": (
+        select(Transaction).where(Transaction.account_id == 1).order_by(Transaction.transaction_date.desc()), SEARCH_SORTED),
+    "transactions_by_accounts": (
+        select(Transaction).where(Transaction.account_id.in_([1, 2, 3])).order_by(Transaction.transaction_date.desc()), SEARCH),
+    "user_products": (select(UserProduct).where(UserProduct.user_id == 1), SEARCH),
+    "credit_score": (select(CreditScore).where(CreditScore.user_id == 1), SEARCH),
+    "monthly_analytics": (SpendingRollupService.monthly_statement(1, "2024-03", "2024-05"), SEARCH),
+    "monthly_analytics_by_account": (SpendingRollupService.monthly_statement(1, "2024-03", "2024-05", 2), SEARCH),
+    # xp_service.py
+    "user_xp": (select(UserXP).where(UserXP.user_id == 1), SEARCH),
+    "recent_activities": (
+        select(XPActivity).where(XPActivity.user_xp_id == 1).order_by(XPActivity.created_at.desc()).limit(10), SEARCH_SORTED),
+    "leaderboard": (select(UserXP).order_by(UserXP.credo_score.desc()).limit(10), TOP_N),
+    # chronicle.py
+    "user_chronicles": (ChronicleService.page_statement(1, 50), SEARCH_SORTED),
+    "user_chronicles_next_page": (ChronicleService.page_statement(1, 50, _CURSOR), SEARCH_SORTED),
+    "public_chronicles": (ChronicleService.page_statement(None, 50), TOP_N),
+    "public_chronicles_next_page": (ChronicleService.page_statement(None, 50, _CURSOR), SEARCH_SORTED),
+    # chronicle_feed.py
+    "home_timeline": (
+        select(ChronicleTimelineEntry.post_id, ChronicleTimelineEntry.timestamp).where(ChronicleTimelineEntry.user_id == 1)
+        .order_by(ChronicleTimelineEntry.timestamp.desc(), ChronicleTimelineEntry.post_id.desc()).limit(51), SEARCH_SORTED),
+    "fan_out_followers": (select(ChronicleFollow.follower_id).where(ChronicleFollow.followee_id == 1), SEARCH),
+    "pull_authors": (
+        select(ChronicleFollow.followee_id).join(ChronicleAuthor, ChronicleAuthor.user_id == ChronicleFollow.followee_id)
+        .where(ChronicleFollow.follower_id == 1, ChronicleAuthor.pull_feed == True), SEARCH),  # noqa: E712
+    "timeline_by_post": (select(ChronicleTimelineEntry).where(ChronicleTimelineEntry.post_id == 1), SEARCH),
+    # home_dashboard.py / ledger_sync_service.py
+    "user_by_ssafy_key": (select(User).where(User.ssafy_user_key == "key"), SEARCH),
+    "ledger_recent_transactions": (
+        select(Transaction).join(BankAccount, Transaction.account_id == BankAccount.id)
+        .where(BankAccount.user_id == 1).order_by(Transaction.transaction_date.desc()).limit(10), SEARCH),
+    "ledger_oldest_sync": (
+        select(func.min(LedgerSyncState.last_synced_at))
+        .join(BankAccount, LedgerSyncState.account_id == BankAccount.id).where(BankAccount.user_id == 1), SEARCH),
+}
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_app_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _plan(engine, statement):
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        return [row[3] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(engine, name):
+    statement, mode = HOT_QUERIES[name]
+    plan = _plan(engine, statement)
+    scans = [line for line in plan if line.startswith("SCAN ")
+             and not (mode == TOP_N and ORDERED_INDEX_SCAN.match(line))]
+    assert not scans, f"{name}: 스캔 {plan}"
+    if mode != SEARCH:
+        # 인덱스 순서로 바로 정렬되어야 함
+        assert not any("TEMP B-TREE" in line for line in plan), f"{name}: 정렬용 임시 B-tree {plan}"
+
+
+def test_index_migration_on_existing_tables():
+    engine = create_app_engine("sqlite://")
+    try:
+        SQLModel.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(text('DROP INDEX "ix_chronicle_posts_user_timestamp"'))
+            conn.execute(text('DROP INDEX "ix_user_xp_user_id"'))
+            # 기존 DB에 남아 있는 사용자별 중복 UserXP
+            conn.execute(text("INSERT INTO user_xp (user_id, current_level, credo_score, current_xp, total_xp, created_at, updated_at) "
+                              "VALUES (1, 1, 0, 0, 0, '2024-01-01', '2024-01-01'), (1, 1, 0, 0, 0, '2024-01-01', '2024-01-01')"))
+
+        # 중복 때문에 유니크 인덱스를 만들 수 없으면 일반 인덱스로 대체하지 않고 실패
+        with pytest.raises(RuntimeError, match="ix_user_xp_user_id"):
+            m0003_hot_lookup_indexes.upgrade(engine)
+        assert "ix_user_xp_user_id" not in {index["name"] for index in inspect(engine).get_indexes("user_xp")}
+
+        # 중복을 정리하고 다시 실행하면 남은 인덱스까지 생성
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM user_xp WHERE id = (SELECT MAX(id) FROM user_xp)"))
+        m0003_hot_lookup_indexes.upgrade(engine)
+
+        indexes = {index["name"]: index for table in ("chronicle_posts", "user_xp")
+                   for index in inspect(engine).get_indexes(table)}
+        assert "ix_chronicle_posts_user_timestamp" in indexes
+        assert indexes["ix_user_xp_user_id"]["unique"] in (1, True)
+    finally:
+        engine.dispose()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+응답 직렬화 테스트
+ORM → 응답 dict 변환이 응답 모델 검증 결과와 같은 JSON을 만드는지, 앱 기본 응답 클래스(orjson)와
+fast_response로 반환하는 금융 조회 API 확인
+"""
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+from datetime import datetime
+from decimal import Decimal
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from sqlmodel import Session
+
+from app.core.responses import AppJSONResponse, dumps_json, to_response, to_response_list
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, get_session
+from app.main import app
+from app.models.financial import (
+    BankAccount, FinancialProduct, UserProduct, BankAccountResponse, FinancialSummaryResponse, UserProductResponse
+)
+from app.models.user import User
+from app.services.user_service import JWTService
+
+
+def _account(account_id=1, **overrides):
+    values = dict(id=account_id, user_id=1, account_number=f"0880-{account_id}", bank_name="신한은행",
+                  account_type="수시입출금", account_name="쏠편한 입출금", balance=150_000,
+                  created_date=datetime(2024, 3, 1, 9, 30), created_at=datetime(2024, 3, 1),
+                  updated_at=datetime(2024, 3, 2, 12, 0, 0, 123456))
+    values.update(overrides)
+    return BankAccount(**values)
+
+
+def _user_product(product_id=1):
+    product = FinancialProduct(id=product_id, product_code=f"P{product_id}", product_name="청년 적금",
+                               product_type="적금", bank_name="신한은행", interest_rate=4,  # int → float 필드
+                               min_amount=10_000, max_amount=500_000, term_months=12,
+                               created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))
+    user_product = UserProduct(id=product_id, user_id=1, product_id=product_id, account_id=1, amount=100_000,
+                               start_date=datetime(2024, 1, 1), end_date=datetime(2025, 1, 1),
+                               created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))
+    user_product.product = product
+    user_product.account = _account(last_transaction_date=None)
+    return user_product
+
+
+def test_mapping_matches_response_model_validation():
+    user_product = _user_product()
+    mapped = to_response(UserProductResponse, user_product)
+    assert isinstance(mapped["product"]["interest_rate"], float)
+    expected = UserProductResponse.model_validate(user_product, from_attributes=True).model_dump(mode="json")
+    assert json.loads(dumps_json(mapped)) == expected
+
+    accounts = [_account(i, last_transaction_date=datetime(2024, 5, i)) for i in range(1, 4)]
+    assert json.loads(dumps_json(to_response_list(BankAccountResponse, accounts))) == [
+        BankAccountResponse.model_validate(account, from_attributes=True).model_dump(mode="json") for account in accounts
+    ]
+
+
+def test_app_json_response_handles_non_json_types():
+    body = AppJSONResponse({1: Decimal("1.5"), "model": BankAccountResponse.model_validate(
+        _account(), from_attributes=True), "tags": {"a"}, "이름": "한글"}).body
+    assert json.loads(body) == {"1": 1.5, "model": json.loads(dumps_json(to_response(BankAccountResponse, _account()))),
+                                "tags": ["a"], "이름": "한글"}
+    assert "한글".encode() in body  # ensure_ascii 없이 UTF-8
+
+
+def test_financial_summary_returns_response_model_shape():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'app.db')}")
+        upgrade(engine)
+        with Session(engine) as session:
+            user = User(email="summary@ssafy.com", password_hash="x")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            session.add(_account(user_id=user.id, id=None))
+            session.commit()
+            token = JWTService.create_access_token(user)
+
+        def override_session():
+            with Session(engine) as session:
+                yield session
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get("/api/financial/summary", headers={"Authorization": f"Bearer {token}"})
+
+        app.dependency_overrides[get_session] = override_session
+        try:
+            response = asyncio.run(scenario())
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+        assert response.status_code == 200, response.text
+        summary = FinancialSummaryResponse.model_validate(response.json())
+        assert (summary.total_balance, summary.credit_score.grade) == (150_000, "N/A")
+        assert [account.account_number for account in summary.accounts] == [_account().account_number]
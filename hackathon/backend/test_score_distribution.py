@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+캠퍼스 크레도 점수 분포 테스트
+점수를 다시 계산해도 상위 백분율이 전체 정렬로 구한 값과 같은지, 대학교 코호트/병합/재집계,
+기록 전 새 점수 순위 미리 계산(분포를 바꾸지 않고 기록한 결과와 같은지) 확인
+"""
+
+import sys
+import os
+import random
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+
+from app.db.session import create_app_engine
+from app.db.migrations import upgrade
+from app.services.score_distribution import ScoreDistribution, ScoreHistogram
+
+
+def _brute_top_percentage(values, score):
+    return round(max(sum(1 for value in values if value >= score), 1) / len(values) * 100, 2)
+
+
+def test_matches_brute_force_with_recalculation_and_cohorts():
+    rng = random.Random(5)
+    distribution, latest = ScoreDistribution(), {}
+    universities = ["서울대학교", "연세대학교", None]
+    for _ in range(3000):
+        user_id = rng.randrange(400)
+        scores = {"total": rng.randrange(4001), "academic": rng.randrange(1001)}
+        university = rng.choice(universities)
+        distribution.record(user_id, scores, university)
+        latest[user_id] = (scores, university)
+
+    assert distribution.size() == len(latest)
+    for score in (0, 1, 1234, 2000, 3999, 4000, 5000):
+        totals = [scores["total"] for scores, _ in latest.values()]
+        assert distribution.top_percentage("total", score) == _brute_top_percentage(totals, score)
+        cohort = [scores["total"] for scores, university in latest.values() if university == "서울대학교"]
+        assert distribution.top_percentage("total", score, "서울대학교") == _brute_top_percentage(cohort, score)
+    academics = [scores["academic"] for scores, _ in latest.values()]
+    assert distribution.top_percentage("academic", 500) == _brute_top_percentage(academics, 500)
+    assert distribution.top_percentage("total", 100, "없는대학교") == 100.0
+
+
+def test_histograms_merge():
+    left, right = ScoreHistogram(100), ScoreHistogram(100)
+    for score in (10, 20, 30):
+        left.add(score)
+    for score in (20, 90):
+        right.add(score)
+    left.merge(right)
+    assert left.total == 5
+    assert left.top_percentage(20) == _brute_top_percentage([10, 20, 30, 20, 90], 20)
+
+
+def test_rebuild_from_campus_credo_rows():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'credo.db')}")
+        upgrade(engine)
+        try:
+            distribution = ScoreDistribution()
+            assert distribution.rebuild(engine) == 0  # 테이블 없음
+            with engine.begin() as conn:
+                conn.execute(text(
+                    "CREATE TABLE campuscredo (id INTEGER PRIMARY KEY, user_id INTEGER, total_score INTEGER, "
+                    "academic_score INTEGER, financial_score INTEGER, skill_score INTEGER, activity_score INTEGER)"
+                ))
+                for i, total in enumerate([3000, 1500, 500], start=1):
+                    conn.execute(text(
+                        'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at, '
+                        "current_university) VALUES (:email, 'x', 1, 0, '2024-01-01', '2024-01-01', :university)"
+                    ), {"email": f"credo{i}@ssafy.com", "university": "서울대학교" if i < 3 else "연세대학교"})
+                    conn.execute(text(
+                        "INSERT INTO campuscredo VALUES (:id, :id, :total, 0, 0, 0, 0)"
+                    ), {"id": i, "total": total})
+            assert distribution.rebuild(engine) == 3
+            assert distribution.top_percentage("total", 1500) == round(2 / 3 * 100, 2)
+            assert distribution.top_percentage("total", 1500, "서울대학교") == 100.0
+            assert distribution.size("연세대학교") == 1
+        finally:
+            engine.dispose()
+
+
+def test_preview_matches_recording():
+    rng = random.Random(9)
+    for _ in range(300):
+        distribution, replaced = ScoreDistribution(), ScoreDistribution()
+        for user_id in range(20):
+            university = rng.choice(["서울대학교", None])
+            scores = {"total": rng.randrange(4001)}
+            distribution.record(user_id, scores, university)
+            replaced.record(user_id, scores, university)
+        user_id, score, university = rng.randrange(25), rng.randrange(4001), rng.choice(["서울대학교", None])
+        previews = [distribution.top_percentage("total", score, cohort, user_id) for cohort in (None, university)]
+        replaced.record(user_id, {"total": score}, university)
+        assert previews == [replaced.top_percentage("total", score, cohort) for cohort in (None, university)]
+        assert distribution.size() == 20  # 미리 계산은 분포를 바꾸지 않음
+
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+월간 카테고리별 수입/지출 집계 테스트
+거래 추가·수정·삭제(롤백 포함)마다 증감한 집계가 거래 테이블에서 다시 만든 결과와 같은지,
+마이그레이션이 기존 거래로 집계를 채우고 /financial/analytics/monthly가 달력 월 기준으로 응답하는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.db.migrations import upgrade
+from app.db.session import create_app_engine, get_session
+from app.main import app
+from app.models.financial import BankAccount, MonthlyAnalyticsResponse, MonthlyCategoryRollup, Transaction
+from app.models.user import User
+from app.services.spending_rollup_service import SpendingRollupService, recent_months
+from app.services.user_service import JWTService
+
+
+def _account(user_id, number):
+    return BankAccount(user_id=user_id, account_number=number, bank_name="신한은행", account_type="수시입출금",
+                       account_name="입출금 계좌", balance=0, created_date=datetime(2024, 1, 1))
+
+
+def _transaction(account, when, amount, category):
+    return Transaction(account_id=account.id, transaction_type="입금" if amount > 0 else "출금", amount=amount,
+                       balance_after=0, description=category, category=category, transaction_date=when)
+
+
+def _rows(session):
+    return sorted(
+        (row.user_id, row.year_month, row.account_id, row.category, row.direction, row.amount, row.transaction_count)
+        for row in session.exec(select(MonthlyCategoryRollup).execution_options(populate_existing=True))
+    )
+
+
+def _rebuilt(engine):
+    """같은 거래로 처음부터 다시 만든 집계 (롤백해서 원래 행은 그대로 둠)"""
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        SpendingRollupService.rebuild(conn)
+        rows = sorted(tuple(row) for row in conn.execute(text(
+            "SELECT user_id, year_month, account_id, category, direction, amount, transaction_count "
+            "FROM monthly_category_rollup"
+        )))
+        transaction.rollback()
+    return rows
+
+
+def test_rollup_follows_transaction_changes():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'app.db')}")
+        upgrade(engine)
+        with Session(engine) as session:
+            user = User(email="rollup@ssafy.com", password_hash="x")
+            session.add(user)
+            session.commit()
+            main, sub = _account(user.id, "110-1"), _account(user.id, "110-2")
+            session.add_all([main, sub])
+            session.commit()
+
+            session.add_all([
+                _transaction(main, datetime(2024, 3, 31, 23, 59), 3_000_000, "수입"),
+                _transaction(main, datetime(2024, 4, 1, 0, 0), -500_000, "생활비"),
+                _transaction(main, datetime(2024, 4, 2), -100_000, "교통비"),
+                _transaction(sub, datetime(2024, 4, 15), -20_000, "교통비"),
+            ])
+            session.commit()
+            assert _rows(session) == [
+                (user.id, "2024-03", main.id, "수입", "income", 3_000_000, 1),
+                (user.id, "2024-04", main.id, "교통비", "expense", 100_000, 1),
+                (user.id, "2024-04", main.id, "생활비", "expense", 500_000, 1),
+                (user.id, "2024-04", sub.id, "교통비", "expense", 20_000, 1),
+            ]
+
+            # 카테고리/월/계좌 변경은 이전 행에서 빼고 새 행에 더함
+            moved = session.exec(select(Transaction).where(Transaction.category == "생활비")).one()
+            moved.category, moved.account_id, moved.transaction_date = "식비", sub.id, datetime(2024, 5, 1)
+            session.add(moved)
+            session.commit()
+            assert _rows(session) == _rebuilt(engine)
+            assert ("2024-04", "생활비") not in {(row[1], row[3]) for row in _rows(session)}
+
+            # 커밋하지 않은 변경은 집계와 함께 롤백
+            session.delete(moved)
+            session.flush()
+            assert ("2024-05", "식비") not in {(row[1], row[3]) for row in _rows(session)}
+            session.rollback()
+            assert (user.id, "2024-05", sub.id, "식비", "expense", 500_000, 1) in _rows(session)
+
+            session.delete(session.exec(select(Transaction).where(Transaction.amount == -20_000)).one())
+            session.commit()
+            assert _rows(session) == _rebuilt(engine)
+
+            months = SpendingRollupService.monthly(session, user.id, 3, now=datetime(2024, 5, 20))
+            assert [(m["year_month"], m["income"], m["expense"], m["net"]) for m in months] == [
+                ("2024-05", 0, 500_000, -500_000), ("2024-04", 0, 100_000, -100_000),
+                ("2024-03", 3_000_000, 0, 3_000_000),
+            ]
+            assert months[0]["categories"] == [{"category": "식비", "income": 0, "expense": 500_000}]
+            only_main = SpendingRollupService.monthly(session, user.id, 3, account_id=main.id, now=datetime(2024, 5, 20))
+            assert [m["expense"] for m in only_main] == [0, 100_000, 0]
+        engine.dispose()
+
+
+def test_recent_months_are_calendar_months():
+    assert recent_months(3, datetime(2024, 3, 31)) == ["2024-03", "2024-02", "2024-01"]
+    assert recent_months(2, datetime(2024, 1, 5)) == ["2024-01", "2023-12"]
+
+
+def test_migration_backfill_and_monthly_endpoint():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'app.db')}")
+        upgrade(engine, target=9)
+        this_month = datetime.now().replace(day=1, hour=12)
+        with engine.begin() as conn:
+            conn.execute(text(
+                'INSERT INTO "user" (id, email, password_hash, is_active, is_verified, created_at, updated_at) '
+                "VALUES (1, 'old@ssafy.com', 'x', 1, 0, '2024-01-01', '2024-01-01')"
+            ))
+            conn.execute(text(
+                "INSERT INTO bankaccount (id, user_id, account_number, bank_name, account_type, account_name, balance, "
+                "currency, is_active, created_date, created_at, updated_at) VALUES "
+                "(1, 1, '1', '신한은행', '수시입출금', 'a', 0, 'KRW', 1, '2024-01-01', '2024-01-01', '2024-01-01')"
+            ))
+            conn.execute(text(
+                "INSERT INTO \"transaction\" (account_id, transaction_type, amount, balance_after, description, category, "
+                "transaction_date, created_at) VALUES (1, :type, :amount, 0, '', :category, :date, '2024-01-01')"
+            ), [
+                {"type": "입금", "amount": 300_000, "category": "용돈", "date": this_month},
+                {"type": "출금", "amount": -12_000, "category": "식비", "date": this_month},
+                {"type": "출금", "amount": -8_000, "category": "식비", "date": this_month},
+                {"type": "출금", "amount": -50_000, "category": "교통비", "date": datetime(2020, 1, 1)},
+            ])
+        upgrade(engine)
+        assert _rebuilt(engine) == [
+            (1, "2020-01", 1, "교통비", "expense", 50_000, 1),
+            (1, this_month.strftime("%Y-%m"), 1, "식비", "expense", 20_000, 2),
+            (1, this_month.strftime("%Y-%m"), 1, "용돈", "income", 300_000, 1),
+        ]
+        with Session(engine) as session:
+            token = JWTService.create_access_token(session.get(User, 1))
+
+        def override_session():
+            with Session(engine) as session:
+                yield session
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get("/api/financial/analytics/monthly", params={"months": 2},
+                                        headers={"Authorization": f"Bearer {token}"})
+
+        app.dependency_overrides[get_session] = override_session
+        try:
+            response = asyncio.run(scenario())
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+        assert response.status_code == 200, response.text
+        months = [MonthlyAnalyticsResponse.model_validate(item) for item in response.json()]
+        assert [(m.year_month, m.income, m.expense, m.net) for m in months] == [
+            (this_month.strftime("%Y-%m"), 300_000, 20_000, 280_000), (recent_months(2)[1], 0, 0, 0),
+        ]
+        assert [category.category for category in months[0].categories] == ["식비", "용돈"]
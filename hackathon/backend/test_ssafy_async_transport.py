@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+SSAFY API 비동기 전송 테스트
+로컬 aiohttp 서버를 띄워 awaitable 엔드포인트 메서드와 동시 호출 제한을 확인
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from aiohttp import web
+
+from app.core.config import settings
+from app.services import ssafy_api_service
+from app.services.ssafy_api_service import AsyncSSAFYAPIService, close_async_transport
+from app.services.ssafy_catalog_cache import catalog_cache
+
+
+async def _start_fake_bank(state):
+    """요청 수와 최대 동시 처리 수를 기록하는 가짜 SSAFY 서버"""
+    async def handler(request):
+        body = await request.json()
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.02)
+        state["in_flight"] -= 1
+        return web.json_response({
+            "Header": {"apiName": body["Header"]["apiName"], "responseCode": "H0000"},
+            "REC": [{"bankCode": "088", "bankName": "신한은행"}]
+        })
+
+    app = web.Application()
+    app.router.add_post("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_async_methods_are_awaitable_and_capped():
+    async def scenario():
+        state = {"in_flight": 0, "max_in_flight": 0}
+        runner, base_url = await _start_fake_bank(state)
+        original_limit = settings.SSAFY_MAX_CONCURRENCY
+        settings.SSAFY_MAX_CONCURRENCY = 4
+        catalog_cache.invalidate()  # 코드 조회가 이전 테스트의 캐시를 쓰지 않도록
+        try:
+            service = AsyncSSAFYAPIService()
+            service.base_url = base_url
+
+            result = await service.get_bank_codes()
+            assert result["REC"][0]["bankCode"] == "088"
+
+            results = await asyncio.gather(*[service.get_bank_codes() for _ in range(20)])
+            assert len(results) == 20
+            assert state["max_in_flight"] <= 4
+
+            # 모든 호출이 같은 공유 세션을 사용
+            shared_session = ssafy_api_service._async_http_session
+            await service.get_currency_codes()
+            assert ssafy_api_service._async_http_session is shared_session
+        finally:
+            settings.SSAFY_MAX_CONCURRENCY = original_limit
+            await close_async_transport()
+            await runner.cleanup()
+
+    asyncio.run(scenario())
+
+
+def test_async_error_response_raises():
+    async def scenario():
+        async def handler(request):
+            return web.Response(status=500, text="bank down")
+
+        app = web.Application()
+        app.router.add_post("/{tail:.*}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        catalog_cache.invalidate()
+        try:
+            service = AsyncSSAFYAPIService()
+            service.base_url = f"http://127.0.0.1:{port}"
+            try:
+                await service.get_bank_codes()
+                assert False, "오류 응답은 예외를 발생시켜야 함"
+            except Exception as e:
+                assert "500" in str(e)
+        finally:
+            await close_async_transport()
+            await runner.cleanup()
+
+    asyncio.run(scenario())
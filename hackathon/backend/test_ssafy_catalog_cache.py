@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+SSAFY 카탈로그 캐시 테스트
+fresh/stale/만료 구간별 응답, 키별 단일 조회(miss/백그라운드 갱신), 요청 기한 분리,
+상품 등록 시 무효화, 통계 카운터와 무효화 API 인증 확인
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from aiohttp import web
+
+from app.main import app
+from app.services.ssafy_api_service import AsyncSSAFYAPIService, close_async_transport
+from app.services.ssafy_catalog_cache import CatalogCache, catalog_cache
+from app.services.ssafy_resilience import remaining_time, reset_request_deadline, set_request_deadline
+
+
+def _age(cache, key, seconds):
+    """캐시 항목을 seconds초 전에 조회한 것으로 변경"""
+    value, _ = cache._entries[key]
+    cache._entries[key] = (value, time.monotonic() - seconds)
+
+
+class Loader:
+    """호출 수를 세고 요청 기한이 보이는지 기록하는 비동기 loader"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.deadlines = []
+
+    async def __call__(self):
+        self.calls += 1
+        version = self.calls
+        self.deadlines.append(remaining_time())
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return {"version": version}
+
+
+def test_fresh_stale_and_expired_entries():
+    async def scenario():
+        cache = CatalogCache(ttl=10, stale_ttl=20)
+        loader = Loader()
+        assert await cache.get_async("codes", loader) == {"version": 1}
+        assert await cache.get_async("codes", loader) == {"version": 1}
+        assert loader.calls == 1
+
+        # stale 구간: 기존 값 반환, 갱신은 하나만
+        _age(cache, "codes", 15)
+        stale = await asyncio.gather(*[cache.get_async("codes", loader) for _ in range(5)])
+        assert stale == [{"version": 1}] * 5
+        await asyncio.sleep(0.01)
+        assert loader.calls == 2
+        assert await cache.get_async("codes", loader) == {"version": 2}
+
+        # 만료: 새로 조회할 때까지 기다림
+        _age(cache, "codes", 31)
+        assert await cache.get_async("codes", loader) == {"version": 3}
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (2, 5, 2)
+        assert (stats["refreshes"], stats["refresh_errors"]) == (3, 0)
+        assert stats["upstream_calls_saved"] == 9 - 3
+        assert stats["cached_keys"] == ["codes"]
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_share_one_load():
+    async def scenario():
+        cache = CatalogCache(ttl=10, stale_ttl=20)
+        loader = Loader(delay=0.05)
+        waiters = [asyncio.ensure_future(cache.get_async("products", loader)) for _ in range(10)]
+        await asyncio.sleep(0.01)
+        # 기다리던 요청 하나가 취소되어도 조회는 계속됨
+        waiters[0].cancel()
+        results = await asyncio.gather(*waiters[1:])
+        assert results == [{"version": 1}] * 9
+        assert loader.calls == 1
+        assert cache.stats()["misses"] == 10
+
+        # 실패는 모든 대기자에게 전달되고 캐시하지 않음
+        failing = Loader(delay=0.01, fail=True)
+        outcomes = await asyncio.gather(*[cache.get_async("rates", failing) for _ in range(3)],
+                                        return_exceptions=True)
+        assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+        assert failing.calls == 1
+        assert cache.stats()["refresh_errors"] == 1
+        assert "rates" not in cache.stats()["cached_keys"]
+
+    asyncio.run(scenario())
+
+
+def test_loads_do_not_inherit_request_deadline():
+    async def scenario():
+        cache = CatalogCache(ttl=10, stale_ttl=20)
+        loader = Loader()
+        token = set_request_deadline(0.5)
+        try:
+            await cache.get_async("codes", loader)
+            _age(cache, "codes", 15)
+            await cache.get_async("codes", loader)
+            await asyncio.sleep(0.01)
+        finally:
+            reset_request_deadline(token)
+        assert loader.calls == 2
+        assert loader.deadlines == [None, None]
+
+    asyncio.run(scenario())
+
+
+def test_invalidation_discards_in_flight_load():
+    async def scenario():
+        cache = CatalogCache(ttl=10, stale_ttl=20)
+        loader = Loader(delay=0.05)
+        first = asyncio.ensure_future(cache.get_async("products", loader))
+        await asyncio.sleep(0.01)
+        cache.invalidate(["products"])
+        # 무효화 이전 조회의 결과는 기다리던 호출자만 받고 저장하지 않음
+        second = await cache.get_async("products", loader)
+        assert await first == {"version": 1}
+        assert second == {"version": 2}
+        assert loader.calls == 2
+        assert await cache.get_async("products", loader) == {"version": 2}
+        assert cache.stats()["invalidations"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_sync_misses_share_one_load():
+    cache = CatalogCache(ttl=10, stale_ttl=20)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"version": len(calls)}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("codes", loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [{"version": 1}] * 8
+    assert len(calls) == 1
+
+    _age(cache, "codes", 15)
+    assert cache.get("codes", loader) == {"version": 1}
+    for _ in range(100):
+        if cache.stats()["refreshes"] == 2:
+            break
+        time.sleep(0.01)
+    assert cache.get("codes", loader) == {"version": 2}
+
+
+def test_create_product_invalidates_catalog():
+    async def scenario():
+        requests = []
+
+        async def handler(request):
+            body = await request.json()
+            requests.append(body["Header"]["apiName"])
+            return web.json_response({
+                "Header": {"apiName": body["Header"]["apiName"], "responseCode": "H0000"},
+                "REC": [{"accountName": f"상품 {len(requests)}"}]
+            })
+
+        app = web.Application()
+        app.router.add_post("/{tail:.*}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        catalog_cache.invalidate()
+        try:
+            service = AsyncSSAFYAPIService()
+            service.base_url = f"http://127.0.0.1:{port}"
+            first = await service.get_deposit_products()
+            assert await service.get_deposit_products() is first
+            await service.create_deposit_product("088", "새 예금", 12, 1000, 100000, 3.0)
+            refreshed = await service.get_deposit_products()
+            assert refreshed is not first
+            assert requests == ["inquireDepositProducts", "createDepositProduct", "inquireDepositProducts"]
+        finally:
+            catalog_cache.invalidate()
+            await close_async_transport()
+            await runner.cleanup()
+
+    asyncio.run(scenario())
+
+
+def test_invalidate_endpoint_requires_login():
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.delete("/api/ssafy/catalog-cache")
+
+    catalog_cache._entries["inquireBankCodes"] = ({"REC": []}, time.monotonic())
+    try:
+        response = asyncio.run(scenario())
+        assert response.status_code == 403
+        assert "inquireBankCodes" in catalog_cache.stats()["cached_keys"]
+    finally:
+        catalog_cache.invalidate()
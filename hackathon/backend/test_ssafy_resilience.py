@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+SSAFY API 장애 대응 테스트
+서킷 브레이커 차단/복구, 조회 API만 재시도, 요청 기한 반영을 확인
+"""
+
+import sys
+import os
+import asyncio
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from aiohttp import web
+
+from app.core.config import settings
+from app.services.ssafy_api_service import AsyncSSAFYAPIService, close_async_transport
+from app.services.ssafy_resilience import (
+    CircuitOpenError, DeadlineExceededError, get_circuit_breaker,
+    reset_circuit_breakers, set_request_deadline, reset_request_deadline
+)
+
+
+async def _start_fake_bank(state):
+    """state["status"]로 응답 코드, state["delay"]로 지연을 조절하는 가짜 SSAFY 서버"""
+    async def handler(request):
+        body = await request.json()
+        state["calls"].append(body["Header"]["apiName"])
+        state["unique_nos"].append(body["Header"]["institutionTransactionUniqueNo"])
+        await asyncio.sleep(state.get("delay", 0))
+        if state["status"] != 200:
+            return web.Response(status=state["status"], text="bank down")
+        return web.json_response({"Header": {"responseCode": "H0000"}, "REC": []})
+
+    app = web.Application()
+    app.router.add_post("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _run(scenario):
+    originals = {
+        name: getattr(settings, name)
+        for name in ("SSAFY_RETRY_BASE_DELAY", "SSAFY_BREAKER_FAILURE_THRESHOLD", "SSAFY_BREAKER_RESET_TIMEOUT")
+    }
+    settings.SSAFY_RETRY_BASE_DELAY = 0.01
+    settings.SSAFY_BREAKER_FAILURE_THRESHOLD = 3
+    settings.SSAFY_BREAKER_RESET_TIMEOUT = 0.2
+    reset_circuit_breakers()
+
+    async def wrapper():
+        state = {"status": 200, "calls": [], "unique_nos": []}
+        runner, base_url = await _start_fake_bank(state)
+        service = AsyncSSAFYAPIService()
+        service.base_url = base_url
+        try:
+            await scenario(service, state)
+        finally:
+            await close_async_transport()
+            await runner.cleanup()
+
+    try:
+        asyncio.run(wrapper())
+    finally:
+        for name, value in originals.items():
+            setattr(settings, name, value)
+        reset_circuit_breakers()
+
+
+def test_only_inquiries_are_retried_with_fresh_header():
+    async def scenario(service, state):
+        state["status"] = 503
+
+        try:
+            await service.get_demand_deposit_accounts("user-key")
+            assert False, "503 응답은 예외를 발생시켜야 함"
+        except Exception as e:
+            assert "503" in str(e)
+        assert len(state["calls"]) == 1 + settings.SSAFY_RETRY_ATTEMPTS
+        # 재시도마다 기관거래고유번호를 새로 발급
+        assert len(set(state["unique_nos"])) == len(state["unique_nos"])
+
+        # 변경 API는 재시도하지 않음
+        state["calls"].clear()
+        try:
+            await service.create_demand_deposit_account("001-1-1", "user-key")
+        except Exception:
+            pass
+        assert state["calls"] == ["createDemandDepositAccount"]
+
+    _run(scenario)
+
+
+def test_breaker_opens_fails_fast_and_recovers_after_probe():
+    async def scenario(service, state):
+        state["status"] = 500
+        for _ in range(settings.SSAFY_BREAKER_FAILURE_THRESHOLD):
+            try:
+                await service.create_demand_deposit_account("001-1-1", "user-key")
+            except Exception:
+                pass
+
+        breaker = get_circuit_breaker("/edu/demandDeposit/createDemandDepositAccount")
+        assert breaker.state == breaker.OPEN
+
+        calls_before = len(state["calls"])
+        started = time.monotonic()
+        try:
+            await service.create_demand_deposit_account("001-1-1", "user-key")
+            assert False, "차단 중에는 바로 실패해야 함"
+        except CircuitOpenError:
+            pass
+        assert time.monotonic() - started < 0.05
+        assert len(state["calls"]) == calls_before
+
+        # 다른 엔드포인트는 영향 없음
+        state["status"] = 200
+        await service.get_demand_deposit_accounts("user-key")
+
+        # reset_timeout 이후 시험 호출 성공 → 복구
+        await asyncio.sleep(settings.SSAFY_BREAKER_RESET_TIMEOUT)
+        await service.create_demand_deposit_account("001-1-1", "user-key")
+        assert breaker.state == breaker.CLOSED
+
+    _run(scenario)
+
+
+def test_outbound_calls_honour_request_deadline():
+    async def scenario(service, state):
+        state["delay"] = 1.0
+        token = set_request_deadline(0.1)
+        try:
+            started = time.monotonic()
+            try:
+                await service.get_demand_deposit_accounts("user-key")
+                assert False, "기한 안에 응답이 없으면 실패해야 함"
+            except Exception:
+                pass
+            # 30초 기본 타임아웃이 아니라 남은 기한 안에서 실패
+            assert time.monotonic() - started < 0.5
+
+            try:
+                await service.get_demand_deposit_accounts("user-key")
+                assert False, "기한이 지난 뒤에는 호출을 시작하지 않아야 함"
+            except DeadlineExceededError:
+                pass
+        finally:
+            reset_request_deadline(token)
+
+    _run(scenario)
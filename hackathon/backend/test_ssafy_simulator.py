@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+SSAFY 시뮬레이터 테스트
+실제 서비스 클래스로 시뮬레이터의 계좌/거래 흐름과 장애 주입을 확인
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.ssafy_api_service import AsyncSSAFYAPIService, close_async_transport
+from app.services.ssafy_resilience import reset_circuit_breakers
+from app.services.ledger_sync_service import extract_records
+from ssafy_simulator import SSAFYSimulator, FaultConfig, start_simulator
+
+
+def _run(scenario, simulator):
+    async def wrapper():
+        runner, base_url = await start_simulator(simulator)
+        service = AsyncSSAFYAPIService()
+        service.base_url = base_url
+        try:
+            await scenario(service)
+        finally:
+            await close_async_transport()
+            await runner.cleanup()
+
+    reset_circuit_breakers()
+    try:
+        asyncio.run(wrapper())
+    finally:
+        reset_circuit_breakers()
+
+
+def test_account_lifecycle_through_service():
+    simulator = SSAFYSimulator(seed=1)
+
+    async def scenario(service):
+        user_key = (await service.create_user_account("student@ssafy.com"))["userKey"]
+        assert (await service.search_user_account("student@ssafy.com"))["userKey"] == user_key
+
+        products = await service.get_demand_deposit_products()
+        product_no = products["REC"][0]["accountTypeUniqueNo"]
+        assert products["dataSearch"]["content"] == products["REC"]
+
+        first = (await service.create_demand_deposit_account(product_no, user_key))["REC"]["accountNo"]
+        second = (await service.create_demand_deposit_account(product_no, user_key))["REC"]["accountNo"]
+
+        await service.deposit_to_account(first, 50000, "용돈", user_key)
+        await service.withdraw_from_account(first, 4500, "카페 결제", user_key)
+        await service.transfer_between_accounts(first, second, 10000, user_key)
+
+        balance = await service.get_account_balance(first, user_key)
+        assert balance["REC"]["accountBalance"] == "35500"
+        assert balance["Header"]["responseCode"] == "H0000"
+
+        history = await service.get_transaction_history(first, "20000101", "29991231", "A", "ASC", user_key)
+        records = extract_records(history)
+        assert [r["transactionType"] for r in records] == ["1", "2", "2"]
+        assert records[-1]["transactionAfterBalance"] == "35500"
+
+        accounts = await service.get_demand_deposit_accounts(user_key)
+        assert len(accounts["dataSearch"]["content"]) == 2
+
+        # 잔액 부족은 업무 오류 (400)
+        try:
+            await service.withdraw_from_account(second, 10 ** 9, "출금", user_key)
+            assert False, "잔액 부족 출금은 실패해야 함"
+        except Exception as e:
+            assert "A1014" in str(e)
+
+    _run(scenario, simulator)
+
+
+def test_fault_injection_and_rate_limit():
+    simulator = SSAFYSimulator(FaultConfig(error_rate=1.0, error_statuses=(503,)), seed=1)
+
+    async def scenario(service):
+        try:
+            await service.get_bank_codes()
+            assert False, "오류 주입 시 예외가 발생해야 함"
+        except Exception as e:
+            assert "503" in str(e)
+
+        simulator.faults.update({"error_rate": 0.0, "rate_limit_rps": 1, "rate_limit_burst": 1})
+        results = await asyncio.gather(
+            *[service.get_deposit_accounts(f"user-{i}") for i in range(3)], return_exceptions=True
+        )
+        assert simulator.stats["rate_limited"] >= 2
+        assert any("429" in str(result) for result in results if isinstance(result, Exception))
+
+    _run(scenario, simulator)
+
+
+def test_latency_distribution_sampling():
+    import random
+    rng = random.Random(0)
+    faults = FaultConfig(latency_ms=100, latency_dist="lognormal", latency_sigma=0.5)
+    samples = sorted(faults.sample_latency(rng) for _ in range(2000))
+    median = samples[len(samples) // 2]
+    assert 0.09 < median < 0.11
+    assert samples[int(len(samples) * 0.99)] > 2 * median
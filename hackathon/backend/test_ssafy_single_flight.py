@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+SSAFY 동일 조회 공유(single-flight) 테스트
+동시에 들어온 동일 조회는 업스트림 호출 하나만, 변경 API는 호출마다 전송되는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from aiohttp import web
+
+from app.services.ssafy_api_service import SSAFYAPIService, AsyncSSAFYAPIService, close_async_transport
+from app.services.ssafy_single_flight import SingleFlight, request_key
+
+
+async def _start_fake_bank(calls):
+    async def handler(request):
+        body = await request.json()
+        calls.append((body["Header"]["apiName"], body["Header"].get("userKey")))
+        await asyncio.sleep(0.05)
+        return web.json_response({"Header": {"responseCode": "H0000"}, "REC": [{"accountNo": "001"}]})
+
+    app = web.Application()
+    app.router.add_post("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def test_concurrent_identical_inquiries_share_one_call():
+    async def scenario():
+        calls = []
+        runner, base_url = await _start_fake_bank(calls)
+        try:
+            service = AsyncSSAFYAPIService()
+            service.base_url = base_url
+
+            results = await asyncio.gather(
+                *[service.get_demand_deposit_accounts("user-a") for _ in range(20)],
+                *[service.get_demand_deposit_accounts("user-b") for _ in range(5)]
+            )
+            assert calls.count(("inquireDemandDepositAccountList", "user-a")) == 1
+            assert calls.count(("inquireDemandDepositAccountList", "user-b")) == 1
+            assert all(result["REC"][0]["accountNo"] == "001" for result in results)
+
+            # 호출자마다 별도 사본
+            results[0]["REC"].clear()
+            assert results[1]["REC"]
+
+            # 변경 API는 공유하지 않음
+            calls.clear()
+            await asyncio.gather(
+                *[service.withdraw_from_account("001", 1000, "출금", "user-a") for _ in range(5)]
+            )
+            assert len(calls) == 5
+        finally:
+            await close_async_transport()
+            await runner.cleanup()
+
+    asyncio.run(scenario())
+
+
+def test_request_key_ignores_header_timestamps():
+    service = SSAFYAPIService()
+    first = {"Header": service._generate_header("inquireMyCreditRating", True, "user-a")}
+    time.sleep(0.01)
+    second = {"Header": service._generate_header("inquireMyCreditRating", True, "user-a")}
+    other = {"Header": service._generate_header("inquireMyCreditRating", True, "user-b")}
+
+    assert request_key("", "/edu/loan/inquireMyCreditRating", first) == \
+        request_key("", "/edu/loan/inquireMyCreditRating", second)
+    assert request_key("", "/edu/loan/inquireMyCreditRating", first) != \
+        request_key("", "/edu/loan/inquireMyCreditRating", other)
+
+
+def test_sync_single_flight_across_threads():
+    flight = SingleFlight()
+    upstream_calls = []
+    started = threading.Event()
+
+    def slow_call():
+        upstream_calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return {"value": 1}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", slow_call))) for _ in range(8)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(upstream_calls) == 1
+    assert results == [{"value": 1}] * 8
+    assert flight.stats()["coalesced_calls"] == 7
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+SSAFY API 호출 트레이싱 테스트
+비활성 시 NOOP span, 활성 시 구조화 필드 기록과 userKey/apiKey 마스킹 확인
+"""
+
+import sys
+import os
+import json
+import logging
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.services.ssafy_tracing import NOOP_SPAN, trace_call, trace_logger
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def _with_settings(**overrides):
+    originals = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return originals
+
+
+def test_disabled_or_unsampled_returns_noop():
+    originals = _with_settings(SSAFY_TRACE_ENABLED=False, SSAFY_TRACE_SAMPLE_RATE=1.0)
+    try:
+        assert trace_call("/edu/bank/inquireBankCodes", {}) is NOOP_SPAN
+        settings.SSAFY_TRACE_ENABLED = True
+        settings.SSAFY_TRACE_SAMPLE_RATE = 0.0
+        assert trace_call("/edu/bank/inquireBankCodes", {}) is NOOP_SPAN
+    finally:
+        for name, value in originals.items():
+            setattr(settings, name, value)
+
+
+def test_span_records_fields_and_masks_secrets():
+    originals = _with_settings(SSAFY_TRACE_ENABLED=True, SSAFY_TRACE_SAMPLE_RATE=1.0, SSAFY_TRACE_BODIES=True)
+    handler = _Collect()
+    trace_logger.addHandler(handler)
+    trace_logger.setLevel(logging.INFO)
+    try:
+        payload = {"Header": {"apiName": "inquireDemandDepositAccountList",
+                              "apiKey": "api-key-1234567890", "userKey": "user-key-abcdefgh"}}
+        with trace_call("/edu/demandDeposit/inquireDemandDepositAccountList", payload) as span:
+            span.record(status=200, response='{"userKey": "user-key-abcdefgh", "REC": []}')
+
+        assert len(handler.messages) == 1
+        fields = json.loads(handler.messages[0].split(" ", 1)[1])
+        assert fields["api_name"] == "inquireDemandDepositAccountList"
+        assert fields["status"] == 200
+        assert fields["duration_ms"] >= 0
+        assert fields["request"]["Header"]["apiKey"] == "***7890"
+        assert fields["response"]["userKey"] == "***efgh"
+        assert "user-key-abcdefgh" not in handler.messages[0]
+    finally:
+        trace_logger.removeHandler(handler)
+        trace_logger.setLevel(logging.NOTSET)
+        for name, value in originals.items():
+            setattr(settings, name, value)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+크레도 레벨 곡선 테스트
+누적 임계값 테이블 계산이 기존 한 레벨씩 올리는 방식과 같은지, 레벨 다운/전체 재계산이 정확한지,
+곡선 교체/테이블 확장이 동시에 읽는 스레드에 섞인 값을 보이지 않는지 확인
+"""
+
+import sys
+import os
+import math
+import random
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.core import xp_rules
+from app.db.session import create_app_engine
+from app.db.migrations import upgrade
+from app.models.xp import UserXP
+from app.services.xp_service import XPService
+
+
+def _loop_add_credo(level, credo, delta):
+    """테이블 도입 전 방식 (양수 delta 기준 비교용)"""
+    def need(lv):
+        return 100 if lv <= 1 else math.ceil(100 * (1.2 ** (lv - 1)))
+    credo += delta
+    while credo >= need(level):
+        credo -= need(level)
+        level += 1
+    return level, credo
+
+
+def test_table_matches_loop_for_positive_deltas():
+    rng = random.Random(7)
+    for _ in range(2000):
+        level = rng.randint(1, 40)
+        credo = rng.randint(0, xp_rules.compute_credo_to_next(level) - 1)
+        delta = rng.choice([0, 1, rng.randint(1, 500), rng.randint(1, 10 ** 6)])
+        new_level, new_credo, credo_to_next, leveled = xp_rules.add_credo(level, credo, delta)
+        assert (new_level, new_credo) == _loop_add_credo(level, credo, delta)
+        assert credo_to_next == xp_rules.compute_credo_to_next(new_level)
+        assert leveled == (new_level > level)
+
+
+def test_huge_and_negative_deltas():
+    level, credo, _, leveled = xp_rules.add_credo(1, 0, 10 ** 30)
+    assert leveled and xp_rules.total_credo(level, credo) == 10 ** 30
+
+    # 레벨 3 잔여 10 → 130 차감하면 레벨 2 잔여 0
+    assert xp_rules.add_credo(3, 10, -130)[:2] == (2, 0)
+    assert xp_rules.add_credo(3, 10, -131)[:2] == (1, 99)
+    assert xp_rules.add_credo(3, 10, -10 ** 6) == (1, 0, 100, False)
+
+
+def test_vectorized_resolve_matches_bisect():
+    totals = np.random.default_rng(3).integers(0, 10 ** 7, size=50_000).tolist()
+    xp_rules.current_curve().extend(total=10 ** 30)  # 다른 호출이 테이블을 int64 범위 밖까지 늘려도 벡터 연산
+    assert xp_rules.current_curve().int64_levels(max(totals)) > 0
+    resolved = xp_rules.resolve_totals(totals)
+    expected = [xp_rules.level_for_total(total) for total in totals]
+    assert list(zip(resolved["level"], resolved["credo"])) == expected
+    assert xp_rules.totals_for(resolved["level"], resolved["credo"]) == totals
+
+    # int64 범위를 넘는 누적 크레도는 bisect로 처리
+    huge = [10 ** 30, 5]
+    resolved = xp_rules.resolve_totals(huge)
+    assert list(zip(resolved["level"], resolved["credo"])) == [xp_rules.level_for_total(total) for total in huge]
+    assert xp_rules.totals_for(resolved["level"], resolved["credo"]) == huge
+
+
+def test_retune_keeps_cumulative_credo():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'xp.db')}")
+        upgrade(engine)
+        rows = [(1, 0), (2, 50), (5, 300), (12, 7)]
+        with engine.begin() as conn:
+            for i, (level, credo) in enumerate(rows, start=1):
+                conn.execute(text(
+                    'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                    "VALUES (:email, 'x', 1, 0, '2024-01-01', '2024-01-01')"
+                ), {"email": f"tune{i}@ssafy.com"})
+                conn.execute(text(
+                    "INSERT INTO user_xp (user_id, current_level, credo_score, current_xp, total_xp, "
+                    "created_at, updated_at) VALUES (:user_id, :level, :credo, 0, 0, '2024-01-01', '2024-01-01')"
+                ), {"user_id": i, "level": level, "credo": credo})
+        before = [xp_rules.total_credo(level, credo) for level, credo in rows]
+        try:
+            with Session(engine) as session:
+                changed = XPService.retune_level_curve(50, 1.1, session=session)
+                after = session.exec(select(UserXP).order_by(UserXP.user_id)).all()
+            assert changed == 3  # 레벨 1 잔여 0은 그대로
+            assert [xp_rules.total_credo(row.current_level, row.credo_score) for row in after] == before
+            assert all(row.credo_score < xp_rules.compute_credo_to_next(row.current_level) for row in after)
+        finally:
+            xp_rules.configure(100, 1.2)
+            engine.dispose()
+
+
+def test_failed_retune_keeps_current_curve():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'xp.db')}")
+        upgrade(engine)
+        with engine.begin() as conn:
+            conn.execute(text(
+                'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                "VALUES ('fail@ssafy.com', 'x', 1, 0, '2024-01-01', '2024-01-01')"
+            ))
+            conn.execute(text(
+                "INSERT INTO user_xp (user_id, current_level, credo_score, current_xp, total_xp, "
+                "created_at, updated_at) VALUES (1, 4, 10, 0, 0, '2024-01-01', '2024-01-01')"
+            ))
+        curve = xp_rules.current_curve()
+        try:
+            with Session(engine) as session:
+                original_execute = session.execute
+
+                def failing_execute(statement, *args, **kwargs):
+                    if args and isinstance(args[0], list):  # executemany UPDATE
+                        raise RuntimeError("write failed")
+                    return original_execute(statement, *args, **kwargs)
+
+                session.execute = failing_execute
+                with pytest.raises(RuntimeError):
+                    XPService.retune_level_curve(50, 1.1, session=session)
+            assert xp_rules.current_curve() is curve
+            assert xp_rules.compute_credo_to_next(1) == 100
+            with Session(engine) as session:
+                row = session.exec(select(UserXP)).one()
+            assert (row.current_level, row.credo_score) == (4, 10)
+        finally:
+            xp_rules.configure(100, 1.2)
+            engine.dispose()
+
+
+def test_configure_swaps_whole_table():
+    curves = [(100, 1.2), (50, 1.1)]
+    expected = {base: xp_rules.LevelCurve(base, multiplier) for base, multiplier in curves}
+    for curve in expected.values():
+        curve.extend(level=300)
+    errors = []
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            level, credo, credo_to_next, _ = xp_rules.add_credo(1, 0, 10 ** 6)
+            reference = next((c for c in expected.values() if c.credo_to_next[level - 1] == credo_to_next
+                              and c.thresholds[level - 1] + credo == 10 ** 6), None)
+            if reference is None:
+                errors.append((level, credo, credo_to_next))
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for i in range(200):
+            xp_rules.configure(*curves[i % 2])
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        xp_rules.configure(100, 1.2)
+    assert not errors
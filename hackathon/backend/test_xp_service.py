@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+크레도 적립 트랜잭션 테스트
+동시에 많은 활동을 적립해도 증가분이 사라지지 않고 레벨/잔여 크레도가 정확한지 확인
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import func, text
+from sqlmodel import Session, select
+
+from app.core.xp_rules import compute_credo_to_next
+from app.db.session import create_app_engine
+from app.db.migrations import upgrade
+from app.models.xp import UserXP, XPActivity, XPActivityType, XPBatchItem, XPBatchRequest
+from app.services.xp_service import XPService
+
+
+def _total_credo(user_xp: UserXP) -> int:
+    """레벨업에 사용한 크레도 + 현재 레벨의 잔여 크레도"""
+    return sum(compute_credo_to_next(level) for level in range(1, user_xp.current_level)) + user_xp.credo_score
+
+
+def _engine_with_users(workdir, count):
+    engine = create_app_engine(f"sqlite:///{os.path.join(workdir, 'xp.db')}")
+    upgrade(engine)
+    with engine.begin() as conn:
+        for i in range(count):
+            conn.execute(text(
+                'INSERT INTO "user" (email, password_hash, is_active, is_verified, created_at, updated_at) '
+                "VALUES (:email, 'x', 1, 0, '2024-01-01', '2024-01-01')"
+            ), {"email": f"xp{i}@ssafy.com"})
+    return engine
+
+
+def test_parallel_adds_keep_exact_totals():
+    per_user, users = 1000, 2
+    activity = XPActivityType.SAVING
+    credo, xp = XPService.ACTIVITY_CREDO_SCORES[activity], XPService.ACTIVITY_XP_SCORES[activity]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine_with_users(workdir, users)
+        try:
+            def add(i):
+                with Session(engine) as session:
+                    return XPService.add_credo_for_activity(i % users + 1, activity, f"저축 {i}", session=session)
+
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                responses = list(pool.map(add, range(per_user * users)))
+
+            with Session(engine) as session:
+                rows = session.exec(select(UserXP).order_by(UserXP.user_id)).all()
+                activity_counts = dict(session.exec(
+                    select(XPActivity.user_xp_id, func.count()).group_by(XPActivity.user_xp_id)
+                ).all())
+
+            assert len(rows) == users  # 동시 생성에도 사용자당 한 행
+            for row in rows:
+                assert _total_credo(row) == per_user * credo
+                assert row.credo_score < compute_credo_to_next(row.current_level)
+                assert row.total_xp == row.current_xp == per_user * xp
+                assert activity_counts[row.id] == per_user
+            assert sum(response.leveled_up for response in responses) == sum(row.current_level - 1 for row in rows)
+        finally:
+            engine.dispose()
+
+
+def test_deduction_never_goes_negative():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine_with_users(workdir, 1)
+        try:
+            with Session(engine) as session:
+                XPService.add_credo_for_activity(1, XPActivityType.TRANSACTION, session=session)  # +2
+                first = XPService.deduct_credo_for_post_deletion(1, "post-1", session=session)
+                second = XPService.deduct_credo_for_post_deletion(1, "post-2", session=session)
+            assert (first.credo_score, second.credo_score) == (0, 0)
+            assert [a["credo_gained"] for a in second.recent_activities][:3] == [-2, -2, 2]
+        finally:
+            engine.dispose()
+
+
+def test_batch_applies_once_and_skips_duplicate_keys():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine_with_users(workdir, 1)
+        try:
+            start = datetime.utcnow() - timedelta(hours=1)
+            items = [
+                XPBatchItem(activity_type=XPActivityType.ACHIEVEMENT, idempotency_key=f"ach-{i}",
+                            occurred_at=start + timedelta(minutes=i))
+                for i in range(3)
+            ]
+            # 같은 배치 안의 중복 키, 가장 먼저 발생한 키 없는 활동
+            items.append(XPBatchItem(activity_type=XPActivityType.ACHIEVEMENT, idempotency_key="ach-0"))
+            items.append(XPBatchItem(activity_type=XPActivityType.LIKE, occurred_at=start - timedelta(minutes=1)))
+
+            with Session(engine) as session:
+                first = XPService.add_credo_batch(1, items, session=session)
+                again = XPService.add_credo_batch(1, items[:3], session=session)
+                row = session.exec(select(UserXP)).one()
+
+            assert (first.applied, first.duplicates) == (4, 1)
+            assert _total_credo(row) == 3 * 50 + 1
+            assert (first.level, first.credo_score) == (row.current_level, row.credo_score) == (2, 51)
+            # 1(LIKE) → 51 → 101(레벨업) → 151 순서
+            assert [item.leveled_up for item in first.items] == [False, True, False, False, False]
+            assert first.items[3].applied is False
+            assert (again.applied, again.duplicates, again.credo_score) == (0, 3, 51)
+        finally:
+            engine.dispose()
+
+
+def test_batch_request_keeps_metadata():
+    request = XPBatchRequest.model_validate(
+        {"items": [{"activity_type": "like", "metadata": {"post_id": 7}, "idempotency_key": "like-7"}]}
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = _engine_with_users(workdir, 1)
+        try:
+            with Session(engine) as session:
+                XPService.add_credo_batch(1, request.items, session=session)
+                activity = session.exec(select(XPActivity)).one()
+            assert activity.get_metadata() == {"post_id": 7}
+        finally:
+            engine.dispose()